@@ -0,0 +1,282 @@
+"""
+Benchmark suite of the client against a local stub PokeAPI server.
+
+Serves synthetic Pokemon shaped like real ones (about a hundred moves each)
+from the test stub server, then measures throughput and p50/p99 latency of
+single gets, bulk gets, pagination and model parsing across transports
+(keep-alive, no keep-alive, async, local dataset) and cache modes (none,
+memory, disk). Results can be saved as JSON and compared with an earlier
+run to catch regressions between commits.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_client
+    python -m benchmarks.bench_client --only get bulk --number 500
+    python -m benchmarks.bench_client --json before.json
+    python -m benchmarks.bench_client --compare before.json --threshold 1.2
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Iterator, List, Optional
+
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.connection.decoders import default_decoder
+from src.pokeapi.connection.disk_cache import DiskCache
+from src.pokeapi.dataset import snapshot
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.trusted import parse_model
+from tests.stub_server import StubPokeAPIServer
+
+from .bench_decode import synthetic_payload
+
+RESULTS_VERSION = 1
+GROUPS = ("parse", "get", "bulk", "paginate")
+
+
+class Case:
+    """One benchmark: an operation timed repeatedly, handling `items` each."""
+
+    def __init__(self, group: str, name: str, op: Callable[[], object],
+                 items: int = 1, warmup: int = 0,
+                 close: Optional[Callable[[], None]] = None):
+        self.group = group
+        self.name = name
+        self.op = op
+        self.items = items
+        self.warmup = warmup
+        self.close = close
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure(case: Case, number: int) -> dict:
+    """Run a case `number` times after its warmup and summarize the timings."""
+    for _ in range(case.warmup):
+        case.op()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(number):
+        began = time.perf_counter()
+        case.op()
+        latencies.append(time.perf_counter() - began)
+    total = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "name": case.name,
+        "group": case.group,
+        "ops": number,
+        "items_per_op": case.items,
+        "throughput": number * case.items / total,
+        "mean_ms": total / number * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def populate(server: StubPokeAPIServer, count: int) -> List[int]:
+    """Replace the stub's Pokemon with `count` synthetic ones."""
+    document = json.loads(synthetic_payload())
+    server.resources["pokemon"].clear()
+    server.names["pokemon"].clear()
+    for i in range(1, count + 1):
+        server.update("pokemon", dict(document, id=i, name=f"pokemon-{i}"))
+    return list(range(1, count + 1))
+
+
+def cycle_op(fetch: Callable[[int], object], ids: List[int]) -> Callable[[], object]:
+    keys = itertools.cycle(ids)
+    return lambda: fetch(next(keys))
+
+
+def cases(server: StubPokeAPIServer, ids: List[int], workdir: str,
+          bulk_size: int, page_size: int) -> Iterator[Case]:
+    """Yield every benchmark case, setting up the API each one needs."""
+    payload = synthetic_payload()
+    loads = default_decoder().loads
+    yield Case("parse", "parse/validated",
+               lambda: Pokemon.model_validate_json(payload))
+    yield Case("parse", "parse/trusted",
+               lambda: parse_model(Pokemon, payload, "trusted", loads))
+
+    dataset = os.path.join(workdir, "dataset")
+    with PokeAPI(base_url=server.base_url) as api:
+        snapshot(dataset, api, endpoints=("pokemon",))
+
+    apis = {
+        "keep-alive/no-cache": lambda: PokeAPI(base_url=server.base_url),
+        "no-keep-alive/no-cache": lambda: PokeAPI(
+            base_url=server.base_url, keep_alive=False
+        ),
+        "keep-alive/memory-cache": lambda: PokeAPI(
+            base_url=server.base_url, cache=ResponseCache(maxsize=len(ids))
+        ),
+        "keep-alive/disk-cache": lambda: PokeAPI(
+            base_url=server.base_url,
+            cache=DiskCache(os.path.join(workdir, "cache.sqlite")),
+        ),
+        "local-dataset/no-cache": lambda: PokeAPI(source=f"local:{dataset}"),
+    }
+    for name, make in apis.items():
+        api = make()
+        warmup = len(ids) if api.cache is not None else 10
+        yield Case("get", f"get/{name}",
+                   cycle_op(lambda i, api=api: api.get_pokemon(i), ids),
+                   warmup=warmup, close=api.close)
+
+    for name in ("keep-alive/no-cache", "local-dataset/no-cache"):
+        api = apis[name]()
+        yield Case("bulk", f"bulk/{name}",
+                   lambda api=api: api.get_many_pokemon(ids[:bulk_size]),
+                   items=bulk_size, warmup=1, close=api.close)
+        api = apis[name]()
+        yield Case("paginate", f"paginate/{name}",
+                   lambda api=api: list(api.iter_pokemon(page_size=page_size)),
+                   items=len(ids), warmup=1, close=api.close)
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return
+    loop = asyncio.new_event_loop()
+    async_api = AsyncPokeAPI(base_url=server.base_url)
+
+    def run(coro_fn):
+        return lambda *args: loop.run_until_complete(coro_fn(*args))
+
+    yield Case("get", "get/async/no-cache",
+               cycle_op(run(lambda i: async_api.get_pokemon(i)), ids), warmup=10)
+    yield Case("bulk", "bulk/async/no-cache",
+               run(lambda: async_api.get_many_pokemon(ids[:bulk_size])),
+               items=bulk_size, warmup=1)
+
+    def close():
+        loop.run_until_complete(async_api.aclose())
+        loop.close()
+
+    yield Case("paginate", "paginate/async/no-cache",
+               run(lambda: _collect(async_api.iter_pokemon(page_size=page_size))),
+               items=len(ids), warmup=1, close=close)
+
+
+async def _collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+def git_commit() -> Optional[str]:
+    """Return the commit being benchmarked, if run from a git checkout."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def compare(results: List[dict], baseline: dict, threshold: float) -> List[str]:
+    """
+    Print the change of each case against a baseline run.
+
+    Returns:
+        List[str]: Names of the cases whose p50 latency grew by more than
+            `threshold` times, or whose throughput shrank as much
+    """
+    base = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} "
+          f"(threshold {threshold}x)")
+    print(f"{'case':<32} {'p50 before':>11} {'p50 now':>11} {'change':>8}")
+    for result in results:
+        before = base.get(result["name"])
+        if before is None:
+            continue
+        ratio = result["p50_ms"] / before["p50_ms"]
+        slower = (ratio > threshold
+                  or before["throughput"] / result["throughput"] > threshold)
+        flag = "  REGRESSION" if slower else ""
+        print(f"{result['name']:<32} {before['p50_ms']:>8.3f} ms "
+              f"{result['p50_ms']:>8.3f} ms {(ratio - 1) * 100:>+7.1f}%{flag}")
+        if slower:
+            regressions.append(result["name"])
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="*", choices=GROUPS, default=GROUPS,
+                        help="benchmark groups to run")
+    parser.add_argument("--number", type=int, default=200,
+                        help="timed operations per case")
+    parser.add_argument("--resources", type=int, default=200,
+                        help="synthetic Pokemon served by the stub server")
+    parser.add_argument("--bulk-size", type=int, default=50,
+                        help="Pokemon per bulk get")
+    parser.add_argument("--page-size", type=int, default=50,
+                        help="page size when paginating")
+    parser.add_argument("--server-delay", type=float, default=0.0,
+                        help="seconds the stub server waits before answering")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write the results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="compare with results written by --json")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = []
+    with StubPokeAPIServer() as server, tempfile.TemporaryDirectory() as workdir:
+        ids = populate(server, args.resources)
+        server.delay = args.server_delay
+        print(f"{'case':<32} {'items/s':>10} {'mean':>10} {'p50':>10} {'p99':>10}")
+        for case in cases(server, ids, workdir, args.bulk_size, args.page_size):
+            try:
+                if case.group not in args.only:
+                    continue
+                number = args.number if case.items == 1 else max(args.number // 20, 5)
+                result = measure(case, number)
+            finally:
+                if case.close is not None:
+                    case.close()
+            results.append(result)
+            print(f"{result['name']:<32} {result['throughput']:>10.0f} "
+                  f"{result['mean_ms']:>7.3f} ms {result['p50_ms']:>7.3f} ms "
+                  f"{result['p99_ms']:>7.3f} ms")
+
+    document = {
+        "version": RESULTS_VERSION,
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {k: v for k, v in vars(args).items()
+                     if k not in ("json", "compare")},
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(document, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
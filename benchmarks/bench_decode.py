@@ -0,0 +1,145 @@
+"""
+Benchmark of the ways a Pokemon response body can be decoded into a model.
+
+Compares the old path (`response.json()` then `Pokemon(**data)`) with
+pydantic parsing the bytes directly and with trusted decoding on each JSON
+backend.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_decode
+    python -m benchmarks.bench_decode --fetch 1 25 150   # real payloads
+    python -m benchmarks.bench_decode --files payload.json --number 50
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+import requests
+
+from src.pokeapi.constants import BASE_URL, POKEMON_ENDPOINT
+from src.pokeapi.connection.decoders import (
+    StdlibJsonDecoder, OrjsonDecoder, default_decoder,
+)
+from src.pokeapi.connection.responses import build_response
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.trusted import parse_model
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "fixtures", "pokemon"
+)
+
+
+def synthetic_payload(moves: int = 100, details: int = 8) -> bytes:
+    """
+    Build a Pokemon body shaped like a real popular Pokemon.
+
+    The recorded fixtures are trimmed; real payloads list around a hundred
+    moves with several version group details each, which dominates parsing.
+    """
+    with open(os.path.join(FIXTURES_DIR, "25.json")) as f:
+        document = json.load(f)
+    detail = document["moves"][0]["version_group_details"][0]
+    document["moves"] = [
+        {
+            "move": {
+                "name": f"move-{i}",
+                "url": f"https://pokeapi.co/api/v2/move/{i}/",
+            },
+            "version_group_details": [
+                dict(detail, level_learned_at=level) for level in range(details)
+            ],
+        }
+        for i in range(moves)
+    ]
+    return json.dumps(document).encode()
+
+
+def load_payloads(args) -> List[Tuple[str, bytes]]:
+    payloads = []
+    for pokemon_id in args.fetch:
+        url = f"{BASE_URL}{POKEMON_ENDPOINT}/{pokemon_id}"
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        payloads.append((f"pokemon/{pokemon_id}", response.content))
+    for path in args.files:
+        with open(path, "rb") as f:
+            payloads.append((os.path.basename(path), f.read()))
+    if not payloads:
+        for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+            with open(path, "rb") as f:
+                payloads.append((f"fixture/{os.path.basename(path)}", f.read()))
+        payloads.append(("synthetic/100-moves", synthetic_payload()))
+    return payloads
+
+
+def strategies() -> Dict[str, Callable[[bytes], object]]:
+    def legacy(content):
+        # What the clients did before: decode to str, json, then validate
+        response = build_response("", 200, {}, content)
+        return Pokemon(**response.json())
+
+    stdlib = StdlibJsonDecoder()
+    result = {
+        "legacy response.json()": legacy,
+        "validated (bytes)": lambda c: parse_model(Pokemon, c, "validated"),
+        "trusted + json": lambda c: parse_model(
+            Pokemon, c, "trusted", stdlib.loads
+        ),
+    }
+    if isinstance(default_decoder(), OrjsonDecoder):
+        orjson_decoder = OrjsonDecoder()
+        result["trusted + orjson"] = lambda c: parse_model(
+            Pokemon, c, "trusted", orjson_decoder.loads
+        )
+    return result
+
+
+def measure(decode: Callable[[bytes], object], content: bytes,
+            number: int, repeat: int) -> float:
+    """Return the best mean time of one decode in milliseconds."""
+    decode(content)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            decode(content)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fetch", nargs="*", default=[], metavar="ID",
+                        help="download these Pokemon from the live API")
+    parser.add_argument("--files", nargs="*", default=[], metavar="PATH",
+                        help="benchmark saved Pokemon response bodies")
+    parser.add_argument("--number", type=int, default=200,
+                        help="decodes per timing run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing runs; the best one is reported")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args)
+    decoders = strategies()
+    names = list(decoders)
+    width = max(len(name) for name, _ in payloads)
+    print(f"{'payload':<{width}} {'KiB':>7} " + " ".join(
+        f"{name:>24}" for name in names
+    ))
+    for label, content in payloads:
+        times = [
+            measure(decoders[name], content, args.number, args.repeat)
+            for name in names
+        ]
+        cells = [
+            f"{t:>9.3f} ms ({times[0] / t:>4.1f}x)".rjust(24) for t in times
+        ]
+        print(f"{label:<{width}} {len(content) / 1024:>7.1f} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of import and startup time.
+
+Runs each step in fresh interpreters, the way a CLI worker or serverless
+function cold-starts, and reports the median and best time of: importing
+the package, importing the clients, creating a client and parsing the
+first Pokemon (which builds its validators). Optionally lists the modules
+that take the longest to import, from `python -X importtime`.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 30 --modules 15
+    python -m benchmarks.bench_import --json startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+from .bench_decode import FIXTURES_DIR
+
+PACKAGE = "src.pokeapi"
+FIXTURE = os.path.join(FIXTURES_DIR, "25.json")
+
+# (name, setup, timed statement); setup runs untimed in the same process
+STEPS = [
+    ("import pokeapi", "", f"import {PACKAGE}"),
+    ("from pokeapi import PokeAPI", "",
+     f"from {PACKAGE} import PokeAPI"),
+    ("from pokeapi import AsyncPokeAPI", "",
+     f"from {PACKAGE} import AsyncPokeAPI"),
+    ("PokeAPI()", f"from {PACKAGE} import PokeAPI", "PokeAPI()"),
+    ("first Pokemon parse",
+     f"from {PACKAGE}.models.pokemon import Pokemon\n"
+     f"body = open({FIXTURE!r}, 'rb').read()",
+     "Pokemon.model_validate_json(body)"),
+]
+
+TIMER = """\
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def run_step(setup: str, statement: str, runs: int) -> List[float]:
+    """Time a statement in `runs` fresh interpreters, in seconds."""
+    code = TIMER.format(setup=setup, statement=statement)
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True,
+            check=True,
+        )
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def slowest_modules(statement: str, count: int) -> List[Tuple[str, int, int]]:
+    """
+    Return the modules taking the longest to import, by self time.
+
+    Returns:
+        List[Tuple[str, int, int]]: (module, self µs, cumulative µs) tuples
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in output.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if match:
+            modules.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    modules.sort(key=lambda module: module[1], reverse=True)
+    return modules[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=15,
+                        help="fresh interpreters per step")
+    parser.add_argument("--modules", type=int, default=0, metavar="N",
+                        help="also list the N slowest modules to import")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write the results to a JSON file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'step':<34} {'median':>10} {'best':>10}")
+    for name, setup, statement in STEPS:
+        times = run_step(setup, statement, args.runs)
+        result = {
+            "name": name,
+            "median_ms": statistics.median(times) * 1000,
+            "best_ms": min(times) * 1000,
+        }
+        results.append(result)
+        print(f"{name:<34} {result['median_ms']:>7.1f} ms {result['best_ms']:>7.1f} ms")
+
+    if args.modules:
+        print("\nSlowest self import times of `from pokeapi import PokeAPI`")
+        print(f"{'module':<48} {'self':>10} {'cumulative':>12}")
+        for module, self_us, cumulative_us in slowest_modules(
+            f"from {PACKAGE} import PokeAPI", args.modules
+        ):
+            print(f"{module:<48} {self_us / 1000:>7.1f} ms {cumulative_us / 1000:>9.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs,
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
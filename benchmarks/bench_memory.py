@@ -0,0 +1,152 @@
+"""
+Benchmark of the memory held by a whole Pokemon roster in each model mode.
+
+Decodes the roster into validated pydantic models, trusted models and
+compact models (frozen, with repeated nested values interned) and reports
+the memory each keeps alive and the time taken to decode it.
+
+The roster is synthetic by default: fixture Pokemon given realistic move
+lists drawn from a shared pool of moves, version groups and learn methods,
+so values repeat across Pokemon the way they do in the real API. Pass a
+dataset written by `pokeapi snapshot` to measure the real roster.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --rows 500
+    python -m benchmarks.bench_memory --dataset ~/data/pokeapi
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from src.pokeapi.connection.decoders import default_decoder
+from src.pokeapi.dataset import LocalDataset
+from src.pokeapi.models.compact import InternPool, compact_decoder
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.trusted import trusted_decoder
+
+from .bench_decode import FIXTURES_DIR
+
+ROSTER_SIZE = 1302  # Entries in the live /pokemon list, forms included
+MOVES = 919
+VERSION_GROUPS = 27
+LEARN_METHODS = ("level-up", "machine", "egg", "tutor")
+
+
+def resource(kind: str, index: int, name: str = None) -> dict:
+    return {
+        "name": name or f"{kind}-{index}",
+        "url": f"https://pokeapi.co/api/v2/{kind}/{index}/",
+    }
+
+
+def synthetic_roster(rows: int, seed: int = 0) -> List[bytes]:
+    """Build `rows` Pokemon bodies with moves drawn from shared pools."""
+    templates = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+        with open(path) as f:
+            templates.append(json.load(f))
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(rows):
+        document = dict(templates[i % len(templates)], id=i + 1,
+                        name=f"pokemon-{i + 1}")
+        moves = []
+        for move in rng.sample(range(1, MOVES + 1), rng.randint(40, 120)):
+            method = rng.randrange(len(LEARN_METHODS))
+            details = [
+                {
+                    "level_learned_at": rng.choice((0, 1, 5, 10, 15, 20, 30, 40))
+                    if method == 0 else 0,
+                    "move_learn_method": resource(
+                        "move-learn-method", method + 1, LEARN_METHODS[method]
+                    ),
+                    "version_group": resource("version-group", group),
+                    "order": None,
+                }
+                for group in sorted(rng.sample(range(1, VERSION_GROUPS + 1),
+                                               rng.randint(1, 12)))
+            ]
+            moves.append({"move": resource("move", move),
+                          "version_group_details": details})
+        document["moves"] = moves
+        bodies.append(json.dumps(document).encode())
+    return bodies
+
+
+def dataset_roster(path: str, rows: int) -> List[bytes]:
+    """Read up to `rows` Pokemon bodies from a local dataset."""
+    dataset = LocalDataset(path)
+    page = dataset.page("pokemon", rows, 0)
+    bodies = []
+    for result in page["results"]:
+        resource_id = result["url"].rstrip("/").rsplit("/", 1)[1]
+        bodies.append(bytes(dataset.get("pokemon", resource_id)))
+    dataset.close()
+    return bodies
+
+
+def measure(decode: Callable[[bytes], object], bodies: List[bytes],
+            reset: Callable[[], None] = None):
+    """Return (bytes retained, seconds) of decoding every body."""
+    # Timed untraced first; this also builds the validators and decoders
+    start = time.perf_counter()
+    models = [decode(body) for body in bodies]
+    elapsed = time.perf_counter() - start
+    del models
+    if reset is not None:
+        reset()  # So the traced pass counts the memory of the pool too
+    gc.collect()
+    tracemalloc.start()
+    models = [decode(body) for body in bodies]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=ROSTER_SIZE,
+                        help="Pokemon in the roster")
+    parser.add_argument("--dataset", metavar="PATH",
+                        help="read the roster from a local dataset")
+    args = parser.parse_args()
+
+    if args.dataset:
+        bodies = dataset_roster(args.dataset, args.rows)
+    else:
+        bodies = synthetic_roster(args.rows)
+    loads = default_decoder().loads
+    trusted = trusted_decoder(Pokemon)
+    pool = InternPool()
+    compact = compact_decoder(Pokemon, pool)
+
+    modes = [
+        ("validated", Pokemon.model_validate_json, None),
+        ("trusted", lambda body: trusted(loads(body)), None),
+        ("compact", lambda body: compact(loads(body)), pool.clear),
+    ]
+    raw = sum(len(body) for body in bodies)
+    print(f"{len(bodies)} Pokemon, {raw / 2**20:.1f} MiB of JSON")
+    print(f"{'mode':<12} {'retained':>12} {'per Pokemon':>12} {'vs validated':>13} "
+          f"{'decode':>10}")
+    baseline = None
+    for name, decode, reset in modes:
+        size, elapsed = measure(decode, bodies, reset)
+        baseline = baseline or size
+        print(f"{name:<12} {size / 2**20:>8.1f} MiB {size / len(bodies) / 1024:>8.1f} KiB "
+              f"{size / baseline:>12.2f}x {elapsed:>8.2f} s")
+    print(f"\nIntern pool: {len(pool)} distinct shared values")
+
+
+if __name__ == "__main__":
+    main()
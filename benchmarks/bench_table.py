@@ -0,0 +1,114 @@
+"""
+Benchmark of PokemonTable against lists of Pokemon models.
+
+Measures the memory retained by each and the time of a typical analytics
+query ("Fire types with base speed > 100", then their mean attack).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_table
+    python -m benchmarks.bench_table --rows 5000 --number 50
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from src.pokeapi.analytics import PokemonTable
+from src.pokeapi.models.pokemon import Pokemon
+
+from .bench_decode import FIXTURES_DIR
+
+
+def synthetic_bodies(rows: int, seed: int = 0) -> List[bytes]:
+    """Build `rows` Pokemon bodies from the fixtures with randomized stats."""
+    templates = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+        with open(path) as f:
+            templates.append(json.load(f))
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(rows):
+        template = templates[i % len(templates)]
+        document = dict(template, id=i + 1, name=f"pokemon-{i}")
+        document["stats"] = [
+            dict(stat, base_stat=rng.randint(5, 180))
+            for stat in template["stats"]
+        ]
+        bodies.append(json.dumps(document).encode())
+    return bodies
+
+
+def retained(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the value `build` returns."""
+    tracemalloc.start()
+    value = build()  # noqa: F841 (kept alive while measuring)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def best_time(fn: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Return the best mean time of one call in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def query_models(models: List[Pokemon]) -> float:
+    attack = [
+        next(s.base_stat for s in p.stats if s.stat.name == "attack")
+        for p in models
+        if any(t.type.name == "fire" for t in p.types)
+        and next(s.base_stat for s in p.stats if s.stat.name == "speed") > 100
+    ]
+    return sum(attack) / len(attack) if attack else 0.0
+
+
+def query_table(table: PokemonTable) -> float:
+    selected = table[table.has_type("fire") & (table.stat("speed") > 100)]
+    return float(selected.stat("attack").mean()) if len(selected) else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000,
+                        help="number of Pokemon")
+    parser.add_argument("--number", type=int, default=20,
+                        help="queries per timing run")
+    args = parser.parse_args()
+
+    bodies = synthetic_bodies(args.rows)
+    models = [Pokemon.model_validate_json(body) for body in bodies]
+    table = PokemonTable.from_pokemon(models)
+    assert abs(query_models(models) - query_table(table)) < 1e-9
+
+    models_bytes = retained(
+        lambda: [Pokemon.model_validate_json(body) for body in bodies]
+    )
+    table_bytes = retained(lambda: PokemonTable.from_pokemon(
+        Pokemon.model_validate_json(body) for body in bodies
+    ))
+    models_ms = best_time(lambda: query_models(models), args.number)
+    table_ms = best_time(lambda: query_table(table), args.number)
+
+    print(f"{args.rows} Pokemon")
+    print(f"{'':<16} {'memory':>12} {'query':>12}")
+    print(f"{'list[Pokemon]':<16} {models_bytes / 1024:>9.0f} KiB "
+          f"{models_ms:>9.3f} ms")
+    print(f"{'PokemonTable':<16} {table_bytes / 1024:>9.0f} KiB "
+          f"{table_ms:>9.3f} ms")
+    print(f"{'ratio':<16} {models_bytes / table_bytes:>11.0f}x "
+          f"{models_ms / table_ms:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,29 @@ setup(
         "pydantic>=2.0.0"
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "table": [
+            "numpy>=1.20.0",
+        ],
         "dev": [
+            "httpx>=0.23.0",
+            "orjson>=3.6.0",
+            "numpy>=1.20.0",
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "flake8>=6.0.0",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "pokeapi=pokeapi.cli:main",
+        ],
+    },
     python_requires=">=3.7",
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -1,6 +1,22 @@
 """
 PokeAPI SDK package.
+
+Exports are loaded on first use, so `import pokeapi` stays cheap until a
+client is actually created.
 """
-from .sdk import PokeAPI
+from typing import TYPE_CHECKING
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .sdk import PokeAPI, AsyncPokeAPI
+    from .connection.cache import ResponseCache
+    from .connection.disk_cache import DiskCache
+
+__all__ = ['PokeAPI', 'AsyncPokeAPI', 'ResponseCache', 'DiskCache']
 
-__all__ = ['PokeAPI']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PokeAPI': '.sdk',
+    'AsyncPokeAPI': '.sdk',
+    'ResponseCache': '.connection.cache',
+    'DiskCache': '.connection.disk_cache',
+})
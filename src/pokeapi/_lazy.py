@@ -0,0 +1,42 @@
+"""
+Lazy loading of package exports.
+Lets packages expose names from their submodules without importing those
+submodules, and their dependencies, until a name is first used.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` (PEP 562) of a package.
+
+    The first access to an exported name imports the submodule defining it
+    and stores the value on the package, so later accesses are plain
+    attribute lookups.
+
+    Args:
+        package (str): The package's `__name__`
+        exports (Dict[str, str]): Exported name -> relative name of the
+            submodule defining it, e.g. {"PokeAPI": ".sdk"}
+
+    Returns:
+        Tuple[Callable, Callable]: The `__getattr__` and `__dir__` functions
+            to assign in the package
+    """
+    def __getattr__(name: str):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,18 @@
+"""
+Analytics helpers for the PokeAPI.
+Provides a columnar table of Pokemon for vectorized queries (requires numpy)
+and indexes of generation membership.
+"""
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .table import PokemonTable
+    from .generation_index import GenerationIndex
+
+__all__ = ['PokemonTable', 'GenerationIndex']
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PokemonTable': '.table',
+    'GenerationIndex': '.generation_index',
+})
@@ -0,0 +1,293 @@
+"""
+Secondary indexes over generation membership.
+Maps species, move, type and ability names to the generations listing them.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+from ..api_clients.resource_client import split_resource_url
+from ..constants import BULK_MAX_WORKERS, ErrorMessages
+from ..exceptions import PokeAPIError
+
+INDEX_VERSION = 1
+
+
+def _fingerprint(members: Dict[str, List[str]]) -> str:
+    # Identifies a generation's membership, so unchanged ones are skipped
+    document = json.dumps(members, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(document.encode()).hexdigest()
+
+
+class GenerationIndex:
+    """
+    Hash maps from species, move, type and ability names to generation IDs.
+
+    Answers "which generation introduced X" with a dict lookup instead of
+    fetching every generation and scanning its lists. Build it once with
+    `build`, persist it with `save`, and bring a loaded index up to date
+    with `update`, which only refetches what may have changed.
+
+    Usage:
+        index = GenerationIndex.build(api)
+        index.introduced_in("pokemon_species", "pikachu")  # 1
+        index.save("generations.json")
+
+        index = GenerationIndex.load("generations.json")
+        index.update(api)
+    """
+
+    # Generation fields that are indexed
+    KINDS = ("pokemon_species", "moves", "types", "abilities")
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.generations: Dict[int, dict] = {}
+        self._maps: Dict[str, Dict[str, List[int]]] = {
+            kind: {} for kind in self.KINDS
+        }
+
+    @classmethod
+    def build(cls, api, max_workers: int = BULK_MAX_WORKERS) -> "GenerationIndex":
+        """
+        Build an index of every generation.
+
+        Args:
+            api (PokeAPI): API to read generations from
+            max_workers (int, optional): Maximum number of concurrent requests
+
+        Returns:
+            GenerationIndex: The populated index
+
+        Raises:
+            PokeAPIError: If a generation cannot be fetched
+        """
+        index = cls()
+        index.update(api, max_workers=max_workers)
+        return index
+
+    def add(self, generation) -> bool:
+        """
+        Index a generation, replacing any previous version of it.
+
+        Args:
+            generation: A Generation model, or a projection of it with the
+                fields in `KINDS`
+
+        Returns:
+            bool: Whether the index changed
+        """
+        members = {
+            kind: sorted({resource.name for resource in getattr(generation, kind)})
+            for kind in self.KINDS
+        }
+        fingerprint = _fingerprint(members)
+        previous = self.generations.get(generation.id)
+        if previous is not None and previous["fingerprint"] == fingerprint:
+            return False
+        self.remove(generation.id)
+        self._insert(generation.id, generation.name, fingerprint, members)
+        return True
+
+    def _insert(self, generation_id: int, name: str, fingerprint: str,
+                members: Dict[str, List[str]]) -> None:
+        self.generations[generation_id] = {
+            "name": name, "fingerprint": fingerprint, "members": members,
+        }
+        for kind, names in members.items():
+            mapping = self._maps[kind]
+            for member in names:
+                ids = mapping.setdefault(member, [])
+                ids.append(generation_id)
+                ids.sort()
+
+    def remove(self, generation_id: int) -> bool:
+        """
+        Drop a generation from the index.
+
+        Args:
+            generation_id (int): The generation ID
+
+        Returns:
+            bool: Whether the generation was indexed
+        """
+        entry = self.generations.pop(generation_id, None)
+        if entry is None:
+            return False
+        for kind, names in entry["members"].items():
+            mapping = self._maps[kind]
+            for member in names:
+                ids = mapping[member]
+                ids.remove(generation_id)
+                if not ids:
+                    del mapping[member]
+        return True
+
+    def update(self, api, refresh: bool = False,
+               max_workers: int = BULK_MAX_WORKERS) -> List[int]:
+        """
+        Bring the index up to date with the API.
+
+        Lists the generations, fetches the ones missing from the index and
+        drops the ones no longer listed. With `refresh`, indexed
+        generations are fetched again too and re-indexed if their
+        membership changed; with a cache, unchanged ones are revalidated
+        rather than downloaded. Generations added to the API are seen once
+        the cached list page expires.
+
+        Args:
+            api (PokeAPI): API to read generations from
+            refresh (bool, optional): Whether to recheck indexed generations
+            max_workers (int, optional): Maximum number of concurrent requests
+
+        Returns:
+            List[int]: IDs of the generations added, changed or removed
+
+        Raises:
+            PokeAPIError: If a generation cannot be fetched
+        """
+        listed = {}
+        for resource in api.iter_generations():
+            listed[int(split_resource_url(resource.url)[1])] = resource.name
+
+        changed = [i for i in list(self.generations) if i not in listed]
+        for generation_id in changed:
+            self.remove(generation_id)
+
+        wanted = [i for i in listed if refresh or i not in self.generations]
+        results = api.get_many_generations(
+            wanted, max_workers, fields=self.KINDS
+        )
+        for result in results:
+            if self.add(result.unwrap()):
+                changed.append(result.key)
+        return sorted(changed)
+
+    def _mapping(self, kind: str) -> Dict[str, List[int]]:
+        mapping = self._maps.get(kind)
+        if mapping is None:
+            raise PokeAPIError(ErrorMessages.INVALID_INDEX_KIND.format(
+                kind, ", ".join(self.KINDS)
+            ))
+        return mapping
+
+    def generations_of(self, kind: str, name: str) -> Tuple[int, ...]:
+        """
+        Return the IDs of the generations listing a resource.
+
+        Args:
+            kind (str): One of `KINDS`, e.g. "moves"
+            name (str): The resource name, e.g. "thunderbolt"
+
+        Returns:
+            Tuple[int, ...]: Generation IDs in ascending order, empty if the
+                name is not indexed
+
+        Raises:
+            PokeAPIError: If kind is not one of `KINDS`
+        """
+        return tuple(self._mapping(kind).get(name, ()))
+
+    def introduced_in(self, kind: str, name: str) -> Optional[int]:
+        """
+        Return the ID of the first generation listing a resource.
+
+        Args:
+            kind (str): One of `KINDS`, e.g. "pokemon_species"
+            name (str): The resource name, e.g. "pikachu"
+
+        Returns:
+            int: The generation ID, or None if the name is not indexed
+
+        Raises:
+            PokeAPIError: If kind is not one of `KINDS`
+        """
+        ids = self._mapping(kind).get(name)
+        return ids[0] if ids else None
+
+    def names(self, kind: str, generation_id: int) -> List[str]:
+        """
+        Return the names a generation lists for a kind, sorted.
+
+        Raises:
+            PokeAPIError: If kind is not one of `KINDS`
+        """
+        self._mapping(kind)
+        entry = self.generations.get(generation_id)
+        return list(entry["members"][kind]) if entry is not None else []
+
+    def __len__(self) -> int:
+        """Number of indexed generations."""
+        return len(self.generations)
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a JSON file, replacing it atomically.
+
+        Args:
+            path (str): Destination file
+        """
+        path = os.path.expanduser(path)
+        document = {
+            "version": INDEX_VERSION,
+            "generations": {
+                str(generation_id): entry
+                for generation_id, entry in sorted(self.generations.items())
+            },
+        }
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GenerationIndex":
+        """
+        Read an index written by `save`.
+
+        Args:
+            path (str): File written by `save`
+
+        Returns:
+            GenerationIndex: The index
+
+        Raises:
+            PokeAPIError: If the file is missing or not an index
+        """
+        path = os.path.expanduser(path)
+        index = cls()
+        try:
+            with open(path) as f:
+                document = json.load(f)
+            if document.get("version") != INDEX_VERSION:
+                raise ValueError(f"unsupported version {document.get('version')}")
+            for generation_id, entry in document["generations"].items():
+                index._insert(int(generation_id), entry["name"],
+                              entry["fingerprint"], entry["members"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise PokeAPIError(ErrorMessages.INVALID_INDEX_FILE.format(path, e))
+        return index
+
+    @classmethod
+    def load_or_build(cls, path: str, api, refresh: bool = False,
+                      max_workers: int = BULK_MAX_WORKERS) -> "GenerationIndex":
+        """
+        Load an index and update it, or build it if the file is missing.
+
+        The index is saved again whenever it changed.
+
+        Args:
+            path (str): Index file
+            api (PokeAPI): API to read generations from
+            refresh (bool, optional): Whether to recheck indexed generations
+            max_workers (int, optional): Maximum number of concurrent requests
+
+        Returns:
+            GenerationIndex: The up-to-date index
+        """
+        exists = os.path.exists(os.path.expanduser(path))
+        index = cls.load(path) if exists else cls()
+        if index.update(api, refresh, max_workers) or not exists:
+            index.save(path)
+        return index
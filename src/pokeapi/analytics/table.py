@@ -0,0 +1,223 @@
+"""
+Columnar table of Pokemon stats, types and measurements.
+Keeps the scalars analytics jobs read in NumPy arrays for vectorized queries.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Tuple
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Sentinel for a stat a Pokemon does not have and an empty type slot
+MISSING = -1
+
+
+class PokemonTable:
+    """
+    Stats, types, height and weight of many Pokemon, one NumPy column each.
+
+    A row costs a few dozen bytes instead of the thousands of objects a
+    `Pokemon` model holds. Stat and type names are interned once per table
+    and rows refer to them by small integer codes. Queries return boolean
+    masks that combine with `&`, `|` and `~`. Indexing a table with a mask
+    returns the matching rows as a new table.
+
+    Usage:
+        results = api.get_many_pokemon(range(1, 152), fields=PokemonTable.FIELDS)
+        table = PokemonTable.from_pokemon(r.value for r in results if r.ok)
+
+        fast_fire = table[table.has_type("fire") & (table.stat("speed") > 100)]
+        print(fast_fire.names, fast_fire.stat("attack").mean())
+        print(table.mean_by_type("speed"))
+    """
+
+    # Fields read from each Pokemon, for use with `fields=` projections
+    FIELDS = ("height", "weight", "stats", "types")
+
+    def __init__(self, ids, names, height, weight, stats, stat_names,
+                 types, type_names):
+        """
+        Initialize the table from its columns. Use `from_pokemon` to build one.
+
+        Args:
+            ids (np.ndarray): Pokemon IDs, int32
+            names (np.ndarray): Pokemon names, object
+            height (np.ndarray): Heights in decimetres, int32
+            weight (np.ndarray): Weights in hectograms, int32
+            stats (np.ndarray): Base stats, int16 of shape (rows, stats),
+                `MISSING` where a Pokemon lacks a stat
+            stat_names (Tuple[str, ...]): Stat name of each `stats` column
+            types (np.ndarray): Type codes by slot, int8 of shape
+                (rows, slots), `MISSING` for empty slots
+            type_names (Tuple[str, ...]): Type name of each code
+        """
+        self.ids = ids
+        self.names = names
+        self.height = height
+        self.weight = weight
+        self.stats = stats
+        self.stat_names = stat_names
+        self.types = types
+        self.type_names = type_names
+        self._stat_index = {name: i for i, name in enumerate(stat_names)}
+        self._type_codes = {name: i for i, name in enumerate(type_names)}
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Iterable) -> "PokemonTable":
+        """
+        Build a table from Pokemon models.
+
+        Validated, trusted and projected models are accepted, as long as
+        they have the fields in `FIELDS`. The input is consumed once, so a
+        generator keeps only one model alive at a time.
+
+        Args:
+            pokemon (Iterable): Pokemon models
+
+        Returns:
+            PokemonTable: One row per Pokemon, in input order
+
+        Raises:
+            PokeAPIError: If numpy is not installed
+        """
+        if np is None:
+            raise PokeAPIError(ErrorMessages.TABLE_DEPENDENCY_MISSING)
+
+        stat_index: Dict[str, int] = {}
+        type_codes: Dict[str, int] = {}
+        ids, names, height, weight = [], [], [], []
+        stat_rows: List[List[Tuple[int, int]]] = []
+        type_rows: List[List[int]] = []
+        for p in pokemon:
+            ids.append(p.id)
+            names.append(p.name)
+            height.append(p.height)
+            weight.append(p.weight)
+            stat_rows.append([
+                (stat_index.setdefault(s.stat.name, len(stat_index)), s.base_stat)
+                for s in p.stats
+            ])
+            type_rows.append([
+                type_codes.setdefault(t.type.name, len(type_codes))
+                for t in sorted(p.types, key=lambda t: t.slot)
+            ])
+        if len(type_codes) > np.iinfo(np.int8).max:
+            raise PokeAPIError(ErrorMessages.TOO_MANY_TYPES.format(len(type_codes)))
+
+        stats = np.full((len(ids), len(stat_index)), MISSING, dtype=np.int16)
+        for row, values in enumerate(stat_rows):
+            for column, value in values:
+                stats[row, column] = value
+        slots = max((len(row) for row in type_rows), default=0)
+        types = np.full((len(ids), slots), MISSING, dtype=np.int8)
+        for row, codes in enumerate(type_rows):
+            types[row, :len(codes)] = codes
+
+        return cls(
+            ids=np.array(ids, dtype=np.int32),
+            names=np.array(names, dtype=object),
+            height=np.array(height, dtype=np.int32),
+            weight=np.array(weight, dtype=np.int32),
+            stats=stats,
+            stat_names=tuple(sys.intern(name) for name in stat_index),
+            types=types,
+            type_names=tuple(sys.intern(name) for name in type_codes),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, rows) -> "PokemonTable":
+        """
+        Select rows with a boolean mask, an index array or a slice.
+
+        Returns:
+            PokemonTable: A table of the selected rows, sharing the name
+                dictionaries of this one
+        """
+        return PokemonTable(
+            self.ids[rows], self.names[rows], self.height[rows],
+            self.weight[rows], self.stats[rows], self.stat_names,
+            self.types[rows], self.type_names,
+        )
+
+    def stat(self, name: str):
+        """
+        Return the base stat column for a stat name, e.g. "speed".
+
+        Returns:
+            np.ndarray: One value per row, `MISSING` where a Pokemon lacks it
+
+        Raises:
+            PokeAPIError: If no Pokemon in the table has this stat
+        """
+        index = self._stat_index.get(name)
+        if index is None:
+            raise PokeAPIError(ErrorMessages.UNKNOWN_STAT.format(
+                name, ", ".join(self.stat_names)
+            ))
+        return self.stats[:, index]
+
+    def has_type(self, name: str):
+        """
+        Return a mask of the rows having a type in any slot, e.g. "fire".
+
+        Returns:
+            np.ndarray: Boolean mask, all False for types absent from the table
+        """
+        code = self._type_codes.get(name)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return (self.types == code).any(axis=1)
+
+    def type_counts(self) -> Dict[str, int]:
+        """
+        Count the Pokemon having each type.
+
+        Returns:
+            Dict[str, int]: Number of rows per type name
+        """
+        present = self.types[self.types != MISSING]
+        counts = np.bincount(present, minlength=len(self.type_names))
+        return {name: int(count) for name, count in zip(self.type_names, counts)}
+
+    def mean_by_type(self, stat: str) -> Dict[str, float]:
+        """
+        Average a base stat over the Pokemon of each type.
+
+        Args:
+            stat (str): Stat name, e.g. "speed"
+
+        Returns:
+            Dict[str, float]: Mean stat per type present in the table
+
+        Raises:
+            PokeAPIError: If no Pokemon in the table has this stat
+        """
+        values = self.stat(stat)
+        result = {}
+        for code, name in enumerate(self.type_names):
+            rows = (self.types == code).any(axis=1) & (values != MISSING)
+            selected = values[rows]
+            if len(selected):
+                result[name] = float(selected.mean())
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns, including the name strings."""
+        columns = (self.ids, self.names, self.height, self.weight,
+                   self.stats, self.types)
+        return (
+            sum(column.nbytes for column in columns)
+            + sum(sys.getsizeof(name) for name in self.names)
+        )
+
+    def __repr__(self):
+        return (f"PokemonTable(rows={len(self)}, stats={list(self.stat_names)}, "
+                f"types={len(self.type_names)})")
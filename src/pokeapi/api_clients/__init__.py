@@ -1,8 +1,31 @@
 """
 Client implementations for different PokeAPI endpoints.
-Provides Pokemon and Generation clients.
+Provides Pokemon, Generation and resource link clients and their asyncio counterparts.
 """
-from .pokemon_client import PokemonClient
-from .generation_client import GenerationClient
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ['PokemonClient', 'GenerationClient'] 
\ No newline at end of file
+if TYPE_CHECKING:  # pragma: no cover
+    from .pokemon_client import PokemonClient
+    from .generation_client import GenerationClient
+    from .async_pokemon_client import AsyncPokemonClient
+    from .async_generation_client import AsyncGenerationClient
+    from .resource_client import ResourceClient
+    from .async_resource_client import AsyncResourceClient
+    from .bulk import BulkResult
+
+__all__ = [
+    'PokemonClient', 'GenerationClient',
+    'AsyncPokemonClient', 'AsyncGenerationClient',
+    'ResourceClient', 'AsyncResourceClient', 'BulkResult',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PokemonClient': '.pokemon_client',
+    'GenerationClient': '.generation_client',
+    'AsyncPokemonClient': '.async_pokemon_client',
+    'AsyncGenerationClient': '.async_generation_client',
+    'ResourceClient': '.resource_client',
+    'AsyncResourceClient': '.async_resource_client',
+    'BulkResult': '.bulk',
+})
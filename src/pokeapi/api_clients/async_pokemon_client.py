@@ -0,0 +1,162 @@
+"""
+Asynchronous client for interacting with the Pokemon endpoints of the PokeAPI.
+Provides awaitable methods to fetch individual Pokemon and list all Pokemon.
+"""
+
+from functools import partial
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
+from ..connection.async_get import AsyncHttpGetClient
+from ..connection.async_transport import AsyncTransport, Timeout
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder
+from ..connection.hooks import Hooks
+from ..connection.singleflight import AsyncSingleFlight
+from ..models.pokemon import Pokemon
+from ..constants import (
+    BASE_URL, DEFAULT_PAGE_SIZE, PAGE_PREFETCH, POKEMON_ENDPOINT,
+    MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+from ..models.api_resource import NamedAPIResource
+from ..models.pagination import NamedAPIResourceList
+from ..models.projection import project
+from .validation import resolve_pokemon, resolve_fields, page_params
+from .paginate import aiter_resources
+from .bulk import BulkResult, fetch_many_async
+
+
+class AsyncPokemonClient(AsyncHttpGetClient):
+    """An asyncio client for interacting with Pokemon endpoints."""
+
+    def __init__(
+        self,
+        transport: Optional[AsyncTransport] = None,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        super().__init__(
+            base_url, transport, cache, model_mode, decoder, single_flight,
+            timeout, hooks,
+        )
+        self.pokemon_path = POKEMON_ENDPOINT
+
+    async def get_pokemon(
+        self, pokemon_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Pokemon:
+        """
+        Get a specific Pokemon by ID or name.
+
+        Args:
+            pokemon_id (int, optional): The ID of the Pokemon to get.
+            name (str, optional): The name of the Pokemon to get.
+            fields (Iterable[str], optional): Names of the fields to decode.
+                The result is a narrowed model with only these fields plus
+                `id` and `name`; other parts of the response are skipped.
+                Defaults to all fields.
+
+        Returns:
+            Pokemon: The requested Pokemon data.
+
+        Raises:
+            PokeAPIError: If neither id nor name is provided, or if id is not positive,
+                         or if id is provided as string, or if fields names an
+                         unknown field.
+        """
+        id_or_name = resolve_pokemon(pokemon_id, name)
+        model = project(Pokemon, fields)
+
+        try:
+            return await self.get_model(
+                self.pokemon_path, id_or_name, model
+            )
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+    async def list_pokemon(
+        self, limit: int = 20, offset: int = 0
+    ) -> NamedAPIResourceList:
+        """
+        Get a paginated list of Pokemon.
+
+        Args:
+            limit (int, optional): Number of Pokemon to return. Defaults to 20.
+            offset (int, optional): Starting position in the list. Defaults to 0.
+
+        Returns:
+            NamedAPIResourceList: Paginated list of Pokemon resources.
+
+        Raises:
+            PokeAPIError: If limit or offset is negative.
+        """
+        params = page_params(limit, offset)
+
+        try:
+            return await self.get_model(
+                self.pokemon_path, params, NamedAPIResourceList
+            )
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+    def iter_pokemon(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[NamedAPIResource]:
+        """
+        Asynchronously iterate over all Pokemon, following `next` links.
+
+        Use with `async for`. Up to `prefetch` upcoming pages are requested
+        as background tasks while the current one is consumed.
+
+        Args:
+            page_size (int, optional): Number of Pokemon per request.
+            offset (int, optional): Starting position in the list. Defaults to 0.
+            prefetch (int, optional): Number of pages requested ahead.
+                0 disables prefetching.
+
+        Yields:
+            NamedAPIResource: Each Pokemon resource in list order.
+
+        Raises:
+            PokeAPIError: If page_size is not positive or prefetch is negative.
+        """
+        return aiter_resources(self.list_pokemon, page_size, offset, prefetch)
+
+    async def get_many_pokemon(
+        self, ids_or_names: Iterable[Union[int, str]],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon concurrently by ID or name.
+
+        Concurrency is bounded by the transport's limit. A failed lookup is
+        recorded in its result instead of aborting the batch.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+                of the Pokemon to get.
+            fields (Iterable[str], optional): Names of the fields to decode,
+                as for `get_pokemon`.
+
+        Returns:
+            List[BulkResult]: One result per input, in input order.
+
+        Raises:
+            PokeAPIError: If fields names an unknown field.
+        """
+        fields = resolve_fields(Pokemon, fields)
+        return await fetch_many_async(
+            partial(self._get_pokemon_by_key, fields=fields), ids_or_names
+        )
+
+    async def _get_pokemon_by_key(
+        self, key: Union[int, str], fields: Optional[Tuple[str, ...]] = None
+    ) -> Pokemon:
+        if isinstance(key, int):
+            return await self.get_pokemon(pokemon_id=key, fields=fields)
+        return await self.get_pokemon(name=key, fields=fields)
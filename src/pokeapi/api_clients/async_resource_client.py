@@ -0,0 +1,94 @@
+"""
+Asynchronous client for following NamedAPIResource links returned by the PokeAPI.
+Provides awaitable methods to fetch a linked resource and to resolve many links at once.
+"""
+
+from typing import Iterable, List, Optional
+from ..connection.async_get import AsyncHttpGetClient
+from ..connection.async_transport import AsyncTransport, Timeout
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder
+from ..connection.hooks import Hooks
+from ..connection.singleflight import AsyncSingleFlight
+from ..models.api_resource import NamedAPIResource
+from ..constants import (
+    BASE_URL, MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+from .bulk import BulkResult, fetch_many_async
+from .resource_client import RESOURCE_MODELS, split_resource_url
+
+
+class AsyncResourceClient(AsyncHttpGetClient):
+    """An asyncio client for dereferencing NamedAPIResource links."""
+
+    def __init__(
+        self,
+        transport: Optional[AsyncTransport] = None,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        super().__init__(
+            base_url, transport, cache, model_mode, decoder, single_flight,
+            timeout, hooks,
+        )
+
+    async def resolve(self, resource: NamedAPIResource):
+        """
+        Fetch the resource a link points at.
+
+        Args:
+            resource (NamedAPIResource): The link to follow.
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource, as a model for
+                known endpoints and as parsed JSON otherwise.
+
+        Raises:
+            PokeAPIError: If the URL is invalid or the request fails.
+        """
+        return await self.resolve_url(resource.url)
+
+    async def resolve_url(self, url: str):
+        """
+        Fetch the resource at a PokeAPI resource URL.
+
+        Args:
+            url (str): The resource URL.
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource.
+
+        Raises:
+            PokeAPIError: If the URL is invalid or the request fails.
+        """
+        endpoint, id_or_name = split_resource_url(url)
+        model = RESOURCE_MODELS.get(endpoint, dict)
+        try:
+            return await self.get_model(endpoint, id_or_name, model)
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+    async def resolve_all(
+        self, resources: Iterable[NamedAPIResource]
+    ) -> List[BulkResult]:
+        """
+        Fetch many links concurrently, requesting each distinct URL once.
+
+        Args:
+            resources (Iterable[NamedAPIResource]): The links to follow.
+
+        Returns:
+            List[BulkResult]: One result per input link, in input order,
+                keyed by URL. Duplicate links share one result.
+        """
+        urls = [resource.url for resource in resources]
+        unique = list(dict.fromkeys(urls))
+        results = await fetch_many_async(self.resolve_url, unique)
+        by_url = {result.key: result for result in results}
+        return [by_url[url] for url in urls]
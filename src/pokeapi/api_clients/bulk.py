@@ -0,0 +1,113 @@
+"""
+Helpers for fetching many resources at once.
+Runs lookups concurrently and collects a result or error per item.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Union
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+
+IdOrName = Union[int, str]
+
+
+class BulkResult:
+    """Outcome of one lookup in a bulk fetch: either a value or an error."""
+
+    __slots__ = ('key', 'value', 'error')
+
+    def __init__(self, key: IdOrName, value: Any = None,
+                 error: Optional[PokeAPIError] = None):
+        """
+        Initialize the result.
+
+        Args:
+            key (Union[int, str]): The ID or name that was requested
+            value (optional): The fetched model if the lookup succeeded
+            error (PokeAPIError, optional): The error if the lookup failed
+        """
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the lookup succeeded."""
+        return self.error is None
+
+    def unwrap(self):
+        """
+        Return the fetched value.
+
+        Raises:
+            PokeAPIError: The error recorded for this lookup
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self):
+        if self.ok:
+            return f"BulkResult(key={self.key!r}, value={type(self.value).__name__})"
+        return f"BulkResult(key={self.key!r}, error={self.error.message!r})"
+
+
+def fetch_many(
+    fetch_one: Callable[[IdOrName], Any],
+    keys: Iterable[IdOrName],
+    max_workers: int,
+) -> List[BulkResult]:
+    """
+    Run `fetch_one` for every key on a thread pool.
+
+    Args:
+        fetch_one (Callable): Function fetching a single resource by ID or name
+        keys (Iterable[Union[int, str]]): IDs or names to fetch
+        max_workers (int): Maximum number of concurrent fetches
+
+    Returns:
+        List[BulkResult]: One result per key, in input order
+
+    Raises:
+        PokeAPIError: If max_workers is not positive
+    """
+    if max_workers <= 0:
+        raise PokeAPIError(ErrorMessages.INVALID_MAX_WORKERS)
+
+    def run(key: IdOrName) -> BulkResult:
+        try:
+            return BulkResult(key, value=fetch_one(key))
+        except PokeAPIError as e:
+            return BulkResult(key, error=e)
+
+    keys = list(keys)
+    if not keys:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return list(executor.map(run, keys))
+
+
+async def fetch_many_async(
+    fetch_one: Callable[[IdOrName], Awaitable[Any]],
+    keys: Iterable[IdOrName],
+) -> List[BulkResult]:
+    """
+    Await `fetch_one` for every key concurrently.
+
+    Concurrency is bounded by the transport the fetches are sent through.
+
+    Args:
+        fetch_one (Callable): Coroutine function fetching a single resource
+        keys (Iterable[Union[int, str]]): IDs or names to fetch
+
+    Returns:
+        List[BulkResult]: One result per key, in input order
+    """
+    async def run(key: IdOrName) -> BulkResult:
+        try:
+            return BulkResult(key, value=await fetch_one(key))
+        except PokeAPIError as e:
+            return BulkResult(key, error=e)
+
+    return list(await asyncio.gather(*(run(key) for key in keys)))
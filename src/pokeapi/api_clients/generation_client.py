@@ -3,22 +3,51 @@ Client for interacting with the Generation endpoints of the PokeAPI.
 Provides methods to fetch individual generations and list all generations.
 """
 
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from ..connection.get import HttpGetClient
+from ..connection.transport import Transport, Timeout
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder
+from ..connection.hooks import Hooks
+from ..connection.singleflight import SingleFlight
 from ..models.generation import Generation
-from ..constants import BASE_URL, GENERATION_ENDPOINT, ErrorMessages
+from ..constants import (
+    BASE_URL, BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, PAGE_PREFETCH,
+    GENERATION_ENDPOINT, MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
 from ..exceptions import PokeAPIError
+from ..models.api_resource import NamedAPIResource
 from ..models.pagination import NamedAPIResourceList
+from ..models.projection import project
+from .validation import resolve_generation, resolve_fields, page_params
+from .paginate import iter_resources
+from .bulk import BulkResult, fetch_many
 
 
 class GenerationClient(HttpGetClient):
     """A client for interacting with Pokemon generation endpoints."""
 
-    def __init__(self):
-        super().__init__(BASE_URL)
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[SingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        super().__init__(
+            base_url, transport, cache, model_mode, decoder, single_flight,
+            timeout, hooks,
+        )
         self.generation_path = GENERATION_ENDPOINT
 
     def get_generation(
-        self, generation_id: int = None, name: str = None
+        self, generation_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Generation:
         """
         Get a specific Pokemon generation by ID or name.
@@ -26,34 +55,26 @@ class GenerationClient(HttpGetClient):
         Args:
             generation_id (int, optional): The ID of the generation to get.
             name (str, optional): The name of the generation to get.
+            fields (Iterable[str], optional): Names of the fields to decode.
+                The result is a narrowed model with only these fields plus
+                `id` and `name`; other parts of the response are skipped.
+                Defaults to all fields.
 
         Returns:
             Generation: The requested generation data.
 
         Raises:
             PokeAPIError: If neither id nor name is provided, or if id is not positive,
-                         or if id is provided as string.
+                         or if id is provided as string, or if fields names an
+                         unknown field.
         """
-        if generation_id is not None and not isinstance(generation_id, int):
-            raise PokeAPIError(
-                ErrorMessages.GENERATION_ID_WRONG_TYPE.format(generation_id)
-            )
-
-        if generation_id is None and (name is None or name == ""):
-            raise PokeAPIError(ErrorMessages.EMPTY_GENERATION_ID)
-
-        if generation_id is not None:
-            if generation_id <= 0:
-                raise PokeAPIError(
-                    ErrorMessages.INVALID_GENERATION_ID.format(generation_id)
-                )
-            id_or_name = str(generation_id)
-        else:
-            id_or_name = name
+        id_or_name = resolve_generation(generation_id, name)
+        model = project(Generation, fields)
 
         try:
-            response = self.get(self.generation_path, id_or_name)
-            return Generation(**response.json())
+            return self.get_model(
+                self.generation_path, id_or_name, model
+            )
         except ValueError:
             raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
 
@@ -73,14 +94,72 @@ class GenerationClient(HttpGetClient):
         Raises:
             PokeAPIError: If limit or offset is negative.
         """
-        if limit < 0:
-            raise PokeAPIError(ErrorMessages.INVALID_LIMIT)
-        if offset < 0:
-            raise PokeAPIError(ErrorMessages.INVALID_OFFSET)
+        params = page_params(limit, offset)
 
         try:
-            params = {'limit': limit, 'offset': offset}
-            response = self.get(self.generation_path, params)
-            return NamedAPIResourceList(**response.json())
+            return self.get_model(
+                self.generation_path, params, NamedAPIResourceList
+            )
         except ValueError:
             raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+    def iter_generations(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> Iterator[NamedAPIResource]:
+        """
+        Iterate over all generations, following `next` links lazily.
+
+        Only the current page and up to `prefetch` upcoming pages are held
+        in memory, so the first item is available after one request.
+
+        Args:
+            page_size (int, optional): Number of generations per request.
+            offset (int, optional): Starting position in the list. Defaults to 0.
+            prefetch (int, optional): Number of pages fetched in the background
+                while the current one is consumed. 0 disables prefetching.
+
+        Yields:
+            NamedAPIResource: Each generation resource in list order.
+
+        Raises:
+            PokeAPIError: If page_size is not positive or prefetch is negative.
+        """
+        return iter_resources(self.list_generations, page_size, offset, prefetch)
+
+    def get_many_generations(
+        self, ids_or_names: Iterable[Union[int, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many generations concurrently by ID or name.
+
+        Lookups run on a thread pool over this client's connection pool.
+        A failed lookup is recorded in its result instead of aborting the batch.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+                of the generations to get.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                Defaults to the connection pool size.
+            fields (Iterable[str], optional): Names of the fields to decode,
+                as for `get_generation`.
+
+        Returns:
+            List[BulkResult]: One result per input, in input order.
+
+        Raises:
+            PokeAPIError: If max_workers is not positive, or if fields names
+                an unknown field.
+        """
+        fields = resolve_fields(Generation, fields)
+        fetch_one = partial(self._get_generation_by_key, fields=fields)
+        return fetch_many(fetch_one, ids_or_names, max_workers)
+
+    def _get_generation_by_key(
+        self, key: Union[int, str], fields: Optional[Tuple[str, ...]] = None
+    ) -> Generation:
+        if isinstance(key, int):
+            return self.get_generation(generation_id=key, fields=fields)
+        return self.get_generation(name=key, fields=fields)
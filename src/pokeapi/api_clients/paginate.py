@@ -0,0 +1,214 @@
+"""
+Helpers for walking paginated list endpoints.
+Follows `next` links lazily, optionally fetching upcoming pages in the background.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+from ..models.api_resource import NamedAPIResource
+from ..models.pagination import NamedAPIResourceList
+
+ListPage = Callable[[int, int], NamedAPIResourceList]
+AsyncListPage = Callable[[int, int], Awaitable[NamedAPIResourceList]]
+
+
+def next_page(page: NamedAPIResourceList) -> Optional[Tuple[int, int]]:
+    """
+    Read the limit and offset of the page after `page` from its `next` link.
+
+    Args:
+        page (NamedAPIResourceList): A fetched page
+
+    Returns:
+        Tuple[int, int]: The (limit, offset) of the next page, or None if
+            `page` is the last one
+    """
+    if not page.next:
+        return None
+    query = parse_qs(urlsplit(page.next).query)
+    try:
+        return int(query["limit"][0]), int(query["offset"][0])
+    except (KeyError, ValueError):
+        raise PokeAPIError(ErrorMessages.INVALID_NEXT_LINK.format(page.next))
+
+
+def _check_arguments(page_size: int, prefetch: int) -> None:
+    if page_size <= 0:
+        raise PokeAPIError(ErrorMessages.INVALID_PAGE_SIZE)
+    if prefetch < 0:
+        raise PokeAPIError(ErrorMessages.INVALID_PREFETCH)
+
+
+def _upcoming(page: NamedAPIResourceList) -> Iterator[Tuple[int, int]]:
+    # The page `page` links to, then the ones after it predicted from its count
+    following = next_page(page)
+    if following is None:
+        return
+    limit, offset = following
+    yield limit, offset
+    offset += limit
+    while offset < page.count:
+        yield limit, offset
+        offset += limit
+
+
+def iter_pages(
+    list_page: ListPage, page_size: int, offset: int = 0, prefetch: int = 1
+) -> Iterator[NamedAPIResourceList]:
+    """
+    Yield pages of a list endpoint until the last one.
+
+    Args:
+        list_page (Callable): Function fetching a page given (limit, offset)
+        page_size (int): Number of resources per page
+        offset (int, optional): Position of the first resource. Defaults to 0.
+        prefetch (int, optional): Number of upcoming pages fetched in the
+            background while the current one is consumed. 0 fetches lazily.
+
+    Yields:
+        NamedAPIResourceList: Each page in order
+
+    Raises:
+        PokeAPIError: If page_size is not positive or prefetch is negative
+    """
+    _check_arguments(page_size, prefetch)
+    page = list_page(page_size, offset)
+    yield page
+
+    if prefetch == 0:
+        following = next_page(page)
+        while following is not None:
+            page = list_page(*following)
+            yield page
+            following = next_page(page)
+        return
+    if not page.next:
+        return
+
+    upcoming = _upcoming(page)
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    try:
+        while True:
+            while len(pending) < prefetch:
+                following = next(upcoming, None)
+                if following is None:
+                    break
+                pending.append(executor.submit(list_page, *following))
+            if not pending:
+                # The list grew past the count the offsets were predicted
+                # from; predict again from the last page's next link
+                upcoming = _upcoming(page)
+                pending.append(executor.submit(list_page, *next(upcoming)))
+            page = pending.popleft().result()
+            yield page
+            if not page.next:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_resources(
+    list_page: ListPage, page_size: int, offset: int = 0, prefetch: int = 1
+) -> Iterator[NamedAPIResource]:
+    """
+    Yield every resource of a list endpoint, one page at a time.
+
+    Args:
+        list_page (Callable): Function fetching a page given (limit, offset)
+        page_size (int): Number of resources per page
+        offset (int, optional): Position of the first resource. Defaults to 0.
+        prefetch (int, optional): Number of pages fetched ahead
+
+    Yields:
+        NamedAPIResource: Each resource in list order
+    """
+    for page in iter_pages(list_page, page_size, offset, prefetch):
+        yield from page.results
+
+
+async def aiter_pages(
+    list_page: AsyncListPage, page_size: int, offset: int = 0, prefetch: int = 1
+) -> AsyncIterator[NamedAPIResourceList]:
+    """
+    Asynchronously yield pages of a list endpoint until the last one.
+
+    Args:
+        list_page (Callable): Coroutine function fetching a page given
+            (limit, offset)
+        page_size (int): Number of resources per page
+        offset (int, optional): Position of the first resource. Defaults to 0.
+        prefetch (int, optional): Number of upcoming pages requested as
+            background tasks. 0 fetches lazily.
+
+    Yields:
+        NamedAPIResourceList: Each page in order
+
+    Raises:
+        PokeAPIError: If page_size is not positive or prefetch is negative
+    """
+    _check_arguments(page_size, prefetch)
+    page = await list_page(page_size, offset)
+    yield page
+
+    if prefetch == 0:
+        following = next_page(page)
+        while following is not None:
+            page = await list_page(*following)
+            yield page
+            following = next_page(page)
+        return
+    if not page.next:
+        return
+
+    upcoming = _upcoming(page)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < prefetch:
+                following = next(upcoming, None)
+                if following is None:
+                    break
+                pending.append(asyncio.ensure_future(list_page(*following)))
+            if not pending:
+                # The list grew past the count the offsets were predicted
+                # from; predict again from the last page's next link
+                upcoming = _upcoming(page)
+                pending.append(asyncio.ensure_future(list_page(*next(upcoming))))
+            page = await pending.popleft()
+            yield page
+            if not page.next:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancellations so no task is destroyed while pending
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def aiter_resources(
+    list_page: AsyncListPage, page_size: int, offset: int = 0, prefetch: int = 1
+) -> AsyncIterator[NamedAPIResource]:
+    """
+    Asynchronously yield every resource of a list endpoint.
+
+    Args:
+        list_page (Callable): Coroutine function fetching a page given
+            (limit, offset)
+        page_size (int): Number of resources per page
+        offset (int, optional): Position of the first resource. Defaults to 0.
+        prefetch (int, optional): Number of pages requested ahead
+
+    Yields:
+        NamedAPIResource: Each resource in list order
+    """
+    async for page in aiter_pages(list_page, page_size, offset, prefetch):
+        for resource in page.results:
+            yield resource
@@ -3,22 +3,51 @@ Client for interacting with the Pokemon endpoints of the PokeAPI.
 Provides methods to fetch individual Pokemon and list all Pokemon.
 """
 
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from ..connection.get import HttpGetClient
-from ..models.pokemon import Pokemon
-from ..constants import BASE_URL, POKEMON_ENDPOINT, ErrorMessages
+from ..connection.transport import Transport, Timeout
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder
+from ..connection.hooks import Hooks
+from ..connection.singleflight import SingleFlight
+from ..models.pokemon import Pokemon, PokemonMove
+from ..constants import (
+    BASE_URL, BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, PAGE_PREFETCH,
+    POKEMON_ENDPOINT, MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
 from ..exceptions import PokeAPIError
+from ..models.api_resource import NamedAPIResource
 from ..models.pagination import NamedAPIResourceList
+from ..models.projection import project
+from .validation import resolve_pokemon, resolve_fields, page_params
+from .paginate import iter_resources
+from .bulk import BulkResult, fetch_many
 
 
 class PokemonClient(HttpGetClient):
     """A client for interacting with Pokemon endpoints."""
 
-    def __init__(self):
-        super().__init__(BASE_URL)
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[SingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        super().__init__(
+            base_url, transport, cache, model_mode, decoder, single_flight,
+            timeout, hooks,
+        )
         self.pokemon_path = POKEMON_ENDPOINT
 
     def get_pokemon(
-        self, pokemon_id: int = None, name: str = None
+        self, pokemon_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None, stream: bool = False,
     ) -> Pokemon:
         """
         Get a specific Pokemon by ID or name.
@@ -26,37 +55,58 @@ class PokemonClient(HttpGetClient):
         Args:
             pokemon_id (int, optional): The ID of the Pokemon to get.
             name (str, optional): The name of the Pokemon to get.
+            fields (Iterable[str], optional): Names of the fields to decode.
+                The result is a narrowed model with only these fields plus
+                `id` and `name`; other parts of the response are skipped.
+                Defaults to all fields.
+            stream (bool, optional): Build the Pokemon while the response
+                is read, holding only the finished model rather than the
+                body too. Streamed responses are not cached. Defaults to False.
 
         Returns:
             Pokemon: The requested Pokemon data.
 
         Raises:
             PokeAPIError: If neither id nor name is provided, or if id is not positive,
-                         or if id is provided as string.
+                         or if id is provided as string, or if fields names an
+                         unknown field.
         """
-        if pokemon_id is not None and not isinstance(pokemon_id, int):
-            raise PokeAPIError(
-                ErrorMessages.POKEMON_ID_WRONG_TYPE.format(pokemon_id)
-            )
-
-        if pokemon_id is None and (name is None or name == ""):
-            raise PokeAPIError(ErrorMessages.EMPTY_POKEMON_ID)
-
-        if pokemon_id is not None:
-            if pokemon_id <= 0:
-                raise PokeAPIError(
-                    ErrorMessages.INVALID_POKEMON_ID.format(pokemon_id)
-                )
-            id_or_name = str(pokemon_id)
-        else:
-            id_or_name = name
+        id_or_name = resolve_pokemon(pokemon_id, name)
+        model = project(Pokemon, fields)
+        get_model = self.stream_model if stream else self.get_model
 
         try:
-            response = self.get(self.pokemon_path, id_or_name)
-            return Pokemon(**response.json())
+            return get_model(
+                self.pokemon_path, id_or_name, model
+            )
         except ValueError:
             raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
 
+    def iter_pokemon_moves(
+        self, pokemon_id: int = None, name: str = None
+    ) -> Iterator[PokemonMove]:
+        """
+        Iterate over the moves of a Pokemon as they are read from the response.
+
+        Memory stays bounded by one move, however many moves the Pokemon
+        learns. The rest of the response is read past without being kept.
+
+        Args:
+            pokemon_id (int, optional): The ID of the Pokemon.
+            name (str, optional): The name of the Pokemon.
+
+        Returns:
+            Iterator[PokemonMove]: The moves in response order. The request
+                is sent when iteration starts.
+
+        Raises:
+            PokeAPIError: If neither id nor name is provided, or if id is not
+                positive. While iterating, if the request fails or the
+                response is invalid.
+        """
+        id_or_name = resolve_pokemon(pokemon_id, name)
+        return self.iter_items(self.pokemon_path, id_or_name, Pokemon, "moves")
+
     def list_pokemon(
         self, limit: int = 20, offset: int = 0
     ) -> NamedAPIResourceList:
@@ -73,16 +123,72 @@ class PokemonClient(HttpGetClient):
         Raises:
             PokeAPIError: If limit or offset is negative.
         """
-        if limit < 0:
-            raise PokeAPIError(ErrorMessages.INVALID_LIMIT)
-        if offset < 0:
-            raise PokeAPIError(ErrorMessages.INVALID_OFFSET)
+        params = page_params(limit, offset)
 
         try:
-            params = {'limit': limit, 'offset': offset}
-            response = self.get(self.pokemon_path, params)
-            return NamedAPIResourceList(**response.json())
+            return self.get_model(
+                self.pokemon_path, params, NamedAPIResourceList
+            )
         except ValueError:
             raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
-        
 
+    def iter_pokemon(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> Iterator[NamedAPIResource]:
+        """
+        Iterate over all Pokemon, following `next` links lazily.
+
+        Only the current page and up to `prefetch` upcoming pages are held
+        in memory, so the first item is available after one request.
+
+        Args:
+            page_size (int, optional): Number of Pokemon per request.
+            offset (int, optional): Starting position in the list. Defaults to 0.
+            prefetch (int, optional): Number of pages fetched in the background
+                while the current one is consumed. 0 disables prefetching.
+
+        Yields:
+            NamedAPIResource: Each Pokemon resource in list order.
+
+        Raises:
+            PokeAPIError: If page_size is not positive or prefetch is negative.
+        """
+        return iter_resources(self.list_pokemon, page_size, offset, prefetch)
+
+    def get_many_pokemon(
+        self, ids_or_names: Iterable[Union[int, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon concurrently by ID or name.
+
+        Lookups run on a thread pool over this client's connection pool.
+        A failed lookup is recorded in its result instead of aborting the batch.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+                of the Pokemon to get.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                Defaults to the connection pool size.
+            fields (Iterable[str], optional): Names of the fields to decode,
+                as for `get_pokemon`.
+
+        Returns:
+            List[BulkResult]: One result per input, in input order.
+
+        Raises:
+            PokeAPIError: If max_workers is not positive, or if fields names
+                an unknown field.
+        """
+        fields = resolve_fields(Pokemon, fields)
+        fetch_one = partial(self._get_pokemon_by_key, fields=fields)
+        return fetch_many(fetch_one, ids_or_names, max_workers)
+
+    def _get_pokemon_by_key(
+        self, key: Union[int, str], fields: Optional[Tuple[str, ...]] = None
+    ) -> Pokemon:
+        if isinstance(key, int):
+            return self.get_pokemon(pokemon_id=key, fields=fields)
+        return self.get_pokemon(name=key, fields=fields)
@@ -0,0 +1,132 @@
+"""
+Client for following NamedAPIResource links returned by the PokeAPI.
+Provides methods to fetch a linked resource and to resolve many links at once.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from ..connection.get import HttpGetClient
+from ..connection.transport import Transport, Timeout
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder
+from ..connection.hooks import Hooks
+from ..connection.singleflight import SingleFlight
+from ..models.api_resource import NamedAPIResource
+from ..models.pokemon import Pokemon
+from ..models.generation import Generation
+from ..constants import (
+    BASE_URL, BULK_MAX_WORKERS, POKEMON_ENDPOINT, GENERATION_ENDPOINT,
+    MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+from .bulk import BulkResult, fetch_many
+
+# Models for endpoints the SDK knows; other resources are returned as dicts
+RESOURCE_MODELS = {
+    POKEMON_ENDPOINT: Pokemon,
+    GENERATION_ENDPOINT: Generation,
+}
+
+
+def split_resource_url(url: str) -> Tuple[str, str]:
+    """
+    Split a resource URL into its endpoint path and ID or name.
+
+    Args:
+        url (str): A resource URL such as
+            "https://pokeapi.co/api/v2/pokemon-species/1/"
+
+    Returns:
+        Tuple[str, str]: The endpoint path and identifier,
+            e.g. ("/pokemon-species", "1")
+
+    Raises:
+        PokeAPIError: If the URL does not point at a single resource
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    if len(segments) < 2:
+        raise PokeAPIError(ErrorMessages.INVALID_RESOURCE_URL.format(url))
+    return f"/{segments[-2]}", segments[-1]
+
+
+class ResourceClient(HttpGetClient):
+    """A client for dereferencing NamedAPIResource links."""
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[SingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        super().__init__(
+            base_url, transport, cache, model_mode, decoder, single_flight,
+            timeout, hooks,
+        )
+
+    def resolve(self, resource: NamedAPIResource):
+        """
+        Fetch the resource a link points at.
+
+        The link is requested relative to this client's base URL, so it goes
+        through the same transport and cache as `get_pokemon`.
+
+        Args:
+            resource (NamedAPIResource): The link to follow.
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource, as a model for
+                known endpoints and as parsed JSON otherwise.
+
+        Raises:
+            PokeAPIError: If the URL is invalid or the request fails.
+        """
+        return self.resolve_url(resource.url)
+
+    def resolve_url(self, url: str):
+        """
+        Fetch the resource at a PokeAPI resource URL.
+
+        Args:
+            url (str): The resource URL.
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource.
+
+        Raises:
+            PokeAPIError: If the URL is invalid or the request fails.
+        """
+        endpoint, id_or_name = split_resource_url(url)
+        model = RESOURCE_MODELS.get(endpoint, dict)
+        try:
+            return self.get_model(endpoint, id_or_name, model)
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+    def resolve_all(
+        self, resources: Iterable[NamedAPIResource],
+        max_workers: int = BULK_MAX_WORKERS
+    ) -> List[BulkResult]:
+        """
+        Fetch many links concurrently, requesting each distinct URL once.
+
+        Args:
+            resources (Iterable[NamedAPIResource]): The links to follow.
+            max_workers (int, optional): Maximum number of concurrent requests.
+
+        Returns:
+            List[BulkResult]: One result per input link, in input order,
+                keyed by URL. Duplicate links share one result.
+
+        Raises:
+            PokeAPIError: If max_workers is not positive.
+        """
+        urls = [resource.url for resource in resources]
+        unique = list(dict.fromkeys(urls))
+        results = fetch_many(self.resolve_url, unique, max_workers)
+        by_url = {result.key: result for result in results}
+        return [by_url[url] for url in urls]
@@ -0,0 +1,112 @@
+"""
+Argument validation shared by the synchronous and asynchronous API clients.
+Keeps error messages identical regardless of how a request is sent.
+"""
+
+from typing import Iterable, Optional, Tuple
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+from ..models.projection import project
+
+
+def resolve_id_or_name(
+    resource_id: int,
+    name: str,
+    wrong_type_message: str,
+    empty_message: str,
+    invalid_id_message: str,
+) -> str:
+    """
+    Validate an ID/name pair and return the path segment to request.
+
+    Args:
+        resource_id (int): The resource ID, or None
+        name (str): The resource name, or None
+        wrong_type_message (str): Error message when the ID is not an integer
+        empty_message (str): Error message when neither ID nor name is given
+        invalid_id_message (str): Error message when the ID is not positive
+
+    Returns:
+        str: The ID or name to append to the endpoint path
+
+    Raises:
+        PokeAPIError: If neither id nor name is provided, or if id is not positive,
+                     or if id is provided as string.
+    """
+    if resource_id is not None and not isinstance(resource_id, int):
+        raise PokeAPIError(wrong_type_message.format(resource_id))
+
+    if resource_id is None and (name is None or name == ""):
+        raise PokeAPIError(empty_message)
+
+    if resource_id is not None:
+        if resource_id <= 0:
+            raise PokeAPIError(invalid_id_message.format(resource_id))
+        return str(resource_id)
+    return name
+
+
+def resolve_pokemon(pokemon_id: int = None, name: str = None) -> str:
+    """Validate Pokemon lookup arguments and return the ID or name to request."""
+    return resolve_id_or_name(
+        pokemon_id,
+        name,
+        ErrorMessages.POKEMON_ID_WRONG_TYPE,
+        ErrorMessages.EMPTY_POKEMON_ID,
+        ErrorMessages.INVALID_POKEMON_ID,
+    )
+
+
+def resolve_generation(generation_id: int = None, name: str = None) -> str:
+    """Validate Generation lookup arguments and return the ID or name to request."""
+    return resolve_id_or_name(
+        generation_id,
+        name,
+        ErrorMessages.GENERATION_ID_WRONG_TYPE,
+        ErrorMessages.EMPTY_GENERATION_ID,
+        ErrorMessages.INVALID_GENERATION_ID,
+    )
+
+
+def page_params(limit: int, offset: int) -> dict:
+    """
+    Validate pagination arguments and return them as query parameters.
+
+    Args:
+        limit (int): Number of resources to return
+        offset (int): Starting position in the list
+
+    Returns:
+        dict: Query parameters for a list request
+
+    Raises:
+        PokeAPIError: If limit or offset is negative.
+    """
+    if limit < 0:
+        raise PokeAPIError(ErrorMessages.INVALID_LIMIT)
+    if offset < 0:
+        raise PokeAPIError(ErrorMessages.INVALID_OFFSET)
+    return {'limit': limit, 'offset': offset}
+
+
+def resolve_fields(
+    model_cls, fields: Optional[Iterable[str]]
+) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a field projection once so it can be reused for many requests.
+
+    Args:
+        model_cls: The model the fields belong to
+        fields (Iterable[str]): Field names, a single name, or None for all
+
+    Returns:
+        Tuple[str, ...]: The field names, or None for all fields
+
+    Raises:
+        PokeAPIError: If a field does not exist on the model.
+    """
+    if fields is None:
+        return None
+    fields = (fields,) if isinstance(fields, str) else tuple(fields)
+    project(model_cls, fields)
+    return fields
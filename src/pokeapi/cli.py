@@ -0,0 +1,184 @@
+"""
+Command line interface of the PokeAPI SDK.
+Provides `pokeapi snapshot` and `pokeapi crawl` for writing local datasets
+and `pokeapi refresh` for bringing them up to date.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+from .constants import (
+    BASE_URL, BULK_MAX_WORKERS, CRAWL_BATCH_SIZE, CRAWL_THREADS, CRAWL_WORKERS,
+    DEFAULT_PAGE_SIZE, SNAPSHOT_ENDPOINTS,
+)
+from .exceptions import PokeAPIError
+
+
+def _snapshot(args: argparse.Namespace) -> int:
+    # Imported here so parsing arguments and --help stay fast
+    from .dataset.snapshot import snapshot
+    from .sdk.pokeapi import PokeAPI
+
+    def progress(endpoint: str, count: int) -> None:
+        if not args.quiet:
+            print(f"{endpoint}: {count}", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        with PokeAPI(base_url=args.base_url) as api:
+            counts = snapshot(
+                args.path, api, args.endpoints, args.page_size,
+                args.max_workers, progress,
+            )
+    except PokeAPIError as e:
+        print(f"pokeapi snapshot: {e.message}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    summary = ", ".join(
+        f"{count} {endpoint}" for endpoint, count in counts.items()
+    )
+    print(f"Wrote {summary} to {args.path} in {elapsed:.1f}s")
+    return 0
+
+
+def _crawl(args: argparse.Namespace) -> int:
+    from .dataset.crawler import crawl
+
+    def progress(stats) -> None:
+        if not args.quiet:
+            print(f"{stats.completed}/{stats.total} "
+                  f"({stats.rate:.1f} resources/s, "
+                  f"{stats.byte_rate / 1024:.0f} KiB/s)", file=sys.stderr)
+
+    try:
+        stats = crawl(
+            args.path, args.base_url, args.endpoints, args.workers,
+            args.threads, not args.no_processes, args.rate, args.batch_size,
+            args.page_size, progress=progress,
+        )
+    except PokeAPIError as e:
+        print(f"pokeapi crawl: {e.message} (rerun to resume)", file=sys.stderr)
+        return 1
+    summary = ", ".join(
+        f"{count} {endpoint}" for endpoint, count in stats.counts.items()
+    )
+    print(f"Wrote {summary} to {args.path} in {stats.elapsed:.1f}s "
+          f"({stats.fetched} fetched at {stats.rate:.1f}/s, "
+          f"{stats.resumed} resumed)")
+    return 0
+
+
+def _refresh(args: argparse.Namespace) -> int:
+    from .dataset.refresh import refresh
+    from .sdk.pokeapi import PokeAPI
+
+    def progress(endpoint: str, count: int) -> None:
+        if not args.quiet:
+            print(f"{endpoint}: {count} checked", file=sys.stderr)
+
+    try:
+        if args.base_url is None:
+            result = refresh(args.path, None, args.endpoints, args.relist,
+                             args.page_size, args.max_workers, progress)
+        else:
+            with PokeAPI(base_url=args.base_url) as api:
+                result = refresh(args.path, api, args.endpoints, args.relist,
+                                 args.page_size, args.max_workers, progress)
+    except PokeAPIError as e:
+        print(f"pokeapi refresh: {e.message}", file=sys.stderr)
+        return 1
+    # The change feed goes to stdout, one JSON object per line
+    for change in result.changes:
+        print(json.dumps(change.to_dict()))
+    print(f"Refreshed {args.path} in {result.elapsed:.1f}s: "
+          f"{len(result.changes)} changed, {result.checked} checked, "
+          f"{result.not_modified} not modified, {result.fetched} fetched",
+          file=sys.stderr)
+    return 0
+
+
+def _add_source_arguments(sub: argparse.ArgumentParser) -> None:
+    sub.add_argument("path", help="directory to write the dataset to")
+    sub.add_argument("--base-url", default=BASE_URL,
+                     help="API to crawl (default: %(default)s)")
+    sub.add_argument("--endpoints", nargs="+", metavar="ENDPOINT",
+                     default=list(SNAPSHOT_ENDPOINTS),
+                     help="endpoints to crawl (default: %(default)s)")
+    sub.add_argument("--quiet", action="store_true",
+                     help="do not report progress")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the `pokeapi` command."""
+    parser = argparse.ArgumentParser(
+        prog="pokeapi", description=__doc__.splitlines()[1]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sub = commands.add_parser(
+        "snapshot", help="download Pokemon and generations into a local dataset"
+    )
+    _add_source_arguments(sub)
+    sub.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                     help="resources listed and fetched per batch")
+    sub.add_argument("--max-workers", type=int, default=BULK_MAX_WORKERS,
+                     help="maximum number of concurrent requests")
+    sub.set_defaults(run=_snapshot)
+
+    sub = commands.add_parser(
+        "crawl", help="download a local dataset with parallel, resumable workers"
+    )
+    _add_source_arguments(sub)
+    sub.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                     help="resources listed per request")
+    sub.add_argument("--workers", type=int, default=CRAWL_WORKERS,
+                     help="worker processes (default: %(default)s)")
+    sub.add_argument("--threads", type=int, default=CRAWL_THREADS,
+                     help="concurrent requests per worker (default: %(default)s)")
+    sub.add_argument("--no-processes", action="store_true",
+                     help="run workers as threads of one process")
+    sub.add_argument("--rate", type=float,
+                     help="requests per second across all workers")
+    sub.add_argument("--batch-size", type=int, default=CRAWL_BATCH_SIZE,
+                     help="resources per checkpointed batch (default: %(default)s)")
+    sub.set_defaults(run=_crawl)
+
+    sub = commands.add_parser(
+        "refresh", help="update a local dataset in place, printing what changed"
+    )
+    sub.add_argument("path", help="directory of the dataset to refresh")
+    sub.add_argument("--base-url",
+                     help="API to refresh from (default: the dataset's source)")
+    sub.add_argument("--endpoints", nargs="+", metavar="ENDPOINT",
+                     help="endpoints to refresh (default: all in the dataset)")
+    sub.add_argument("--relist", action="store_true",
+                     help="walk every list even if its count is unchanged")
+    sub.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                     help="resources listed and revalidated per batch")
+    sub.add_argument("--max-workers", type=int, default=BULK_MAX_WORKERS,
+                     help="maximum number of concurrent requests")
+    sub.add_argument("--quiet", action="store_true",
+                     help="do not report progress")
+    sub.set_defaults(run=_refresh)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the `pokeapi` command.
+
+    Args:
+        argv (List[str], optional): Arguments without the program name.
+            Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status
+    """
+    args = build_parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,106 @@
 HTTP client implementations for making API requests.
 Provides base and GET-specific client functionality.
 """
-from .get import HttpGetClient
-from .base import BaseHttpClient
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ['HttpGetClient', 'BaseHttpClient'] 
\ No newline at end of file
+if TYPE_CHECKING:  # pragma: no cover
+    from .get import HttpGetClient
+    from .async_get import AsyncHttpGetClient
+    from .base import BaseHttpClient
+    from .cache import Cache, ResponseCache, CacheStats
+    from .disk_cache import DiskCache
+    from .transport import (
+        Transport, HttpTransport, ThrottledTransport, ResilientTransport,
+        HedgedTransport,
+    )
+    from .async_transport import (
+        AsyncTransport, AsyncHttpTransport, AsyncThrottledTransport,
+        AsyncResilientTransport, AsyncHedgedTransport,
+    )
+    from .decoders import JsonDecoder, StdlibJsonDecoder, OrjsonDecoder
+    from .singleflight import SingleFlight, AsyncSingleFlight
+    from .ratelimit import (
+        RateLimiter, TokenBucket, FileTokenBucket,
+        AdaptiveConcurrency, AsyncAdaptiveConcurrency,
+    )
+    from .resilience import RetryPolicy, HedgePolicy, CircuitBreaker
+    from .hooks import (
+        Hook, Hooks, LoggingHook, Event, RequestEvent, CacheEvent, ParseEvent,
+        RetryEvent,
+    )
+    from .metrics import MetricsCollector, Histogram
+    from .replay import (
+        ArchiveWriter, ResponseArchive, RecordingTransport, ReplayTransport,
+        AsyncRecordingTransport, AsyncReplayTransport,
+    )
+    from .streaming import JsonStream
+
+__all__ = [
+    'HttpGetClient', 'AsyncHttpGetClient', 'BaseHttpClient',
+    'Transport', 'HttpTransport', 'AsyncTransport', 'AsyncHttpTransport',
+    'Cache', 'ResponseCache', 'DiskCache', 'CacheStats',
+    'JsonDecoder', 'StdlibJsonDecoder', 'OrjsonDecoder',
+    'SingleFlight', 'AsyncSingleFlight',
+    'ThrottledTransport', 'AsyncThrottledTransport',
+    'RateLimiter', 'TokenBucket', 'FileTokenBucket',
+    'AdaptiveConcurrency', 'AsyncAdaptiveConcurrency',
+    'RetryPolicy', 'HedgePolicy', 'CircuitBreaker',
+    'ResilientTransport', 'AsyncResilientTransport',
+    'HedgedTransport', 'AsyncHedgedTransport',
+    'Hook', 'Hooks', 'LoggingHook', 'Event', 'RequestEvent', 'CacheEvent',
+    'ParseEvent', 'RetryEvent', 'MetricsCollector', 'Histogram',
+    'ArchiveWriter', 'ResponseArchive', 'RecordingTransport',
+    'ReplayTransport', 'AsyncRecordingTransport', 'AsyncReplayTransport',
+    'JsonStream',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'HttpGetClient': '.get',
+    'AsyncHttpGetClient': '.async_get',
+    'BaseHttpClient': '.base',
+    'Cache': '.cache',
+    'ResponseCache': '.cache',
+    'CacheStats': '.cache',
+    'DiskCache': '.disk_cache',
+    'Transport': '.transport',
+    'HttpTransport': '.transport',
+    'ThrottledTransport': '.transport',
+    'ResilientTransport': '.transport',
+    'HedgedTransport': '.transport',
+    'AsyncTransport': '.async_transport',
+    'AsyncHttpTransport': '.async_transport',
+    'AsyncThrottledTransport': '.async_transport',
+    'AsyncResilientTransport': '.async_transport',
+    'AsyncHedgedTransport': '.async_transport',
+    'JsonDecoder': '.decoders',
+    'StdlibJsonDecoder': '.decoders',
+    'OrjsonDecoder': '.decoders',
+    'SingleFlight': '.singleflight',
+    'AsyncSingleFlight': '.singleflight',
+    'RateLimiter': '.ratelimit',
+    'TokenBucket': '.ratelimit',
+    'FileTokenBucket': '.ratelimit',
+    'AdaptiveConcurrency': '.ratelimit',
+    'AsyncAdaptiveConcurrency': '.ratelimit',
+    'RetryPolicy': '.resilience',
+    'HedgePolicy': '.resilience',
+    'CircuitBreaker': '.resilience',
+    'Hook': '.hooks',
+    'Hooks': '.hooks',
+    'LoggingHook': '.hooks',
+    'Event': '.hooks',
+    'RequestEvent': '.hooks',
+    'CacheEvent': '.hooks',
+    'ParseEvent': '.hooks',
+    'RetryEvent': '.hooks',
+    'MetricsCollector': '.metrics',
+    'Histogram': '.metrics',
+    'ArchiveWriter': '.replay',
+    'ResponseArchive': '.replay',
+    'RecordingTransport': '.replay',
+    'ReplayTransport': '.replay',
+    'AsyncRecordingTransport': '.replay',
+    'AsyncReplayTransport': '.replay',
+    'JsonStream': '.streaming',
+})
@@ -0,0 +1,229 @@
+"""
+Asynchronous HTTP GET client implementation for the PokeAPI.
+Mirrors HttpGetClient with awaitable request execution.
+"""
+
+import time
+from typing import Optional, Union
+from .base import BaseHttpClient
+from .cache import Cache, CacheEntry
+from .decoders import JsonDecoder
+from .hooks import Hooks
+from .singleflight import AsyncSingleFlight
+from .get import HttpGetClient
+from .async_transport import (
+    AsyncTransport, AsyncHttpTransport, Timeout, TIMEOUT_ERRORS,
+    CONNECTION_ERRORS,
+)
+from ..constants import (
+    DEFAULT_HEADERS, MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+
+
+class AsyncHttpGetClient(BaseHttpClient):
+    """HTTP client implementation for making awaitable GET requests to the PokeAPI."""
+
+    def __init__(
+        self,
+        base_url: str,
+        transport: Optional[AsyncTransport] = None,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        """
+        Initialize the async GET client.
+
+        Args:
+            base_url (str): The base URL for all API requests
+            transport (AsyncTransport, optional): Shared transport to send
+                requests through. A private pooled transport is created if omitted.
+            cache (Cache, optional): Cache consulted before sending
+                requests. Caching is disabled if omitted.
+            model_mode (str, optional): "validated", "trusted" or "compact", see
+                `BaseHttpClient`
+            decoder (JsonDecoder, optional): JSON decoder for response bodies
+            single_flight (AsyncSingleFlight, optional): Coalesces identical
+                requests made concurrently. A private one is created if omitted.
+            timeout (Timeout, optional): Timeout of each request in seconds,
+                or a (connect, read) pair
+            hooks (Hooks, optional): Hooks receiving request, cache and
+                parse events
+        """
+        super().__init__(base_url, cache, model_mode, decoder, hooks)
+        self.timeout = timeout
+        self._owns_transport = transport is None
+        self.transport = (
+            transport if transport is not None else AsyncHttpTransport()
+        )
+        self.single_flight = (
+            single_flight if single_flight is not None else AsyncSingleFlight()
+        )
+
+    async def aclose(self) -> None:
+        """Close the transport if it was created by this client."""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def build_url(self, path: str, params: Union[str, dict]) -> str:
+        """
+        Build URL with the same rules as `HttpGetClient.build_url`.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Either resource ID/name as string or
+                query params as dict
+
+        Returns:
+            str: The complete URL
+
+        Raises:
+            PokeAPIError: If path is empty
+        """
+        return HttpGetClient.build_url(self, path, params)
+
+    async def request(self, method: str, path: str, params: Union[str, dict]):
+        """
+        Make an awaitable HTTP GET request.
+
+        Args:
+            method (str): Must be "GET"
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            PokeAPIError: For various error conditions including invalid method,
+                timeout, connection errors, etc.
+        """
+        if method.upper() != "GET":
+            raise PokeAPIError(ErrorMessages.INVALID_METHOD)
+
+        url = self.build_url(path, params)
+        return (await self._fetch(url, path)).response
+
+    async def _fetch(self, url: str, endpoint: str, model=None) -> CacheEntry:
+        """
+        Return the cache entry for a URL, sending the request on a miss.
+
+        An expired entry with validators is revalidated with a conditional
+        request rather than downloaded again.
+
+        Args:
+            url (str): The complete URL
+            endpoint (str): API endpoint path, used to pick the cache TTL
+            model (optional): The model the entry will be parsed into, or
+                None for the raw response
+
+        Returns:
+            CacheEntry: The cached or freshly fetched entry
+
+        Raises:
+            PokeAPIError: If the request fails, or on a miss in offline mode
+        """
+        entry = self._cache_lookup(url, endpoint, model)
+        if entry is not None:
+            return entry
+        if self.cache is not None and self.cache.offline:
+            raise PokeAPIError(ErrorMessages.OFFLINE_CACHE_MISS.format(url))
+
+        async def load() -> CacheEntry:
+            stale = self._stale_entry(url, model)
+            response = await self._send(
+                url, self._request_headers(stale), endpoint
+            )
+            return self._cache_store(url, endpoint, response, stale)
+
+        # Concurrent tasks missing the same URL share one request
+        entry = await self.single_flight.do(url, load)
+        if not entry.serves(model, self.model_mode):
+            # Joined a revalidation of an entry without the body needed here
+            entry = await load()
+        return entry
+
+    async def _send(self, url: str, headers: dict = DEFAULT_HEADERS,
+                    endpoint: Optional[str] = None):
+        """
+        Send the request through the transport and check the response.
+
+        Args:
+            url (str): The complete URL
+            headers (dict, optional): Request headers
+            endpoint (str, optional): API endpoint path, reported to hooks
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            PokeAPIError: For timeouts, connection errors and error statuses
+        """
+        start = time.perf_counter()
+        response = error = None
+        try:
+            response = await self.transport.send(
+                url, headers=headers, timeout=self.timeout
+            )
+            return self._handle_response(response)
+        except PokeAPIError as e:
+            error = e
+        except TIMEOUT_ERRORS:
+            error = PokeAPIError(ErrorMessages.TIMEOUT_ERROR)
+        except CONNECTION_ERRORS:
+            error = PokeAPIError(ErrorMessages.CONNECTION_ERROR)
+        except Exception as e:
+            error = PokeAPIError(ErrorMessages.NETWORK_ERROR.format(str(e)))
+        finally:
+            if self.hooks:
+                self._emit_request(url, endpoint, response,
+                                   time.perf_counter() - start, error)
+        raise error
+
+    async def get(self, path: str, params: Union[str, dict]):
+        """
+        Convenience method for making awaitable GET requests.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+
+        Returns:
+            The HTTP response
+        """
+        return await self.request("GET", path, params)
+
+    async def get_model(self, path: str, params: Union[str, dict], model):
+        """
+        Make an awaitable GET request and parse the response into a model.
+
+        With a cache, the parsed model is kept alongside the cached response
+        and shared by later lookups, so treat returned models as read-only.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+            model: The pydantic model class to build
+
+        Returns:
+            An instance of `model`, or of its trusted mirror in trusted mode
+
+        Raises:
+            ValueError: If the response is not valid JSON or fails validation
+        """
+        url = self.build_url(path, params)
+        entry = await self._fetch(url, path, model)
+        # Parsing does not yield, so tasks sharing the entry share its model
+        value = self._parse(entry, url, path, model)
+        self._canonicalize(url, path, value)
+        return value
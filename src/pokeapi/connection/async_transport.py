@@ -0,0 +1,389 @@
+"""
+Asynchronous transport implementations for sending HTTP requests.
+Provides a pooled httpx transport with a bounded number of in-flight requests.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+from urllib.parse import urlsplit
+from .ratelimit import AsyncAdaptiveConcurrency, RateLimiter, parse_retry_after
+from .hooks import Hook, RetryEvent
+from .resilience import CircuitBreaker, HedgePolicy, RetryPolicy
+from .transport import Timeout, is_congested
+from ..constants import (
+    DEFAULT_HEADERS, TIMEOUT, POOL_MAXSIZE, MAX_CONCURRENCY,
+    RATE_LIMIT_BACKOFF, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+# Exceptions raised by the transport, grouped the way the client reports them
+TIMEOUT_ERRORS = (httpx.TimeoutException,) if httpx is not None else ()
+CONNECTION_ERRORS = (httpx.TransportError,) if httpx is not None else ()
+RETRY_ERRORS = TIMEOUT_ERRORS + CONNECTION_ERRORS
+
+
+def httpx_timeout(timeout: Timeout):
+    """Convert a timeout or (connect, read) pair to an `httpx.Timeout`."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+class AsyncTransport(ABC):
+    """Base abstract class for transports that send GET requests asynchronously."""
+
+    @abstractmethod
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release any resources held by the transport."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+class AsyncHttpTransport(AsyncTransport):
+    """
+    Transport backed by a pooled `httpx.AsyncClient`.
+
+    At most `max_concurrency` requests are in flight at once; further
+    requests wait on a semaphore instead of opening more connections.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        pool_maxsize: int = POOL_MAXSIZE,
+        keep_alive: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            max_concurrency (int, optional): Maximum number of requests in
+                flight at once
+            pool_maxsize (int, optional): Maximum number of open connections
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests
+
+        Raises:
+            PokeAPIError: If httpx is not installed or the concurrency limit
+                is not positive
+        """
+        if httpx is None:
+            raise PokeAPIError(ErrorMessages.ASYNC_DEPENDENCY_MISSING)
+        if max_concurrency <= 0:
+            raise PokeAPIError(ErrorMessages.INVALID_CONCURRENCY)
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+        self.client = httpx.AsyncClient(headers=DEFAULT_HEADERS, limits=limits)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request once a concurrency slot is available.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            httpx.Response: The HTTP response
+        """
+        async with self._get_semaphore():
+            return await self.client.get(
+                url, headers=headers, timeout=httpx_timeout(timeout)
+            )
+
+    async def aclose(self) -> None:
+        """Close the client and every pooled connection."""
+        await self.client.aclose()
+
+
+class AsyncThrottledTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `ThrottledTransport`.
+
+    Waiting for a token or a concurrency slot suspends the task without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AsyncAdaptiveConcurrency] = None,
+        backoff: float = RATE_LIMIT_BACKOFF,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (AsyncTransport): Transport that sends the requests
+            rate_limiter (RateLimiter, optional): Limiter spacing requests
+            concurrency (AsyncAdaptiveConcurrency, optional): Limit on
+                requests in flight
+            backoff (float, optional): Pause after a 429 response without
+                a Retry-After header, in seconds
+        """
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.backoff = backoff
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request once the limits allow it.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+        start = time.perf_counter()
+        congested = True
+        try:
+            response = await self.transport.send(
+                url, headers=headers, timeout=timeout
+            )
+            congested = is_congested(response.status_code)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.rate_limiter.pause(
+                    retry_after if retry_after is not None else self.backoff
+                )
+            return response
+        except asyncio.CancelledError:
+            # An abandoned request says nothing about the server's health
+            congested = False
+            raise
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release(time.perf_counter() - start, congested)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+class AsyncResilientTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `ResilientTransport`.
+
+    Backoff waits suspend the task without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hooks: Optional[Hook] = None,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (AsyncTransport): Transport that sends the requests
+            retry_policy (RetryPolicy, optional): When to send requests
+                again. Requests are sent once if omitted.
+            circuit_breaker (CircuitBreaker, optional): Breaker consulted
+                before, and updated after, every attempt
+            hooks (Hook, optional): Hook receiving a `RetryEvent` per retry
+        """
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hooks = hooks
+        self.retries = 0
+
+    async def _attempt(self, url: str, host: str, headers: Optional[dict],
+                       timeout: Timeout):
+        if self.circuit_breaker is None:
+            return await self.transport.send(url, headers=headers, timeout=timeout)
+        self.circuit_breaker.allow(host)
+        try:
+            response = await self.transport.send(
+                url, headers=headers, timeout=timeout
+            )
+        except RETRY_ERRORS:
+            self.circuit_breaker.record(host, True)
+            raise
+        except BaseException:
+            # Includes cancellation, which says nothing about the host
+            self.circuit_breaker.abandon(host)
+            raise
+        self.circuit_breaker.record(host, response.status_code >= 500)
+        return response
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request, retrying it as the policy allows.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Timeout of each attempt
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._attempt(url, host, headers, timeout)
+            except RETRY_ERRORS as e:
+                delay = (self.retry_policy.next_delay(attempt)
+                         if self.retry_policy is not None else None)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                if (self.retry_policy is None
+                        or not self.retry_policy.retries_status(response.status_code)):
+                    return response
+                delay = self.retry_policy.next_delay(
+                    attempt, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                if delay is None:
+                    return response
+                reason = str(response.status_code)
+            self.retries += 1
+            if self.hooks:
+                self.hooks.on_retry(RetryEvent(url, attempt, delay, reason))
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+class AsyncHedgedTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `HedgedTransport`.
+
+    Copies run as tasks on the event loop and the losing copy is cancelled
+    as soon as a response is chosen.
+    """
+
+    def __init__(self, transport: AsyncTransport,
+                 hedge_policy: Optional[HedgePolicy] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (AsyncTransport): Transport that sends the requests
+            hedge_policy (HedgePolicy, optional): When to send the second
+                copy. Defaults to an adaptive 95th percentile delay.
+        """
+        self.transport = transport
+        self.hedge_policy = hedge_policy if hedge_policy is not None else HedgePolicy()
+
+    async def _timed(self, url: str, headers: Optional[dict], timeout: Timeout):
+        start = time.perf_counter()
+        response = await self.transport.send(url, headers=headers, timeout=timeout)
+        self.hedge_policy.record(time.perf_counter() - start)
+        return response
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request, hedging it if it is slow to answer.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Timeout of each copy
+
+        Returns:
+            The first successful HTTP response
+        """
+        delay = self.hedge_policy.hedge_delay()
+        if delay is None:
+            return await self._timed(url, headers, timeout)
+
+        primary = asyncio.ensure_future(self._timed(url, headers, timeout))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            hedge = asyncio.ensure_future(self._timed(url, headers, timeout))
+            tasks.append(hedge)
+
+            pending = set(tasks)
+            fallback = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        self.hedge_policy.record_hedge(task is hedge)
+                        return task.result()
+                    if fallback is None:
+                        fallback = task
+            self.hedge_policy.record_hedge(False)
+            return fallback.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
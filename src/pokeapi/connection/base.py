@@ -3,23 +3,181 @@ Base HTTP client functionality for making API requests.
 Provides abstract base classes and common error handling.
 """
 
+import time
 import requests
-from typing import Union
+from typing import Optional, Union
 from abc import ABC, abstractmethod
-from ..constants import ErrorMessages
-from ..exceptions import PokeAPIError
+from .cache import Cache, CacheEntry
+from .decoders import JsonDecoder, default_decoder
+from .hooks import CacheEvent, Hooks, ParseEvent, RequestEvent
+from .ratelimit import parse_retry_after
+from ..models.projection import is_projection
+from ..constants import (
+    DEFAULT_HEADERS, MODEL_MODE_VALIDATED, MODEL_MODES, ErrorMessages,
+)
+from ..exceptions import PokeAPIError, RateLimitError
 
 class BaseHttpClient(ABC):
     """Base abstract class for HTTP clients with common functionality."""
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        hooks: Optional[Hooks] = None,
+    ):
         """
         Initialize the HTTP client.
 
         Args:
             base_url (str): The base URL for all API requests
+            cache (Cache, optional): Cache consulted before sending
+                requests. Caching is disabled if omitted.
+            model_mode (str, optional): "validated" to return validated
+                pydantic models, "trusted" to return their faster,
+                unvalidated slotted mirrors, or "compact" to return frozen
+                mirrors sharing repeated nested values
+            decoder (JsonDecoder, optional): JSON decoder for response
+                bodies. Defaults to orjson if installed, else the stdlib.
+            hooks (Hooks, optional): Hooks receiving request, cache and
+                parse events. Share one between clients to observe them all.
+
+        Raises:
+            PokeAPIError: If model_mode is unknown
         """
+        if model_mode not in MODEL_MODES:
+            raise PokeAPIError(
+                ErrorMessages.INVALID_MODEL_MODE.format(", ".join(MODEL_MODES))
+            )
         self.base_url = base_url
+        self.cache = cache
+        self.model_mode = model_mode
+        self.decoder = decoder if decoder is not None else default_decoder()
+        self.hooks = hooks if hooks is not None else Hooks()
+
+    def _cache_lookup(self, url: str, endpoint: Optional[str] = None,
+                      model=None) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for a URL, if caching is enabled.
+
+        An entry whose body was dropped only answers lookups for the models
+        it holds; `model` is None when the raw response is wanted.
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(url)
+        if entry is not None and not entry.serves(model, self.model_mode):
+            entry = None
+        if self.hooks:
+            self.hooks.on_cache(CacheEvent(url, endpoint, entry is not None))
+        return entry
+
+    def _parse(self, entry: CacheEntry, url: str, endpoint: str, model):
+        """
+        Parse an entry into a model, timing the parse for the hooks.
+
+        Once an entry has only been read through one projection, the cache
+        keeps the projected model and the validators but not the body.
+        """
+        if not self.hooks or (model, self.model_mode) in entry.models:
+            value = entry.model(model, self.model_mode, self.decoder)
+        else:
+            start = time.perf_counter()
+            value = entry.model(model, self.model_mode, self.decoder)
+            self.hooks.on_parse(ParseEvent(
+                url, endpoint, model.__name__, self.model_mode,
+                time.perf_counter() - start,
+            ))
+        if (self.cache is not None and entry.has_body and is_projection(model)
+                and entry.models.keys() == {(model, self.model_mode)}):
+            self.cache.replace(url, entry, entry.without_body())
+        return value
+
+    def _emit_request(self, url: str, endpoint: Optional[str], response,
+                      elapsed: float, error: Optional[Exception],
+                      streamed: bool = False) -> None:
+        """
+        Send a request event to the hooks.
+
+        The body of a streamed response is not read here; its size is taken
+        from the Content-Length header, or 0 if the server sent none.
+        """
+        status = time_to_headers = None
+        size = 0
+        if response is not None:
+            status = response.status_code
+            if streamed:
+                size = int(response.headers.get("Content-Length") or 0)
+            else:
+                size = len(response.content)
+            if isinstance(response, requests.Response):
+                # requests stops this clock once the headers are parsed
+                time_to_headers = response.elapsed.total_seconds()
+        message = getattr(error, "message", None) or (
+            str(error) if error is not None else None
+        )
+        self.hooks.on_request(RequestEvent(
+            url, endpoint, status, elapsed, time_to_headers, size, message
+        ))
+
+    def _stale_entry(self, url: str, model=None) -> Optional[CacheEntry]:
+        """
+        Return an expired cache entry that can be revalidated, if any.
+
+        An entry that cannot serve `model`, or the raw response if `model`
+        is None, is not revalidated but replaced.
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get_stale(url)
+        if entry is not None and not entry.serves(model, self.model_mode):
+            return None
+        return entry
+
+    def _request_headers(self, stale: Optional[CacheEntry]) -> dict:
+        """Return the request headers, conditional if a stale entry exists."""
+        if stale is None:
+            return DEFAULT_HEADERS
+        return {**DEFAULT_HEADERS, **stale.conditional_headers()}
+
+    def _cache_store(
+        self, url: str, endpoint: str, response,
+        stale: Optional[CacheEntry] = None,
+    ) -> CacheEntry:
+        """
+        Wrap a response in an entry, storing it if caching is enabled.
+
+        A 304 response refreshes the stale entry instead, keeping its body
+        and parsed models.
+
+        Raises:
+            PokeAPIError: If the server answered 304 to an unconditional request
+        """
+        if response.status_code == 304:
+            if stale is None:
+                raise PokeAPIError(ErrorMessages.UNEXPECTED_NOT_MODIFIED)
+            return self.cache.refresh(url, stale, response, endpoint)
+        if self.cache is None:
+            return CacheEntry(response)
+        return self.cache.set(url, response, endpoint)
+
+    def _canonicalize(self, url: str, path: str, value) -> None:
+        """
+        Alias the requested URL and the resource's name URL to its ID URL.
+
+        Makes `get_pokemon(25)` and `get_pokemon(name="pikachu")` share one
+        cache entry once the ID is known.
+        """
+        resource_id = getattr(value, 'id', None)
+        if self.cache is None or not isinstance(resource_id, int):
+            return
+        canonical_url = self.build_url(path, str(resource_id))
+        self.cache.alias(url, canonical_url)
+        name = getattr(value, 'name', None)
+        if name:
+            self.cache.alias(self.build_url(path, name), canonical_url)
 
     def _handle_response(self, response: requests.Response) -> requests.Response:
         """
@@ -29,11 +187,20 @@ class BaseHttpClient(ABC):
             response: The HTTP response object
 
         Returns:
-            The response if successful
+            The response if successful or 304 Not Modified
 
         Raises:
+            RateLimitError: For 429 Too Many Requests, with the delay the
+                server asked for in `retry_after`
             PokeAPIError: For various HTTP error conditions
         """
+        if response.status_code == 304:
+            return response
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise RateLimitError(
+                ErrorMessages.RATE_LIMITED.format(retry_after), retry_after
+            )
         try:
             response.raise_for_status()
             return response
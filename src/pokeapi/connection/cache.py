@@ -0,0 +1,534 @@
+"""
+Response caches for the PokeAPI clients.
+Provides the cache interface and a thread-safe in-memory LRU cache with
+per-endpoint TTLs keyed by resource URL.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..constants import CACHE_MAXSIZE, CACHE_TTL, MODEL_MODE_VALIDATED
+from ..models.trusted import parse_model
+from .decoders import JsonDecoder, default_decoder
+from .responses import build_response
+
+# Headers a 304 response may update on the stored response
+_REVALIDATION_HEADERS = ("ETag", "Last-Modified", "Cache-Control", "Date")
+# Response headers identifying a revision, and the request headers sending them back
+_VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+def validators(headers) -> Dict[str, str]:
+    """
+    Return the validators of a response, to revalidate it later.
+
+    Args:
+        headers: The response headers
+
+    Returns:
+        Dict[str, str]: The `ETag` and `Last-Modified` headers present
+    """
+    return {name: headers[name] for name in _VALIDATOR_HEADERS if headers.get(name)}
+
+
+def conditional_headers(headers) -> Dict[str, str]:
+    """
+    Build the headers that ask the server whether a response changed.
+
+    Args:
+        headers: The response headers, or validators returned by `validators`
+
+    Returns:
+        dict: `If-None-Match` and/or `If-Modified-Since` headers, or an
+            empty dict if there are no validators
+    """
+    return {
+        request_header: headers[name]
+        for name, request_header in _VALIDATOR_HEADERS.items()
+        if headers.get(name)
+    }
+
+
+class CacheEntry:
+    """A cached response together with the models already parsed from it."""
+
+    __slots__ = ('response', 'expires_at', 'models', 'has_body')
+
+    def __init__(self, response, expires_at: Optional[float] = None,
+                 has_body: bool = True):
+        """
+        Initialize the entry.
+
+        Args:
+            response: The HTTP response
+            expires_at (float, optional): Monotonic time after which the entry
+                is stale, or None if it never expires
+            has_body (bool, optional): False if the response body was
+                dropped and only the parsed models can be served
+        """
+        self.response = response
+        self.expires_at = expires_at
+        self.models = {}
+        self.has_body = has_body
+
+    def serves(self, model_cls=None, mode: str = MODEL_MODE_VALIDATED) -> bool:
+        """
+        Whether the entry can answer a lookup.
+
+        Args:
+            model_cls: The model class wanted, or None for the raw response
+            mode (str, optional): The model mode wanted
+
+        Returns:
+            bool: True if the entry has its body or already holds the model
+        """
+        return self.has_body or (
+            model_cls is not None and (model_cls, mode) in self.models
+        )
+
+    def without_body(self) -> "CacheEntry":
+        """
+        Return a copy holding only the parsed models and validators.
+
+        Used for entries only read through projections, so the cache does
+        not retain the full body for a few fields. The entry itself is left
+        untouched for threads still reading it.
+
+        Returns:
+            CacheEntry: An entry with an empty body and the same models
+        """
+        headers = self.response.headers
+        response = build_response(
+            self.response.url, self.response.status_code,
+            {name: headers[name] for name in _REVALIDATION_HEADERS
+             if name in headers},
+            b"",
+        )
+        entry = CacheEntry(response, self.expires_at, has_body=False)
+        entry.models = dict(self.models)
+        return entry
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry has not yet expired."""
+        if self.expires_at is None:
+            return True
+        return (time.monotonic() if now is None else now) < self.expires_at
+
+    def conditional_headers(self) -> dict:
+        """
+        Build the headers that revalidate this entry with the server.
+
+        Returns:
+            dict: `If-None-Match` and/or `If-Modified-Since` headers, or an
+                empty dict if the response carried no validators
+        """
+        return conditional_headers(self.response.headers)
+
+    def revalidate(self, not_modified, ttl: Optional[float]) -> None:
+        """
+        Extend the entry after the server answered 304 Not Modified.
+
+        The stored body and parsed models are kept; only validators sent
+        with the 304 response replace the stored ones.
+
+        Args:
+            not_modified: The 304 response
+            ttl (float, optional): New lifetime in seconds, or None
+        """
+        for name in _REVALIDATION_HEADERS:
+            value = not_modified.headers.get(name)
+            if value:
+                self.response.headers[name] = value
+        self.expires_at = time.monotonic() + ttl if ttl is not None else None
+
+    def model(
+        self, model_cls, mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+    ):
+        """
+        Parse the response into `model_cls`, reusing an earlier parse.
+
+        Args:
+            model_cls: The pydantic model class to build
+            mode (str, optional): "validated", "trusted" or "compact", see
+                `parse_model`
+            decoder (JsonDecoder, optional): Decoder for bodies not parsed by
+                pydantic directly. Defaults to the fastest available one.
+
+        Returns:
+            An instance of `model_cls`, or of its trusted or compact mirror
+
+        Raises:
+            ValueError: If the body is not valid JSON or fails validation
+            LookupError: If the body was dropped and the model is not held
+        """
+        key = (model_cls, mode)
+        value = self.models.get(key)
+        if value is None:
+            if not self.has_body:
+                raise LookupError(f"{model_cls.__name__} was not kept")
+            decoder = decoder if decoder is not None else default_decoder()
+            value = parse_model(
+                model_cls, self.response.content, mode, decoder.loads
+            )
+            self.models[key] = value
+        return value
+
+
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    __slots__ = ('hits', 'misses', 'evictions', 'size', 'revalidations')
+
+    def __init__(self, hits: int, misses: int, evictions: int, size: int,
+                 revalidations: int = 0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.revalidations = revalidations
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, size={self.size}, "
+            f"revalidations={self.revalidations})"
+        )
+
+
+class Cache(ABC):
+    """
+    Base abstract class for response caches used by the HTTP clients.
+
+    Expired entries that carry an ETag or Last-Modified validator are kept,
+    so clients can revalidate them with a conditional request instead of
+    downloading the body again. In offline mode clients never send requests;
+    expired entries are served and a cache miss is an error.
+    """
+
+    offline = False
+
+    def __init__(
+        self,
+        ttl: Optional[float] = CACHE_TTL,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """
+        Initialize the TTL settings shared by every cache.
+
+        Args:
+            ttl (float, optional): Default lifetime of an entry in seconds,
+                or None to keep entries until evicted
+            endpoint_ttls (dict, optional): Lifetimes overriding `ttl` for
+                specific endpoint paths such as "/pokemon"
+        """
+        self.ttl = ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+
+    def ttl_for(self, endpoint: Optional[str]) -> Optional[float]:
+        """Return the lifetime used for entries of an endpoint path."""
+        return self.endpoint_ttls.get(endpoint, self.ttl)
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None on a miss or if it expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, url: str, response, endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Store a response.
+
+        Args:
+            url (str): The requested URL
+            response: The HTTP response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The stored entry
+        """
+        pass
+
+    @abstractmethod
+    def get_stale(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry regardless of expiry, without counting a lookup.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None if nothing is stored
+        """
+        pass
+
+    @abstractmethod
+    def refresh(self, url: str, entry: CacheEntry, not_modified,
+                endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Keep a stale entry after the server confirmed it is unchanged.
+
+        Args:
+            url (str): The requested URL
+            entry (CacheEntry): The stale entry that was revalidated
+            not_modified: The 304 response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The refreshed entry
+        """
+        pass
+
+    @abstractmethod
+    def alias(self, url: str, canonical_url: str) -> None:
+        """
+        Make `url` resolve to the entry stored under `canonical_url`.
+
+        Args:
+            url (str): An alternative URL for the resource
+            canonical_url (str): The URL the entry is stored under
+        """
+        pass
+
+    def replace(self, url: str, entry: CacheEntry, new: CacheEntry) -> None:
+        """
+        Swap a stored entry for a lighter copy of it.
+
+        Nothing is done if `entry` is no longer the entry stored for `url`.
+        Caches that do not keep entries in memory ignore the call.
+
+        Args:
+            url (str): The requested URL
+            entry (CacheEntry): The entry expected to be stored
+            new (CacheEntry): The entry to store in its place
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry and alias and reset the counters."""
+        pass
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Current hit, miss and eviction counters."""
+        pass
+
+
+class ResponseCache(Cache):
+    """
+    Size-bounded LRU cache of responses keyed by canonical resource URL.
+
+    Several URLs can point at one entry through aliases, so a Pokemon fetched
+    by ID is also found when requested by name and vice versa.
+
+    Usage:
+        cache = ResponseCache(maxsize=2048, endpoint_ttls={"/pokemon": 3600})
+        api = PokeAPI(cache=cache)
+        api.get_pokemon(25)
+        api.get_pokemon(name="pikachu")  # Served from the cache
+        print(cache.stats)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = CACHE_MAXSIZE,
+        ttl: Optional[float] = CACHE_TTL,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries kept
+            ttl (float, optional): Default lifetime of an entry in seconds,
+                or None to keep entries until evicted
+            endpoint_ttls (dict, optional): Lifetimes overriding `ttl` for
+                specific endpoint paths such as "/pokemon"
+        """
+        super().__init__(ttl, endpoint_ttls)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._aliases = {}
+        self._aliases_by_key = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry and mark it as recently used.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None on a miss or if it expired
+        """
+        with self._lock:
+            key = self._aliases.get(url, url)
+            entry = self._entries.get(key)
+            if entry is not None and not self.offline and not entry.is_fresh():
+                # Keep expired entries that can still be revalidated
+                if not entry.conditional_headers():
+                    self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def get_stale(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry regardless of expiry, without counting a lookup.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None if nothing is stored
+        """
+        with self._lock:
+            return self._entries.get(self._aliases.get(url, url))
+
+    def refresh(self, url: str, entry: CacheEntry, not_modified,
+                endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Keep a stale entry after the server confirmed it is unchanged.
+
+        The entry keeps its parsed models, so no re-parse is needed.
+
+        Args:
+            url (str): The requested URL
+            entry (CacheEntry): The stale entry that was revalidated
+            not_modified: The 304 response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The refreshed entry
+        """
+        entry.revalidate(not_modified, self.ttl_for(endpoint))
+        with self._lock:
+            self._revalidations += 1
+            self._insert(self._aliases.get(url, url), entry)
+        return entry
+
+    def set(self, url: str, response, endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Store a response, evicting the least recently used entries if full.
+
+        Args:
+            url (str): The requested URL
+            response: The HTTP response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The stored entry
+        """
+        ttl = self.ttl_for(endpoint)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        entry = CacheEntry(response, expires_at)
+        with self._lock:
+            self._insert(self._aliases.get(url, url), entry)
+        return entry
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def alias(self, url: str, canonical_url: str) -> None:
+        """
+        Make `url` resolve to the entry stored under `canonical_url`.
+
+        If only `url` has an entry, it is moved to `canonical_url`.
+
+        Args:
+            url (str): An alternative URL for the resource
+            canonical_url (str): The URL the entry is stored under
+        """
+        if url == canonical_url:
+            return
+        with self._lock:
+            if self._aliases.get(url) == canonical_url:
+                return
+            entry = self._entries.pop(url, None)
+            if entry is not None and canonical_url not in self._entries:
+                self._entries[canonical_url] = entry
+            if canonical_url in self._entries:
+                aliases = self._aliases_by_key.setdefault(canonical_url, set())
+                for alias in self._aliases_by_key.pop(url, set()) | {url}:
+                    self._aliases[alias] = canonical_url
+                    aliases.add(alias)
+
+    def replace(self, url: str, entry: CacheEntry, new: CacheEntry) -> None:
+        """
+        Swap a stored entry for a lighter copy of it.
+
+        Nothing is done if `entry` is no longer the entry stored for `url`.
+        The entry keeps its place in the LRU order.
+
+        Args:
+            url (str): The requested URL
+            entry (CacheEntry): The entry expected to be stored
+            new (CacheEntry): The entry to store in its place
+        """
+        with self._lock:
+            key = self._aliases.get(url, url)
+            if self._entries.get(key) is entry:
+                self._entries[key] = new
+
+    def clear(self) -> None:
+        """Remove every entry and alias and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._aliases_by_key.clear()
+            self._hits = self._misses = self._evictions = 0
+            self._revalidations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries),
+                self._revalidations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._aliases.get(url, url) in self._entries
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        for alias in self._aliases_by_key.pop(key, ()):
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
@@ -0,0 +1,87 @@
+"""
+JSON decoders turning raw response bodies into Python objects.
+Provides the decoder interface, a stdlib decoder and a faster orjson decoder.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonDecoder(ABC):
+    """
+    Base abstract class for decoders parsing response bodies.
+
+    Decoders are used where the body must become plain Python objects:
+    trusted models and resources without a model. Validated models are
+    parsed from the bytes by pydantic directly.
+    """
+
+    name = None
+
+    @abstractmethod
+    def loads(self, content: bytes):
+        """
+        Parse a JSON document.
+
+        Args:
+            content (bytes): The raw response body
+
+        Returns:
+            The parsed document
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+
+
+class StdlibJsonDecoder(JsonDecoder):
+    """Decoder using the standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, content: bytes):
+        return json.loads(content)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    Decoder using orjson, which parses bytes without decoding them to `str`
+    first and is about twice as fast as the standard library.
+
+    Requires the optional dependency: pip install pokeapi-sdk[fast]
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Initialize the decoder.
+
+        Raises:
+            PokeAPIError: If orjson is not installed
+        """
+        if orjson is None:
+            raise PokeAPIError(ErrorMessages.JSON_BACKEND_MISSING)
+
+    def loads(self, content: bytes):
+        return orjson.loads(content)
+
+
+def default_decoder() -> JsonDecoder:
+    """
+    Return the fastest available decoder.
+
+    Returns:
+        JsonDecoder: An OrjsonDecoder if orjson is installed, otherwise a
+            StdlibJsonDecoder
+    """
+    if orjson is not None:
+        return OrjsonDecoder()
+    return StdlibJsonDecoder()
@@ -0,0 +1,393 @@
+"""
+Persistent response cache for the PokeAPI clients.
+Stores raw response bodies in SQLite so fetched data survives restarts.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from .cache import Cache, CacheEntry, CacheStats
+from .responses import build_response, storable_headers
+from ..constants import (
+    CACHE_TTL, DISK_CACHE_MAX_BYTES, DISK_CACHE_TOUCH_INTERVAL, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS aliases (
+    url TEXT PRIMARY KEY,
+    canonical TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS aliases_canonical ON aliases (canonical);
+"""
+
+
+class DiskCache(Cache):
+    """
+    SQLite-backed cache of raw response bodies keyed by URL.
+
+    The database runs in WAL mode, so any number of threads and processes
+    can read while one writes. Hits only read: the access time used for
+    eviction is recorded at most once per `touch_interval`, and aliases
+    are only written when new. When the stored bodies exceed `max_bytes`,
+    the least recently used entries are deleted.
+
+    Usage:
+        cache = DiskCache("~/.cache/pokeapi.sqlite")
+        api = PokeAPI(cache=cache)
+
+        # Serve only what was cached earlier, never touching the network
+        api = PokeAPI(cache=DiskCache("~/.cache/pokeapi.sqlite", offline=True))
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = DISK_CACHE_MAX_BYTES,
+        ttl: Optional[float] = CACHE_TTL,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None,
+        offline: bool = False,
+        touch_interval: float = DISK_CACHE_TOUCH_INTERVAL,
+    ):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path (str): Path of the SQLite database file
+            max_bytes (int, optional): Maximum total size of stored bodies,
+                or None for no limit
+            ttl (float, optional): Default lifetime of an entry in seconds,
+                or None to keep entries until evicted
+            endpoint_ttls (dict, optional): Lifetimes overriding `ttl` for
+                specific endpoint paths such as "/pokemon"
+            offline (bool, optional): Serve only cached entries, including
+                expired ones, and never send requests. Hits then never
+                write, so the database may be shared read-only.
+            touch_interval (float, optional): Seconds after which a hit
+                records its access time again, bounding how stale the
+                least recently used order may be
+
+        Raises:
+            PokeAPIError: If the database cannot be opened
+        """
+        super().__init__(ttl, endpoint_ttls)
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+        with self._errors():
+            self._connect().executescript(_SCHEMA)
+
+    @staticmethod
+    @contextmanager
+    def _errors() -> Iterator[None]:
+        # Reports database failures, such as a locked or unwritable file,
+        # like every other cache and network error
+        try:
+            yield
+        except sqlite3.Error as e:
+            raise PokeAPIError(ErrorMessages.DISK_CACHE_ERROR.format(e))
+
+    def _connect(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared between threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            with self._errors():
+                connection = sqlite3.connect(
+                    self.path, timeout=30, isolation_level=None
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _select(self, url: str):
+        return self._connect().execute(
+            "SELECT url, status, headers, body, expires_at, accessed_at FROM responses "
+            "WHERE url = COALESCE("
+            "(SELECT canonical FROM aliases WHERE url = ?), ?)",
+            (url, url),
+        ).fetchone()
+
+    def _entry(self, row, now: float) -> CacheEntry:
+        key, status, headers, body, expires_at, _ = row
+        response = build_response(key, status, json.loads(headers), body)
+        if expires_at is None:
+            return CacheEntry(response)
+        # Entries carry monotonic deadlines; convert from wall-clock time
+        return CacheEntry(response, time.monotonic() + (expires_at - now))
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry, ignoring expiry in offline mode.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None on a miss or if it expired
+
+        Raises:
+            PokeAPIError: If the database cannot be read
+        """
+        with self._errors():
+            row = self._select(url)
+            now = time.time()
+            if row is None or (
+                not self.offline and row[4] is not None and row[4] <= now
+            ):
+                self._count('_misses')
+                return None
+
+            if not self.offline and now - row[5] >= self.touch_interval:
+                self._connect().execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                    (now, row[0]),
+                )
+        self._count('_hits')
+        return self._entry(row, now)
+
+    def get_stale(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry regardless of expiry, without counting a lookup.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            CacheEntry: The entry, or None if nothing is stored
+        """
+        with self._errors():
+            row = self._select(url)
+        return self._entry(row, time.time()) if row is not None else None
+
+    def refresh(self, url: str, entry: CacheEntry, not_modified,
+                endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Keep a stale entry after the server confirmed it is unchanged.
+
+        Only the expiry and validators are updated; the body is not rewritten.
+
+        Args:
+            url (str): The requested URL
+            entry (CacheEntry): The stale entry that was revalidated
+            not_modified: The 304 response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The refreshed entry
+        """
+        ttl = self.ttl_for(endpoint)
+        entry.revalidate(not_modified, ttl)
+        now = time.time()
+        with self._errors():
+            updated = self._connect().execute(
+                "UPDATE responses SET headers = ?, expires_at = ?, accessed_at = ? "
+                "WHERE url = ?",
+                (json.dumps(storable_headers(entry.response.headers)),
+                 now + ttl if ttl is not None else None, now,
+                 entry.response.url),
+            ).rowcount
+        if not updated:
+            # Evicted by another writer while the request was in flight
+            self.set(url, entry.response, endpoint)
+        self._count('_revalidations')
+        return entry
+
+    def set(self, url: str, response, endpoint: Optional[str] = None) -> CacheEntry:
+        """
+        Store a response body, evicting the least recently used entries if
+        the size limit is exceeded.
+
+        Args:
+            url (str): The requested URL
+            response: The HTTP response
+            endpoint (str, optional): Endpoint path used to pick the TTL
+
+        Returns:
+            CacheEntry: The stored entry
+
+        Raises:
+            PokeAPIError: If the database cannot be written
+        """
+        ttl = self.ttl_for(endpoint)
+        now = time.time()
+        body = response.content
+        headers = json.dumps(storable_headers(response.headers))
+
+        with self._errors():
+            self._store(url, response.status_code, headers, body, ttl, now)
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        return CacheEntry(response, expires_at)
+
+    def _store(self, url: str, status: int, headers: str, body: bytes,
+               ttl: Optional[float], now: float) -> None:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            key = connection.execute(
+                "SELECT canonical FROM aliases WHERE url = ?", (url,)
+            ).fetchone()
+            key = key[0] if key is not None else url
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, headers, body, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, status, headers, body, len(body),
+                 now + ttl if ttl is not None else None, now),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self.max_bytes is None:
+            return
+        total = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        while total > self.max_bytes:
+            row = connection.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._delete(connection, row[0])
+            self._count('_evictions')
+            total -= row[1]
+
+    def _delete(self, connection: sqlite3.Connection, key: str) -> None:
+        connection.execute("DELETE FROM responses WHERE url = ?", (key,))
+        connection.execute("DELETE FROM aliases WHERE canonical = ?", (key,))
+
+    def alias(self, url: str, canonical_url: str) -> None:
+        """
+        Make `url` resolve to the entry stored under `canonical_url`.
+
+        If only `url` has an entry, it is moved to `canonical_url`.
+
+        Args:
+            url (str): An alternative URL for the resource
+            canonical_url (str): The URL the entry is stored under
+
+        Raises:
+            PokeAPIError: If the database cannot be written
+        """
+        if url == canonical_url:
+            return
+        with self._errors():
+            connection = self._connect()
+            # Known aliases, the common case on every hit, need no write lock
+            known = connection.execute(
+                "SELECT canonical FROM aliases WHERE url = ?", (url,)
+            ).fetchone()
+            if known is not None and known[0] == canonical_url:
+                return
+            self._move(connection, url, canonical_url)
+
+    def _move(self, connection: sqlite3.Connection, url: str,
+              canonical_url: str) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            has_canonical = connection.execute(
+                "SELECT 1 FROM responses WHERE url = ?", (canonical_url,)
+            ).fetchone()
+            if has_canonical is None:
+                connection.execute(
+                    "UPDATE responses SET url = ? WHERE url = ?",
+                    (canonical_url, url),
+                )
+            else:
+                connection.execute(
+                    "DELETE FROM responses WHERE url = ?", (url,)
+                )
+            connection.execute(
+                "UPDATE aliases SET canonical = ? WHERE canonical = ?",
+                (canonical_url, url),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO aliases (url, canonical) "
+                "SELECT ?, ? WHERE EXISTS "
+                "(SELECT 1 FROM responses WHERE url = ?)",
+                (url, canonical_url, canonical_url),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        """Remove every entry and alias and reset the counters."""
+        with self._errors():
+            connection = self._connect()
+            connection.execute("DELETE FROM responses")
+            connection.execute("DELETE FROM aliases")
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+            self._revalidations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss and eviction counters for this process."""
+        with self._errors():
+            size = self._connect().execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, size,
+                self._revalidations,
+            )
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored response bodies."""
+        with self._errors():
+            return self._connect().execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.stats.size
+
+    def __contains__(self, url: str) -> bool:
+        with self._errors():
+            return self._connect().execute(
+                "SELECT 1 FROM responses WHERE url = COALESCE("
+                "(SELECT canonical FROM aliases WHERE url = ?), ?)",
+                (url, url),
+            ).fetchone() is not None
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -3,16 +3,77 @@ HTTP GET client implementation for the PokeAPI.
 Handles URL building and request execution for GET operations.
 """
 
+import time
+from contextlib import contextmanager
 from urllib.parse import urlencode
 import requests
-from typing import Union
+from typing import Iterator, Mapping, Optional, Union
 from .base import BaseHttpClient
-from ..constants import DEFAULT_HEADERS, TIMEOUT, ErrorMessages
+from .cache import Cache, CacheEntry, conditional_headers
+from .decoders import JsonDecoder
+from .hooks import Hooks, ParseEvent
+from .singleflight import SingleFlight
+from .streaming import list_fields, stream_items, stream_model
+from .transport import Transport, HttpTransport, Timeout
+from ..constants import (
+    DEFAULT_HEADERS, MODEL_MODE_VALIDATED, REQUEST_TIMEOUT, STREAM_CHUNK_SIZE,
+    ErrorMessages,
+)
 from ..exceptions import PokeAPIError
 
 class HttpGetClient(BaseHttpClient):
     """HTTP client implementation for making GET requests to the PokeAPI."""
 
+    def __init__(
+        self,
+        base_url: str,
+        transport: Optional[Transport] = None,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        single_flight: Optional[SingleFlight] = None,
+        timeout: Timeout = REQUEST_TIMEOUT,
+        hooks: Optional[Hooks] = None,
+    ):
+        """
+        Initialize the GET client.
+
+        Args:
+            base_url (str): The base URL for all API requests
+            transport (Transport, optional): Shared transport to send requests
+                through. A private pooled transport is created if omitted.
+            cache (Cache, optional): Cache consulted before sending
+                requests. Caching is disabled if omitted.
+            model_mode (str, optional): "validated", "trusted" or "compact", see
+                `BaseHttpClient`
+            decoder (JsonDecoder, optional): JSON decoder for response bodies
+            single_flight (SingleFlight, optional): Coalesces identical
+                requests made concurrently. Share one between clients to
+                coalesce across them; a private one is created if omitted.
+            timeout (Timeout, optional): Timeout of each request in seconds,
+                or a (connect, read) pair
+            hooks (Hooks, optional): Hooks receiving request, cache and
+                parse events
+        """
+        super().__init__(base_url, cache, model_mode, decoder, hooks)
+        self.timeout = timeout
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else HttpTransport()
+        self.single_flight = (
+            single_flight if single_flight is not None else SingleFlight()
+        )
+
+    def close(self) -> None:
+        """Close the transport if it was created by this client."""
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def build_url(self, path: str, params: Union[str, dict]) -> str:
         """
         Build URL with proper parameter handling.
@@ -58,17 +119,127 @@ class HttpGetClient(BaseHttpClient):
         if method.upper() != "GET":
             raise PokeAPIError(ErrorMessages.INVALID_METHOD)
 
+        url = self.build_url(path, params)
+        return self._fetch(url, path).response
+
+    def _fetch(self, url: str, endpoint: str) -> CacheEntry:
+        """
+        Return the cache entry for a URL, sending the request on a miss.
+
+        An expired entry with validators is revalidated with a conditional
+        request rather than downloaded again.
+
+        Args:
+            url (str): The complete URL
+            endpoint (str): API endpoint path, used to pick the cache TTL
+
+        Returns:
+            CacheEntry: The cached or freshly fetched entry
+
+        Raises:
+            PokeAPIError: If the request fails, or on a miss in offline mode
+        """
+        entry = self._cache_lookup(url, endpoint)
+        if entry is not None:
+            return entry
+        return self._load(url, endpoint)
+
+    def _load(self, url: str, endpoint: str, model=None) -> CacheEntry:
+        """
+        Send the request for a URL that missed the cache.
+
+        Concurrent loads of the same URL are coalesced: one request is
+        sent and every caller receives its entry or its error. `model` is
+        the model the entry will be parsed into, or None for the raw
+        response.
+
+        Raises:
+            PokeAPIError: If the request fails, or in offline mode
+        """
+        if self.cache is not None and self.cache.offline:
+            raise PokeAPIError(ErrorMessages.OFFLINE_CACHE_MISS.format(url))
+
+        def load() -> CacheEntry:
+            stale = self._stale_entry(url, model)
+            response = self._send(url, self._request_headers(stale), endpoint)
+            return self._cache_store(url, endpoint, response, stale)
+
+        entry = self.single_flight.do(url, load)
+        if not entry.serves(model, self.model_mode):
+            # Joined a revalidation of an entry without the body needed here
+            entry = load()
+        return entry
+
+    def _send(self, url: str, headers: dict = DEFAULT_HEADERS,
+              endpoint: Optional[str] = None, stream: bool = False):
+        """
+        Send the request through the transport and check the response.
+
+        Args:
+            url (str): The complete URL
+            headers (dict, optional): Request headers
+            endpoint (str, optional): API endpoint path, reported to hooks
+            stream (bool, optional): Whether to return before the body is
+                read, see `Transport.stream`
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            PokeAPIError: For timeouts, connection errors and error statuses
+        """
+        start = time.perf_counter()
+        response = error = None
+        send = self.transport.stream if stream else self.transport.send
         try:
-            url = self.build_url(path, params)
-            response = requests.get(
-                url, headers=DEFAULT_HEADERS, timeout=TIMEOUT
-            )
+            response = send(url, headers=headers, timeout=self.timeout)
             return self._handle_response(response)
+        except PokeAPIError as e:
+            error = e
         except requests.exceptions.Timeout:
-            raise PokeAPIError(ErrorMessages.TIMEOUT_ERROR)
+            error = PokeAPIError(ErrorMessages.TIMEOUT_ERROR)
         except requests.exceptions.ConnectionError:
-            raise PokeAPIError(ErrorMessages.CONNECTION_ERROR)
+            error = PokeAPIError(ErrorMessages.CONNECTION_ERROR)
         except Exception as e:
+            error = PokeAPIError(ErrorMessages.NETWORK_ERROR.format(str(e)))
+        finally:
+            if self.hooks:
+                self._emit_request(url, endpoint, response,
+                                   time.perf_counter() - start, error, stream)
+        if stream and response is not None:
+            response.close()
+        raise error
+
+    @contextmanager
+    def _stream(self, url: str, endpoint: str) -> Iterator[Iterator[bytes]]:
+        """
+        Send a streamed request and provide its body in chunks.
+
+        The response is closed on exit, returning its connection to the pool
+        even if the body was not read to the end.
+
+        Raises:
+            PokeAPIError: If the request fails, or in offline mode
+        """
+        if self.cache is not None and self.cache.offline:
+            raise PokeAPIError(ErrorMessages.OFFLINE_CACHE_MISS.format(url))
+        response = self._send(url, DEFAULT_HEADERS, endpoint, stream=True)
+        try:
+            yield self._read_chunks(response)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _read_chunks(response) -> Iterator[bytes]:
+        """Read a streamed body, reporting network errors as PokeAPIError."""
+        try:
+            yield from response.iter_content(STREAM_CHUNK_SIZE)
+        except requests.exceptions.Timeout:
+            raise PokeAPIError(ErrorMessages.TIMEOUT_ERROR)
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError):
+            raise PokeAPIError(ErrorMessages.CONNECTION_ERROR)
+        except requests.exceptions.RequestException as e:
             raise PokeAPIError(ErrorMessages.NETWORK_ERROR.format(str(e)))
 
     def get(self, path: str, params: Union[str, dict]):
@@ -82,4 +253,148 @@ class HttpGetClient(BaseHttpClient):
         Returns:
             The HTTP response
         """
-        return self.request("GET", path, params)
\ No newline at end of file
+        return self.request("GET", path, params)
+
+    def revalidate(self, path: str, params: Union[str, dict],
+                   validators: Mapping[str, str]):
+        """
+        Ask the server whether a resource changed since a known revision.
+
+        The request bypasses the cache and carries the revision's
+        validators, so an unchanged resource costs a 304 response without
+        a body. Without validators the resource is simply fetched.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+            validators (Mapping[str, str]): `ETag` and/or `Last-Modified` of
+                the known revision, see `cache.validators`
+
+        Returns:
+            The HTTP response, or None if the resource is unchanged
+
+        Raises:
+            PokeAPIError: If the request fails, or in offline mode
+        """
+        url = self.build_url(path, params)
+        if self.cache is not None and self.cache.offline:
+            raise PokeAPIError(ErrorMessages.OFFLINE_CACHE_MISS.format(url))
+        headers = {**DEFAULT_HEADERS, **conditional_headers(validators)}
+        response = self._send(url, headers, path)
+        return None if response.status_code == 304 else response
+
+    def get_model(self, path: str, params: Union[str, dict], model):
+        """
+        Make a GET request and parse the response into a model.
+
+        With a cache, the parsed model is kept alongside the cached response
+        and shared by later lookups, so treat returned models as read-only.
+        Concurrent calls for the same URL and model share one request and
+        one parsed model.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+            model: The pydantic model class to build
+
+        Returns:
+            An instance of `model`, or of its trusted mirror in trusted mode
+
+        Raises:
+            ValueError: If the response is not valid JSON or fails validation
+        """
+        url = self.build_url(path, params)
+        entry = self._cache_lookup(url, path, model)
+        if entry is not None:
+            value = self._parse(entry, url, path, model)
+        else:
+            value = self.single_flight.do(
+                (url, model, self.model_mode),
+                lambda: self._parse(
+                    self._load(url, path, model), url, path, model
+                ),
+            )
+        self._canonicalize(url, path, value)
+        return value
+
+    def stream_model(self, path: str, params: Union[str, dict], model):
+        """
+        Make a GET request and build a model while its body is read.
+
+        Lists of nested models are built one element at a time as the body
+        arrives, so the raw body is never held whole and peak memory is
+        about the size of the finished model. A cached response is parsed
+        as by `get_model`. Otherwise the response is neither cached nor
+        coalesced with concurrent calls, and the parse time reported to the
+        hooks includes reading the body.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Query parameters or resource identifier
+            model: The pydantic model class to build
+
+        Returns:
+            An instance of `model`, or of its trusted or compact mirror
+
+        Raises:
+            ValueError: If the response is not valid JSON or fails validation
+        """
+        url = self.build_url(path, params)
+        entry = self._cache_lookup(url, path, model)
+        if entry is not None:
+            value = self._parse(entry, url, path, model)
+            self._canonicalize(url, path, value)
+            return value
+        with self._stream(url, path) as chunks:
+            start = time.perf_counter()
+            value = stream_model(model, chunks, self.model_mode)
+            if self.hooks:
+                self.hooks.on_parse(ParseEvent(
+                    url, path, model.__name__, self.model_mode,
+                    time.perf_counter() - start,
+                ))
+        return value
+
+    def iter_items(self, path: str, params: Union[str, dict], model,
+                   field: str) -> Iterator:
+        """
+        Iterate over one list field of a resource, building each element
+        as it is read from the response.
+
+        Only one element and one chunk of the body are held at a time,
+        however long the list is. The request is sent when iteration
+        starts; a cached response is parsed whole and its list iterated.
+
+        Args:
+            path (str): API endpoint path
+            params (Union[str, dict]): Resource identifier
+            model: The pydantic model class of the resource
+            field (str): Name of a field of `model` holding a list of models,
+                e.g. "moves"
+
+        Returns:
+            Iterator: The field's elements, as instances of the item model
+                or of its trusted or compact mirror
+
+        Raises:
+            PokeAPIError: If `field` is not a list of models. While
+                iterating, if the request fails or the response is not
+                valid JSON or does not fit the model.
+        """
+        if field not in {name for name, _ in list_fields(model).values()}:
+            raise PokeAPIError(
+                ErrorMessages.INVALID_LIST_FIELD.format(model.__name__, field)
+            )
+        url = self.build_url(path, params)
+        return self._iter_items(url, path, model, field)
+
+    def _iter_items(self, url: str, path: str, model, field: str) -> Iterator:
+        try:
+            entry = self._cache_lookup(url, path, model)
+            if entry is not None:
+                yield from getattr(self._parse(entry, url, path, model), field)
+                return
+            with self._stream(url, path) as chunks:
+                yield from stream_items(model, field, chunks, self.model_mode)
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
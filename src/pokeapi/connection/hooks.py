@@ -0,0 +1,263 @@
+"""
+Instrumentation hooks for the HTTP clients.
+Defines the events emitted while serving a request and the hooks that
+receive them, including one writing each event as a structured log line.
+"""
+
+import json
+import logging
+import threading
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger("pokeapi")
+
+
+class Event:
+    """Base class of the events passed to hooks."""
+
+    __slots__ = ()
+    kind = "event"
+
+    def to_dict(self) -> dict:
+        """Return the event as a JSON-serializable dict."""
+        fields = {"event": self.kind}
+        for name in self.__slots__:
+            fields[name] = getattr(self, name)
+        return fields
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items()
+                           if k != "event")
+        return f"{type(self).__name__}({fields})"
+
+
+class RequestEvent(Event):
+    """
+    A request sent through the transport, successful or not.
+
+    Emitted once per request, after any retries: `elapsed` includes the
+    failed attempts and backoff waits, which are reported as `RetryEvent`s.
+
+    Attributes:
+        url (str): The requested URL
+        endpoint (str): API endpoint path, e.g. "/pokemon"
+        status (int): Response status, or None if no response was received
+        elapsed (float): Seconds from sending to having the whole body
+        time_to_headers (float): Seconds until the response headers
+            arrived (connection setup and server time included), when the
+            transport reports it separately; None otherwise
+        size (int): Response body size in bytes
+        error (str): Error message if the request failed, else None
+    """
+
+    __slots__ = ("url", "endpoint", "status", "elapsed", "time_to_headers",
+                 "size", "error")
+    kind = "request"
+
+    def __init__(self, url: str, endpoint: Optional[str], status: Optional[int],
+                 elapsed: float, time_to_headers: Optional[float] = None,
+                 size: int = 0, error: Optional[str] = None):
+        self.url = url
+        self.endpoint = endpoint
+        self.status = status
+        self.elapsed = elapsed
+        self.time_to_headers = time_to_headers
+        self.size = size
+        self.error = error
+
+
+class CacheEvent(Event):
+    """
+    A cache lookup.
+
+    Attributes:
+        url (str): The looked up URL
+        endpoint (str): API endpoint path
+        hit (bool): Whether a fresh entry was found
+    """
+
+    __slots__ = ("url", "endpoint", "hit")
+    kind = "cache"
+
+    def __init__(self, url: str, endpoint: Optional[str], hit: bool):
+        self.url = url
+        self.endpoint = endpoint
+        self.hit = hit
+
+
+class ParseEvent(Event):
+    """
+    A response body decoded into a model (JSON decoding and validation).
+
+    Attributes:
+        url (str): The URL the body was fetched from
+        endpoint (str): API endpoint path
+        model (str): Name of the model class built
+        mode (str): "validated", "trusted" or "compact"
+        elapsed (float): Seconds spent parsing
+    """
+
+    __slots__ = ("url", "endpoint", "model", "mode", "elapsed")
+    kind = "parse"
+
+    def __init__(self, url: str, endpoint: Optional[str], model: str,
+                 mode: str, elapsed: float):
+        self.url = url
+        self.endpoint = endpoint
+        self.model = model
+        self.mode = mode
+        self.elapsed = elapsed
+
+
+class RetryEvent(Event):
+    """
+    A failed attempt about to be retried.
+
+    Attributes:
+        url (str): The requested URL
+        attempt (int): Number of the attempt that failed, from 1
+        delay (float): Seconds waited before the next attempt
+        reason (str): Status code or exception name of the failure
+    """
+
+    __slots__ = ("url", "attempt", "delay", "reason")
+    kind = "retry"
+
+    def __init__(self, url: str, attempt: int, delay: float, reason: str):
+        self.url = url
+        self.attempt = attempt
+        self.delay = delay
+        self.reason = reason
+
+
+class Hook:
+    """
+    Receiver of client events. Override the methods of interest.
+
+    Hooks are called synchronously on the thread (or task) making the
+    request, so they should be quick and must not block.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called after each request, once any retries are done."""
+        pass
+
+    def on_cache(self, event: CacheEvent) -> None:
+        """Called after each cache lookup."""
+        pass
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Called after each response body is parsed into a model."""
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Called before each retry."""
+        pass
+
+
+class Hooks(Hook):
+    """
+    Hooks receiving every event of the clients sharing this instance.
+
+    Hooks can be added and removed at any time. An error raised by a hook
+    is logged and does not affect the request. An empty `Hooks` is falsy,
+    so clients skip building events when nobody listens.
+
+    Usage:
+        api = PokeAPI()
+        api.hooks.add(MetricsCollector())
+    """
+
+    def __init__(self, hooks: Iterable[Hook] = ()):
+        """
+        Initialize the hooks.
+
+        Args:
+            hooks (Iterable[Hook], optional): Hooks to start with
+        """
+        self._hooks = tuple(hooks)
+        self._lock = threading.Lock()
+
+    def add(self, hook: Hook) -> None:
+        """Start sending events to a hook."""
+        with self._lock:
+            # Replaced rather than mutated, so dispatch needs no lock
+            self._hooks = self._hooks + (hook,)
+
+    def remove(self, hook: Hook) -> None:
+        """Stop sending events to a hook."""
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def __iter__(self) -> Iterator[Hook]:
+        return iter(self._hooks)
+
+    def _dispatch(self, method: str, event: Event) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, method)(event)
+            except Exception:
+                logger.exception("Hook %r failed handling %r", hook, event)
+
+    def on_request(self, event: RequestEvent) -> None:
+        self._dispatch("on_request", event)
+
+    def on_cache(self, event: CacheEvent) -> None:
+        self._dispatch("on_cache", event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self._dispatch("on_parse", event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._dispatch("on_retry", event)
+
+
+class LoggingHook(Hook):
+    """
+    Hook writing every event as a one-line JSON log record.
+
+    The event's fields are also attached to the record as `pokeapi_event`
+    for handlers that format records themselves.
+
+    Usage:
+        logging.basicConfig(level=logging.DEBUG)
+        api = PokeAPI(hooks=[LoggingHook()])
+        # DEBUG:pokeapi:{"event": "request", "url": ..., "elapsed": 0.08, ...}
+    """
+
+    def __init__(self, log: Optional[logging.Logger] = None,
+                 level: int = logging.DEBUG):
+        """
+        Initialize the hook.
+
+        Args:
+            log (logging.Logger, optional): Logger to write to. Defaults
+                to the "pokeapi" logger.
+            level (int, optional): Level of the records
+        """
+        self.log = log if log is not None else logger
+        self.level = level
+
+    def _write(self, event: Event) -> None:
+        if self.log.isEnabledFor(self.level):
+            fields = event.to_dict()
+            self.log.log(self.level, json.dumps(fields),
+                         extra={"pokeapi_event": fields})
+
+    def on_request(self, event: RequestEvent) -> None:
+        self._write(event)
+
+    def on_cache(self, event: CacheEvent) -> None:
+        self._write(event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self._write(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._write(event)
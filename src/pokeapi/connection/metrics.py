@@ -0,0 +1,341 @@
+"""
+Built-in metrics collection for the HTTP clients.
+Aggregates hook events into per-endpoint histograms and counters, exported
+in the Prometheus text format or as a structured log record.
+"""
+
+import json
+import logging
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from .hooks import CacheEvent, Hook, ParseEvent, RequestEvent, RetryEvent
+from ..constants import (
+    METRICS_LATENCY_BUCKETS, METRICS_PARSE_BUCKETS, METRICS_PREFIX,
+    METRICS_SIZE_BUCKETS,
+)
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram, as used by Prometheus.
+
+    Observations are counted in the first bucket whose upper bound they do
+    not exceed, plus an implicit +Inf bucket. Quantiles are estimated by
+    interpolating linearly inside the bucket they fall in.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Iterable[float]):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds (Iterable[float]): Bucket upper bounds, ascending
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, observations <= bound) pairs, +Inf last."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile of the observations.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (0.99 for p99)
+
+        Returns:
+            float: The estimate, or None without observations. Values in
+                the +Inf bucket are reported as the highest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.bounds[-1] if self.bounds else self.sum / self.count
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the observations, or None without observations."""
+        return self.sum / self.count if self.count else None
+
+    def summary(self) -> dict:
+        """Return the count, sum, mean and p50/p90/p99 estimates."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+def _escape(value) -> str:
+    return (str(value).replace("\\", "\\\\").replace("\n", "\\n")
+            .replace('"', '\\"'))
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsCollector(Hook):
+    """
+    Hook aggregating request, cache, parse and retry events.
+
+    Records per endpoint: a latency histogram, response sizes, request
+    counts by status, cache hits and misses, and parse durations per model.
+    Retries are counted by reason. Export everything with
+    `render_prometheus()`, or log a summary with `log()`.
+
+    Usage:
+        metrics = MetricsCollector()
+        api = PokeAPI(hooks=[metrics], cache=ResponseCache())
+        api.get_pokemon(name="pikachu")
+        metrics.latency("/pokemon").quantile(0.99)
+        print(metrics.render_prometheus())
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float] = METRICS_LATENCY_BUCKETS,
+        size_buckets: Iterable[float] = METRICS_SIZE_BUCKETS,
+        parse_buckets: Iterable[float] = METRICS_PARSE_BUCKETS,
+    ):
+        """
+        Initialize empty metrics.
+
+        Args:
+            latency_buckets (Iterable[float], optional): Request latency
+                bucket bounds in seconds
+            size_buckets (Iterable[float], optional): Response size bucket
+                bounds in bytes
+            parse_buckets (Iterable[float], optional): Parse duration
+                bucket bounds in seconds
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.parse_buckets = tuple(parse_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        with self._lock:
+            self._latency: Dict[str, Histogram] = {}
+            self._time_to_headers: Dict[str, Histogram] = {}
+            self._size: Dict[str, Histogram] = {}
+            self._parse: Dict[Tuple[str, str, str], Histogram] = {}
+            self._requests: Counter = Counter()
+            self._cache: Counter = Counter()
+            self._retries: Counter = Counter()
+
+    @staticmethod
+    def _histogram(table: dict, key, bounds) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(bounds)
+        return histogram
+
+    def on_request(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint or ""
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            self._requests[endpoint, status] += 1
+            self._histogram(self._latency, endpoint,
+                            self.latency_buckets).observe(event.elapsed)
+            if event.time_to_headers is not None:
+                self._histogram(self._time_to_headers, endpoint,
+                                self.latency_buckets).observe(event.time_to_headers)
+            if event.status is not None:
+                self._histogram(self._size, endpoint,
+                                self.size_buckets).observe(event.size)
+
+    def on_cache(self, event: CacheEvent) -> None:
+        with self._lock:
+            self._cache[event.endpoint or "", event.hit] += 1
+
+    def on_parse(self, event: ParseEvent) -> None:
+        key = (event.endpoint or "", event.model, event.mode)
+        with self._lock:
+            self._histogram(self._parse, key,
+                            self.parse_buckets).observe(event.elapsed)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._retries[event.reason] += 1
+
+    def latency(self, endpoint: str) -> Histogram:
+        """Return the request latency histogram of an endpoint."""
+        with self._lock:
+            return self._histogram(self._latency, endpoint, self.latency_buckets)
+
+    def response_sizes(self, endpoint: str) -> Histogram:
+        """Return the response size histogram of an endpoint."""
+        with self._lock:
+            return self._histogram(self._size, endpoint, self.size_buckets)
+
+    def cache_hit_ratio(self, endpoint: Optional[str] = None) -> float:
+        """
+        Return the fraction of cache lookups that hit.
+
+        Args:
+            endpoint (str, optional): Restrict to one endpoint
+
+        Returns:
+            float: The ratio, 0.0 without lookups
+        """
+        with self._lock:
+            hits = sum(n for (e, hit), n in self._cache.items()
+                       if hit and endpoint in (None, e))
+            lookups = sum(n for (e, _), n in self._cache.items()
+                          if endpoint in (None, e))
+        return hits / lookups if lookups else 0.0
+
+    @property
+    def retries(self) -> int:
+        """Total number of retries."""
+        with self._lock:
+            return sum(self._retries.values())
+
+    def snapshot(self) -> dict:
+        """
+        Return every metric as a JSON-serializable dict.
+
+        Returns:
+            dict: "requests", "cache", "parse" and "retries" sections keyed
+                by endpoint (parse by "endpoint model mode", retries by reason)
+        """
+        with self._lock:
+            requests = {}
+            for endpoint, histogram in self._latency.items():
+                statuses = {status: n for (e, status), n in self._requests.items()
+                            if e == endpoint}
+                size = self._size.get(endpoint)
+                headers = self._time_to_headers.get(endpoint)
+                requests[endpoint] = {
+                    "statuses": statuses,
+                    "latency": histogram.summary(),
+                    "time_to_headers": headers.summary() if headers else None,
+                    "bytes": {"sum": size.sum, "mean": size.mean} if size else None,
+                }
+            cache = {}
+            for (endpoint, hit), n in self._cache.items():
+                counts = cache.setdefault(endpoint, {"hits": 0, "misses": 0})
+                counts["hits" if hit else "misses"] += n
+            for counts in cache.values():
+                counts["hit_ratio"] = counts["hits"] / (counts["hits"] + counts["misses"])
+            parse = {
+                " ".join(key): histogram.summary()
+                for key, histogram in self._parse.items()
+            }
+            retries = dict(self._retries)
+        return {"requests": requests, "cache": cache, "parse": parse,
+                "retries": retries}
+
+    def log(self, log: Optional[logging.Logger] = None,
+            level: int = logging.INFO) -> None:
+        """
+        Write the snapshot as a one-line JSON log record.
+
+        Args:
+            log (logging.Logger, optional): Logger to write to. Defaults to
+                the "pokeapi" logger.
+            level (int, optional): Level of the record
+        """
+        log = log if log is not None else logging.getLogger("pokeapi")
+        snapshot = self.snapshot()
+        log.log(level, json.dumps({"event": "metrics", **snapshot}),
+                extra={"pokeapi_event": snapshot})
+
+    def render_prometheus(self, prefix: str = METRICS_PREFIX) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names
+
+        Returns:
+            str: The exposition text, ready to serve on a /metrics endpoint
+        """
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def histogram(name, labels, h):
+            for bound, count in h.cumulative():
+                le = _labels(**labels, le=_number(bound))
+                lines.append(f"{prefix}_{name}_bucket{{{le}}} {count}")
+            label_text = _labels(**labels)
+            lines.append(f"{prefix}_{name}_sum{{{label_text}}} {_number(h.sum)}")
+            lines.append(f"{prefix}_{name}_count{{{label_text}}} {h.count}")
+
+        with self._lock:
+            header("requests_total", "counter", "Requests sent, by endpoint and status.")
+            for (endpoint, status), n in sorted(self._requests.items()):
+                lines.append(f"{prefix}_requests_total{{"
+                             f"{_labels(endpoint=endpoint, status=status)}}} {n}")
+
+            header("request_duration_seconds", "histogram",
+                   "Time from sending a request to reading its body.")
+            for endpoint, h in sorted(self._latency.items()):
+                histogram("request_duration_seconds", {"endpoint": endpoint}, h)
+
+            header("time_to_headers_seconds", "histogram",
+                   "Time until response headers arrived, connection setup included.")
+            for endpoint, h in sorted(self._time_to_headers.items()):
+                histogram("time_to_headers_seconds", {"endpoint": endpoint}, h)
+
+            header("response_size_bytes", "histogram", "Response body sizes.")
+            for endpoint, h in sorted(self._size.items()):
+                histogram("response_size_bytes", {"endpoint": endpoint}, h)
+
+            header("parse_duration_seconds", "histogram",
+                   "Time spent decoding and validating response bodies.")
+            for (endpoint, model, mode), h in sorted(self._parse.items()):
+                histogram("parse_duration_seconds",
+                          {"endpoint": endpoint, "model": model, "mode": mode}, h)
+
+            header("cache_lookups_total", "counter", "Cache lookups, by result.")
+            for (endpoint, hit), n in sorted(self._cache.items()):
+                result = "hit" if hit else "miss"
+                lines.append(f"{prefix}_cache_lookups_total{{"
+                             f"{_labels(endpoint=endpoint, result=result)}}} {n}")
+
+            header("retries_total", "counter", "Retried attempts, by reason.")
+            for reason, n in sorted(self._retries.items()):
+                lines.append(f"{prefix}_retries_total{{{_labels(reason=reason)}}} {n}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,349 @@
+"""
+Client-side rate limiting and adaptive concurrency control.
+Provides token buckets (in-process and shared between processes) and an
+AIMD concurrency limit driven by latency and throttling responses.
+"""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from ..constants import (
+    AIMD_DECREASE_FACTOR, AIMD_LATENCY_TARGET, ErrorMessages, POOL_MAXSIZE,
+)
+from ..exceptions import PokeAPIError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Read a Retry-After header value.
+
+    Args:
+        value (str, optional): Delay in seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter(ABC):
+    """Base abstract class for limiters spacing requests out over time."""
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """
+        Take the right to send one request.
+
+        Returns:
+            float: Seconds the caller must wait before sending it
+        """
+        pass
+
+    @abstractmethod
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every request for a while, e.g. after a 429 response.
+
+        Args:
+            seconds (float): How long to pause
+        """
+        pass
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket allowing `rate` requests per second with bursts of `burst`.
+
+    Callers are served in arrival order: each reservation takes a token,
+    possibly going into debt, and waits until the debt is repaid. Share one
+    bucket between clients (PokeAPI does) to limit them together.
+
+    Usage:
+        limiter = TokenBucket(rate=5, burst=10)
+        api = PokeAPI(rate_limiter=limiter)
+    """
+
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate (float): Requests allowed per second on average
+            burst (int, optional): Requests that may be sent at once after a
+                quiet period. Defaults to one second's worth, at least 1.
+
+        Raises:
+            PokeAPIError: If rate or burst is not positive
+        """
+        if burst is None:
+            burst = max(1, int(rate))
+        if rate <= 0 or burst <= 0:
+            raise PokeAPIError(ErrorMessages.INVALID_RATE_LIMIT)
+        self.rate = float(rate)
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = self._clock()
+        self._paused_until = 0.0
+
+    def _take(self, now: float) -> float:
+        # Refill for the elapsed time, then take one token
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return wait + max(self._paused_until - now, 0.0)
+
+    def _hold(self, now: float, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, now + seconds)
+        # Restart gently instead of with a full burst
+        self._tokens = min(self._tokens, 0.0)
+
+    def reserve(self) -> float:
+        with self._lock:
+            return self._take(self._clock())
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._hold(self._clock(), seconds)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared by every process on a host through a state file.
+
+    The bucket state lives in a small file locked with `fcntl.flock` on each
+    reservation, so processes using the same path share one budget.
+    Only available on POSIX systems.
+
+    Usage:
+        limiter = FileTokenBucket("/tmp/pokeapi.bucket", rate=5)
+    """
+
+    _clock = staticmethod(time.time)
+    _STATE = struct.Struct("ddd")
+
+    def __init__(self, path: str, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the bucket, creating its state file if needed.
+
+        Args:
+            path (str): State file shared by the cooperating processes
+            rate (float): Requests allowed per second, across all processes
+            burst (int, optional): Requests that may be sent at once
+
+        Raises:
+            PokeAPIError: If rate or burst is not positive, or file locking
+                is unavailable on this platform
+        """
+        if fcntl is None:
+            raise PokeAPIError(ErrorMessages.FILE_LOCK_UNAVAILABLE)
+        super().__init__(rate, burst)
+        self.path = os.path.expanduser(path)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _locked(self, update) -> float:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                state = os.pread(self._fd, self._STATE.size, 0)
+                if len(state) == self._STATE.size:
+                    self._tokens, self._updated, self._paused_until = (
+                        self._STATE.unpack(state)
+                    )
+                result = update(self._clock())
+                os.pwrite(self._fd, self._STATE.pack(
+                    self._tokens, self._updated, self._paused_until
+                ), 0)
+                return result
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def reserve(self) -> float:
+        return self._locked(self._take)
+
+    def pause(self, seconds: float) -> None:
+        self._locked(lambda now: self._hold(now, seconds))
+
+    def close(self) -> None:
+        """Close the state file."""
+        os.close(self._fd)
+
+
+class AdaptiveConcurrency:
+    """
+    Limit on requests in flight, adjusted by AIMD (additive increase,
+    multiplicative decrease).
+
+    Each fast, successful response raises the limit by 1/limit, about one
+    slot per round of requests. A 429 or 5xx response, a transport error or
+    a response slower than `latency_target` cuts it by `decrease_factor`,
+    at most once per round trip so one burst of failures counts once.
+
+    Usage:
+        concurrency = AdaptiveConcurrency(initial=4, maximum=20)
+        api = PokeAPI(concurrency=concurrency)
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = POOL_MAXSIZE,
+        latency_target: float = AIMD_LATENCY_TARGET,
+        decrease_factor: float = AIMD_DECREASE_FACTOR,
+    ):
+        """
+        Initialize the limit.
+
+        Args:
+            initial (int, optional): Starting limit
+            minimum (int, optional): Lowest limit
+            maximum (int, optional): Highest limit
+            latency_target (float, optional): Seconds above which a response
+                counts as a sign of overload
+            decrease_factor (float, optional): Factor applied to the limit
+                on overload, between 0 and 1
+
+        Raises:
+            PokeAPIError: If the bounds are not 1 <= minimum <= initial <= maximum
+                or the decrease factor is not between 0 and 1
+        """
+        if not 1 <= minimum <= initial <= maximum or not 0 < decrease_factor < 1:
+            raise PokeAPIError(ErrorMessages.INVALID_CONCURRENCY_BOUNDS)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    def _adjust(self, latency: float, congested: bool) -> None:
+        now = time.monotonic()
+        if congested or latency > self.latency_target:
+            if now - self._last_decrease >= latency:
+                self._limit = max(self.minimum, self._limit * self.decrease_factor)
+                self._last_decrease = now
+        else:
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, congested: bool = False) -> None:
+        """
+        Record the outcome of a request and free its slot.
+
+        Args:
+            latency (float): Seconds the request took
+            congested (bool, optional): Whether the response signalled
+                overload (429, 5xx or a transport error)
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._adjust(latency, congested)
+            self._condition.notify_all()
+
+
+class AsyncAdaptiveConcurrency(AdaptiveConcurrency):
+    """
+    `AdaptiveConcurrency` for asyncio tasks, as used by `AsyncPokeAPI`.
+
+    Waiting tasks are woken in arrival order as slots free up.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._waiters = deque()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float, congested: bool = False) -> None:
+        """
+        Record the outcome of a request and free its slot.
+
+        Args:
+            latency (float): Seconds the request took
+            congested (bool, optional): Whether the response signalled
+                overload (429, 5xx or a transport error)
+        """
+        self._in_flight -= 1
+        self._adjust(latency, congested)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,465 @@
+"""
+Recording and replay of HTTP traffic.
+Records responses into a compact archive and replays them later without
+any network I/O, for deterministic tests, load tests and CI.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from .async_transport import AsyncTransport
+from .responses import build_response, storable_headers
+from .transport import Timeout, Transport
+from ..constants import TIMEOUT, ErrorMessages
+from ..exceptions import PokeAPIError
+
+ARCHIVE_VERSION = 1
+ARCHIVE_MAGIC = b"PKAPIARC"
+# Index position and magic, at the very end of the archive
+_FOOTER = struct.Struct("<Q8s")
+
+
+def archive_key(url: str) -> str:
+    """
+    Return the key a response is archived under.
+
+    Only the path and query are kept, so traffic recorded against one base
+    URL replays under any other.
+
+    Args:
+        url (str): The requested URL
+
+    Returns:
+        str: The path, without trailing slash, and query of the URL
+    """
+    parts = urlsplit(url)
+    key = parts.path.rstrip("/")
+    return f"{key}?{parts.query}" if parts.query else key
+
+
+class ArchiveWriter:
+    """
+    Writes responses into an archive file.
+
+    The archive is written to a temporary file and moved into place on
+    `commit()`, so readers never see a partially written archive.
+
+    Layout: a magic header, then each response's headers (as JSON) and body
+    back to back, then a JSON index of (key, status, offset, lengths)
+    entries in recording order, and a footer pointing at the index.
+
+    Usage:
+        with ArchiveWriter("traffic.pkar") as writer:
+            writer.add(url, 200, {"Content-Type": "application/json"}, body)
+            writer.commit()
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): File the archive is written to, replaced if it
+                already exists
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(ARCHIVE_MAGIC)
+        self._entries: List[list] = []
+        self._lock = threading.Lock()
+        self._committed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, url: str, status_code: int, headers: Mapping[str, str],
+            content: bytes) -> None:
+        """
+        Append a response. Thread-safe.
+
+        Args:
+            url (str): The requested URL
+            status_code (int): The HTTP status code
+            headers (Mapping[str, str]): The response headers
+            content (bytes): The response body
+        """
+        header_bytes = json.dumps(
+            storable_headers(headers), separators=(",", ":")
+        ).encode()
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(header_bytes)
+            self._file.write(content)
+            self._entries.append([
+                archive_key(url), status_code, offset, len(header_bytes),
+                len(content),
+            ])
+
+    def commit(self) -> None:
+        """Write the index and move the archive into place."""
+        with self._lock:
+            if self._committed:
+                return
+            index = {
+                "version": ARCHIVE_VERSION,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "entries": self._entries,
+            }
+            index_offset = self._file.tell()
+            self._file.write(json.dumps(index, separators=(",", ":")).encode())
+            self._file.write(_FOOTER.pack(index_offset, ARCHIVE_MAGIC))
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+            self._committed = True
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._committed:
+            self.abort()
+
+
+class ResponseArchive:
+    """
+    Read-only, memory-mapped view of an archive written by `ArchiveWriter`.
+
+    Opening an archive only reads its index, and lookups cost a dict access
+    and a copy of the body, however large the archive is. A URL requested
+    several times while recording keeps every response, in order.
+
+    Usage:
+        archive = ResponseArchive("traffic.pkar")
+        status, headers, body = archive.get(url)
+    """
+
+    def __init__(self, path: str):
+        """
+        Open an archive.
+
+        Args:
+            path (str): File written by `ArchiveWriter`
+
+        Raises:
+            PokeAPIError: If the file is not a readable archive
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._file = None
+        self._data = None
+        try:
+            self._file = open(self.path, "rb")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if (len(self._data) < len(ARCHIVE_MAGIC) + _FOOTER.size
+                    or self._data[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC):
+                raise ValueError("not an archive")
+            index_offset, magic = _FOOTER.unpack(self._data[-_FOOTER.size:])
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError("truncated archive")
+            index = json.loads(self._data[index_offset:-_FOOTER.size])
+            if index.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"unsupported version {index.get('version')}")
+            entries = index["entries"]
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            self.close()
+            raise PokeAPIError(ErrorMessages.INVALID_ARCHIVE.format(self.path, e))
+
+        self.created_at = index.get("created_at")
+        self._order: List[str] = []
+        self._entries: Dict[str, List[Tuple[int, int, int, int]]] = {}
+        for key, status, offset, header_length, body_length in entries:
+            self._order.append(key)
+            self._entries.setdefault(key, []).append(
+                (status, offset, header_length, body_length)
+            )
+
+    def __len__(self) -> int:
+        """Number of recorded responses."""
+        return len(self._order)
+
+    def __contains__(self, url: str) -> bool:
+        return archive_key(url) in self._entries
+
+    def keys(self) -> Iterator[str]:
+        """Yield the key of every recorded request, in recording order."""
+        return iter(self._order)
+
+    def count(self, url: str) -> int:
+        """Number of responses recorded for a URL."""
+        return len(self._entries.get(archive_key(url), ()))
+
+    def get(self, url: str, occurrence: int = 0
+            ) -> Optional[Tuple[int, dict, bytes]]:
+        """
+        Return a recorded response.
+
+        Args:
+            url (str): The requested URL
+            occurrence (int, optional): Which of the responses recorded for
+                the URL to return, from 0. Past the last one, the last one
+                is returned.
+
+        Returns:
+            Tuple[int, dict, bytes]: The status, headers and body, or None
+                if the URL was not recorded
+        """
+        entries = self._entries.get(archive_key(url))
+        if entries is None:
+            return None
+        status, offset, header_length, body_length = (
+            entries[min(occurrence, len(entries) - 1)]
+        )
+        body_offset = offset + header_length
+        headers = json.loads(self._data[offset:body_offset])
+        return status, headers, self._data[body_offset:body_offset + body_length]
+
+    def close(self) -> None:
+        """Unmap the archive."""
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecordingTransport(Transport):
+    """
+    Transport wrapper recording every response into an archive.
+
+    Requests are sent through the wrapped transport and their responses
+    (status, headers and body) appended to the archive, which is written
+    when the transport is closed. Failed requests are not recorded, and
+    neither are 304 Not Modified answers to a caching client's conditional
+    requests: they carry no body, so a client replaying without that cache
+    could not use them.
+
+    Usage:
+        with RecordingTransport(HttpTransport(), "traffic.pkar") as recorder:
+            api = PokeAPI(transport=recorder)
+            api.get_pokemon(name="pikachu")
+    """
+
+    def __init__(self, transport: Transport, path: str):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (Transport): Transport that sends the requests
+            path (str): File the archive is written to
+        """
+        self.transport = transport
+        self.writer = ArchiveWriter(path)
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request and record its response.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response of the wrapped transport
+        """
+        response = self.transport.send(url, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            self.writer.add(url, response.status_code, response.headers,
+                            response.content)
+        return response
+
+    def close(self) -> None:
+        """Write the archive and close the wrapped transport."""
+        try:
+            self.writer.commit()
+        finally:
+            self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Transport answering requests from a `ResponseArchive`.
+
+    Each request gets the next response recorded for its URL, so a
+    recorded sequence like 503 then 200 replays the same way; once they
+    are used up the last one is repeated. Requests are matched on path and
+    query, so any base URL works.
+
+    Usage:
+        api = PokeAPI(transport=ReplayTransport("traffic.pkar"))
+    """
+
+    def __init__(self, archive, strict: bool = True):
+        """
+        Initialize the transport.
+
+        Args:
+            archive (Union[str, ResponseArchive]): The archive, or the file
+                it was written to
+            strict (bool, optional): Whether a request that was not
+                recorded raises `PokeAPIError`. Otherwise it gets a 404.
+
+        Raises:
+            PokeAPIError: If the file is not a readable archive
+        """
+        if not isinstance(archive, ResponseArchive):
+            archive = ResponseArchive(archive)
+        self.archive = archive
+        self.strict = strict
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def replay(self, url: str) -> requests.Response:
+        """Return the next recorded response for a URL."""
+        key = archive_key(url)
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+        recorded = self.archive.get(url, occurrence)
+        if recorded is None:
+            if self.strict:
+                raise PokeAPIError(ErrorMessages.REPLAY_MISS.format(url))
+            return build_response(url, 404, {}, b"")
+        status, headers, body = recorded
+        return build_response(url, status, headers, body)
+
+    def rewind(self) -> None:
+        """Replay every URL from its first recorded response again."""
+        with self._lock:
+            self._occurrences.clear()
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT) -> requests.Response:
+        """
+        Answer a GET request from the archive.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Ignored, kept for compatibility
+            timeout (Timeout, optional): Ignored, kept for compatibility
+
+        Returns:
+            requests.Response: The recorded response
+
+        Raises:
+            PokeAPIError: If the URL was not recorded and the transport is
+                strict
+        """
+        return self.replay(url)
+
+    def close(self) -> None:
+        """Close the archive."""
+        self.archive.close()
+
+
+class AsyncRecordingTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `RecordingTransport` for `AsyncPokeAPI`.
+
+    Like it, skips 304 Not Modified answers, which carry no body.
+    """
+
+    def __init__(self, transport: AsyncTransport, path: str):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (AsyncTransport): Transport that sends the requests
+            path (str): File the archive is written to
+        """
+        self.transport = transport
+        self.writer = ArchiveWriter(path)
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request and record its response.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response of the wrapped transport
+        """
+        response = await self.transport.send(url, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            self.writer.add(url, response.status_code, response.headers,
+                            response.content)
+        return response
+
+    async def aclose(self) -> None:
+        """Write the archive and close the wrapped transport."""
+        try:
+            self.writer.commit()
+        finally:
+            await self.transport.aclose()
+
+
+class AsyncReplayTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `ReplayTransport` for `AsyncPokeAPI`.
+
+    Lookups are memory reads, so they are answered without yielding to the
+    event loop.
+    """
+
+    def __init__(self, archive, strict: bool = True):
+        """
+        Initialize the transport.
+
+        Args:
+            archive (Union[str, ResponseArchive]): The archive, or the file
+                it was written to
+            strict (bool, optional): Whether a request that was not
+                recorded raises `PokeAPIError`. Otherwise it gets a 404.
+
+        Raises:
+            PokeAPIError: If the file is not a readable archive
+        """
+        self._replay = ReplayTransport(archive, strict)
+        self.archive = self._replay.archive
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: Timeout = TIMEOUT) -> requests.Response:
+        """
+        Answer a GET request from the archive.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Ignored, kept for compatibility
+            timeout (Timeout, optional): Ignored, kept for compatibility
+
+        Returns:
+            requests.Response: The recorded response
+
+        Raises:
+            PokeAPIError: If the URL was not recorded and the transport is
+                strict
+        """
+        return self._replay.replay(url)
+
+    def rewind(self) -> None:
+        """Replay every URL from its first recorded response again."""
+        self._replay.rewind()
+
+    async def aclose(self) -> None:
+        """Close the archive."""
+        self._replay.close()
@@ -0,0 +1,296 @@
+"""
+Policies for riding out an unreliable upstream.
+Provides retries with exponential backoff and jitter, hedged requests and
+a per-host circuit breaker, applied by the resilient and hedged transports.
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional
+from ..constants import (
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIME, HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE, HEDGE_WINDOW, RETRY_ATTEMPTS, RETRY_BACKOFF,
+    RETRY_MAX_BACKOFF, RETRY_STATUSES, ErrorMessages,
+)
+from ..exceptions import CircuitOpenError, PokeAPIError
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed GET again.
+
+    Timeouts, connection errors and responses with a status in `statuses`
+    are retried up to `max_attempts` attempts in total. The wait before
+    attempt n + 1 is drawn uniformly between 0 and
+    min(max_backoff, backoff * 2 ** (n - 1)) ("full jitter"), so clients
+    failing together do not retry in lockstep. A Retry-After header is
+    honoured as a lower bound; one longer than `max_backoff` ends the retries.
+
+    Usage:
+        api = PokeAPI(retry_policy=RetryPolicy(max_attempts=4))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_ATTEMPTS,
+        backoff: float = RETRY_BACKOFF,
+        max_backoff: float = RETRY_MAX_BACKOFF,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        jitter: bool = True,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts (int, optional): Attempts per request, the first
+                one included
+            backoff (float, optional): Wait ceiling after the first
+                failure, in seconds; doubled after each further failure
+            max_backoff (float, optional): Highest wait ceiling, in seconds
+            statuses (Iterable[int], optional): Response statuses to retry
+            jitter (bool, optional): Whether to randomize waits. Without
+                jitter, the wait is the ceiling itself.
+
+        Raises:
+            PokeAPIError: If max_attempts is below 1 or a delay is negative
+        """
+        if max_attempts < 1 or backoff < 0 or max_backoff < 0:
+            raise PokeAPIError(ErrorMessages.INVALID_RETRY_POLICY)
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.jitter = jitter
+        self._random = random.Random()
+
+    def retries_status(self, status_code: int) -> bool:
+        """Whether a response with this status should be retried."""
+        return status_code in self.statuses
+
+    def next_delay(self, attempt: int,
+                   retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Return the wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, from 1
+            retry_after (float, optional): Delay asked for by the server
+
+        Returns:
+            float: Seconds to wait, or None if the request should not be
+                sent again
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None and retry_after > self.max_backoff:
+            return None
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        delay = self._random.uniform(0, ceiling) if self.jitter else ceiling
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class HedgePolicy:
+    """
+    When to send a second, "hedged" copy of a request that is slow to answer.
+
+    The first response to arrive wins and the other copy is abandoned. With
+    a fixed `delay`, the hedge is sent after that many seconds. Otherwise
+    the delay tracks the `percentile` of recent latencies, so only the
+    slowest few percent of requests are duplicated; no hedge is sent until
+    `min_samples` latencies have been seen. Only use it for idempotent
+    requests, as every GET to PokeAPI is.
+
+    Usage:
+        api = PokeAPI(hedge_policy=HedgePolicy(percentile=95))
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        window: int = HEDGE_WINDOW,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            delay (float, optional): Fixed hedging delay in seconds. If
+                omitted, the delay adapts to observed latencies.
+            percentile (float, optional): Latency percentile used as the
+                adaptive delay, between 0 and 100
+            min_samples (int, optional): Latencies needed before hedging
+                with an adaptive delay
+            window (int, optional): Number of recent latencies tracked
+
+        Raises:
+            PokeAPIError: If the delay is negative or the percentile is not
+                between 0 and 100
+        """
+        if (delay is not None and delay < 0) or not 0 < percentile <= 100:
+            raise PokeAPIError(ErrorMessages.INVALID_HEDGE_POLICY)
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = max(min_samples, 1)
+        self._latencies = deque(maxlen=max(window, self.min_samples))
+        self._lock = threading.Lock()
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Return how long to wait for a response before hedging.
+
+        Returns:
+            float: Seconds, or None if the request should not be hedged yet
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return ordered[max(rank, 0)]
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def record_hedge(self, won: bool) -> None:
+        """Count a hedged request, and whether the hedge answered first."""
+        with self._lock:
+            self.hedged += 1
+            if won:
+                self.hedge_wins += 1
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker failing requests fast while a host is unhealthy.
+
+    After `failure_threshold` consecutive failures (timeouts, connection
+    errors or 5xx responses) the circuit for that host opens and requests
+    raise `CircuitOpenError` without touching the network. After
+    `recovery_time` seconds one probe request is let through: success
+    closes the circuit, failure opens it again. Share one breaker between
+    clients (PokeAPI does) so they trip together.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=5, recovery_time=30)
+        api = PokeAPI(circuit_breaker=breaker)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_time: float = CIRCUIT_RECOVERY_TIME,
+    ):
+        """
+        Initialize the breaker with every circuit closed.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that
+                open a host's circuit
+            recovery_time (float, optional): Seconds an open circuit waits
+                before letting a probe through
+
+        Raises:
+            PokeAPIError: If the threshold is below 1 or the recovery time
+                is negative
+        """
+        if failure_threshold < 1 or recovery_time < 0:
+            raise PokeAPIError(ErrorMessages.INVALID_CIRCUIT_BREAKER)
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        """Return the state of a host's circuit: closed, open or half-open."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return self.CLOSED
+            if circuit.probing:
+                return self.HALF_OPEN
+            waited = self._clock() - circuit.opened_at
+            return self.HALF_OPEN if waited >= self.recovery_time else self.OPEN
+
+    def allow(self, host: str) -> None:
+        """
+        Check that a request to a host may be sent.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open, or half-open
+                with a probe already in flight
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return
+            remaining = circuit.opened_at + self.recovery_time - self._clock()
+            if remaining <= 0 and not circuit.probing:
+                circuit.probing = True
+                return
+        raise CircuitOpenError(
+            ErrorMessages.CIRCUIT_OPEN.format(host), host, max(remaining, 0.0)
+        )
+
+    def record(self, host: str, failed: bool) -> None:
+        """
+        Record the outcome of a request to a host.
+
+        Args:
+            host (str): The host the request was sent to
+            failed (bool): Whether it timed out, failed to connect or got
+                a 5xx response
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if not failed:
+                if circuit is not None:
+                    del self._circuits[host]
+                return
+            if circuit is None:
+                circuit = self._circuits[host] = _Circuit()
+            circuit.failures += 1
+            if circuit.probing or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = self._clock()
+                circuit.probing = False
+
+    def abandon(self, host: str) -> None:
+        """Let another probe through after one ended without an outcome."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.probing = False
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Close one host's circuit, or every circuit."""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
@@ -0,0 +1,57 @@
+"""
+Helpers for rebuilding HTTP responses from stored data.
+Lets caches and offline transports hand clients ordinary response objects.
+"""
+
+from typing import Mapping
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+def build_response(
+    url: str, status_code: int, headers: Mapping[str, str], content: bytes
+) -> requests.Response:
+    """
+    Build a `requests.Response` from its parts without any network I/O.
+
+    Args:
+        url (str): The URL the response belongs to
+        status_code (int): The HTTP status code
+        headers (Mapping[str, str]): The response headers
+        content (bytes): The raw response body
+
+    Returns:
+        requests.Response: A response behaving like one read from the network
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = "utf-8"
+    response._content = content
+    response._content_consumed = True  # So iter_content() yields the body
+    return response
+
+
+# Headers describing the wire encoding, which no longer apply once the body
+# has been read and decoded
+_TRANSPORT_HEADERS = frozenset({
+    "connection", "content-encoding", "content-length", "keep-alive",
+    "transfer-encoding",
+})
+
+
+def storable_headers(headers: Mapping[str, str]) -> dict:
+    """
+    Return the headers worth keeping alongside a decoded response body.
+
+    Args:
+        headers (Mapping[str, str]): The response headers
+
+    Returns:
+        dict: Headers without hop-by-hop and encoding headers
+    """
+    return {
+        name: value for name, value in headers.items()
+        if name.lower() not in _TRANSPORT_HEADERS
+    }
@@ -0,0 +1,134 @@
+"""
+Request coalescing for concurrent identical lookups.
+Lets one caller do the work for a key while others wait for its result.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """A call in progress and its outcome."""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key across threads.
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving while it runs wait and receive the same value, or the same
+    exception. Once the call finishes, the key is released, so later
+    callers start a new call.
+
+    Usage:
+        flight = SingleFlight()
+        response = flight.do(url, lambda: transport.send(url))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn`, unless a call with the same key is already running.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. a URL
+            fn (Callable): The work to do
+
+        Returns:
+            The value returned by `fn`, possibly in another thread
+
+        Raises:
+            Exception: Whatever `fn` raised, in the leader and every waiter
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls with the same key across asyncio tasks.
+
+    The leader's coroutine runs in its own task, so cancelling one waiter,
+    even the one that started the call, does not cancel it for the others.
+
+    Usage:
+        flight = AsyncSingleFlight()
+        response = await flight.do(url, lambda: transport.send(url))
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()`, unless a call with the same key is already running.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. a URL
+            fn (Callable): Coroutine function doing the work
+
+        Returns:
+            The value returned by `fn`
+
+        Raises:
+            Exception: Whatever `fn` raised, in every waiter
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._release(key, task))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the outcome as retrieved when every waiter was cancelled
+            task.exception()
+
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._tasks)
@@ -0,0 +1,308 @@
+"""
+Incremental parsing of JSON response bodies.
+Builds models from a body as it arrives, one array element at a time, so
+large responses are never held in memory as bytes, text and dicts at once.
+"""
+
+import codecs
+import json
+import re
+import typing
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type
+from pydantic import BaseModel
+from ..constants import MODEL_MODE_COMPACT, MODEL_MODE_VALIDATED
+from ..models.trusted import decode_model
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStream:
+    """
+    Reader of one JSON document arriving in chunks of bytes.
+
+    Only the unread part of the current chunk and the value being decoded
+    are kept, so an array can be consumed element by element in memory
+    bounded by its largest element rather than by the whole document.
+
+    Usage:
+        stream = JsonStream(response.iter_content(65536))
+        for key in stream.members():
+            if key == "moves":
+                for move in stream.elements():
+                    ...
+            else:
+                stream.skip()
+        stream.end()
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        Initialize the reader.
+
+        Args:
+            chunks (Iterable[bytes]): The document, in chunks of any size
+        """
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int = 0) -> bool:
+        """
+        Read chunks until more than `size` characters are unread.
+
+        Returns:
+            bool: Whether any text was added; False at the end of the document
+        """
+        if self._eof:
+            return False
+        unread = len(self._buffer) - self._pos
+        parts, added = [], 0
+        while not added or unread + added <= size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                parts.append(self._utf8.decode(b"", final=True))
+                added += len(parts[-1])
+                break
+            parts.append(self._utf8.decode(chunk))
+            added += len(parts[-1])
+        if added:
+            self._buffer = self._buffer[self._pos:] + "".join(parts)
+            self._pos = 0
+        return bool(added)
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self._peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of document"
+            expected = " or ".join(repr(c) for c in chars)
+            raise ValueError(f"Expected {expected} in JSON stream, found {found}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """
+        Decode the next complete value.
+
+        Returns:
+            The decoded value
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete so far: read at least as much again, so values
+                # spanning many chunks are not decoded once per chunk
+                if self._fill(2 * (len(self._buffer) - self._pos)):
+                    continue
+                raise
+            # A value ending the buffer may continue in the next chunk
+            if end < len(self._buffer) or not self._fill():
+                self._pos = end
+                return value
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next value, which must be an object.
+
+        Consume each key's value, with `value()`, `elements()` or `skip()`,
+        before advancing to the next key.
+
+        Yields:
+            str: Each key in document order
+
+        Raises:
+            ValueError: If the value is not a valid object
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                raise ValueError("Expected an object key in JSON stream")
+            key = self.value()
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def elements(self) -> Iterator[Any]:
+        """
+        Iterate over the elements of the next value, which must be an array.
+
+        Yields:
+            Each element, decoded as it is reached
+
+        Raises:
+            ValueError: If the value is not a valid array
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._expect(",]") == "]":
+                return
+
+    def is_array(self) -> bool:
+        """Whether the next value is an array."""
+        return self._peek() == "["
+
+    def skip(self) -> None:
+        """Read past the next value, decoding arrays one element at a time."""
+        if self.is_array():
+            for _ in self.elements():
+                pass
+        else:
+            self.value()
+
+    def end(self) -> None:
+        """
+        Check that nothing but whitespace follows the document.
+
+        Raises:
+            ValueError: If extra data follows
+        """
+        if self._peek():
+            raise ValueError("Extra data after JSON document")
+
+
+def _item_model(annotation) -> Optional[Type[BaseModel]]:
+    """The model of a `List[Model]` or `Optional[List[Model]]` annotation."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if typing.get_origin(annotation) is not list:
+        return None
+    item = typing.get_args(annotation)[0]
+    if isinstance(item, type) and issubclass(item, BaseModel):
+        return item
+    return None
+
+
+def list_fields(model_cls: Type[BaseModel]) -> Dict[str, Tuple[str, Type[BaseModel]]]:
+    """
+    Return the fields of a model holding lists of models.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model class
+
+    Returns:
+        Dict[str, Tuple[str, Type[BaseModel]]]: JSON key -> (field name,
+            item model) for each such field
+    """
+    fields = {}
+    for name, field in model_cls.model_fields.items():
+        item = _item_model(field.annotation)
+        if item is not None:
+            fields[field.alias or name] = (name, item)
+    return fields
+
+
+def stream_model(model_cls: Type[BaseModel], chunks: Iterable[bytes],
+                 mode: str = MODEL_MODE_VALIDATED):
+    """
+    Build a model from a JSON object arriving in chunks.
+
+    Elements of fields holding lists of models (a Pokemon's moves, game
+    indices, stats, ...) are built one at a time as they are read. Keys the
+    model does not declare are read past without being kept. Peak memory is
+    the finished model plus one chunk, instead of the body, its decoded
+    JSON and the model together.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model class to build
+        chunks (Iterable[bytes]): The response body, in chunks
+        mode (str, optional): "validated", "trusted" or "compact", see
+            `parse_model`
+
+    Returns:
+        An instance of `model_cls` or of its trusted or compact mirror
+
+    Raises:
+        ValueError: If the body is not valid JSON or does not fit the model
+    """
+    stream = JsonStream(chunks)
+    fields = list_fields(model_cls)
+    keys = {field.alias or name for name, field in model_cls.model_fields.items()}
+    data, lists = {}, {}
+    for key in stream.members():
+        if key not in keys:
+            stream.skip()
+        elif key in fields and stream.is_array():
+            name, item_cls = fields[key]
+            # Validated with an empty list, then replaced by the built items
+            data[key] = []
+            lists[name] = [
+                decode_model(item_cls, element, mode)
+                for element in stream.elements()
+            ]
+        else:
+            data[key] = stream.value()
+    stream.end()
+
+    value = decode_model(model_cls, data, mode)
+    for name, items in lists.items():
+        if mode == MODEL_MODE_COMPACT:
+            items = tuple(items)
+        # Bypasses the frozen __setattr__ of compact models
+        object.__setattr__(value, name, items)
+    return value
+
+
+def stream_items(model_cls: Type[BaseModel], field: str, chunks: Iterable[bytes],
+                 mode: str = MODEL_MODE_VALIDATED) -> Iterator[Any]:
+    """
+    Iterate over the elements of one list field of a JSON object arriving
+    in chunks, building each one as it is read.
+
+    Other keys are read past without being kept, so memory stays bounded by
+    one chunk and one element however long the list is.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model of the whole object
+        field (str): Name of a field of `model_cls` holding a list of models
+        chunks (Iterable[bytes]): The response body, in chunks
+        mode (str, optional): "validated", "trusted" or "compact", see
+            `parse_model`
+
+    Yields:
+        Each element as an instance of the item model or of its mirror
+
+    Raises:
+        ValueError: If the body is not valid JSON or an element does not
+            fit the item model
+    """
+    fields = {name: (key, item) for key, (name, item) in list_fields(model_cls).items()}
+    if field not in fields:
+        raise ValueError(f"{model_cls.__name__}.{field} is not a list of models")
+    key, item_cls = fields[field]
+    stream = JsonStream(chunks)
+    for member in stream.members():
+        if member == key and stream.is_array():
+            for element in stream.elements():
+                yield decode_model(item_cls, element, mode)
+        else:
+            stream.skip()
+    stream.end()
@@ -0,0 +1,499 @@
+"""
+Transport implementations for sending HTTP requests.
+Provides a pooled, keep-alive transport shared between API clients.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Tuple, Union
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from .ratelimit import AdaptiveConcurrency, RateLimiter, parse_retry_after
+from .hooks import Hook, RetryEvent
+from .resilience import CircuitBreaker, HedgePolicy, RetryPolicy
+from ..constants import (
+    DEFAULT_HEADERS, TIMEOUT, POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK,
+    RATE_LIMIT_BACKOFF, HEDGE_MAX_WORKERS,
+)
+
+# A timeout in seconds, or a (connect, read) pair
+Timeout = Union[float, Tuple[float, float]]
+
+# Exceptions after which an idempotent request is worth sending again
+RETRY_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+
+class Transport(ABC):
+    """Base abstract class for transports that send GET requests."""
+
+    @abstractmethod
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response
+        """
+        pass
+
+    def stream(self, url: str, headers: Optional[dict] = None,
+               timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request, returning before the body is read where possible.
+
+        Read the body with `response.iter_content(chunk_size)` and close the
+        response when done. Transports that hold bodies in memory anyway
+        return a complete response from `send`.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response
+        """
+        return self.send(url, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        """Release any resources held by the transport."""
+        pass
+
+    def release(self) -> None:
+        """
+        Release resources held by this wrapper only, leaving the transport
+        it wraps open.
+
+        Lets the creator of a wrapper around a transport it does not own
+        clean up without closing that transport.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class HttpTransport(Transport):
+    """
+    Transport backed by a pooled `requests.Session`.
+
+    Connections are kept alive between requests and reused by every client
+    sharing the transport, so repeated lookups skip the TCP and TLS handshake.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        keep_alive: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_connections (int, optional): Number of per-host connection
+                pools to cache
+            pool_maxsize (int, optional): Maximum number of connections kept
+                open per host
+            pool_block (bool, optional): Whether to wait for a free connection
+                instead of opening one beyond `pool_maxsize`
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests
+        """
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT) -> requests.Response:
+        """
+        Send a GET request over the pooled session.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            requests.Response: The HTTP response
+        """
+        return self.session.get(url, headers=headers, timeout=timeout)
+
+    def stream(self, url: str, headers: Optional[dict] = None,
+               timeout: Timeout = TIMEOUT) -> requests.Response:
+        """
+        Send a GET request, returning once the headers are read.
+
+        The connection goes back to the pool when the body has been read
+        or the response is closed.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            requests.Response: The HTTP response, with its body unread
+        """
+        return self.session.get(url, headers=headers, timeout=timeout, stream=True)
+
+    def close(self) -> None:
+        """Close the session and every pooled connection."""
+        self.session.close()
+
+
+def is_congested(status_code: int) -> bool:
+    """Whether a response status signals that the server is overloaded."""
+    return status_code == 429 or status_code >= 500
+
+
+class ThrottledTransport(Transport):
+    """
+    Transport wrapper applying a rate limit and an adaptive concurrency
+    limit to every request sent through it.
+
+    Requests wait for a token from the rate limiter, then for a concurrency
+    slot. Each outcome feeds the concurrency limit: 429 and 5xx responses,
+    transport errors and slow responses shrink it. A 429 also pauses the
+    rate limiter for the server's Retry-After, or `backoff` seconds, so
+    every client sharing it backs off together.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        backoff: float = RATE_LIMIT_BACKOFF,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (Transport): Transport that sends the requests
+            rate_limiter (RateLimiter, optional): Limiter spacing requests
+            concurrency (AdaptiveConcurrency, optional): Limit on requests
+                in flight
+            backoff (float, optional): Pause after a 429 response without
+                a Retry-After header, in seconds
+        """
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.backoff = backoff
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request once the limits allow it.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response
+        """
+        return self._limited(self.transport.send, url, headers, timeout)
+
+    def stream(self, url: str, headers: Optional[dict] = None,
+               timeout: Timeout = TIMEOUT):
+        """
+        Stream a GET request once the limits allow it.
+
+        The concurrency slot is released once the headers arrive.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response, with its body unread where supported
+        """
+        return self._limited(self.transport.stream, url, headers, timeout)
+
+    def _limited(self, send, url: str, headers: Optional[dict],
+                 timeout: Timeout):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        start = time.perf_counter()
+        congested = True
+        try:
+            response = send(url, headers=headers, timeout=timeout)
+            congested = is_congested(response.status_code)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.rate_limiter.pause(
+                    retry_after if retry_after is not None else self.backoff
+                )
+            return response
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release(time.perf_counter() - start, congested)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class ResilientTransport(Transport):
+    """
+    Transport wrapper retrying failed requests and tripping a circuit
+    breaker on unhealthy hosts.
+
+    Timeouts, connection errors and retryable statuses are sent again after
+    the retry policy's backoff. Each attempt first checks the host's
+    circuit, so a host that keeps failing is given up on at once with
+    `CircuitOpenError` rather than after every retry. Once retries are
+    exhausted, the last response is returned or the last error re-raised.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hooks: Optional[Hook] = None,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (Transport): Transport that sends the requests
+            retry_policy (RetryPolicy, optional): When to send requests
+                again. Requests are sent once if omitted.
+            circuit_breaker (CircuitBreaker, optional): Breaker consulted
+                before, and updated after, every attempt
+            hooks (Hook, optional): Hook receiving a `RetryEvent` per retry
+        """
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hooks = hooks
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def _attempt(self, send, url: str, host: str, headers: Optional[dict],
+                 timeout: Timeout):
+        if self.circuit_breaker is None:
+            return send(url, headers=headers, timeout=timeout)
+        self.circuit_breaker.allow(host)
+        try:
+            response = send(url, headers=headers, timeout=timeout)
+        except RETRY_ERRORS:
+            self.circuit_breaker.record(host, True)
+            raise
+        except BaseException:
+            self.circuit_breaker.abandon(host)
+            raise
+        self.circuit_breaker.record(host, response.status_code >= 500)
+        return response
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request, retrying it as the policy allows.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Timeout of each attempt
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        return self._retried(self.transport.send, url, headers, timeout)
+
+    def stream(self, url: str, headers: Optional[dict] = None,
+               timeout: Timeout = TIMEOUT):
+        """
+        Stream a GET request, retrying it as the policy allows.
+
+        Only failures before the headers arrive are retried; an error while
+        the body is read is raised to the reader.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Timeout of each attempt
+
+        Returns:
+            The HTTP response, with its body unread where supported
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        return self._retried(self.transport.stream, url, headers, timeout)
+
+    def _retried(self, send, url: str, headers: Optional[dict],
+                 timeout: Timeout):
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._attempt(send, url, host, headers, timeout)
+            except RETRY_ERRORS as e:
+                delay = (self.retry_policy.next_delay(attempt)
+                         if self.retry_policy is not None else None)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                if (self.retry_policy is None
+                        or not self.retry_policy.retries_status(response.status_code)):
+                    return response
+                delay = self.retry_policy.next_delay(
+                    attempt, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                if delay is None:
+                    return response
+                response.close()  # Releases the connection of an unread body
+                reason = str(response.status_code)
+            with self._lock:
+                self.retries += 1
+            if self.hooks:
+                self.hooks.on_retry(RetryEvent(url, attempt, delay, reason))
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class HedgedTransport(Transport):
+    """
+    Transport wrapper sending a second copy of requests that are slow to
+    answer, and returning whichever response arrives first.
+
+    Cuts tail latency at the cost of a few percent more requests. Copies
+    are sent from a thread pool; the losing copy runs to completion in the
+    background and its response is dropped. An error or 5xx response from
+    one copy is only returned if the other fails too.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        hedge_policy: Optional[HedgePolicy] = None,
+        max_workers: int = HEDGE_MAX_WORKERS,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport (Transport): Transport that sends the requests
+            hedge_policy (HedgePolicy, optional): When to send the second
+                copy. Defaults to an adaptive 95th percentile delay.
+            max_workers (int, optional): Threads sending copies
+        """
+        self.transport = transport
+        self.hedge_policy = hedge_policy if hedge_policy is not None else HedgePolicy()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pokeapi-hedge"
+        )
+
+    def _timed(self, url: str, headers: Optional[dict], timeout: Timeout):
+        start = time.perf_counter()
+        response = self.transport.send(url, headers=headers, timeout=timeout)
+        self.hedge_policy.record(time.perf_counter() - start)
+        return response
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: Timeout = TIMEOUT):
+        """
+        Send a GET request, hedging it if it is slow to answer.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Timeout of each copy
+
+        Returns:
+            The first successful HTTP response
+        """
+        delay = self.hedge_policy.hedge_delay()
+        if delay is None:
+            return self._timed(url, headers, timeout)
+
+        primary = self._executor.submit(self._timed, url, headers, timeout)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        hedge = self._executor.submit(self._timed, url, headers, timeout)
+
+        pending = {primary, hedge}
+        fallback = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().status_code < 500:
+                    self.hedge_policy.record_hedge(future is hedge)
+                    return future.result()
+                if fallback is None:
+                    fallback = future
+        self.hedge_policy.record_hedge(False)
+        return fallback.result()
+
+    def stream(self, url: str, headers: Optional[dict] = None,
+               timeout: Timeout = TIMEOUT):
+        """
+        Stream a GET request without hedging it.
+
+        A streamed body is read by the caller after this returns, so a
+        second copy could not be cancelled once it won the race.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Extra headers for this request
+            timeout (Timeout, optional): Request timeout in seconds, or a
+                (connect, read) pair
+
+        Returns:
+            The HTTP response, with its body unread where supported
+        """
+        return self.transport.stream(url, headers=headers, timeout=timeout)
+
+    def release(self) -> None:
+        """Stop the hedging threads, leaving the wrapped transport open."""
+        self._executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Stop the hedging threads and close the wrapped transport."""
+        self.release()
+        self.transport.close()
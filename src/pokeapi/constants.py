@@ -12,11 +12,75 @@ GENERATION_ENDPOINT: Final = "/generation"
 
 # HTTP Settings
 TIMEOUT: Final = 30
+CONNECT_TIMEOUT: Final = 5  # Seconds allowed to open a connection
+READ_TIMEOUT: Final = TIMEOUT  # Seconds allowed between bytes of a response
+REQUEST_TIMEOUT: Final = (CONNECT_TIMEOUT, READ_TIMEOUT)  # Used by the clients
 DEFAULT_HEADERS: Final = {
     "Accept": "application/json",
     "User-Agent": "PokeSDK/1.0"
 }
 
+# Connection Pool Settings
+POOL_CONNECTIONS: Final = 10  # Number of per-host pools kept alive
+POOL_MAXSIZE: Final = 10  # Maximum open connections per host
+POOL_BLOCK: Final = False  # Block instead of opening extra connections
+MAX_CONCURRENCY: Final = 10  # In-flight requests allowed by async clients
+BULK_MAX_WORKERS: Final = POOL_MAXSIZE  # Threads used by bulk fetches
+
+# Pagination Settings
+DEFAULT_PAGE_SIZE: Final = 100  # Resources per page when iterating lists
+PAGE_PREFETCH: Final = 1  # Pages fetched ahead while iterating lists
+
+# Cache Settings
+CACHE_MAXSIZE: Final = 1024  # Maximum number of cached responses
+CACHE_TTL: Final = 24 * 60 * 60  # Seconds before a cached response expires
+DISK_CACHE_MAX_BYTES: Final = 256 * 1024 * 1024  # Size limit of the disk cache
+DISK_CACHE_TOUCH_INTERVAL: Final = 60.0  # Seconds before a disk cache hit records its access again
+
+# Model Modes
+MODEL_MODE_VALIDATED: Final = "validated"  # Validated pydantic models
+MODEL_MODE_TRUSTED: Final = "trusted"  # Unvalidated slotted mirrors, faster
+MODEL_MODE_COMPACT: Final = "compact"  # Frozen slotted mirrors sharing repeated values
+MODEL_MODES: Final = (MODEL_MODE_VALIDATED, MODEL_MODE_TRUSTED, MODEL_MODE_COMPACT)
+
+# Streaming Settings
+STREAM_CHUNK_SIZE: Final = 64 * 1024  # Bytes read at a time from streamed responses
+
+# Rate Limiting Settings
+RATE_LIMIT_BACKOFF: Final = 1.0  # Pause after a 429 without Retry-After, in seconds
+AIMD_LATENCY_TARGET: Final = 2.0  # Slower responses reduce the concurrency limit
+AIMD_DECREASE_FACTOR: Final = 0.5  # Factor applied to the limit on overload
+
+# Retry and Resilience Settings
+RETRY_ATTEMPTS: Final = 3  # Attempts per request, the first one included
+RETRY_BACKOFF: Final = 0.2  # Wait ceiling after the first failure, in seconds
+RETRY_MAX_BACKOFF: Final = 10.0  # Highest wait ceiling, in seconds
+RETRY_STATUSES: Final = (429, 500, 502, 503, 504)  # Statuses worth retrying
+HEDGE_PERCENTILE: Final = 95  # Latency percentile after which requests are hedged
+HEDGE_MIN_SAMPLES: Final = 20  # Latencies seen before adaptive hedging starts
+HEDGE_WINDOW: Final = 200  # Recent latencies the hedging delay is computed from
+HEDGE_MAX_WORKERS: Final = 2 * POOL_MAXSIZE  # Threads sending hedged requests
+CIRCUIT_FAILURE_THRESHOLD: Final = 5  # Consecutive failures opening a circuit
+CIRCUIT_RECOVERY_TIME: Final = 30.0  # Seconds before an open circuit is probed
+
+# Metrics Settings
+METRICS_PREFIX: Final = "pokeapi"  # Prefix of exported metric names
+METRICS_LATENCY_BUCKETS: Final = (  # Request latency bucket bounds, in seconds
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+METRICS_SIZE_BUCKETS: Final = (  # Response size bucket bounds, in bytes
+    1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)
+METRICS_PARSE_BUCKETS: Final = (  # Parse duration bucket bounds, in seconds
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5,
+)
+
+# Local Dataset Settings
+LOCAL_SOURCE_PREFIX: Final = "local:"  # Prefix of `source` for local datasets
+SNAPSHOT_ENDPOINTS: Final = ("pokemon", "generation")  # Endpoints crawled by snapshot
+CRAWL_WORKERS: Final = 4  # Worker processes (or threads) used by crawl
+CRAWL_THREADS: Final = 4  # Concurrent requests per crawl worker
+CRAWL_BATCH_SIZE: Final = 50  # Resources fetched and checkpointed together by crawl
 
 # Error Messages
 class ErrorMessages:
@@ -35,4 +99,39 @@ class ErrorMessages:
     EMPTY_GENERATION_ID = "Generation ID or name cannot be empty"
     INVALID_GENERATION_ID = "Generation ID must be a positive number: {}"
     GENERATION_ID_WRONG_TYPE = "Generation ID must be an integer. Did you mean to use name='{}'?"
-    POKEMON_ID_WRONG_TYPE = "Pokemon ID must be an integer. Did you mean to use name='{}'?"
\ No newline at end of file
+    POKEMON_ID_WRONG_TYPE = "Pokemon ID must be an integer. Did you mean to use name='{}'?"
+    ASYNC_DEPENDENCY_MISSING = "The async client requires httpx. Install it with: pip install pokeapi-sdk[async]"
+    INVALID_CONCURRENCY = "Concurrency limit must be a positive number"
+    INVALID_MAX_WORKERS = "Max workers must be a positive number"
+    OFFLINE_CACHE_MISS = "Resource is not cached and offline mode is enabled: {}"
+    DISK_CACHE_ERROR = "Disk cache error: {}"
+    INVALID_PAGE_SIZE = "Page size must be a positive number"
+    INVALID_PREFETCH = "Prefetch must not be negative"
+    INVALID_NEXT_LINK = "Cannot read limit and offset from next link: {}"
+    UNEXPECTED_NOT_MODIFIED = "Server answered 304 Not Modified to an unconditional request"
+    INVALID_RESOURCE_URL = "Not a PokeAPI resource URL: {}"
+    INVALID_MODEL_MODE = "Model mode must be one of: {}"
+    INVALID_FIELDS = "Unknown {} fields: {}"
+    JSON_BACKEND_MISSING = "The orjson decoder requires orjson. Install it with: pip install pokeapi-sdk[fast]"
+    INVALID_DATASET = "Cannot open local dataset {}: {}"
+    SNAPSHOT_FAILED = "Snapshot failed fetching {} {}: {}"
+    INVALID_SOURCE = "Source must be 'remote' or 'local:<path>': {}"
+    SOURCE_WITH_TRANSPORT = "Pass either a source or a transport, not both"
+    TABLE_DEPENDENCY_MISSING = "PokemonTable requires numpy. Install it with: pip install pokeapi-sdk[table]"
+    UNKNOWN_STAT = "Unknown stat: {}. Available stats: {}"
+    TOO_MANY_TYPES = "Too many distinct types for a PokemonTable: {}"
+    INVALID_INDEX_KIND = "Unknown index kind: {}. Must be one of: {}"
+    INVALID_INDEX_FILE = "Cannot load generation index {}: {}"
+    RATE_LIMITED = "Rate limited by server (Retry-After: {})"
+    INVALID_RATE_LIMIT = "Rate and burst must be positive numbers"
+    INVALID_CONCURRENCY_BOUNDS = "Concurrency bounds must satisfy 1 <= minimum <= initial <= maximum, with a decrease factor between 0 and 1"
+    FILE_LOCK_UNAVAILABLE = "Sharing a rate limit between processes requires fcntl (POSIX only)"
+    INVALID_RETRY_POLICY = "Retry policy needs at least one attempt and non-negative delays"
+    INVALID_HEDGE_POLICY = "Hedge delay must not be negative and percentile must be between 0 and 100"
+    INVALID_CIRCUIT_BREAKER = "Circuit breaker needs a failure threshold of at least 1 and a non-negative recovery time"
+    CIRCUIT_OPEN = "Circuit open for {}: failing fast while the server is unhealthy"
+    INVALID_ARCHIVE = "Cannot open response archive {}: {}"
+    REPLAY_MISS = "No recorded response for {}"
+    INVALID_LIST_FIELD = "{} has no list field {}"
+    INVALID_CRAWL_OPTIONS = "Crawl workers, threads and batch size must be positive numbers"
+    REFRESH_FAILED = "Refresh failed fetching {} {}: {}"
\ No newline at end of file
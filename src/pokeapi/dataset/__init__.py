@@ -0,0 +1,26 @@
+"""
+Local dataset support for the PokeAPI.
+Provides the snapshot and parallel crawlers, incremental refreshes, the
+on-disk dataset and transports serving it.
+"""
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+from .store import LocalDataset, DatasetWriter, DatasetUpdater
+from .transport import LocalTransport
+from .snapshot import snapshot
+from .crawler import CrawlStats, crawl
+from .refresh import Change, RefreshResult, refresh
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_transport import AsyncLocalTransport
+
+__all__ = [
+    'LocalDataset', 'DatasetWriter', 'DatasetUpdater', 'LocalTransport',
+    'AsyncLocalTransport', 'snapshot', 'crawl', 'CrawlStats', 'refresh',
+    'RefreshResult', 'Change',
+]
+
+# Loaded on first use so the sync client does not import httpx
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'AsyncLocalTransport': '.async_transport',
+})
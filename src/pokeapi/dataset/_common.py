@@ -0,0 +1,143 @@
+"""
+Steps shared by the dataset writers.
+Lists endpoints and fetches, validates and compacts resource bodies for
+`snapshot`, `crawl` and `refresh`.
+"""
+
+import hashlib
+import json
+from typing import Callable, Dict, Iterator, List, Tuple
+from ..api_clients.bulk import fetch_many
+from ..api_clients.paginate import iter_pages
+from ..api_clients.resource_client import split_resource_url
+from ..api_clients.validation import page_params
+from ..connection.cache import validators
+from ..models.generation import Generation
+from ..models.pagination import NamedAPIResourceList
+from ..models.pokemon import Pokemon
+from ..models.trusted import parse_model
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+
+# Models each endpoint's bodies are validated against before being stored
+ENDPOINT_MODELS = {"pokemon": Pokemon, "generation": Generation}
+
+# (resource ID, name) pairs, in list order
+Listing = List[Tuple[int, str]]
+# (resource ID, name, compacted body, validators) of a fetched batch
+Batch = List[Tuple[int, str, bytes, Dict[str, str]]]
+
+
+def digest(body: bytes) -> str:
+    """Return the SHA-256 digest identifying a stored body."""
+    return hashlib.sha256(body).hexdigest()
+
+
+def compact(body: bytes) -> bytes:
+    """
+    Strip insignificant whitespace from a JSON body.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return json.dumps(
+        json.loads(body), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def prepare(endpoint: str, body: bytes) -> bytes:
+    """
+    Validate a body against its endpoint's model and compact it.
+
+    Raises:
+        PokeAPIError: If the body is not valid JSON for the model
+    """
+    model = ENDPOINT_MODELS.get(endpoint)
+    try:
+        if model is not None:
+            parse_model(model, body)
+        return compact(body)
+    except ValueError:
+        raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+
+
+def list_page(api, endpoint: str) -> Callable[[int, int], NamedAPIResourceList]:
+    """
+    Return a function fetching one page of an endpoint's list.
+
+    Pokemon and generations are listed through their clients, other
+    endpoints through the generic resource client.
+
+    Args:
+        api (PokeAPI): The API to list from
+        endpoint (str): Endpoint name, e.g. "pokemon"
+
+    Returns:
+        Callable[[int, int], NamedAPIResourceList]: Takes a limit and offset
+    """
+    clients = {"pokemon": api.list_pokemon, "generation": api.list_generations}
+    if endpoint in clients:
+        return clients[endpoint]
+    client = api.resources
+
+    def list_resources(limit: int, offset: int) -> NamedAPIResourceList:
+        try:
+            return client.get_model(
+                f"/{endpoint}", page_params(limit, offset), NamedAPIResourceList
+            )
+        except ValueError:
+            raise PokeAPIError(ErrorMessages.INVALID_JSON_RESPONSE)
+    return list_resources
+
+
+def iter_listing(api, endpoint: str, page_size: int) -> Iterator[Listing]:
+    """
+    Walk an endpoint's list one page at a time.
+
+    Yields:
+        Listing: The (ID, name) pairs of each page
+    """
+    for page in iter_pages(list_page(api, endpoint), page_size):
+        yield [(int(split_resource_url(resource.url)[1]), resource.name)
+               for resource in page.results]
+
+
+def list_endpoint(api, endpoint: str, page_size: int) -> Listing:
+    """Return every (ID, name) pair of an endpoint's list, in list order."""
+    return [resource for page in iter_listing(api, endpoint, page_size)
+            for resource in page]
+
+
+def fetch_batch(api, endpoint: str, batch: Listing, max_workers: int) -> Batch:
+    """
+    Fetch, validate and compact the bodies of a batch of resources.
+
+    Args:
+        api (PokeAPI): The API to fetch from
+        endpoint (str): Endpoint name, e.g. "pokemon"
+        batch (Listing): The resources to fetch
+        max_workers (int): Maximum number of concurrent requests
+
+    Returns:
+        Batch: The resources with their bodies and response validators
+
+    Raises:
+        PokeAPIError: If a resource cannot be fetched or is invalid
+    """
+    path = f"/{endpoint}"
+
+    def fetch(resource_id: int) -> Tuple[bytes, Dict[str, str]]:
+        response = api.resources.get(path, str(resource_id))
+        return prepare(endpoint, response.content), validators(response.headers)
+
+    results = fetch_many(
+        fetch, [resource_id for resource_id, _ in batch], max_workers
+    )
+    fetched = []
+    for (resource_id, name), result in zip(batch, results):
+        if not result.ok:
+            raise PokeAPIError(ErrorMessages.SNAPSHOT_FAILED.format(
+                endpoint, resource_id, result.error.message
+            ))
+        fetched.append((resource_id, name, *result.value))
+    return fetched
@@ -0,0 +1,52 @@
+"""
+Asynchronous transport answering requests from a local dataset.
+Lets AsyncPokeAPI serve lookups and list pages without any network I/O.
+"""
+
+from typing import Optional
+import requests
+from ..connection.async_transport import AsyncTransport
+from ..constants import TIMEOUT
+from .transport import LocalTransport
+
+
+class AsyncLocalTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of `LocalTransport` for `AsyncPokeAPI`.
+
+    Lookups are memory reads, so they are answered without yielding to the
+    event loop.
+    """
+
+    def __init__(self, dataset):
+        """
+        Initialize the transport.
+
+        Args:
+            dataset (Union[str, LocalDataset]): The dataset, or the directory
+                it was written to
+
+        Raises:
+            PokeAPIError: If the directory is not a readable dataset
+        """
+        self._local = LocalTransport(dataset)
+        self.dataset = self._local.dataset
+
+    async def send(self, url: str, headers: Optional[dict] = None,
+                   timeout: float = TIMEOUT) -> requests.Response:
+        """
+        Answer a GET request from the dataset.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Ignored, kept for compatibility
+            timeout (float, optional): Ignored, kept for compatibility
+
+        Returns:
+            requests.Response: A 200 response with the stored body, or 404
+        """
+        return self._local.send(url, headers, timeout)
+
+    async def aclose(self) -> None:
+        """Close the dataset."""
+        self._local.close()
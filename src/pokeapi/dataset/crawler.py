@@ -0,0 +1,423 @@
+"""
+Parallel crawler writing local PokeAPI datasets.
+Fetches and parses resources in worker processes under one global rate
+limit, checkpointing every finished batch so a killed crawl resumes where
+it stopped.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from ..connection.ratelimit import FileTokenBucket, TokenBucket
+from ..connection.resilience import RetryPolicy
+from ..constants import (
+    BASE_URL, CRAWL_BATCH_SIZE, CRAWL_THREADS, CRAWL_WORKERS,
+    DEFAULT_PAGE_SIZE, SNAPSHOT_ENDPOINTS, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+from ._common import Batch, Listing, fetch_batch, list_endpoint
+from .store import DatasetWriter
+
+CHECKPOINT_VERSION = 2
+
+
+class CrawlStats:
+    """
+    Progress and throughput of a crawl.
+
+    Passed to the progress callback after every batch and returned by
+    `crawl` once the dataset is written.
+
+    Attributes:
+        counts (Dict[str, int]): Resources stored per endpoint, including
+            those restored from a checkpoint
+        total (int): Resources listed across all endpoints
+        resumed (int): Resources restored from a checkpoint
+        fetched (int): Resources fetched by this run
+        bytes (int): Compacted body bytes fetched by this run
+        elapsed (float): Seconds since the crawl started
+    """
+
+    __slots__ = ("counts", "total", "resumed", "fetched", "bytes", "elapsed")
+
+    def __init__(self, counts: Dict[str, int], total: int, resumed: int):
+        self.counts = counts
+        self.total = total
+        self.resumed = resumed
+        self.fetched = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def completed(self) -> int:
+        """Resources stored so far, across all endpoints."""
+        return sum(self.counts.values())
+
+    @property
+    def rate(self) -> float:
+        """Resources fetched per second by this run."""
+        return self.fetched / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def byte_rate(self) -> float:
+        """Body bytes fetched per second by this run."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        """Return the stats as a JSON-serializable dict."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(completed=self.completed, rate=self.rate,
+                      byte_rate=self.byte_rate)
+        return fields
+
+    def __repr__(self):
+        return (f"CrawlStats(completed={self.completed}/{self.total}, "
+                f"resumed={self.resumed}, rate={self.rate:.1f}/s)")
+
+
+class Checkpoint:
+    """
+    Batches finished by a crawl, kept on disk until the dataset is written.
+
+    Each batch's bodies are written to a file of their own before the batch
+    is appended to a log, so a crawl killed at any point loses at most the
+    batches in flight. A checkpoint is only resumed by a crawl with the
+    same plan (source, endpoints, batch size and listed resources); any
+    other checkpoint at the path is discarded.
+    """
+
+    PLAN_FILE = "plan.json"
+    LOG_FILE = "batches.log"
+
+    def __init__(self, path: str, plan: dict):
+        """
+        Open the checkpoint at `path`, or start a new one.
+
+        Args:
+            path (str): Directory holding the checkpoint
+            plan (dict): Description of the crawl, see `crawl_plan`
+        """
+        self.path = path
+        self._batches: Dict[Tuple[str, int], list] = {}
+        if self._read_plan() == plan:
+            self._read_log()
+        else:
+            shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(path)
+            self._write_json(self.PLAN_FILE, plan)
+        self._log = open(os.path.join(path, self.LOG_FILE), "a")
+
+    def _write_json(self, name: str, value) -> None:
+        tmp = os.path.join(self.path, f"{name}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp, os.path.join(self.path, name))
+
+    def _read_plan(self) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.path, self.PLAN_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_log(self) -> None:
+        # Keeps the records before any line torn by a kill, and rewrites
+        # the log without it so later records are appended cleanly
+        lines = []
+        try:
+            with open(os.path.join(self.path, self.LOG_FILE)) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    key = (record["endpoint"], record["offset"])
+                    if os.path.exists(self._batch_file(*key)):
+                        self._batches[key] = record["entries"]
+                        lines.append(line)
+        except OSError:
+            pass
+        tmp = os.path.join(self.path, f"{self.LOG_FILE}.tmp")
+        with open(tmp, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp, os.path.join(self.path, self.LOG_FILE))
+
+    def _batch_file(self, endpoint: str, offset: int) -> str:
+        return os.path.join(self.path, f"{endpoint}-{offset}.bin")
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        """Whether the batch at (endpoint, offset) is finished."""
+        return key in self._batches
+
+    def count(self, endpoint: str) -> int:
+        """Number of resources of an endpoint in finished batches."""
+        return sum(len(entries) for (name, _), entries in self._batches.items()
+                   if name == endpoint)
+
+    def record(self, endpoint: str, offset: int, batch: Batch) -> None:
+        """
+        Store a finished batch durably.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            offset (int): Position of the batch's first resource in the list
+            batch (Batch): The batch's resources and bodies
+        """
+        path = self._batch_file(endpoint, offset)
+        with open(f"{path}.tmp", "wb") as f:
+            for _, _, body, _ in batch:
+                f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+        entries = [[resource_id, name, len(body), response_validators]
+                   for resource_id, name, body, response_validators in batch]
+        self._log.write(json.dumps(
+            {"endpoint": endpoint, "offset": offset, "entries": entries}
+        ) + "\n")
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._batches[(endpoint, offset)] = entries
+
+    def read(self, endpoint: str, offset: int) -> Iterator[Tuple[int, str, bytes, Dict[str, str]]]:
+        """
+        Iterate over the resources of a finished batch.
+
+        Yields:
+            Tuple[int, str, bytes, Dict[str, str]]: The resource ID, name,
+                body and response validators
+        """
+        with open(self._batch_file(endpoint, offset), "rb") as f:
+            for resource_id, name, length, response_validators in self._batches[(endpoint, offset)]:
+                yield resource_id, name, f.read(length), response_validators
+
+    def close(self) -> None:
+        """Close the log."""
+        self._log.close()
+
+    def remove(self) -> None:
+        """Delete the checkpoint."""
+        self.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def crawl_plan(base_url: str, listings: Dict[str, Listing], batch_size: int) -> dict:
+    """
+    Describe a crawl, so a checkpoint is only resumed by the same crawl.
+
+    Args:
+        base_url (str): Base URL of the crawled API
+        listings (Dict[str, Listing]): Listed resources per endpoint
+        batch_size (int): Resources per batch
+
+    Returns:
+        dict: JSON-serializable description of the crawl
+    """
+    digest = hashlib.sha256(
+        json.dumps(listings, separators=(",", ":")).encode()
+    ).hexdigest()
+    return {
+        "version": CHECKPOINT_VERSION,
+        "source_url": base_url,
+        "batch_size": batch_size,
+        "counts": {endpoint: len(listing) for endpoint, listing in listings.items()},
+        "listing": digest,
+    }
+
+
+# Client of a worker process, created once by _init_worker
+_worker_api = None
+
+
+def _init_worker(options: dict, bucket: Optional[Tuple[str, float]]) -> None:
+    # Runs in each worker process, giving it one client and connection pool.
+    # The rate limit is shared through the bucket file, opened per process.
+    global _worker_api
+    from ..sdk.pokeapi import PokeAPI
+    if bucket is not None:
+        options = {**options, "rate_limiter": FileTokenBucket(*bucket)}
+    _worker_api = PokeAPI(**options)
+
+
+def _fetch_in_worker(endpoint: str, batch: Listing, threads: int) -> Batch:
+    return fetch_batch(_worker_api, endpoint, batch, threads)
+
+
+def crawl(
+    path: str,
+    base_url: str = BASE_URL,
+    endpoints: Iterable[str] = SNAPSHOT_ENDPOINTS,
+    workers: int = CRAWL_WORKERS,
+    threads: int = CRAWL_THREADS,
+    processes: bool = True,
+    rate: Optional[float] = None,
+    batch_size: int = CRAWL_BATCH_SIZE,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    retry_policy: Optional[RetryPolicy] = None,
+    progress: Optional[Callable[[CrawlStats], None]] = None,
+) -> CrawlStats:
+    """
+    Download every resource of the given endpoints into a local dataset,
+    in parallel and resumably.
+
+    The endpoints are listed first. Their resources are then split into
+    batches that worker processes fetch, validate against their models and
+    compact, each worker sending `threads` requests at a time. Finished
+    batches are checkpointed in `<path>.crawl`, so running the same crawl
+    again after it was killed or failed only fetches the batches that were
+    missing. The dataset replaces `path` once every batch is done, in the
+    format written by `snapshot`.
+
+    Usage:
+        stats = crawl("/data/pokeapi", workers=8, rate=50)
+        local = PokeAPI(source="local:/data/pokeapi")
+
+    Args:
+        path (str): Directory to write the dataset to
+        base_url (str, optional): Base URL of the API to crawl
+        endpoints (Iterable[str], optional): Endpoint names to crawl.
+            Defaults to "pokemon" and "generation".
+        workers (int, optional): Worker processes, or threads if
+            `processes` is False
+        threads (int, optional): Concurrent requests per worker
+        processes (bool, optional): Whether workers are processes, which
+            parse in parallel, or threads of this process
+        rate (float, optional): Requests per second allowed across every
+            worker, listing included. Unlimited if omitted. Worker
+            processes share it through a `FileTokenBucket`.
+        batch_size (int, optional): Resources per batch, the unit of work
+            and of checkpointing
+        page_size (int, optional): Resources per list request
+        retry_policy (RetryPolicy, optional): Retries transient failures
+            of every request
+        progress (Callable[[CrawlStats], None], optional): Called with the
+            stats after every batch
+
+    Returns:
+        CrawlStats: Resources stored per endpoint and the run's throughput
+
+    Raises:
+        PokeAPIError: If an option is not positive, or a list or resource
+            cannot be fetched, in which case finished batches are kept for
+            the next run and nothing is written to `path`
+    """
+    if workers <= 0 or threads <= 0 or batch_size <= 0:
+        raise PokeAPIError(ErrorMessages.INVALID_CRAWL_OPTIONS)
+    from ..sdk.pokeapi import PokeAPI
+
+    start = time.perf_counter()
+    path = os.path.abspath(os.path.expanduser(path))
+    options = {
+        "base_url": base_url, "retry_policy": retry_policy,
+        "pool_maxsize": threads if processes else threads * workers,
+    }
+    bucket = limiter = None
+    if rate is not None and processes:
+        bucket = (f"{path}.crawl-rate", rate)
+        limiter = FileTokenBucket(*bucket)
+    elif rate is not None:
+        limiter = TokenBucket(rate)
+
+    try:
+        with PokeAPI(rate_limiter=limiter, **options) as api:
+            listings = {
+                endpoint: list_endpoint(api, endpoint, page_size)
+                for endpoint in endpoints
+            }
+            checkpoint = Checkpoint(
+                f"{path}.crawl", crawl_plan(base_url, listings, batch_size)
+            )
+            try:
+                stats = _run_batches(
+                    api, options, bucket, listings, checkpoint, workers,
+                    threads, processes, batch_size, progress, start,
+                )
+            finally:
+                checkpoint.close()
+    finally:
+        if bucket is not None:
+            limiter.close()
+
+    with DatasetWriter(path, base_url) as writer:
+        for endpoint, listing in listings.items():
+            for offset in range(0, len(listing), batch_size):
+                for resource in checkpoint.read(endpoint, offset):
+                    writer.add(endpoint, *resource)
+        writer.commit()
+    checkpoint.remove()
+    if bucket is not None:
+        os.remove(bucket[0])
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def _run_batches(
+    api, options: dict, bucket: Optional[Tuple[str, float]],
+    listings: Dict[str, Listing], checkpoint: Checkpoint, workers: int,
+    threads: int, processes: bool, batch_size: int,
+    progress: Optional[Callable[[CrawlStats], None]], start: float,
+) -> CrawlStats:
+    """Fetch every batch missing from the checkpoint on the worker pool."""
+    counts = {endpoint: checkpoint.count(endpoint) for endpoint in listings}
+    stats = CrawlStats(
+        counts, sum(len(listing) for listing in listings.values()),
+        sum(counts.values()),
+    )
+    pending = iter([
+        (endpoint, offset, listing[offset:offset + batch_size])
+        for endpoint, listing in listings.items()
+        for offset in range(0, len(listing), batch_size)
+        if (endpoint, offset) not in checkpoint
+    ])
+    if processes:
+        executor = ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(options, bucket)
+        )
+    else:
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="pokeapi-crawl")
+
+    def submit(endpoint: str, batch: Listing):
+        if processes:
+            return executor.submit(_fetch_in_worker, endpoint, batch, threads)
+        return executor.submit(fetch_batch, api, endpoint, batch, threads)
+
+    in_flight = {}
+    try:
+        while True:
+            # At most two batches per worker are queued or held in memory
+            while len(in_flight) < 2 * workers:
+                item = next(pending, None)
+                if item is None:
+                    break
+                in_flight[submit(item[0], item[2])] = item[:2]
+            if not in_flight:
+                return stats
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            error = None
+            for future in done:
+                endpoint, offset = in_flight.pop(future)
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                batch = future.result()
+                checkpoint.record(endpoint, offset, batch)
+                counts[endpoint] += len(batch)
+                stats.fetched += len(batch)
+                stats.bytes += sum(len(body) for _, _, body, _ in batch)
+                stats.elapsed = time.perf_counter() - start
+                if progress is not None:
+                    progress(stats)
+            if error is not None:
+                raise error
+    finally:
+        # Batches not yet started are dropped; shutdown(cancel_futures=True)
+        # needs Python 3.9
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
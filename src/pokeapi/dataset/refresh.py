@@ -0,0 +1,280 @@
+"""
+Incremental refresh of local PokeAPI datasets.
+Revalidates stored resources with conditional requests and content
+digests, and rewrites only the resources that changed.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from ..api_clients.bulk import fetch_many
+from ..connection.cache import validators
+from ..constants import BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, ErrorMessages
+from ..exceptions import PokeAPIError
+from ._common import Listing, compact, digest, list_endpoint, list_page, prepare
+from .store import DatasetUpdater
+
+
+class Change:
+    """
+    A resource added, updated or removed by a refresh.
+
+    Attributes:
+        endpoint (str): Endpoint name, e.g. "pokemon"
+        resource_id (int): The resource ID
+        name (str): The resource name
+        kind (str): One of `Change.ADDED`, `Change.UPDATED`, `Change.REMOVED`
+    """
+
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+    __slots__ = ("endpoint", "resource_id", "name", "kind")
+
+    def __init__(self, endpoint: str, resource_id: int, name: str, kind: str):
+        self.endpoint = endpoint
+        self.resource_id = resource_id
+        self.name = name
+        self.kind = kind
+
+    def to_dict(self) -> dict:
+        """Return the change as a JSON-serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"Change({self.kind} {self.endpoint} "
+                f"{self.resource_id} {self.name!r})")
+
+
+class RefreshResult:
+    """
+    Change feed and cost of a refresh.
+
+    Attributes:
+        changes (List[Change]): Resources added, updated and removed, per
+            endpoint with its removals first, each in list order
+        checked (int): Stored resources revalidated with the server
+        not_modified (int): Resources the server reported unchanged with
+            304 Not Modified, without sending a body
+        fetched (int): Bodies downloaded, for new resources, resources
+            stored without validators and resources whose validators no
+            longer matched
+        relisted (List[str]): Endpoints whose list was walked, because its
+            count differed from the dataset or resources had disappeared
+        elapsed (float): Seconds the refresh took
+    """
+
+    __slots__ = ("changes", "checked", "not_modified", "fetched", "relisted",
+                 "elapsed")
+
+    def __init__(self):
+        self.changes: List[Change] = []
+        self.checked = 0
+        self.not_modified = 0
+        self.fetched = 0
+        self.relisted: List[str] = []
+        self.elapsed = 0.0
+
+    def ids(self, endpoint: str,
+            kinds: Iterable[str] = (Change.ADDED, Change.UPDATED)) -> List[int]:
+        """
+        Return the IDs of an endpoint's changed resources.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            kinds (Iterable[str], optional): Kinds of change to include.
+                Defaults to added and updated resources.
+
+        Returns:
+            List[int]: The resource IDs, in list order
+        """
+        kinds = set(kinds)
+        return [change.resource_id for change in self.changes
+                if change.endpoint == endpoint and change.kind in kinds]
+
+    def to_dict(self) -> dict:
+        """Return the result as a JSON-serializable dict."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields["changes"] = [change.to_dict() for change in self.changes]
+        return fields
+
+    def __repr__(self):
+        return (f"RefreshResult(changes={len(self.changes)}, "
+                f"checked={self.checked}, not_modified={self.not_modified}, "
+                f"fetched={self.fetched})")
+
+
+def refresh(
+    path: str,
+    api=None,
+    endpoints: Optional[Iterable[str]] = None,
+    relist: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = BULK_MAX_WORKERS,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> RefreshResult:
+    """
+    Bring a local dataset up to date with the API, in place.
+
+    The `count` of each endpoint's list is compared with the dataset
+    first; the list is only walked when they differ, or when a stored
+    resource has disappeared. Every stored resource is then revalidated
+    with a conditional request carrying the validators recorded when it
+    was downloaded, so unchanged resources cost a 304 response without a
+    body. Resources stored without validators are downloaded and compared
+    by content digest. Only new and changed bodies are parsed, validated
+    and written, see `DatasetUpdater`.
+
+    Usage:
+        result = refresh("/data/pokeapi")
+        for pokemon_id in result.ids("pokemon"):
+            ...
+
+    Args:
+        path (str): Directory written by `snapshot` or `crawl`
+        api (PokeAPI, optional): API to refresh from. A PokeAPI for the
+            dataset's source URL is created and closed if omitted.
+        endpoints (Iterable[str], optional): Endpoint names to refresh.
+            Defaults to every endpoint in the dataset.
+        relist (bool, optional): Walk every list even if its count is
+            unchanged, to catch resources replaced by others
+        page_size (int, optional): Resources listed and revalidated per batch
+        max_workers (int, optional): Maximum number of concurrent requests
+        progress (Callable[[str, int], None], optional): Called with the
+            endpoint and number of resources revalidated after each batch
+
+    Returns:
+        RefreshResult: The change feed and the requests it took
+
+    Raises:
+        PokeAPIError: If the dataset cannot be opened, or a list or
+            resource cannot be fetched, in which case the dataset is left
+            unchanged
+    """
+    start = time.perf_counter()
+    result = RefreshResult()
+    with DatasetUpdater(path) as updater:
+        owned = api is None
+        if owned:
+            from ..sdk.pokeapi import PokeAPI
+            api = PokeAPI(base_url=updater.manifest["source_url"])
+        try:
+            for endpoint in (updater.endpoints if endpoints is None else endpoints):
+                _refresh_endpoint(updater, api, endpoint, relist, page_size,
+                                  max_workers, progress, result)
+        finally:
+            if owned:
+                api.close()
+        updater.commit()
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _refresh_endpoint(
+    updater: DatasetUpdater, api, endpoint: str, relist: bool,
+    page_size: int, max_workers: int,
+    progress: Optional[Callable[[str, int], None]], result: RefreshResult,
+) -> None:
+    """Revalidate one endpoint and record its changes in the updater."""
+    client = api.resources
+    stored = updater.listing(endpoint)
+    known = {resource_id for resource_id, _ in stored}
+    count = list_page(api, endpoint)(1, 0).count
+    listing = stored
+    if relist or count != len(stored):
+        listing = list_endpoint(api, endpoint, page_size)
+        result.relisted.append(endpoint)
+    changes: List[Change] = []
+    gone: Set[int] = set()
+    checked = 0
+
+    def check(resources: Listing) -> None:
+        nonlocal checked
+        for offset in range(0, len(resources), page_size):
+            batch = resources[offset:offset + page_size]
+            _check_batch(updater, client, endpoint, batch, known, max_workers,
+                         result, changes, gone)
+            checked += len(batch)
+            if progress is not None:
+                progress(endpoint, checked)
+
+    check(listing)
+    if gone and endpoint not in result.relisted:
+        # Resources disappeared although the count matched, so others may
+        # have taken their place
+        listing = list_endpoint(api, endpoint, page_size)
+        result.relisted.append(endpoint)
+        check([resource for resource in listing if resource[0] not in known])
+
+    listed = {resource_id for resource_id, _ in listing} - gone
+    removed = []
+    for resource_id, name in stored:
+        if resource_id not in listed:
+            updater.remove(endpoint, resource_id)
+            removed.append(Change(endpoint, resource_id, name, Change.REMOVED))
+    changes[:0] = removed
+    order = [resource_id for resource_id, _ in listing if resource_id in listed]
+    if order != [resource_id for resource_id, _ in updater.listing(endpoint)]:
+        updater.reorder(endpoint, order)
+    result.changes.extend(changes)
+
+
+def _check_batch(
+    updater: DatasetUpdater, client, endpoint: str, batch: Listing,
+    known: Set[int], max_workers: int, result: RefreshResult,
+    changes: List[Change], gone: Set[int],
+) -> None:
+    """
+    Revalidate a batch of resources, storing those that are new or changed.
+
+    Raises:
+        PokeAPIError: If a resource cannot be fetched or is invalid
+    """
+    path = f"/{endpoint}"
+
+    def revalidate(resource_id: int):
+        stored_validators: Dict[str, str] = {}
+        if resource_id in known:
+            stored_validators = updater.revision(endpoint, resource_id)[1]
+        return client.revalidate(path, str(resource_id), stored_validators)
+
+    results = fetch_many(
+        revalidate, [resource_id for resource_id, _ in batch], max_workers
+    )
+    for (resource_id, name), fetched in zip(batch, results):
+        stored = resource_id in known
+        if stored:
+            result.checked += 1
+        if not fetched.ok:
+            if stored and fetched.error.message == ErrorMessages.RESOURCE_NOT_FOUND:
+                gone.add(resource_id)
+                continue
+            raise _failed(endpoint, resource_id, fetched.error.message)
+        response = fetched.value
+        if response is None:
+            result.not_modified += 1
+            continue
+        result.fetched += 1
+        response_validators = validators(response.headers)
+        try:
+            body = compact(response.content)
+        except ValueError:
+            raise _failed(endpoint, resource_id, ErrorMessages.INVALID_JSON_RESPONSE)
+        if stored:
+            stored_digest, stored_validators = updater.revision(endpoint, resource_id)
+            if digest(body) == stored_digest:
+                if response_validators != stored_validators:
+                    updater.set_validators(endpoint, resource_id, response_validators)
+                continue
+        try:
+            body = prepare(endpoint, body)
+        except PokeAPIError as e:
+            raise _failed(endpoint, resource_id, e.message)
+        updater.put(endpoint, resource_id, name, body, response_validators)
+        changes.append(Change(
+            endpoint, resource_id, name, Change.UPDATED if stored else Change.ADDED
+        ))
+
+
+def _failed(endpoint: str, resource_id: int, message: str) -> PokeAPIError:
+    return PokeAPIError(ErrorMessages.REFRESH_FAILED.format(endpoint, resource_id, message))
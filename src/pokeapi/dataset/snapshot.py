@@ -0,0 +1,69 @@
+"""
+Crawler writing local PokeAPI datasets.
+Walks the list endpoints through the SDK clients and stores every resource.
+"""
+
+from typing import Callable, Dict, Iterable, Optional
+from ..constants import BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, SNAPSHOT_ENDPOINTS
+from ._common import fetch_batch, iter_listing
+from .store import DatasetWriter
+
+
+def snapshot(
+    path: str,
+    api=None,
+    endpoints: Iterable[str] = SNAPSHOT_ENDPOINTS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = BULK_MAX_WORKERS,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Download every resource of the given endpoints into a local dataset.
+
+    Each endpoint's list is walked one page at a time and the page's
+    resources are fetched concurrently through the API's transport, cache
+    and coalescing, then validated against their model. Bodies are streamed to
+    disk, so memory use is bounded by one page. The dataset only replaces
+    `path` once every resource has been written.
+
+    Usage:
+        with PokeAPI() as api:
+            snapshot("/data/pokeapi", api)
+        local = PokeAPI(source="local:/data/pokeapi")
+
+    Args:
+        path (str): Directory to write the dataset to
+        api (PokeAPI, optional): API to crawl. A default PokeAPI is created
+            and closed if omitted.
+        endpoints (Iterable[str], optional): Endpoint names to crawl.
+            Defaults to "pokemon" and "generation".
+        page_size (int, optional): Resources listed and fetched per batch
+        max_workers (int, optional): Maximum number of concurrent requests
+        progress (Callable[[str, int], None], optional): Called with the
+            endpoint and number of resources stored after each batch
+
+    Returns:
+        Dict[str, int]: Number of resources stored per endpoint
+
+    Raises:
+        PokeAPIError: If a list or resource cannot be fetched, in which case
+            nothing is written
+    """
+    if api is None:
+        from ..sdk.pokeapi import PokeAPI
+        with PokeAPI() as api:
+            return snapshot(path, api, endpoints, page_size, max_workers,
+                            progress)
+
+    counts = {}
+    with DatasetWriter(path, api.resources.base_url) as writer:
+        for endpoint in endpoints:
+            counts[endpoint] = 0
+            for page in iter_listing(api, endpoint, page_size):
+                for resource in fetch_batch(api, endpoint, page, max_workers):
+                    writer.add(endpoint, *resource)
+                counts[endpoint] += len(page)
+                if progress is not None:
+                    progress(endpoint, counts[endpoint])
+        writer.commit()
+    return counts
@@ -0,0 +1,532 @@
+"""
+On-disk format of local PokeAPI datasets.
+Stores raw resource bodies back to back in one file per endpoint, with an
+ID/name index kept in memory for constant-time lookups and the revision
+of every body for incremental refreshes.
+"""
+
+import json
+import mmap
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Tuple
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+from ._common import digest
+
+DATASET_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+
+def _data_file(endpoint: str) -> str:
+    return f"{endpoint}.bin"
+
+
+def _index_file(endpoint: str, commit: int = 0) -> str:
+    # DatasetWriter writes commit 0; each DatasetUpdater commit writes new
+    # files, which the manifest then points at
+    return f"{endpoint}.index.{commit}.json" if commit else f"{endpoint}.index.json"
+
+
+def _revisions_file(endpoint: str, commit: int = 0) -> str:
+    # Kept apart from the index, which readers load on every open
+    if commit:
+        return f"{endpoint}.revisions.{commit}.json"
+    return f"{endpoint}.revisions.json"
+
+
+def _commit(manifest: dict, endpoint: str) -> int:
+    """Return the commit whose index files the manifest uses for an endpoint."""
+    return manifest["endpoints"].get(endpoint, {}).get("commit", 0)
+
+
+class DatasetWriter:
+    """
+    Writes a dataset into a temporary directory and moves it into place on
+    `commit()`, so readers never see a partially written dataset.
+
+    Usage:
+        with DatasetWriter("/data/pokeapi", source_url) as writer:
+            writer.add("pokemon", 25, "pikachu", body)
+            writer.commit()
+    """
+
+    def __init__(self, path: str, source_url: str):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): Directory the dataset is written to, replaced if it
+                already exists
+            source_url (str): Base URL of the API the data was taken from
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.source_url = source_url
+        self._tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        shutil.rmtree(self._tmp_path, ignore_errors=True)
+        os.makedirs(self._tmp_path)
+        self._files = {}
+        self._entries: Dict[str, List[list]] = {}
+        self._revisions: Dict[str, Dict[str, list]] = {}
+        self._committed = False
+
+    def add(self, endpoint: str, resource_id: int, name: str,
+            body: bytes, validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Append a resource body.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            resource_id (int): The resource ID
+            name (str): The resource name
+            body (bytes): The JSON body as returned by the API
+            validators (Dict[str, str], optional): `ETag` and/or
+                `Last-Modified` of the response, used by `refresh` to
+                revalidate the resource with a conditional request
+        """
+        f = self._files.get(endpoint)
+        if f is None:
+            f = self._files[endpoint] = open(
+                os.path.join(self._tmp_path, _data_file(endpoint)), "wb"
+            )
+            self._entries[endpoint] = []
+            self._revisions[endpoint] = {}
+        offset = f.tell()
+        f.write(body)
+        self._entries[endpoint].append([resource_id, name, offset, len(body)])
+        self._revisions[endpoint][str(resource_id)] = [digest(body), validators or {}]
+
+    def commit(self) -> None:
+        """Write the indexes and manifest and move the dataset into place."""
+        endpoints = {}
+        for endpoint, f in self._files.items():
+            f.close()
+            entries = self._entries[endpoint]
+            with open(os.path.join(self._tmp_path, _index_file(endpoint)), "w") as index:
+                json.dump({"entries": entries}, index, separators=(",", ":"))
+            with open(os.path.join(self._tmp_path, _revisions_file(endpoint)), "w") as revisions:
+                json.dump({"entries": self._revisions[endpoint]}, revisions,
+                          separators=(",", ":"))
+            endpoints[endpoint] = {"count": len(entries)}
+        manifest = {
+            "version": DATASET_VERSION,
+            "source_url": self.source_url,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "endpoints": endpoints,
+        }
+        with open(os.path.join(self._tmp_path, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        old_path = f"{self.path}.old-{os.getpid()}"
+        if os.path.exists(self.path):
+            os.rename(self.path, old_path)
+        os.rename(self._tmp_path, self.path)
+        shutil.rmtree(old_path, ignore_errors=True)
+        self._committed = True
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self._tmp_path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._committed:
+            self.abort()
+
+
+class _EndpointIndex:
+    """Index and revisions of one endpoint, as edited by DatasetUpdater."""
+
+    __slots__ = ('entries', 'revisions')
+
+    def __init__(self, root: str, endpoint: str, commit: int = 0):
+        self.entries: Dict[int, list] = {}
+        self.revisions: Dict[int, list] = {}
+        if not os.path.exists(os.path.join(root, _index_file(endpoint, commit))):
+            return
+        with open(os.path.join(root, _index_file(endpoint, commit))) as f:
+            for resource_id, name, offset, length in json.load(f)["entries"]:
+                self.entries[resource_id] = [name, offset, length]
+        try:
+            with open(os.path.join(root, _revisions_file(endpoint, commit))) as f:
+                revisions = json.load(f)["entries"]
+        except FileNotFoundError:
+            # Written before revisions were recorded; digests are computed
+            # from the stored bodies when needed
+            revisions = {}
+        self.revisions = {int(key): value for key, value in revisions.items()}
+
+
+class DatasetUpdater:
+    """
+    Applies changes to an existing dataset in place.
+
+    New and changed bodies are appended to the data files and only the
+    indexes are rewritten on `commit()`, so an update costs in proportion
+    to the resources it changes rather than to the size of the dataset.
+    The new indexes are written beside the old ones and the manifest naming
+    them is replaced last, so a dataset opened at any time sees every change
+    of a commit or none of them. Datasets opened before the commit keep
+    reading the previous version.
+    Replaced bodies stay in the data files until the dataset is written
+    again by `snapshot` or `crawl`.
+
+    Usage:
+        with DatasetUpdater("/data/pokeapi") as updater:
+            updater.put("pokemon", 25, "pikachu", body)
+            updater.commit()
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a dataset for updating.
+
+        Args:
+            path (str): Directory written by `snapshot` or `crawl`
+
+        Raises:
+            PokeAPIError: If the directory is not a readable dataset
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        try:
+            with open(os.path.join(self.path, MANIFEST_FILE)) as f:
+                self.manifest = json.load(f)
+            if self.manifest.get("version") != DATASET_VERSION:
+                raise ValueError(f"unsupported version {self.manifest.get('version')}")
+            self._indexes = {
+                endpoint: _EndpointIndex(
+                    self.path, endpoint, _commit(self.manifest, endpoint)
+                )
+                for endpoint in self.manifest["endpoints"]
+            }
+        except (OSError, ValueError, KeyError) as e:
+            raise PokeAPIError(ErrorMessages.INVALID_DATASET.format(self.path, e))
+        self._files = {}
+        self._sizes: Dict[str, int] = {}
+        self._changed = set()
+        self._committed = False
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Names of the endpoints stored in the dataset."""
+        return list(self._indexes)
+
+    def _index(self, endpoint: str) -> _EndpointIndex:
+        index = self._indexes.get(endpoint)
+        if index is None:
+            index = self._indexes[endpoint] = _EndpointIndex(self.path, endpoint)
+        self._changed.add(endpoint)
+        return index
+
+    def listing(self, endpoint: str) -> List[Tuple[int, str]]:
+        """
+        Return the stored resources of an endpoint.
+
+        Returns:
+            List[Tuple[int, str]]: (ID, name) pairs in list order, empty if
+                the endpoint is not stored
+        """
+        index = self._indexes.get(endpoint)
+        if index is None:
+            return []
+        return [(resource_id, entry[0]) for resource_id, entry in index.entries.items()]
+
+    def revision(self, endpoint: str, resource_id: int) -> Tuple[str, Dict[str, str]]:
+        """
+        Return the revision of a stored resource.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            resource_id (int): The resource ID
+
+        Returns:
+            Tuple[str, Dict[str, str]]: The SHA-256 digest of the stored body
+                and the validators of the response it came from
+        """
+        index = self._indexes[endpoint]
+        revision = index.revisions.get(resource_id)
+        if revision is not None:
+            return revision[0], revision[1]
+        _, offset, length = index.entries[resource_id]
+        with open(os.path.join(self.path, _data_file(endpoint)), "rb") as f:
+            f.seek(offset)
+            return digest(f.read(length)), {}
+
+    def put(self, endpoint: str, resource_id: int, name: str, body: bytes,
+            validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Add a resource, or replace the body of a stored one.
+
+        New resources are placed at the end of the endpoint's list, see
+        `reorder`.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            resource_id (int): The resource ID
+            name (str): The resource name
+            body (bytes): The JSON body
+            validators (Dict[str, str], optional): `ETag` and/or
+                `Last-Modified` of the response
+        """
+        index = self._index(endpoint)
+        f = self._files.get(endpoint)
+        if f is None:
+            f = self._files[endpoint] = open(
+                os.path.join(self.path, _data_file(endpoint)), "ab"
+            )
+            self._sizes[endpoint] = f.tell()
+        offset = f.tell()
+        f.write(body)
+        index.entries[resource_id] = [name, offset, len(body)]
+        index.revisions[resource_id] = [digest(body), validators or {}]
+
+    def set_validators(self, endpoint: str, resource_id: int,
+                       validators: Dict[str, str]) -> None:
+        """Record new validators for a stored resource whose body is unchanged."""
+        digest, _ = self.revision(endpoint, resource_id)
+        self._index(endpoint).revisions[resource_id] = [digest, validators]
+
+    def remove(self, endpoint: str, resource_id: int) -> None:
+        """Drop a resource from the endpoint's index."""
+        index = self._index(endpoint)
+        del index.entries[resource_id]
+        index.revisions.pop(resource_id, None)
+
+    def reorder(self, endpoint: str, resource_ids: List[int]) -> None:
+        """
+        Arrange an endpoint's resources in the given order.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            resource_ids (List[int]): IDs of every stored resource of the
+                endpoint, in their new order
+        """
+        index = self._index(endpoint)
+        index.entries = {resource_id: index.entries[resource_id]
+                         for resource_id in resource_ids}
+
+    def _write_json(self, name: str, value, indent: Optional[int] = None) -> None:
+        tmp = os.path.join(self.path, f"{name}.tmp-{os.getpid()}")
+        with open(tmp, "w") as f:
+            if indent is None:
+                json.dump(value, f, separators=(",", ":"))
+            else:
+                json.dump(value, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.path, name))
+
+    def commit(self) -> None:
+        """
+        Make the changes visible to datasets opened from now on.
+
+        Appended bodies are synced, then the indexes of changed endpoints
+        are written under new names, and finally the manifest is replaced
+        to point at them. That single replace is the commit: a crash before
+        it leaves the previous version intact. Index files two commits old
+        are deleted afterwards; those of the previous commit are kept for
+        readers that loaded its manifest just before the replace.
+        """
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        commits = {endpoint: _commit(self.manifest, endpoint)
+                   for endpoint in self._indexes}
+        for endpoint in self._changed:
+            index = self._indexes[endpoint]
+            commit = commits[endpoint] = commits[endpoint] + 1
+            # An endpoint new to the dataset needs a data file, even if empty
+            open(os.path.join(self.path, _data_file(endpoint)), "ab").close()
+            self._write_json(_index_file(endpoint, commit), {"entries": [
+                [resource_id, *entry] for resource_id, entry in index.entries.items()
+            ]})
+            self._write_json(_revisions_file(endpoint, commit), {"entries": {
+                str(resource_id): revision
+                for resource_id, revision in index.revisions.items()
+            }})
+        if self._changed:
+            self.manifest["endpoints"] = {
+                endpoint: {"count": len(index.entries), "commit": commits[endpoint]}
+                for endpoint, index in self._indexes.items()
+            }
+            self.manifest["updated_at"] = time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime()
+            )
+            self._write_json(MANIFEST_FILE, self.manifest, indent=2)
+            for endpoint in self._changed:
+                if commits[endpoint] >= 2:
+                    self._discard(endpoint, commits[endpoint] - 2)
+        self._committed = True
+
+    def _discard(self, endpoint: str, commit: int) -> None:
+        for name in (_index_file(endpoint, commit), _revisions_file(endpoint, commit)):
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
+
+    def abort(self) -> None:
+        """Discard the changes, truncating the bodies appended so far."""
+        for endpoint, f in self._files.items():
+            # Closed already if the commit itself failed
+            f.close()
+            os.truncate(os.path.join(self.path, _data_file(endpoint)),
+                        self._sizes[endpoint])
+        self._files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._committed:
+            self.abort()
+
+
+class _EndpointData:
+    """Memory-mapped bodies of one endpoint and their index."""
+
+    __slots__ = ('order', 'by_id', 'by_name', 'file', 'data')
+
+    def __init__(self, root: str, endpoint: str, commit: int = 0):
+        with open(os.path.join(root, _index_file(endpoint, commit))) as f:
+            entries = json.load(f)["entries"]
+        self.order: List[Tuple[int, str]] = []
+        self.by_id: Dict[int, Tuple[int, int]] = {}
+        self.by_name: Dict[str, int] = {}
+        for resource_id, name, offset, length in entries:
+            self.order.append((resource_id, name))
+            self.by_id[resource_id] = (offset, length)
+            self.by_name[name] = resource_id
+
+        self.file = open(os.path.join(root, _data_file(endpoint)), "rb")
+        if os.fstat(self.file.fileno()).st_size:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b""
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
+class LocalDataset:
+    """
+    Read-only view of a dataset written by `snapshot`.
+
+    Bodies are memory-mapped, so opening a dataset only reads its indexes
+    and lookups cost a dict access and a copy of the body.
+
+    Usage:
+        dataset = LocalDataset("/data/pokeapi")
+        body = dataset.get("pokemon", "pikachu")
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a dataset.
+
+        Args:
+            path (str): Directory written by `snapshot`
+
+        Raises:
+            PokeAPIError: If the directory is not a readable dataset
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        try:
+            with open(os.path.join(self.path, MANIFEST_FILE)) as f:
+                self.manifest = json.load(f)
+            if self.manifest.get("version") != DATASET_VERSION:
+                raise ValueError(f"unsupported version {self.manifest.get('version')}")
+            self._endpoints = {
+                endpoint: _EndpointData(
+                    self.path, endpoint, _commit(self.manifest, endpoint)
+                )
+                for endpoint in self.manifest["endpoints"]
+            }
+        except (OSError, ValueError, KeyError) as e:
+            raise PokeAPIError(ErrorMessages.INVALID_DATASET.format(self.path, e))
+
+    @property
+    def source_url(self) -> str:
+        """Base URL of the API the dataset was taken from."""
+        return self.manifest["source_url"]
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Names of the endpoints stored in the dataset."""
+        return list(self._endpoints)
+
+    def count(self, endpoint: str) -> int:
+        """Number of resources stored for an endpoint."""
+        return len(self._endpoints[endpoint].order)
+
+    def get(self, endpoint: str, id_or_name: str) -> Optional[bytes]:
+        """
+        Return the body of a resource.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            id_or_name (str): Resource ID or name
+
+        Returns:
+            bytes: The JSON body, or None if the resource is not stored
+        """
+        data = self._endpoints.get(endpoint)
+        if data is None:
+            return None
+        if id_or_name.isdigit():
+            resource_id = int(id_or_name)
+        else:
+            resource_id = data.by_name.get(id_or_name)
+        location = data.by_id.get(resource_id)
+        if location is None:
+            return None
+        offset, length = location
+        return data.data[offset:offset + length]
+
+    def page(self, endpoint: str, limit: int, offset: int,
+             base_url: Optional[str] = None) -> Optional[dict]:
+        """
+        Build a page of a list endpoint, shaped like the API's response.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "pokemon"
+            limit (int): Number of resources in the page
+            offset (int): Position of the first resource
+            base_url (str, optional): Base URL used in links. Defaults to the
+                dataset's source URL.
+
+        Returns:
+            dict: A NamedAPIResourceList document, or None if the endpoint
+                is not stored
+        """
+        data = self._endpoints.get(endpoint)
+        if data is None:
+            return None
+        url = f"{base_url or self.source_url}/{endpoint}"
+        total = len(data.order)
+
+        def link(new_offset):
+            return f"{url}?offset={new_offset}&limit={limit}"
+
+        return {
+            "count": total,
+            "next": link(offset + limit) if offset + limit < total else None,
+            "previous": link(max(offset - limit, 0)) if offset > 0 else None,
+            "results": [
+                {"name": name, "url": f"{url}/{resource_id}/"}
+                for resource_id, name in data.order[offset:offset + limit]
+            ],
+        }
+
+    def close(self) -> None:
+        """Unmap the data files."""
+        for data in self._endpoints.values():
+            data.close()
@@ -0,0 +1,111 @@
+"""
+Transport answering requests from a local dataset.
+Lets the clients serve lookups and list pages without any network I/O.
+"""
+
+import json
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+import requests
+from ..connection.responses import build_response
+from ..connection.transport import Transport
+from ..constants import LOCAL_SOURCE_PREFIX, TIMEOUT, ErrorMessages
+from ..exceptions import PokeAPIError
+from .store import LocalDataset
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+REMOTE_SOURCE = "remote"
+
+
+def local_source_path(source: str) -> Optional[str]:
+    """
+    Parse the `source` argument of PokeAPI and AsyncPokeAPI.
+
+    Args:
+        source (str): "remote" for the live API, or "local:<path>" for a
+            dataset written by `snapshot`
+
+    Returns:
+        str: The dataset directory, or None for the live API
+
+    Raises:
+        PokeAPIError: If the source is neither form
+    """
+    if source == REMOTE_SOURCE:
+        return None
+    if source.startswith(LOCAL_SOURCE_PREFIX) and len(source) > len(LOCAL_SOURCE_PREFIX):
+        return source[len(LOCAL_SOURCE_PREFIX):]
+    raise PokeAPIError(ErrorMessages.INVALID_SOURCE.format(source))
+
+
+class LocalTransport(Transport):
+    """
+    Transport serving resources and list pages from a `LocalDataset`.
+
+    Requests are routed on the last segments of the URL path, so any base
+    URL works: `.../pokemon/25` returns a stored resource and
+    `.../pokemon?limit=20&offset=0` a list page whose links use the
+    request's own base URL. Anything else gets a 404 response.
+
+    Usage:
+        api = PokeAPI(transport=LocalTransport("/data/pokeapi"))
+    """
+
+    def __init__(self, dataset):
+        """
+        Initialize the transport.
+
+        Args:
+            dataset (Union[str, LocalDataset]): The dataset, or the directory
+                it was written to
+
+        Raises:
+            PokeAPIError: If the directory is not a readable dataset
+        """
+        if not isinstance(dataset, LocalDataset):
+            dataset = LocalDataset(dataset)
+        self.dataset = dataset
+
+    def send(self, url: str, headers: Optional[dict] = None,
+             timeout: float = TIMEOUT) -> requests.Response:
+        """
+        Answer a GET request from the dataset.
+
+        Args:
+            url (str): The complete URL to request
+            headers (dict, optional): Ignored, kept for compatibility
+            timeout (float, optional): Ignored, kept for compatibility
+
+        Returns:
+            requests.Response: A 200 response with the stored body, or 404
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/")
+        segments = path.split("/")
+        endpoints = self.dataset.endpoints
+
+        body = None
+        if len(segments) >= 2 and segments[-2] in endpoints:
+            body = self.dataset.get(segments[-2], segments[-1])
+        elif segments[-1] in endpoints:
+            query = parse_qs(parts.query)
+            try:
+                limit = int(query.get("limit", ["20"])[0])
+                offset = int(query.get("offset", ["0"])[0])
+            except ValueError:
+                limit = offset = -1
+            if limit >= 0 and offset >= 0:
+                base_url = urlunsplit(
+                    (parts.scheme, parts.netloc, path.rsplit("/", 1)[0], "", "")
+                )
+                page = self.dataset.page(segments[-1], limit, offset, base_url)
+                body = json.dumps(page, separators=(",", ":")).encode()
+
+        if body is None:
+            return build_response(url, 404, {}, b"")
+        return build_response(url, 200, JSON_HEADERS, body)
+
+    def close(self) -> None:
+        """Close the dataset."""
+        self.dataset.close()
+
@@ -3,8 +3,26 @@ Custom exceptions for the PokeAPI SDK.
 Defines error types specific to API operations and validation.
 """
 
+from typing import Optional
+
+
 class PokeAPIError(Exception):
     """Base exception for PokeAPI errors"""
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
+
+
+class RateLimitError(PokeAPIError):
+    """Raised when the server rejects a request with 429 Too Many Requests"""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class CircuitOpenError(PokeAPIError):
+    """Raised without sending a request while a host's circuit is open"""
+    def __init__(self, message: str, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(message)
@@ -1,9 +1,28 @@
 """
 Data models for the PokeAPI SDK.
 """
-from .pokemon import Pokemon
-from .generation import Generation
-from .pagination import NamedAPIResourceList
-from .api_resource import NamedAPIResource
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ['Pokemon', 'Generation', 'NamedAPIResourceList', 'NamedAPIResource'] 
\ No newline at end of file
+if TYPE_CHECKING:  # pragma: no cover
+    from .pokemon import Pokemon
+    from .generation import Generation
+    from .pagination import NamedAPIResourceList
+    from .api_resource import NamedAPIResource
+    from .trusted import TrustedModel
+    from .compact import CompactModel, InternPool
+
+__all__ = [
+    'Pokemon', 'Generation', 'NamedAPIResourceList', 'NamedAPIResource',
+    'TrustedModel', 'CompactModel', 'InternPool',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Pokemon': '.pokemon',
+    'Generation': '.generation',
+    'NamedAPIResourceList': '.pagination',
+    'NamedAPIResource': '.api_resource',
+    'TrustedModel': '.trusted',
+    'CompactModel': '.compact',
+    'InternPool': '.compact',
+})
@@ -3,11 +3,35 @@ Base resource models for the PokeAPI.
 Defines common structures used across different API responses.
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
+from .base import PokeAPIModel
 
-class NamedAPIResource(BaseModel):
+class NamedAPIResource(PokeAPIModel):
     """Represents a resource that can be obtained from the PokeAPI."""
     name: str
     url: str
 
-    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+    def fetch(self, api=None):
+        """
+        Fetch the resource this link points at.
+
+        Args:
+            api (PokeAPI or AsyncPokeAPI, optional): Client to fetch through,
+                so its cache and connection pool are used. Defaults to a
+                shared PokeAPI instance. With an AsyncPokeAPI the result
+                must be awaited.
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource, as a model for
+                known endpoints and as parsed JSON otherwise
+
+        Raises:
+            PokeAPIError: If the request fails
+        """
+        if api is None:
+            # Imported here because the SDK depends on this module
+            from ..sdk.pokeapi import default_api
+            api = default_api()
+        return api.resolve(self)
@@ -0,0 +1,17 @@
+"""
+Base class of the PokeAPI response models.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PokeAPIModel(BaseModel):
+    """
+    Base of every response model.
+
+    Validators are built when a model is first validated rather than when
+    its class is created (`defer_build`), so importing the SDK does not pay
+    for the schemas of models that are never parsed.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -0,0 +1,282 @@
+"""
+Memory-compact, immutable decoding of PokeAPI responses.
+Builds slotted, frozen classes mirroring the pydantic models and shares one
+instance between identical nested values, such as the NamedAPIResource
+links repeated across every Pokemon.
+"""
+
+import inspect
+import threading
+import typing
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+from pydantic import BaseModel
+from .api_resource import NamedAPIResource
+from .generation import Name
+from .pokemon import (
+    PokemonAbility, PokemonFormType, PokemonHeldItemVersion,
+    PokemonMoveVersion, PokemonStat, PokemonType, VersionGameIndex,
+)
+
+_MISSING = object()
+
+# Small value models repeated across many resources, interned by default.
+# Models unique to one resource (sprites, cries, the resource itself) are
+# not, so the pool does not keep them alive.
+INTERNED_MODELS: Tuple[Type[BaseModel], ...] = (
+    NamedAPIResource, Name, PokemonAbility, PokemonFormType,
+    PokemonHeldItemVersion, PokemonMoveVersion, PokemonStat, PokemonType,
+    VersionGameIndex,
+)
+
+
+class CompactModel:
+    """
+    Base class of the slotted, frozen classes built by `compact_model`.
+
+    Instances expose the same attributes as the pydantic model they mirror,
+    with lists stored as tuples. They cannot be modified, so equal nested
+    values can safely be shared, and they are hashable and comparable with
+    `==`. Convert them with `model_dump()`. Like trusted models, values are
+    taken from the response without type checks.
+    """
+
+    __slots__ = ()
+    __model__: Type[BaseModel] = None
+    # Returns the field values as a tuple; set per class
+    _values: Callable[[Any], tuple] = None
+
+    def model_dump(self) -> dict:
+        """Return the fields as a dict, converting nested values recursively."""
+        return {name: _dump(getattr(self, name)) for name in self.__slots__}
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values(self) == other._values(other)
+
+    def __hash__(self):
+        return hash(self._values(self))
+
+    def __reduce__(self):
+        return _rebuild, (type(self).__model__, self._values(self))
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def _dump(value):
+    if isinstance(value, CompactModel):
+        return value.model_dump()
+    if isinstance(value, tuple):
+        return [_dump(item) for item in value]
+    return value
+
+
+def _rebuild(model_cls: Type[BaseModel], values: tuple):
+    # Unpickles an instance, which __setattr__ would otherwise refuse
+    cls = compact_model(model_cls)
+    obj = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+class InternPool:
+    """
+    Pool of canonical instances of compact models.
+
+    Decoding a response looks every value of an interned model up in the
+    pool and reuses the instance already there, so a link such as the
+    "level-up" move learn method is stored once however many Pokemon
+    mention it. The pool keeps its instances until `clear()` is called.
+
+    Usage:
+        pool = InternPool()
+        decode = compact_decoder(Pokemon, pool)
+    """
+
+    def __init__(self, models: Optional[Iterable[Type[BaseModel]]] = None):
+        """
+        Initialize an empty pool.
+
+        Args:
+            models (Iterable[Type[BaseModel]], optional): Models whose values
+                are interned. Defaults to `INTERNED_MODELS`.
+        """
+        self.models = frozenset(INTERNED_MODELS if models is None else models)
+        self._objects: Dict[CompactModel, CompactModel] = {}
+
+    def interns(self, model_cls: Type[BaseModel]) -> bool:
+        """Whether values of a model are interned."""
+        return model_cls in self.models
+
+    def intern(self, obj: CompactModel) -> CompactModel:
+        """
+        Return the canonical instance equal to `obj`, adding `obj` if new.
+
+        Args:
+            obj (CompactModel): A compact model instance
+
+        Returns:
+            CompactModel: The pooled instance
+        """
+        return self._objects.setdefault(obj, obj)
+
+    def __len__(self) -> int:
+        """Number of distinct instances in the pool."""
+        return len(self._objects)
+
+    def clear(self) -> None:
+        """Drop every pooled instance. Later decodes start a new pool."""
+        self._objects.clear()
+
+
+default_pool = InternPool()
+
+_classes: Dict[type, type] = {}
+_decoders: Dict[Tuple[type, InternPool], Callable[[dict], Any]] = {}
+_lock = threading.RLock()
+
+
+def compact_model(model_cls: Type[BaseModel]) -> type:
+    """
+    Return the slotted, frozen class mirroring a pydantic model.
+
+    Public methods defined on the model (such as `NamedAPIResource.fetch`)
+    are copied onto the class.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model to mirror
+
+    Returns:
+        type: A `CompactModel` subclass with one slot per model field
+    """
+    cls = _classes.get(model_cls)
+    if cls is not None:
+        return cls
+    with _lock:
+        cls = _classes.get(model_cls)
+        if cls is None:
+            fields = tuple(model_cls.model_fields)
+            namespace = {
+                name: value for name, value in vars(model_cls).items()
+                if inspect.isfunction(value) and not name.startswith('_')
+            }
+            if len(fields) == 1:
+                getter = attrgetter(fields[0])
+                values = lambda obj: (getter(obj),)  # noqa: E731
+            else:
+                values = attrgetter(*fields)
+            namespace.update({
+                '__slots__': fields,
+                '__model__': model_cls,
+                '__module__': __name__,
+                '__qualname__': model_cls.__name__,
+                '__doc__': model_cls.__doc__,
+                '_values': staticmethod(values),
+            })
+            cls = type(model_cls.__name__, (CompactModel,), namespace)
+            _classes[model_cls] = cls
+        return cls
+
+
+def _expression(annotation, source: str, namespace: dict, depth: int,
+                pool: InternPool) -> str:
+    # Python expression converting `source` to the value stored for `annotation`
+    origin = typing.get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        name = f"decode_{annotation.__name__}"
+        namespace[name] = compact_decoder(annotation, pool)
+        return f"{name}({source})"
+    if origin is list:
+        item = f"item{depth}"
+        inner = _expression(
+            typing.get_args(annotation)[0], item, namespace, depth + 1, pool
+        )
+        if inner == item:
+            return f"tuple({source})"
+        return f"tuple([{inner} for {item} in {source}])"
+    if origin is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            inner = _expression(args[0], source, namespace, depth, pool)
+            if inner == source:
+                return source
+            return f"(None if {source} is None else {inner})"
+    return source
+
+
+def compact_decoder(model_cls: Type[BaseModel],
+                    pool: Optional[InternPool] = None) -> Callable[[dict], Any]:
+    """
+    Return a compiled function building `compact_model(model_cls)` from JSON.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model to decode into
+        pool (InternPool, optional): Pool sharing equal nested values.
+            Defaults to `default_pool`.
+
+    Returns:
+        Callable[[dict], Any]: Function taking the parsed JSON object
+    """
+    pool = pool if pool is not None else default_pool
+    key = (model_cls, pool)
+    decoder = _decoders.get(key)
+    if decoder is not None:
+        return decoder
+    with _lock:
+        decoder = _decoders.get(key)
+        if decoder is not None:
+            return decoder
+        # Register a forwarder first so self-referencing models terminate
+        _decoders[key] = lambda data: _decoders[key](data)
+        try:
+            decoder = _compile(model_cls, pool)
+        except BaseException:
+            del _decoders[key]
+            raise
+        _decoders[key] = decoder
+        return decoder
+
+
+def _compile(model_cls: Type[BaseModel], pool: InternPool) -> Callable[[dict], Any]:
+    # Generate the decoder source for one model and compile it
+    cls = compact_model(model_cls)
+    namespace = {'new': object.__new__, 'cls': cls, '_MISSING': _MISSING}
+    lines = ["def decode(data):", "    obj = new(cls)"]
+    for i, (name, field) in enumerate(model_cls.model_fields.items()):
+        key = field.alias or name
+        if field.is_required():
+            lines.append(f"    value = data[{key!r}]")
+        elif field.default_factory is not None:
+            namespace[f"factory{i}"] = field.default_factory
+            lines.append(f"    value = data.get({key!r}, _MISSING)")
+            lines.append("    if value is _MISSING:")
+            lines.append(f"        value = factory{i}()")
+        else:
+            namespace[f"default{i}"] = field.default
+            lines.append(f"    value = data.get({key!r}, default{i})")
+        expression = _expression(field.annotation, "value", namespace, 0, pool)
+        # Slot descriptors set the value past the frozen __setattr__
+        namespace[f"set{i}"] = vars(cls)[name].__set__
+        lines.append(f"    set{i}(obj, {expression})")
+    if pool.interns(model_cls):
+        namespace['intern'] = pool.intern
+        lines.append("    return intern(obj)")
+    else:
+        lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    return namespace['decode']
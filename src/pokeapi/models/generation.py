@@ -4,16 +4,17 @@ Defines structures for generations and their associated resources.
 """
 
 from typing import List
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
+from .base import PokeAPIModel
 from .api_resource import NamedAPIResource
 
-class Name(BaseModel):
+class Name(PokeAPIModel):
     """Represents a localized name and its language."""
     name: str
     language: NamedAPIResource
     model_config = ConfigDict(from_attributes=True)
 
-class Generation(BaseModel):
+class Generation(PokeAPIModel):
     """Represents a Pokemon generation with its region, species, moves and other attributes."""
     id: int
     name: str
@@ -4,10 +4,11 @@ Defines structures for handling paginated lists of resources.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
+from .base import PokeAPIModel
 from .api_resource import NamedAPIResource
 
-class NamedAPIResourceList(BaseModel):
+class NamedAPIResourceList(PokeAPIModel):
     """Represents a paginated list of API resources with navigation links."""
     count: int
     next: Optional[str] = None
@@ -4,65 +4,66 @@ Defines structures for Pokemon and their associated attributes.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
+from .base import PokeAPIModel
 from .api_resource import NamedAPIResource
 
-class PokemonAbility(BaseModel):
+class PokemonAbility(PokeAPIModel):
     """Represents a Pokemon's ability with its slot and hidden status."""
     is_hidden: bool
     slot: int
     ability: Optional[NamedAPIResource] = None 
     model_config = ConfigDict(from_attributes=True)
 
-class PokemonType(BaseModel):
+class PokemonType(PokeAPIModel):
     """Represents one of a Pokemon's types and its slot position."""
     slot: int
     type: NamedAPIResource
 
-class PokemonFormType(BaseModel):
+class PokemonFormType(PokeAPIModel):
     """Represents a Pokemon form's type and its slot position."""
     slot: int
     type: NamedAPIResource
 
-class PokemonTypePast(BaseModel):
+class PokemonTypePast(PokeAPIModel):
     """Represents a Pokemon's type in a previous generation."""
     generation: NamedAPIResource
     types: List[PokemonType]
 
-class PokemonAbilityPast(BaseModel):
+class PokemonAbilityPast(PokeAPIModel):
     """Represents a Pokemon's abilities in a previous generation."""
     generation: NamedAPIResource
     abilities: Optional[List[PokemonAbility]] = None
 
-class PokemonHeldItemVersion(BaseModel):
+class PokemonHeldItemVersion(PokeAPIModel):
     """Represents details about a held item in a specific game version."""
     version: NamedAPIResource
     rarity: int
 
-class PokemonHeldItem(BaseModel):
+class PokemonHeldItem(PokeAPIModel):
     """Represents an item that can be held by a Pokemon across different versions."""
     item: NamedAPIResource
     version_details: List[PokemonHeldItemVersion]
 
-class PokemonMoveVersion(BaseModel):
+class PokemonMoveVersion(PokeAPIModel):
     """Represents how a Pokemon learns a move in a specific version group."""
     move_learn_method: NamedAPIResource
     version_group: NamedAPIResource
     level_learned_at: int
     order: Optional[int] = None
 
-class PokemonMove(BaseModel):
+class PokemonMove(PokeAPIModel):
     """Represents a move that a Pokemon can learn and how it learns it across versions."""
     move: NamedAPIResource
     version_group_details: List[PokemonMoveVersion]
 
-class PokemonStat(BaseModel):
+class PokemonStat(PokeAPIModel):
     """Represents one of a Pokemon's base stats and effort values."""
     stat: NamedAPIResource
     effort: int
     base_stat: int
 
-class PokemonSprites(BaseModel):
+class PokemonSprites(PokeAPIModel):
     """Represents all available sprite images for a Pokemon."""
     front_default: Optional[str]
     front_shiny: Optional[str]
@@ -73,17 +74,17 @@ class PokemonSprites(BaseModel):
     back_female: Optional[str]
     back_shiny_female: Optional[str]
 
-class PokemonCries(BaseModel):
+class PokemonCries(PokeAPIModel):
     """Represents the sound files for a Pokemon's cry."""
     latest: str
     legacy: str
 
-class VersionGameIndex(BaseModel):
+class VersionGameIndex(PokeAPIModel):
     """Represents a Pokemon's index number within a specific game version."""
     game_index: int
     version: NamedAPIResource
 
-class Pokemon(BaseModel):
+class Pokemon(PokeAPIModel):
     """Represents a Pokemon with all its attributes, stats, moves, and other details."""
     id: int
     name: str
@@ -0,0 +1,80 @@
+"""
+Narrowed versions of the PokeAPI models holding only selected fields.
+Lets callers skip decoding and storing parts of a response they never read.
+"""
+
+import threading
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Type
+from pydantic import BaseModel, create_model
+from ..constants import ErrorMessages
+from ..exceptions import PokeAPIError
+
+# Fields kept in every projection, so results can still be identified and cached
+IDENTITY_FIELDS = ("id", "name")
+
+_projections: Dict[Tuple[type, FrozenSet[str]], Type[BaseModel]] = {}
+_projected = set()
+_lock = threading.Lock()
+
+
+def is_projection(model_cls: type) -> bool:
+    """Whether `model_cls` was created by `project`."""
+    return model_cls in _projected
+
+
+def project(
+    model_cls: Type[BaseModel], fields: Optional[Iterable[str]]
+) -> Type[BaseModel]:
+    """
+    Return a model with only the given top-level fields of `model_cls`.
+
+    The projection keeps the field types and defaults of `model_cls`, plus
+    its `id` and `name` fields. The same class is returned for the same set
+    of fields, so parsed projections are cached like full models.
+
+    Args:
+        model_cls (Type[BaseModel]): The model to narrow
+        fields (Iterable[str], optional): Names of the fields to keep, or None
+            to keep every field
+
+    Returns:
+        Type[BaseModel]: The narrowed model, or `model_cls` itself if `fields`
+            is None or covers every field
+
+    Raises:
+        PokeAPIError: If a field does not exist on `model_cls`
+    """
+    if fields is None:
+        return model_cls
+    if isinstance(fields, str):
+        fields = (fields,)
+    wanted = frozenset(fields)
+    unknown = sorted(wanted - set(model_cls.model_fields))
+    if unknown:
+        raise PokeAPIError(ErrorMessages.INVALID_FIELDS.format(
+            model_cls.__name__, ", ".join(unknown)
+        ))
+    wanted |= {name for name in IDENTITY_FIELDS if name in model_cls.model_fields}
+    if wanted == set(model_cls.model_fields):
+        return model_cls
+
+    key = (model_cls, wanted)
+    projection = _projections.get(key)
+    if projection is not None:
+        return projection
+    with _lock:
+        projection = _projections.get(key)
+        if projection is None:
+            projection = create_model(
+                f"{model_cls.__name__}Projection",
+                __config__=model_cls.model_config,
+                __doc__=model_cls.__doc__,
+                **{
+                    name: (field.annotation, field)
+                    for name, field in model_cls.model_fields.items()
+                    if name in wanted
+                },
+            )
+            _projections[key] = projection
+            _projected.add(projection)
+        return projection
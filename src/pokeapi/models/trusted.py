@@ -0,0 +1,239 @@
+"""
+Lightweight decoding of PokeAPI responses without pydantic validation.
+Builds slotted classes mirroring the pydantic models and compiled decoders
+that fill them straight from parsed JSON.
+"""
+
+import inspect
+import json
+import threading
+import typing
+from typing import Any, Callable, Dict, Type
+from pydantic import BaseModel
+from .compact import compact_decoder
+from ..constants import MODEL_MODE_COMPACT, MODEL_MODE_TRUSTED, MODEL_MODE_VALIDATED
+
+_MISSING = object()
+
+
+class TrustedModel:
+    """
+    Base class of the slotted classes built by `trusted_model`.
+
+    Instances expose the same attributes as the pydantic model they mirror,
+    but values are taken from the response as-is: types are not checked or
+    coerced. Compare them with `==` or convert them with `model_dump()`.
+    """
+
+    __slots__ = ()
+    __model__: Type[BaseModel] = None
+    __hash__ = None
+
+    def model_dump(self) -> dict:
+        """Return the fields as a dict, converting nested models recursively."""
+        return {name: _dump(getattr(self, name)) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def _dump(value):
+    if isinstance(value, TrustedModel):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+_classes: Dict[type, type] = {}
+_decoders: Dict[type, Callable[[dict], Any]] = {}
+_lock = threading.RLock()
+
+
+def trusted_model(model_cls: Type[BaseModel]) -> type:
+    """
+    Return the slotted class mirroring a pydantic model.
+
+    Public methods defined on the model (such as `NamedAPIResource.fetch`)
+    are copied onto the class.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model to mirror
+
+    Returns:
+        type: A `TrustedModel` subclass with one slot per model field
+    """
+    cls = _classes.get(model_cls)
+    if cls is not None:
+        return cls
+    with _lock:
+        cls = _classes.get(model_cls)
+        if cls is None:
+            namespace = {
+                name: value for name, value in vars(model_cls).items()
+                if inspect.isfunction(value) and not name.startswith('_')
+            }
+            namespace.update({
+                '__slots__': tuple(model_cls.model_fields),
+                '__model__': model_cls,
+                '__module__': __name__,
+                '__qualname__': model_cls.__name__,
+                '__doc__': model_cls.__doc__,
+            })
+            cls = type(model_cls.__name__, (TrustedModel,), namespace)
+            _classes[model_cls] = cls
+        return cls
+
+
+def _expression(annotation, source: str, namespace: dict, depth: int) -> str:
+    # Python expression converting `source` to the value stored for `annotation`
+    origin = typing.get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        name = f"decode_{annotation.__name__}"
+        namespace[name] = trusted_decoder(annotation)
+        return f"{name}({source})"
+    if origin is list:
+        item = f"item{depth}"
+        inner = _expression(
+            typing.get_args(annotation)[0], item, namespace, depth + 1
+        )
+        if inner == item:
+            return source
+        return f"[{inner} for {item} in {source}]"
+    if origin is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            inner = _expression(args[0], source, namespace, depth)
+            if inner == source:
+                return source
+            return f"(None if {source} is None else {inner})"
+    return source
+
+
+def trusted_decoder(model_cls: Type[BaseModel]) -> Callable[[dict], Any]:
+    """
+    Return a compiled function building `trusted_model(model_cls)` from JSON.
+
+    The function is generated once per model, with one statement per field,
+    so decoding runs no per-field dispatch.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model to decode into
+
+    Returns:
+        Callable[[dict], Any]: Function taking the parsed JSON object
+    """
+    decoder = _decoders.get(model_cls)
+    if decoder is not None:
+        return decoder
+    with _lock:
+        decoder = _decoders.get(model_cls)
+        if decoder is not None:
+            return decoder
+        # Register a forwarder first so self-referencing models terminate
+        _decoders[model_cls] = lambda data: _decoders[model_cls](data)
+        try:
+            decoder = _compile(model_cls)
+        except BaseException:
+            del _decoders[model_cls]
+            raise
+        _decoders[model_cls] = decoder
+        return decoder
+
+
+def _compile(model_cls: Type[BaseModel]) -> Callable[[dict], Any]:
+    # Generate the decoder source for one model and compile it
+    namespace = {'new': object.__new__, 'cls': trusted_model(model_cls)}
+    lines = ["def decode(data):", "    obj = new(cls)"]
+    for i, (name, field) in enumerate(model_cls.model_fields.items()):
+        key = field.alias or name
+        if field.is_required():
+            lines.append(f"    value = data[{key!r}]")
+        elif field.default_factory is not None:
+            namespace[f"factory{i}"] = field.default_factory
+            lines.append(f"    value = data.get({key!r}, _MISSING)")
+            lines.append("    if value is _MISSING:")
+            lines.append(f"        value = factory{i}()")
+            namespace['_MISSING'] = _MISSING
+        else:
+            namespace[f"default{i}"] = field.default
+            lines.append(f"    value = data.get({key!r}, default{i})")
+        expression = _expression(field.annotation, "value", namespace, 0)
+        lines.append(f"    obj.{name} = {expression}")
+    lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    return namespace['decode']
+
+
+def parse_model(
+    model_cls, content: bytes, mode: str = MODEL_MODE_VALIDATED,
+    loads: Callable[[bytes], Any] = json.loads,
+):
+    """
+    Build a model from a raw JSON response body in the given mode.
+
+    Validated models are parsed straight from the bytes by pydantic, so no
+    intermediate dict is built and fields the model does not declare are
+    never turned into Python objects. Otherwise the body is parsed by `loads`.
+
+    Args:
+        model_cls: The pydantic model class, or `dict` to keep the JSON object
+        content (bytes): The response body
+        mode (str, optional): "validated" to build and validate the pydantic
+            model, "trusted" to build its slotted mirror without checks, or
+            "compact" to build its frozen mirror sharing repeated values
+        loads (Callable, optional): JSON parser for bytes, used for trusted
+            models and dicts
+
+    Returns:
+        An instance of `model_cls` or of its trusted or compact mirror
+
+    Raises:
+        ValueError: If the body is not valid JSON or does not fit the model
+    """
+    if not (isinstance(model_cls, type) and issubclass(model_cls, BaseModel)):
+        return model_cls(**loads(content))
+    if mode not in (MODEL_MODE_TRUSTED, MODEL_MODE_COMPACT):
+        return model_cls.model_validate_json(content)
+    return decode_model(model_cls, loads(content), mode)
+
+
+def decode_model(model_cls: Type[BaseModel], data: dict,
+                 mode: str = MODEL_MODE_VALIDATED):
+    """
+    Build a model from an already parsed JSON object in the given mode.
+
+    Args:
+        model_cls (Type[BaseModel]): The pydantic model class
+        data (dict): The parsed JSON object
+        mode (str, optional): "validated", "trusted" or "compact", see
+            `parse_model`
+
+    Returns:
+        An instance of `model_cls` or of its trusted or compact mirror
+
+    Raises:
+        ValueError: If the object does not fit the model
+    """
+    if mode == MODEL_MODE_TRUSTED:
+        decode = trusted_decoder(model_cls)
+    elif mode == MODEL_MODE_COMPACT:
+        decode = compact_decoder(model_cls)
+    else:
+        return model_cls.model_validate(data)
+    try:
+        return decode(data)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Cannot decode {model_cls.__name__}: {e!r}")
@@ -1,7 +1,17 @@
 """
 Main SDK package for the PokeAPI.
-Provides the main PokeAPI class.
+Provides the main PokeAPI class and its asyncio counterpart.
 """
-from .pokeapi import PokeAPI
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ['PokeAPI'] 
\ No newline at end of file
+if TYPE_CHECKING:  # pragma: no cover
+    from .pokeapi import PokeAPI
+    from .async_pokeapi import AsyncPokeAPI
+
+__all__ = ['PokeAPI', 'AsyncPokeAPI']
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PokeAPI': '.pokeapi',
+    'AsyncPokeAPI': '.async_pokeapi',
+})
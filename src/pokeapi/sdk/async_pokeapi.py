@@ -0,0 +1,340 @@
+"""
+Asynchronous SDK interface for interacting with the PokeAPI.
+Provides an awaitable counterpart to the PokeAPI class.
+"""
+
+from typing import AsyncIterator, Iterable, List, Optional, Union
+from ..api_clients.async_pokemon_client import AsyncPokemonClient
+from ..api_clients.async_generation_client import AsyncGenerationClient
+from ..api_clients.async_resource_client import AsyncResourceClient
+from ..api_clients.bulk import BulkResult
+from ..models.pokemon import Pokemon
+from ..models.generation import Generation
+from ..models.api_resource import NamedAPIResource
+from ..models.pagination import NamedAPIResourceList
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder, default_decoder
+from ..connection.hooks import Hook, Hooks
+from ..connection.ratelimit import RateLimiter, AsyncAdaptiveConcurrency
+from ..connection.resilience import CircuitBreaker, HedgePolicy, RetryPolicy
+from ..connection.singleflight import AsyncSingleFlight
+from ..connection.async_transport import (
+    AsyncTransport, AsyncHttpTransport, AsyncThrottledTransport,
+    AsyncResilientTransport, AsyncHedgedTransport,
+)
+from ..dataset.async_transport import AsyncLocalTransport
+from ..dataset.transport import local_source_path
+from ..constants import (
+    BASE_URL, DEFAULT_PAGE_SIZE, PAGE_PREFETCH, POOL_MAXSIZE, MAX_CONCURRENCY,
+    MODEL_MODE_VALIDATED, CONNECT_TIMEOUT, READ_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
+
+
+class AsyncPokeAPI:
+    """
+    Asyncio entry point for the Pokemon API SDK.
+    Provides awaitable access to all API functionality through a single interface.
+
+    Usage:
+        async with AsyncPokeAPI(max_concurrency=20) as api:
+            pikachu = await api.get_pokemon(name="pikachu")
+            pokemon_list = await api.list_pokemon(limit=5)
+
+            gen1 = await api.get_generation(generation_id=1)
+            generations = await api.list_generations()
+
+            species = await api.resolve_all(gen1.pokemon_species)
+    """
+
+    def __init__(
+        self,
+        transport: Optional[AsyncTransport] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        pool_maxsize: int = POOL_MAXSIZE,
+        keep_alive: bool = True,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        source: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AsyncAdaptiveConcurrency] = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        hooks: Optional[Iterable[Hook]] = None,
+    ):
+        """
+        Initialize the AsyncPokeAPI with Pokemon and Generation clients.
+
+        Both clients share a single transport, so the concurrency limit
+        applies to all requests made through this instance.
+        Identical requests made concurrently by several tasks are sent once
+        and their result is shared.
+
+        Args:
+            transport (AsyncTransport, optional): Transport to share between the
+                clients. If omitted, a pooled AsyncHttpTransport is created
+                using the settings below and closed by `aclose()`.
+            max_concurrency (int, optional): Maximum number of requests in
+                flight at once
+            pool_maxsize (int, optional): Maximum number of open connections
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests
+            base_url (str, optional): Base URL of the API
+            cache (Cache, optional): Response cache shared by the
+                clients. Caching is disabled if omitted.
+            model_mode (str, optional): "validated", "trusted" or "compact", as for
+                `PokeAPI`
+            decoder (JsonDecoder, optional): JSON decoder shared by the
+                clients. Defaults to orjson if installed, else the stdlib.
+            source (str, optional): "remote" (default) for the live API, or
+                "local:<path>" to answer every request from a dataset written
+                by `snapshot`, without network access.
+            rate_limiter (RateLimiter, optional): Limits the request rate
+                of every client, e.g. a `TokenBucket`, or a
+                `FileTokenBucket` to share the limit between processes.
+                A 429 response pauses it for the server's Retry-After.
+            concurrency (AsyncAdaptiveConcurrency, optional): Caps the
+                requests in flight and adapts the cap (AIMD) to latency
+                and 429/5xx responses
+            connect_timeout (float, optional): Seconds allowed to open a
+                connection
+            read_timeout (float, optional): Seconds allowed between bytes
+                of a response
+            retry_policy (RetryPolicy, optional): Retries timeouts,
+                connection errors and 429/5xx responses with exponential
+                backoff and jitter. Requests are sent once if omitted.
+            circuit_breaker (CircuitBreaker, optional): Fails requests fast
+                with `CircuitOpenError` while a host keeps failing
+            hedge_policy (HedgePolicy, optional): Sends a second copy of
+                requests slower than the policy's delay and keeps the
+                first response, trading a few extra requests for a lower
+                tail latency
+            hooks (Iterable[Hook], optional): Hooks receiving request,
+                cache, parse and retry events from every client, e.g. a
+                `MetricsCollector` or a `LoggingHook`. More can be added
+                later with `hooks.add()`.
+
+        Raises:
+            PokeAPIError: If the source is invalid, is combined with a
+                transport, or names a directory that is not a dataset
+        """
+        # Shared so one hook observes every client
+        self.hooks = Hooks(hooks or ())
+        local_path = local_source_path(source) if source is not None else None
+        if local_path is not None and transport is not None:
+            raise PokeAPIError(ErrorMessages.SOURCE_WITH_TRANSPORT)
+        self._owns_transport = transport is None
+        if local_path is not None:
+            transport = AsyncLocalTransport(local_path)
+        elif transport is None:
+            transport = AsyncHttpTransport(
+                max_concurrency=max_concurrency,
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive,
+            )
+        if rate_limiter is not None or concurrency is not None:
+            transport = AsyncThrottledTransport(transport, rate_limiter, concurrency)
+        if hedge_policy is not None:
+            transport = AsyncHedgedTransport(transport, hedge_policy)
+        if retry_policy is not None or circuit_breaker is not None:
+            transport = AsyncResilientTransport(
+                transport, retry_policy, circuit_breaker, self.hooks
+            )
+        self.transport = transport
+        self.cache = cache
+        timeout = (connect_timeout, read_timeout)
+        if decoder is None:
+            decoder = default_decoder()
+        # Shared so identical concurrent requests from any client coalesce
+        self.single_flight = AsyncSingleFlight()
+        self.pokemon = AsyncPokemonClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+        self.generation = AsyncGenerationClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+        self.resources = AsyncResourceClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared transport if it was created by this instance."""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def get_pokemon(
+        self, pokemon_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Pokemon:
+        """
+        Get a specific Pokemon by ID or name.
+
+        Args:
+            pokemon_id (int, optional): The ID of the Pokemon to get
+            name (str, optional): The name of the Pokemon to get
+            fields (Iterable[str], optional): Names of the fields to decode.
+                Returns a narrowed model with only these fields plus `id`
+                and `name`. Defaults to all fields.
+
+        Returns:
+            Pokemon: The requested Pokemon data
+        """
+        return await self.pokemon.get_pokemon(pokemon_id, name, fields)
+
+    async def list_pokemon(
+        self, limit: int = 20, offset: int = 0
+    ) -> NamedAPIResourceList:
+        """
+        Get a paginated list of Pokemon.
+
+        Args:
+            limit (int, optional): Number of Pokemon to return. Defaults to 20
+            offset (int, optional): Starting position in the list. Defaults to 0
+
+        Returns:
+            NamedAPIResourceList: Paginated list of Pokemon resources
+        """
+        return await self.pokemon.list_pokemon(limit, offset)
+
+    def iter_pokemon(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[NamedAPIResource]:
+        """
+        Asynchronously iterate over all Pokemon, following `next` links lazily.
+
+        Args:
+            page_size (int, optional): Number of resources per request
+            offset (int, optional): Starting position in the list. Defaults to 0
+            prefetch (int, optional): Number of pages fetched ahead
+
+        Returns:
+            AsyncIterator[NamedAPIResource]: Pokemon resources in list order
+        """
+        return self.pokemon.iter_pokemon(page_size, offset, prefetch)
+
+    async def get_generation(
+        self, generation_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Generation:
+        """
+        Get a specific Pokemon generation by ID or name.
+
+        Args:
+            generation_id (int, optional): The ID of the generation to get
+            name (str, optional): The name of the generation to get
+            fields (Iterable[str], optional): Names of the fields to decode.
+                Returns a narrowed model with only these fields plus `id`
+                and `name`. Defaults to all fields.
+
+        Returns:
+            Generation: The requested generation data
+        """
+        return await self.generation.get_generation(generation_id, name, fields)
+
+    async def list_generations(
+        self, limit: int = 20, offset: int = 0
+    ) -> NamedAPIResourceList:
+        """
+        Get a paginated list of Pokemon generations.
+
+        Args:
+            limit (int, optional): Number of generations to return. Defaults to 20
+            offset (int, optional): Starting position in the list. Defaults to 0
+
+        Returns:
+            NamedAPIResourceList: Paginated list of generation resources
+        """
+        return await self.generation.list_generations(limit, offset)
+
+    def iter_generations(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[NamedAPIResource]:
+        """
+        Asynchronously iterate over all Pokemon generations, following `next` links lazily.
+
+        Args:
+            page_size (int, optional): Number of resources per request
+            offset (int, optional): Starting position in the list. Defaults to 0
+            prefetch (int, optional): Number of pages fetched ahead
+
+        Returns:
+            AsyncIterator[NamedAPIResource]: Pokemon generations resources in list order
+        """
+        return self.generation.iter_generations(page_size, offset, prefetch)
+
+    async def get_many_pokemon(
+        self, ids_or_names: Iterable[Union[int, str]],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon concurrently by ID or name.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+            fields (Iterable[str], optional): Names of the fields to decode
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return await self.pokemon.get_many_pokemon(ids_or_names, fields)
+
+    async def get_many_generations(
+        self, ids_or_names: Iterable[Union[int, str]],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon generations concurrently by ID or name.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+            fields (Iterable[str], optional): Names of the fields to decode
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return await self.generation.get_many_generations(ids_or_names, fields)
+
+    async def resolve(self, resource: NamedAPIResource):
+        """
+        Fetch the resource a NamedAPIResource link points at.
+
+        Args:
+            resource (NamedAPIResource): The link to follow
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource, as a model for
+                known endpoints and as parsed JSON otherwise
+        """
+        return await self.resources.resolve(resource)
+
+    async def resolve_all(
+        self, resources: Iterable[NamedAPIResource]
+    ) -> List[BulkResult]:
+        """
+        Fetch many NamedAPIResource links concurrently.
+
+        Identical URLs are requested once and share a result.
+
+        Args:
+            resources (Iterable[NamedAPIResource]): The links to follow
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return await self.resources.resolve_all(resources)
@@ -3,11 +3,33 @@ Main SDK interface for interacting with the PokeAPI.
 Provides a simplified interface for accessing Pokemon and Generation data.
 """
 
+import threading
+from typing import Iterable, Iterator, List, Optional, Union
 from ..api_clients.pokemon_client import PokemonClient
 from ..api_clients.generation_client import GenerationClient
-from ..models.pokemon import Pokemon
+from ..api_clients.resource_client import ResourceClient
+from ..api_clients.bulk import BulkResult
+from ..models.pokemon import Pokemon, PokemonMove
 from ..models.generation import Generation
+from ..models.api_resource import NamedAPIResource
 from ..models.pagination import NamedAPIResourceList
+from ..connection.cache import Cache
+from ..connection.decoders import JsonDecoder, default_decoder
+from ..connection.hooks import Hook, Hooks
+from ..connection.ratelimit import RateLimiter, AdaptiveConcurrency
+from ..connection.resilience import CircuitBreaker, HedgePolicy, RetryPolicy
+from ..connection.singleflight import SingleFlight
+from ..connection.transport import (
+    Transport, HttpTransport, ThrottledTransport, ResilientTransport,
+    HedgedTransport,
+)
+from ..dataset.transport import LocalTransport, local_source_path
+from ..constants import (
+    BASE_URL, BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, PAGE_PREFETCH,
+    POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK, MODEL_MODE_VALIDATED,
+    CONNECT_TIMEOUT, READ_TIMEOUT, ErrorMessages,
+)
+from ..exceptions import PokeAPIError
 
 
 class PokeAPI:
@@ -25,15 +47,203 @@ class PokeAPI:
         # Generation operations
         gen1 = api.generation.get_generation("1")
         generations = api.generation.list_generations()
+
+        # Iterate over every Pokemon without handling pagination
+        for resource in api.iter_pokemon(page_size=200):
+            print(resource.name)
+
+        # Bulk operations keep input order and report errors per item
+        results = api.get_many_pokemon([1, "pikachu", 9999])
+        found = [r.value for r in results if r.ok]
+
+        # Follow links, fetching each distinct URL once
+        gen1 = api.get_generation(generation_id=1)
+        species = api.resolve_all(gen1.pokemon_species)
+        kanto = gen1.main_region.fetch(api)
+
+        # Decode only the fields you read
+        light = api.get_pokemon(name="pikachu", fields=["types", "stats"])
+
+        # Stream a Pokemon's moves without buffering the response
+        for move in api.iter_pokemon_moves(name="mew"):
+            print(move.move.name)
+
+        # Skip validation for trusted, read-heavy workloads
+        fast = PokeAPI(model_mode="trusted")
+
+        # Serve lookups from a dataset written by `pokeapi snapshot`
+        local = PokeAPI(source="local:/data/pokeapi")
+
+        # Retry transient failures, fail fast on an unhealthy host and
+        # hedge requests slower than the 95th percentile
+        resilient = PokeAPI(
+            retry_policy=RetryPolicy(),
+            circuit_breaker=CircuitBreaker(),
+            hedge_policy=HedgePolicy(percentile=95),
+        )
+
+        # Release pooled connections when done
+        api.close()
+
+        # Or scope the connection pool with a context manager
+        with PokeAPI(pool_maxsize=20) as api:
+            api.get_pokemon(name="pikachu")
     """
 
-    def __init__(self):
-        """Initialize the PokeAPI with Pokemon and Generation clients."""
-        self.pokemon = PokemonClient()
-        self.generation = GenerationClient()
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        keep_alive: bool = True,
+        base_url: str = BASE_URL,
+        cache: Optional[Cache] = None,
+        model_mode: str = MODEL_MODE_VALIDATED,
+        decoder: Optional[JsonDecoder] = None,
+        source: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        hooks: Optional[Iterable[Hook]] = None,
+    ):
+        """
+        Initialize the PokeAPI with Pokemon and Generation clients.
+
+        Both clients share a single pooled transport, so connections opened
+        by one client are reused by the other.
+        Identical requests made concurrently, from any thread and through
+        any client, are sent once and their result is shared.
+
+        Args:
+            transport (Transport, optional): Transport to share between the
+                clients. If omitted, a pooled HttpTransport is created using
+                the pool settings below and closed by `close()`.
+            pool_connections (int, optional): Number of per-host connection
+                pools to cache
+            pool_maxsize (int, optional): Maximum connections kept open per host
+            pool_block (bool, optional): Whether to wait for a free connection
+                instead of opening one beyond `pool_maxsize`
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests
+            base_url (str, optional): Base URL of the API
+            cache (Cache, optional): Response cache shared by the
+                clients. Caching is disabled if omitted.
+            model_mode (str, optional): "validated" (default) returns
+                validated pydantic models. "trusted" skips validation and
+                returns slotted classes with the same attributes, which is
+                several times faster for large responses. "compact" returns
+                frozen slotted classes that share repeated nested values,
+                using the least memory when many resources are kept.
+            decoder (JsonDecoder, optional): JSON decoder shared by the
+                clients. Defaults to orjson if installed, else the stdlib.
+            source (str, optional): "remote" (default) for the live API, or
+                "local:<path>" to answer every request from a dataset written
+                by `snapshot`, without network access.
+            rate_limiter (RateLimiter, optional): Limits the request rate
+                of every client, e.g. a `TokenBucket`, or a
+                `FileTokenBucket` to share the limit between processes.
+                A 429 response pauses it for the server's Retry-After.
+            concurrency (AdaptiveConcurrency, optional): Caps the
+                requests in flight and adapts the cap (AIMD) to latency
+                and 429/5xx responses
+            connect_timeout (float, optional): Seconds allowed to open a
+                connection
+            read_timeout (float, optional): Seconds allowed between bytes
+                of a response
+            retry_policy (RetryPolicy, optional): Retries timeouts,
+                connection errors and 429/5xx responses with exponential
+                backoff and jitter. Requests are sent once if omitted.
+            circuit_breaker (CircuitBreaker, optional): Fails requests fast
+                with `CircuitOpenError` while a host keeps failing
+            hedge_policy (HedgePolicy, optional): Sends a second copy of
+                requests slower than the policy's delay and keeps the
+                first response, trading a few extra requests for a lower
+                tail latency
+            hooks (Iterable[Hook], optional): Hooks receiving request,
+                cache, parse and retry events from every client, e.g. a
+                `MetricsCollector` or a `LoggingHook`. More can be added
+                later with `hooks.add()`.
+
+        Raises:
+            PokeAPIError: If the source is invalid, is combined with a
+                transport, or names a directory that is not a dataset
+        """
+        # Shared so one hook observes every client
+        self.hooks = Hooks(hooks or ())
+        local_path = local_source_path(source) if source is not None else None
+        if local_path is not None and transport is not None:
+            raise PokeAPIError(ErrorMessages.SOURCE_WITH_TRANSPORT)
+        self._owns_transport = transport is None
+        if local_path is not None:
+            transport = LocalTransport(local_path)
+        elif transport is None:
+            transport = HttpTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        # Wrappers created here, released by close() even when the
+        # transport they wrap belongs to the caller
+        self._wrappers = []
+        if rate_limiter is not None or concurrency is not None:
+            transport = ThrottledTransport(transport, rate_limiter, concurrency)
+            self._wrappers.append(transport)
+        if hedge_policy is not None:
+            transport = HedgedTransport(transport, hedge_policy)
+            self._wrappers.append(transport)
+        if retry_policy is not None or circuit_breaker is not None:
+            transport = ResilientTransport(
+                transport, retry_policy, circuit_breaker, self.hooks
+            )
+            self._wrappers.append(transport)
+        self.transport = transport
+        self.cache = cache
+        timeout = (connect_timeout, read_timeout)
+        if decoder is None:
+            decoder = default_decoder()
+        # Shared so identical concurrent requests from any client coalesce
+        self.single_flight = SingleFlight()
+        self.pokemon = PokemonClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+        self.generation = GenerationClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+        self.resources = ResourceClient(
+            transport, base_url, cache, model_mode, decoder,
+            self.single_flight, timeout, self.hooks,
+        )
+
+    def close(self) -> None:
+        """
+        Close the shared transport if it was created by this instance.
+
+        A transport passed in by the caller is left open, but the wrappers
+        added around it, such as the hedging thread pool, are released.
+        """
+        if self._owns_transport:
+            self.transport.close()
+            return
+        for wrapper in reversed(self._wrappers):
+            wrapper.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_pokemon(
-        self, pokemon_id: int = None, name: str = None
+        self, pokemon_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None, stream: bool = False,
     ) -> Pokemon:
         """
         Get a specific Pokemon by ID or name.
@@ -41,11 +251,31 @@ class PokeAPI:
         Args:
             pokemon_id (int, optional): The ID of the Pokemon to get
             name (str, optional): The name of the Pokemon to get
+            fields (Iterable[str], optional): Names of the fields to decode.
+                Returns a narrowed model with only these fields plus `id`
+                and `name`. Defaults to all fields.
+            stream (bool, optional): Build the Pokemon while the response
+                is read instead of buffering the body. Not cached.
 
         Returns:
             Pokemon: The requested Pokemon data
         """
-        return self.pokemon.get_pokemon(pokemon_id, name)
+        return self.pokemon.get_pokemon(pokemon_id, name, fields, stream)
+
+    def iter_pokemon_moves(
+        self, pokemon_id: int = None, name: str = None
+    ) -> Iterator[PokemonMove]:
+        """
+        Iterate over the moves of a Pokemon as they are read from the response.
+
+        Args:
+            pokemon_id (int, optional): The ID of the Pokemon
+            name (str, optional): The name of the Pokemon
+
+        Returns:
+            Iterator[PokemonMove]: The moves, holding one at a time in memory
+        """
+        return self.pokemon.iter_pokemon_moves(pokemon_id, name)
 
     def list_pokemon(
         self, limit: int = 20, offset: int = 0
@@ -62,8 +292,26 @@ class PokeAPI:
         """
         return self.pokemon.list_pokemon(limit, offset)
 
+    def iter_pokemon(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> Iterator[NamedAPIResource]:
+        """
+        Iterate over all Pokemon, following `next` links lazily.
+
+        Args:
+            page_size (int, optional): Number of resources per request
+            offset (int, optional): Starting position in the list. Defaults to 0
+            prefetch (int, optional): Number of pages fetched ahead
+
+        Returns:
+            Iterator[NamedAPIResource]: Pokemon resources in list order
+        """
+        return self.pokemon.iter_pokemon(page_size, offset, prefetch)
+
     def get_generation(
-        self, generation_id: int = None, name: str = None
+        self, generation_id: int = None, name: str = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Generation:
         """
         Get a specific Pokemon generation by ID or name.
@@ -71,11 +319,14 @@ class PokeAPI:
         Args:
             generation_id (int, optional): The ID of the generation to get
             name (str, optional): The name of the generation to get
+            fields (Iterable[str], optional): Names of the fields to decode.
+                Returns a narrowed model with only these fields plus `id`
+                and `name`. Defaults to all fields.
 
         Returns:
             Generation: The requested generation data
         """
-        return self.generation.get_generation(generation_id, name)
+        return self.generation.get_generation(generation_id, name, fields)
 
     def list_generations(
         self, limit: int = 20, offset: int = 0
@@ -91,5 +342,111 @@ class PokeAPI:
             NamedAPIResourceList: Paginated list of generation resources
         """
         return self.generation.list_generations(limit, offset)
-    
-    
\ No newline at end of file
+
+    def iter_generations(
+        self, page_size: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+        prefetch: int = PAGE_PREFETCH
+    ) -> Iterator[NamedAPIResource]:
+        """
+        Iterate over all Pokemon generations, following `next` links lazily.
+
+        Args:
+            page_size (int, optional): Number of resources per request
+            offset (int, optional): Starting position in the list. Defaults to 0
+            prefetch (int, optional): Number of pages fetched ahead
+
+        Returns:
+            Iterator[NamedAPIResource]: Pokemon generations resources in list order
+        """
+        return self.generation.iter_generations(page_size, offset, prefetch)
+
+    def get_many_pokemon(
+        self, ids_or_names: Iterable[Union[int, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon concurrently by ID or name.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+            max_workers (int, optional): Maximum number of concurrent requests
+            fields (Iterable[str], optional): Names of the fields to decode
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return self.pokemon.get_many_pokemon(
+            ids_or_names, max_workers, fields
+        )
+
+    def get_many_generations(
+        self, ids_or_names: Iterable[Union[int, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[BulkResult]:
+        """
+        Get many Pokemon generations concurrently by ID or name.
+
+        Args:
+            ids_or_names (Iterable[Union[int, str]]): IDs (int) or names (str)
+            max_workers (int, optional): Maximum number of concurrent requests
+            fields (Iterable[str], optional): Names of the fields to decode
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return self.generation.get_many_generations(
+            ids_or_names, max_workers, fields
+        )
+
+    def resolve(self, resource: NamedAPIResource):
+        """
+        Fetch the resource a NamedAPIResource link points at.
+
+        Args:
+            resource (NamedAPIResource): The link to follow
+
+        Returns:
+            Pokemon, Generation or dict: The linked resource, as a model for
+                known endpoints and as parsed JSON otherwise
+        """
+        return self.resources.resolve(resource)
+
+    def resolve_all(
+        self, resources: Iterable[NamedAPIResource],
+        max_workers: int = BULK_MAX_WORKERS
+    ) -> List[BulkResult]:
+        """
+        Fetch many NamedAPIResource links concurrently.
+
+        Identical URLs are requested once and share a result.
+
+        Args:
+            resources (Iterable[NamedAPIResource]): The links to follow
+            max_workers (int, optional): Maximum number of concurrent requests
+
+        Returns:
+            List[BulkResult]: One result or error per input, in input order
+        """
+        return self.resources.resolve_all(resources, max_workers)
+
+
+_default_api = None
+_default_api_lock = threading.Lock()
+
+
+def default_api() -> PokeAPI:
+    """
+    Return the shared PokeAPI instance used by `NamedAPIResource.fetch()`.
+
+    The instance is created on first use with default settings.
+
+    Returns:
+        PokeAPI: The shared instance
+    """
+    global _default_api
+    with _default_api_lock:
+        if _default_api is None:
+            _default_api = PokeAPI()
+        return _default_api
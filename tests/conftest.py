@@ -0,0 +1,9 @@
+import pytest
+from tests.stub_server import StubPokeAPIServer
+
+
+@pytest.fixture
+def stub_server():
+    """Fixture that serves the recorded fixtures from a local HTTP server"""
+    with StubPokeAPIServer() as server:
+        yield server
@@ -0,0 +1,106 @@
+# tests/integration/test_async_pokeapi.py
+
+import asyncio
+import pytest
+from src.pokeapi.sdk.async_pokeapi import AsyncPokeAPI
+from src.pokeapi.connection.async_transport import AsyncHttpTransport
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.generation import Generation
+from src.pokeapi.models.pagination import NamedAPIResourceList
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_pokemon_by_id(stub_server):
+    """Test that get_pokemon returns a Pokemon object"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return await api.get_pokemon(pokemon_id=1)
+
+    pokemon = run(scenario())
+    assert isinstance(pokemon, Pokemon)
+    assert pokemon.name == "bulbasaur"
+
+def test_get_generation_by_name(stub_server):
+    """Test that get_generation returns a Generation object when using name"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return await api.get_generation(name="generation-i")
+
+    generation = run(scenario())
+    assert isinstance(generation, Generation)
+    assert generation.main_region.name == "kanto"
+
+def test_list_endpoints(stub_server):
+    """Test that list methods return NamedAPIResourceList pages"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return await asyncio.gather(
+                api.list_pokemon(limit=2, offset=1),
+                api.list_generations(limit=2),
+            )
+
+    pokemon_list, generation_list = run(scenario())
+    assert isinstance(pokemon_list, NamedAPIResourceList)
+    assert [r.name for r in pokemon_list.results] == ["ivysaur", "venusaur"]
+    assert len(generation_list.results) == 2
+
+def test_not_found_keeps_error_message(stub_server):
+    """Test that a 404 raises the same PokeAPIError as the sync client"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            await api.get_pokemon(name="missingno")
+
+    with pytest.raises(PokeAPIError) as exc:
+        run(scenario())
+    assert str(exc.value) == "The requested resource was not found"
+
+def test_invalid_id_raises_before_request(stub_server):
+    """Test that argument validation matches the sync client"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            await api.get_pokemon(pokemon_id=-1)
+
+    with pytest.raises(PokeAPIError) as exc:
+        run(scenario())
+    assert "Pokemon ID must be a positive number: -1" in str(exc.value)
+    assert stub_server.requests == []
+
+def test_concurrency_is_bounded(stub_server):
+    """Test that no more than max_concurrency requests are in flight"""
+    stub_server.delay = 0.05
+    in_flight = 0
+    peak = 0
+
+    async def scenario():
+        transport = AsyncHttpTransport(max_concurrency=2)
+        original_get = transport.client.get
+
+        async def counting_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await original_get(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        transport.client.get = counting_get
+        async with transport:
+            api = AsyncPokeAPI(transport=transport, base_url=stub_server.base_url)
+            return await asyncio.gather(
+                *(api.get_pokemon(pokemon_id=i) for i in (1, 2, 3, 4, 5, 6))
+            )
+
+    results = run(scenario())
+    assert [p.id for p in results] == [1, 2, 3, 4, 5, 6]
+    assert peak == 2
+
+def test_invalid_concurrency():
+    """Test that a non-positive concurrency limit is rejected"""
+    with pytest.raises(PokeAPIError) as exc:
+        AsyncHttpTransport(max_concurrency=0)
+    assert "Concurrency limit must be a positive number" in str(exc.value)
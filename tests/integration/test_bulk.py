@@ -0,0 +1,58 @@
+# tests/integration/test_bulk.py
+
+import asyncio
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.generation import Generation
+
+
+@pytest.fixture
+def api(stub_server):
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        yield api
+
+def test_get_many_pokemon_keeps_input_order(api):
+    """Test that results come back in the order they were requested"""
+    keys = [25, "bulbasaur", 6, "gengar", 4]
+    results = api.get_many_pokemon(keys, max_workers=4)
+    assert [r.key for r in results] == keys
+    assert all(isinstance(r.value, Pokemon) for r in results)
+    assert [r.value.id for r in results] == [25, 1, 6, 94, 4]
+
+def test_get_many_pokemon_reports_errors_per_item(api):
+    """Test that a missing Pokemon does not abort the batch"""
+    results = api.get_many_pokemon([1, "missingno", 0, 2])
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[1].error.message == "The requested resource was not found"
+    assert "Pokemon ID must be a positive number: 0" in results[2].error.message
+    with pytest.raises(PokeAPIError):
+        results[1].unwrap()
+    assert results[3].unwrap().name == "ivysaur"
+
+def test_get_many_generations(api):
+    """Test that get_many_generations returns Generation objects"""
+    results = api.get_many_generations([1, "generation-ii"])
+    assert all(isinstance(r.unwrap(), Generation) for r in results)
+    assert [r.value.main_region.name for r in results] == ["kanto", "johto"]
+
+def test_get_many_empty(api):
+    """Test that an empty batch makes no requests"""
+    assert api.get_many_pokemon([]) == []
+
+def test_get_many_invalid_max_workers(api):
+    """Test that a non-positive max_workers is rejected"""
+    with pytest.raises(PokeAPIError) as exc:
+        api.get_many_pokemon([1], max_workers=0)
+    assert "Max workers must be a positive number" in str(exc.value)
+
+def test_async_get_many_pokemon(stub_server):
+    """Test that the async bulk fetch keeps order and per-item errors"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return await api.get_many_pokemon(["pikachu", 9999, 7])
+
+    results = asyncio.run(scenario())
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[2].value.name == "squirtle"
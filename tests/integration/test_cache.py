@@ -0,0 +1,121 @@
+# tests/integration/test_cache.py
+
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.connection import cache as cache_module
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.exceptions import PokeAPIError
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(maxsize=3)
+
+@pytest.fixture
+def api(stub_server, cache):
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        yield api
+
+def test_repeated_lookup_is_served_from_cache(api, cache, stub_server):
+    """Test that a second lookup does not reach the server"""
+    first = api.get_pokemon(pokemon_id=1)
+    second = api.get_pokemon(pokemon_id=1)
+    assert second is first
+    assert stub_server.hits("/api/v2/pokemon/1") == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+def test_id_and_name_share_one_entry(api, cache, stub_server):
+    """Test that get_pokemon(25) and get_pokemon(name="pikachu") share an entry"""
+    by_id = api.get_pokemon(pokemon_id=25)
+    by_name = api.get_pokemon(name="pikachu")
+    assert by_name is by_id
+    assert len(cache) == 1
+    assert len(stub_server.requests) == 1
+
+def test_name_lookup_is_aliased_to_id(api, cache, stub_server):
+    """Test that a Pokemon fetched by name is found again by ID"""
+    api.get_pokemon(name="charizard")
+    api.get_pokemon(pokemon_id=6)
+    assert len(cache) == 1
+    assert len(stub_server.requests) == 1
+
+def test_lru_eviction(api, cache, stub_server):
+    """Test that the least recently used entry is evicted when full"""
+    for pokemon_id in (1, 2, 3):
+        api.get_pokemon(pokemon_id=pokemon_id)
+    api.get_pokemon(pokemon_id=1)  # Refresh 1 so 2 is the oldest
+    api.get_pokemon(pokemon_id=4)
+    assert cache.stats.evictions == 1
+    api.get_pokemon(pokemon_id=1)
+    assert stub_server.hits("/api/v2/pokemon/1") == 1
+    api.get_pokemon(pokemon_id=2)
+    assert stub_server.hits("/api/v2/pokemon/2") == 2
+
+def test_endpoint_ttl_expiry(stub_server, monkeypatch):
+    """Test that entries expire after their endpoint's TTL"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=None, endpoint_ttls={"/generation": 60})
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        api.get_generation(generation_id=1)
+        api.get_pokemon(pokemon_id=1)
+        now[0] += 61
+        api.get_generation(generation_id=1)
+        api.get_pokemon(pokemon_id=1)
+    assert stub_server.hits("/api/v2/generation/1") == 2
+    assert stub_server.hits("/api/v2/pokemon/1") == 1
+
+def test_list_pages_are_cached(api, stub_server):
+    """Test that list pages are cached by their query string"""
+    api.list_pokemon(limit=2, offset=0)
+    api.list_pokemon(limit=2, offset=0)
+    api.list_pokemon(limit=2, offset=2)
+    assert len(stub_server.requests) == 2
+
+def test_errors_are_not_cached(api, cache, stub_server):
+    """Test that failed lookups are retried rather than cached"""
+    for _ in range(2):
+        with pytest.raises(PokeAPIError):
+            api.get_pokemon(name="missingno")
+    assert stub_server.hits("/api/v2/pokemon/missingno") == 2
+    assert len(cache) == 0
+
+def test_no_cache_by_default(stub_server):
+    """Test that caching is opt-in"""
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        api.get_pokemon(pokemon_id=1)
+        api.get_pokemon(pokemon_id=1)
+    assert stub_server.hits("/api/v2/pokemon/1") == 2
+
+def test_expired_entry_is_revalidated(stub_server, monkeypatch):
+    """Test that an expired entry is refreshed with a conditional request"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=60)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        first = api.get_pokemon(pokemon_id=25)
+        now[0] += 61
+        second = api.get_pokemon(pokemon_id=25)
+        third = api.get_pokemon(pokemon_id=25)
+    assert stub_server.hits("/api/v2/pokemon/25") == 2
+    assert stub_server.not_modified == 1
+    assert cache.stats.revalidations == 1
+    # The body was not re-downloaded, so the parsed model is reused
+    assert second is first
+    assert third is first
+
+def test_changed_resource_is_downloaded_again(stub_server, monkeypatch):
+    """Test that a resource whose ETag changed is re-fetched and re-parsed"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=60)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        first = api.get_pokemon(pokemon_id=4)
+        changed = first.model_dump()
+        changed["weight"] = 86
+        stub_server.update("pokemon", changed)
+        now[0] += 61
+        second = api.get_pokemon(pokemon_id=4)
+    assert stub_server.not_modified == 0
+    assert second.weight == 86
+    assert cache.stats.revalidations == 0
@@ -0,0 +1,74 @@
+# tests/integration/test_compact_models.py
+
+import pickle
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.generation import Generation
+from src.pokeapi.models.api_resource import NamedAPIResource
+from src.pokeapi.models.compact import (
+    CompactModel, InternPool, compact_decoder, compact_model,
+)
+from src.pokeapi.models.trusted import parse_model
+from tests.stub_server import load_fixtures
+
+
+@pytest.mark.parametrize("endpoint,model", [
+    ("pokemon", Pokemon), ("generation", Generation),
+])
+def test_compact_models_match_validated_fixtures(endpoint, model):
+    """Test that compact decoding dumps the same data as validation"""
+    for content in load_fixtures(endpoint):
+        compact = parse_model(model, content, "compact")
+        validated = parse_model(model, content, "validated")
+        assert isinstance(compact, compact_model(model))
+        assert compact.model_dump() == validated.model_dump()
+
+def test_compact_models_share_repeated_values():
+    """Test that equal nested values decoded from different responses are one object"""
+    pool = InternPool()
+    decode = compact_decoder(Pokemon, pool)
+    content = load_fixtures("pokemon")[0]
+    first = decode(Pokemon.model_validate_json(content).model_dump(by_alias=True))
+    second = decode(Pokemon.model_validate_json(content).model_dump(by_alias=True))
+    assert first is not second
+    assert first.species is second.species
+    assert first.moves[0].version_group_details[0] is \
+        second.moves[0].version_group_details[0]
+    assert first.moves[0] is not second.moves[0]
+    assert len(pool) > 0
+    pool.clear()
+    assert len(pool) == 0
+    assert decode(Pokemon.model_validate_json(content).model_dump(by_alias=True)) \
+        .species is not first.species
+
+def test_compact_models_are_immutable_values():
+    """Test that compact models refuse changes and compare, hash and pickle by value"""
+    pokemon = parse_model(Pokemon, load_fixtures("pokemon")[0], "compact")
+    assert isinstance(pokemon, CompactModel)
+    assert not hasattr(pokemon, "__dict__")
+    assert isinstance(pokemon.moves, tuple)
+    with pytest.raises(AttributeError, match="Pokemon is immutable"):
+        pokemon.name = "missingno"
+    with pytest.raises(AttributeError, match="immutable"):
+        del pokemon.species.name
+
+    link = compact_decoder(NamedAPIResource, InternPool())(
+        {"name": pokemon.species.name, "url": pokemon.species.url}
+    )
+    assert link == pokemon.species and link is not pokemon.species
+    assert hash(link) == hash(pokemon.species)
+    assert len({link, pokemon.species}) == 1
+    assert pickle.loads(pickle.dumps(pokemon)) == pokemon
+
+def test_compact_model_api(stub_server):
+    """Test that a compact client returns frozen models that can still be resolved"""
+    with PokeAPI(base_url=stub_server.base_url, model_mode="compact") as api:
+        pikachu = api.get_pokemon(name="pikachu")
+        assert isinstance(pikachu, CompactModel)
+        assert type(pikachu).__name__ == "Pokemon"
+        assert pikachu.types[0].type.name == "electric"
+        assert pikachu == api.get_pokemon(pokemon_id=pikachu.id)
+
+        first = api.list_pokemon(limit=1).results[0]
+        assert first.fetch(api).name == "bulbasaur"
@@ -0,0 +1,106 @@
+# tests/integration/test_crawler.py
+
+import json
+import os
+import time
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.cli import main
+from src.pokeapi.dataset import LocalDataset, crawl, snapshot
+from src.pokeapi.exceptions import PokeAPIError
+from tests.stub_server import FIXTURES_DIR
+
+
+def dataset_bodies(path):
+    """Return every stored body of a dataset, by endpoint and ID"""
+    dataset = LocalDataset(path)
+    try:
+        return {
+            (endpoint, resource_id): bytes(dataset.get(endpoint, str(resource_id)))
+            for endpoint in dataset.endpoints
+            for resource_id, _ in dataset._endpoints[endpoint].order
+        }
+    finally:
+        dataset.close()
+
+def listed_pokemon(stub_server):
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        return [int(r.url.rstrip("/").rsplit("/", 1)[1])
+                for r in api.list_pokemon(limit=100).results]
+
+@pytest.mark.parametrize("processes", [True, False])
+def test_crawl_matches_snapshot(stub_server, tmp_path, processes):
+    """Test that a parallel crawl writes the same dataset as a snapshot"""
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        snapshot(str(tmp_path / "snapshot"), api)
+    reports = []
+    stats = crawl(str(tmp_path / "crawl"), stub_server.base_url, workers=2,
+                  threads=2, processes=processes, batch_size=2, page_size=4,
+                  progress=reports.append)
+    assert dataset_bodies(tmp_path / "crawl") == dataset_bodies(tmp_path / "snapshot")
+    assert stats.counts == {"pokemon": 9, "generation": 3}
+    assert stats.fetched == stats.total == 12 and stats.resumed == 0
+    assert stats.rate > 0 and stats.bytes > 0
+    assert reports[-1].completed == 12
+    assert not os.path.exists(tmp_path / "crawl.crawl")
+
+def test_killed_crawl_resumes_from_checkpoint(stub_server, tmp_path):
+    """Test that a failed crawl keeps finished batches and the rerun skips them"""
+    path = str(tmp_path / "dataset")
+    ids = listed_pokemon(stub_server)
+    stub_server.fail(f"/api/v2/pokemon/{ids[-1]}", 500)
+    with pytest.raises(PokeAPIError, match=f"pokemon {ids[-1]}"):
+        crawl(path, stub_server.base_url, workers=1, threads=1,
+              processes=False, batch_size=2)
+    assert not os.path.exists(path)
+    assert os.path.exists(f"{path}.crawl")
+
+    # A record torn by the kill is dropped, not misread
+    with open(os.path.join(f"{path}.crawl", "batches.log"), "a") as f:
+        f.write('{"endpoint": "pok')
+    stats = crawl(path, stub_server.base_url, workers=1, threads=1,
+                  processes=False, batch_size=2)
+    assert stats.resumed >= len(ids) - 2
+    assert stats.resumed + stats.fetched == stats.total == 12
+    assert stub_server.hits(f"/api/v2/pokemon/{ids[0]}") == 1
+    assert len(dataset_bodies(path)) == 12
+
+def test_checkpoint_of_a_different_crawl_is_discarded(stub_server, tmp_path):
+    """Test that a changed listing restarts the crawl instead of resuming"""
+    path = str(tmp_path / "dataset")
+    ids = listed_pokemon(stub_server)
+    stub_server.fail(f"/api/v2/pokemon/{ids[-1]}", 500)
+    with pytest.raises(PokeAPIError):
+        crawl(path, stub_server.base_url, workers=1, threads=1,
+              processes=False, batch_size=2)
+
+    with open(os.path.join(FIXTURES_DIR, "pokemon", f"{ids[0]}.json")) as f:
+        document = dict(json.load(f), id=10000, name="missingno")
+    stub_server.update("pokemon", document)
+    stats = crawl(path, stub_server.base_url, processes=False, batch_size=2)
+    assert stats.resumed == 0 and stats.fetched == stats.total == 13
+
+def test_crawl_rate_limit_is_shared_by_worker_processes(stub_server, tmp_path):
+    """Test that the rate limit holds across every worker process"""
+    start = time.perf_counter()
+    crawl(str(tmp_path / "dataset"), stub_server.base_url, ["generation"],
+          workers=3, batch_size=1, rate=2)
+    # 1 list + 3 resource requests at 2/s with a burst of 2
+    assert time.perf_counter() - start >= 0.9
+    assert not os.path.exists(tmp_path / "dataset.crawl-rate")
+
+def test_invalid_crawl_options(tmp_path):
+    """Test that non-positive workers, threads or batch sizes are rejected"""
+    for options in ({"workers": 0}, {"threads": 0}, {"batch_size": 0}):
+        with pytest.raises(PokeAPIError, match="must be positive"):
+            crawl(str(tmp_path), **options)
+
+def test_cli_crawl(stub_server, tmp_path, capsys):
+    """Test `pokeapi crawl` and its throughput report"""
+    path = str(tmp_path / "dataset")
+    assert main(["crawl", path, "--base-url", stub_server.base_url,
+                 "--workers", "2", "--no-processes", "--batch-size", "5"]) == 0
+    output = capsys.readouterr()
+    assert "Wrote 9 pokemon, 3 generation" in output.out
+    assert "12 fetched" in output.out
+    assert "resources/s" in output.err
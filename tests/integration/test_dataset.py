@@ -0,0 +1,107 @@
+# tests/integration/test_dataset.py
+
+import asyncio
+import os
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.cli import main
+from src.pokeapi.connection.transport import HttpTransport
+from src.pokeapi.dataset import LocalDataset, snapshot
+from src.pokeapi.exceptions import PokeAPIError
+
+
+@pytest.fixture
+def dataset_path(stub_server, tmp_path):
+    path = str(tmp_path / "dataset")
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        snapshot(path, api, page_size=4)
+    return path
+
+def test_snapshot_stores_every_resource(stub_server, dataset_path):
+    """Test that the snapshot crawls both lists and stores each resource once"""
+    dataset = LocalDataset(dataset_path)
+    assert dataset.count("pokemon") == len(stub_server.resources["pokemon"])
+    assert dataset.count("generation") == len(stub_server.resources["generation"])
+    assert dataset.source_url == stub_server.base_url
+    assert stub_server.hits("/api/v2/pokemon/25") == 1
+    dataset.close()
+
+def test_local_source_matches_remote(stub_server, dataset_path):
+    """Test that lookups and list pages answered locally match the live API"""
+    with PokeAPI(base_url=stub_server.base_url) as remote:
+        expected = [
+            remote.get_pokemon(pokemon_id=25),
+            remote.get_generation(name="generation-ii"),
+            remote.list_pokemon(limit=3, offset=2),
+        ]
+    requests_made = len(stub_server.requests)
+    stub_server.stop()
+
+    with PokeAPI(source=f"local:{dataset_path}") as local:
+        assert local.get_pokemon(pokemon_id=25) == expected[0]
+        assert local.get_pokemon(name="pikachu") == expected[0]
+        assert local.get_generation(name="generation-ii") == expected[1]
+        page = local.list_pokemon(limit=3, offset=2)
+        assert [r.name for r in page.results] == [r.name for r in expected[2].results]
+        assert page.count == expected[2].count
+        names = [r.name for r in local.iter_pokemon(page_size=2)]
+        assert len(names) == page.count
+    assert len(stub_server.requests) == requests_made
+
+def test_local_source_missing_resource(dataset_path):
+    """Test that resources absent from the dataset are reported as not found"""
+    with PokeAPI(source=f"local:{dataset_path}") as api:
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(pokemon_id=9999)
+        assert exc.value.message == "The requested resource was not found"
+        with pytest.raises(PokeAPIError):
+            api.get_generation(generation_id=1).main_region.fetch(api)
+
+def test_failed_snapshot_keeps_previous_dataset(stub_server, dataset_path):
+    """Test that a failed crawl leaves the existing dataset untouched"""
+    stub_server.resources["pokemon"][94] = b'{"id": 94, "name": '
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        with pytest.raises(PokeAPIError) as exc:
+            snapshot(dataset_path, api)
+    assert "pokemon 94" in exc.value.message
+    assert LocalDataset(dataset_path).get("pokemon", "94") is not None
+    assert os.listdir(os.path.dirname(dataset_path)) == ["dataset"]
+
+def test_invalid_sources(tmp_path):
+    """Test that bad sources and missing datasets are rejected"""
+    with pytest.raises(PokeAPIError) as exc:
+        PokeAPI(source="ftp://example.com")
+    assert "local:<path>" in exc.value.message
+    with pytest.raises(PokeAPIError) as exc:
+        PokeAPI(source=f"local:{tmp_path}")
+    assert exc.value.message.startswith("Cannot open local dataset")
+    with pytest.raises(PokeAPIError):
+        PokeAPI(source=f"local:{tmp_path}", transport=HttpTransport())
+    PokeAPI(source="remote").close()
+
+def test_cli_snapshot(stub_server, tmp_path, capsys):
+    """Test that `pokeapi snapshot` writes a dataset and reports what it stored"""
+    path = str(tmp_path / "cli")
+    status = main([
+        "snapshot", path, "--base-url", stub_server.base_url,
+        "--endpoints", "generation", "--quiet",
+    ])
+    assert status == 0
+    assert capsys.readouterr().out.startswith("Wrote 3 generation to")
+    assert LocalDataset(path).endpoints == ["generation"]
+
+    stub_server.stop()
+    assert main(["snapshot", path, "--base-url", stub_server.base_url]) == 1
+
+def test_async_local_source(dataset_path):
+    """Test that AsyncPokeAPI answers from a local dataset"""
+    async def scenario():
+        async with AsyncPokeAPI(source=f"local:{dataset_path}") as api:
+            return await asyncio.gather(
+                api.get_pokemon(name="charizard"),
+                api.list_generations(limit=10),
+            )
+
+    charizard, generations = asyncio.run(scenario())
+    assert charizard.id == 6
+    assert [g.name for g in generations.results][0] == "generation-i"
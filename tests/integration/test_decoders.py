@@ -0,0 +1,71 @@
+# tests/integration/test_decoders.py
+
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.connection.decoders import (
+    JsonDecoder, StdlibJsonDecoder, OrjsonDecoder, default_decoder,
+)
+from src.pokeapi.exceptions import PokeAPIError
+
+
+class CountingDecoder(StdlibJsonDecoder):
+    """Stdlib decoder recording how many bodies it parsed."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def loads(self, content: bytes):
+        self.calls += 1
+        return super().loads(content)
+
+
+def test_default_decoder_prefers_orjson():
+    """Test that orjson is used when installed, with the stdlib as fallback"""
+    pytest.importorskip("orjson")
+    assert isinstance(default_decoder(), OrjsonDecoder)
+
+@pytest.mark.parametrize("decoder_cls", [StdlibJsonDecoder, OrjsonDecoder])
+def test_decoders_parse_bytes(decoder_cls):
+    """Test that every backend parses raw bytes to the same objects"""
+    if decoder_cls is OrjsonDecoder:
+        pytest.importorskip("orjson")
+    decoder = decoder_cls()
+    assert isinstance(decoder, JsonDecoder)
+    assert decoder.loads(b'{"name": "pikachu", "ids": [25, null]}') == {
+        "name": "pikachu", "ids": [25, None],
+    }
+    with pytest.raises(ValueError):
+        decoder.loads(b'{"name": ')
+
+@pytest.mark.parametrize("mode", ["validated", "trusted"])
+def test_backends_build_equal_models(stub_server, mode):
+    """Test that models are the same whichever decoder parsed the body"""
+    pytest.importorskip("orjson")
+    results = []
+    for decoder in (StdlibJsonDecoder(), OrjsonDecoder()):
+        with PokeAPI(base_url=stub_server.base_url, model_mode=mode,
+                     decoder=decoder) as api:
+            results.append(api.get_pokemon(pokemon_id=6).model_dump())
+    assert results[0] == results[1]
+
+def test_decoder_used_only_without_validation(stub_server):
+    """Test that validated models skip the decoder and parse bytes directly"""
+    decoder = CountingDecoder()
+    with PokeAPI(base_url=stub_server.base_url, decoder=decoder) as api:
+        api.get_pokemon(pokemon_id=1)
+        assert decoder.calls == 0
+        api.get_generation(generation_id=1).main_region.fetch(api)
+        assert decoder.calls == 1
+    with PokeAPI(base_url=stub_server.base_url, decoder=decoder,
+                 model_mode="trusted") as api:
+        api.get_pokemon(pokemon_id=1)
+    assert decoder.calls == 2
+
+@pytest.mark.parametrize("mode", ["validated", "trusted"])
+def test_invalid_json_body(stub_server, mode):
+    """Test that a malformed body is reported as an invalid JSON response"""
+    stub_server.resources["pokemon"][1] = b'{"id": 1, "name": '
+    with PokeAPI(base_url=stub_server.base_url, model_mode=mode) as api:
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(pokemon_id=1)
+    assert exc.value.message == "Invalid JSON response from server"
@@ -0,0 +1,117 @@
+# tests/integration/test_disk_cache.py
+
+import multiprocessing
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.connection.disk_cache import DiskCache
+from src.pokeapi.exceptions import PokeAPIError
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "pokeapi.sqlite")
+
+def test_warm_start_does_not_hit_network(stub_server, cache_path):
+    """Test that a new process-like instance is served from disk"""
+    with PokeAPI(base_url=stub_server.base_url, cache=DiskCache(cache_path)) as api:
+        api.get_pokemon(pokemon_id=25)
+        api.list_generations(limit=2)
+
+    with PokeAPI(base_url=stub_server.base_url, cache=DiskCache(cache_path)) as api:
+        pikachu = api.get_pokemon(name="pikachu")
+        generations = api.list_generations(limit=2)
+    assert pikachu.id == 25
+    assert len(generations.results) == 2
+    assert len(stub_server.requests) == 2
+
+def test_offline_mode(stub_server, cache_path):
+    """Test that offline mode serves cached entries and never sends requests"""
+    with PokeAPI(base_url=stub_server.base_url, cache=DiskCache(cache_path)) as api:
+        api.get_pokemon(pokemon_id=1)
+
+    offline = DiskCache(cache_path, ttl=0, offline=True)
+    with PokeAPI(base_url=stub_server.base_url, cache=offline) as api:
+        assert api.get_pokemon(pokemon_id=1).name == "bulbasaur"
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(pokemon_id=2)
+    assert "offline mode is enabled" in str(exc.value)
+    assert len(stub_server.requests) == 1
+
+def test_size_limit_evicts_least_recently_used(stub_server, cache_path):
+    """Test that the oldest bodies are deleted once max_bytes is exceeded"""
+    cache = DiskCache(cache_path, max_bytes=None, touch_interval=0)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        api.get_pokemon(pokemon_id=1)
+        api.get_pokemon(pokemon_id=2)
+        two_entries = cache.size_bytes
+        cache.max_bytes = two_entries
+        api.get_pokemon(pokemon_id=1)  # Refresh 1 so 2 is the oldest
+        api.get_pokemon(pokemon_id=5)
+    assert cache.size_bytes <= two_entries
+    assert cache.stats.evictions == 1
+    assert stub_server.base_url + "/pokemon/1" in cache
+    assert stub_server.base_url + "/pokemon/2" not in cache
+
+def test_expired_entries_are_refetched(stub_server, cache_path):
+    """Test that entries past their TTL are fetched again when online"""
+    with PokeAPI(base_url=stub_server.base_url, cache=DiskCache(cache_path, ttl=0)) as api:
+        api.get_pokemon(pokemon_id=1)
+        api.get_pokemon(pokemon_id=1)
+    assert stub_server.hits("/api/v2/pokemon/1") == 2
+
+def _read_from_cache(args):
+    base_url, cache_path = args
+    cache = DiskCache(cache_path, offline=True)
+    with PokeAPI(base_url=base_url, cache=cache) as api:
+        return [api.get_pokemon(pokemon_id=i).name for i in (1, 4, 7)]
+
+def test_concurrent_readers_across_processes(stub_server, cache_path):
+    """Test that several processes can read the cache at once"""
+    with PokeAPI(base_url=stub_server.base_url, cache=DiskCache(cache_path)) as api:
+        api.get_many_pokemon([1, 4, 7])
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(3) as pool:
+        results = pool.map(_read_from_cache, [(stub_server.base_url, cache_path)] * 3)
+    assert results == [["bulbasaur", "charmander", "squirtle"]] * 3
+    assert len(stub_server.requests) == 3
+
+def test_expired_entry_is_revalidated(stub_server, cache_path):
+    """Test that an expired body on disk is revalidated instead of re-downloaded"""
+    cache = DiskCache(cache_path, ttl=0)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        api.get_generation(generation_id=1)
+        generation = api.get_generation(generation_id=1)
+    assert generation.name == "generation-i"
+    assert stub_server.not_modified == 1
+    assert cache.stats.revalidations == 1
+
+def test_warm_hits_do_not_write(stub_server, cache_path):
+    """Test that repeated hits and known aliases leave the database untouched"""
+    cache = DiskCache(cache_path)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        api.get_pokemon(name="pikachu")
+        writes = cache._connect().total_changes
+        for _ in range(5):
+            assert api.get_pokemon(name="pikachu").id == 25
+        assert cache._connect().total_changes == writes
+    assert cache.stats.hits == 5
+
+def test_database_errors_raise_pokeapi_error(stub_server, cache_path):
+    """Test that SQLite failures after opening are reported as PokeAPIError"""
+    cache = DiskCache(cache_path)
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        api.get_pokemon(pokemon_id=1)
+        cache._connect().execute("DROP TABLE responses")
+        with pytest.raises(PokeAPIError, match="Disk cache error: no such table"):
+            api.get_pokemon(pokemon_id=1)
+        with pytest.raises(PokeAPIError, match="Disk cache error"):
+            cache.alias(stub_server.base_url + "/pokemon/x", stub_server.base_url + "/pokemon/1")
+        with pytest.raises(PokeAPIError, match="Disk cache error"):
+            cache.stats
+        with pytest.raises(PokeAPIError, match="Disk cache error"):
+            len(cache)
+        with pytest.raises(PokeAPIError, match="Disk cache error"):
+            cache.size_bytes
+        with pytest.raises(PokeAPIError, match="Disk cache error"):
+            stub_server.base_url + "/pokemon/1" in cache
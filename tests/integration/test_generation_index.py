@@ -0,0 +1,97 @@
+# tests/integration/test_generation_index.py
+
+import json
+import os
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.analytics import GenerationIndex
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.exceptions import PokeAPIError
+from tests.stub_server import FIXTURES_DIR
+
+
+@pytest.fixture
+def api(stub_server):
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache()) as api:
+        yield api
+
+def fixture_document(generation_id):
+    path = os.path.join(FIXTURES_DIR, "generation", f"{generation_id}.json")
+    with open(path) as f:
+        return json.load(f)
+
+def test_build_answers_membership_lookups(api):
+    """Test that every indexed name maps to the generation listing it"""
+    index = GenerationIndex.build(api)
+    assert len(index) == 3
+    assert index.introduced_in("pokemon_species", "pikachu") == 1
+    assert index.introduced_in("moves", "thunderbolt") == 1
+    assert index.generations_of("types", "steel") == (2,)
+    assert index.introduced_in("abilities", "overgrow") == 3
+    assert index.introduced_in("pokemon_species", "mew-three") is None
+    assert index.names("types", 2) == ["dark", "steel"]
+
+def test_unknown_kind(api):
+    """Test that lookups on a field that is not indexed are rejected"""
+    index = GenerationIndex()
+    with pytest.raises(PokeAPIError) as exc:
+        index.introduced_in("version_groups", "red-blue")
+    assert exc.value.message.startswith("Unknown index kind: version_groups")
+
+def test_save_and_load_round_trip(api, tmp_path):
+    """Test that a saved index loads with the same lookups"""
+    path = str(tmp_path / "generations.json")
+    built = GenerationIndex.build(api)
+    built.save(path)
+    loaded = GenerationIndex.load(path)
+    assert loaded.generations == built.generations
+    for kind in GenerationIndex.KINDS:
+        for generation_id in built.generations:
+            for name in built.names(kind, generation_id):
+                expected = built.generations_of(kind, name)
+                assert loaded.generations_of(kind, name) == expected
+    with pytest.raises(PokeAPIError):
+        GenerationIndex.load(str(tmp_path / "missing.json"))
+
+def test_update_fetches_only_new_generations(api, stub_server):
+    """Test that update adds new generations without refetching indexed ones"""
+    index = GenerationIndex.build(api)
+    turtwig = {
+        "name": "turtwig",
+        "url": "https://pokeapi.co/api/v2/pokemon-species/387/",
+    }
+    document = dict(fixture_document(3), id=4, name="generation-iv",
+                    pokemon_species=[turtwig])
+    stub_server.update("generation", document)
+    api.cache.clear()  # the cached list page would hide the new generation
+    assert index.update(api) == [4]
+    assert index.introduced_in("pokemon_species", "turtwig") == 4
+    assert stub_server.hits("/api/v2/generation/1") == 1
+    assert index.update(api) == []
+
+def test_refresh_reindexes_changed_generations(api, stub_server):
+    """Test that refresh re-indexes changed generations and drops removed names"""
+    index = GenerationIndex.build(api)
+    document = fixture_document(2)
+    old_move = document["moves"][0]["name"]
+    document["moves"] = [
+        {"name": "sketch", "url": "https://pokeapi.co/api/v2/move/166/"}
+    ]
+    stub_server.update("generation", document)
+    api.cache.clear()
+    assert index.update(api, refresh=True) == [2]
+    assert index.introduced_in("moves", "sketch") == 2
+    assert index.names("moves", 2) == ["sketch"]
+    assert index.introduced_in("moves", old_move) is None
+    assert index.update(api, refresh=True) == []
+
+def test_load_or_build_persists_changes(stub_server, tmp_path):
+    """Test that load_or_build writes the index once and reloads it afterwards"""
+    path = str(tmp_path / "generations.json")
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        GenerationIndex.load_or_build(path, api)
+        assert os.path.exists(path)
+        index = GenerationIndex.load_or_build(path, api)
+    assert index.introduced_in("types", "dark") == 2
+    assert stub_server.hits("/api/v2/generation/2") == 1
+    assert stub_server.hits("/api/v2/generation") == 2  # only the list is reread
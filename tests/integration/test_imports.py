@@ -0,0 +1,60 @@
+# tests/integration/test_imports.py
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+import src.pokeapi as pokeapi
+import src.pokeapi.connection as connection
+from src.pokeapi.dataset import snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the modules it imported"""
+    output = subprocess.run(
+        [sys.executable, "-c",
+         f"import sys, json\n{code}\nprint(json.dumps(sorted(sys.modules)))"],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    return set(json.loads(output.stdout))
+
+def test_package_import_loads_no_dependencies():
+    """Test that importing the package imports neither requests, pydantic nor httpx"""
+    modules = loaded_modules("import src.pokeapi")
+    assert not {"requests", "pydantic", "httpx"} & modules
+    assert "src.pokeapi.sdk" not in modules
+
+def test_sync_client_does_not_load_async_dependencies():
+    """Test that the sync client and CLI parser leave httpx and unused models alone"""
+    modules = loaded_modules("from src.pokeapi import PokeAPI")
+    assert "requests" in modules
+    assert "httpx" not in modules
+    assert "src.pokeapi.sdk.async_pokeapi" not in modules
+    assert "src.pokeapi.analytics" not in modules
+    assert "requests" not in loaded_modules("from src.pokeapi.cli import build_parser")
+
+def test_lazy_exports_resolve_on_access():
+    """Test lazy attribute access, dir() and unknown attributes"""
+    assert pokeapi.PokeAPI.__name__ == "PokeAPI"
+    assert "PokeAPI" in vars(pokeapi)
+    assert set(pokeapi.__all__) <= set(dir(pokeapi))
+    assert all(hasattr(connection, name) for name in connection.__all__)
+    assert callable(snapshot)
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        pokeapi.Missing
+
+def test_model_validators_are_built_on_first_use():
+    """Test that model schemas are deferred until a model is first validated"""
+    code = (
+        "from src.pokeapi.models.pokemon import Pokemon\n"
+        "from src.pokeapi.models.generation import Generation\n"
+        "before = Pokemon.__pydantic_complete__\n"
+        "Pokemon.model_validate_json(open('tests/fixtures/pokemon/1.json').read())\n"
+        "print(before, Pokemon.__pydantic_complete__, Generation.__pydantic_complete__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True, cwd=ROOT)
+    assert output.stdout.split() == ["False", "True", "False"]
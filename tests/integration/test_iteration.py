@@ -0,0 +1,109 @@
+# tests/integration/test_iteration.py
+
+import asyncio
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.api_clients.paginate import aiter_pages, iter_pages
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.api_resource import NamedAPIResource
+
+ALL_POKEMON = [
+    "bulbasaur", "ivysaur", "venusaur", "charmander", "charmeleon",
+    "charizard", "squirtle", "pikachu", "gengar",
+]
+
+
+@pytest.fixture
+def api(stub_server):
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        yield api
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_pokemon_follows_next_links(api, stub_server, prefetch):
+    """Test that iter_pokemon yields every Pokemon across pages"""
+    resources = list(api.iter_pokemon(page_size=2, prefetch=prefetch))
+    assert all(isinstance(r, NamedAPIResource) for r in resources)
+    assert [r.name for r in resources] == ALL_POKEMON
+    assert stub_server.hits("/api/v2/pokemon") == 5
+
+def test_iter_pokemon_is_lazy(api, stub_server):
+    """Test that only the first page is requested before the first item"""
+    iterator = api.iter_pokemon(page_size=4, prefetch=0)
+    assert stub_server.requests == []
+    assert next(iterator).name == "bulbasaur"
+    assert stub_server.hits("/api/v2/pokemon") == 1
+    iterator.close()
+
+def test_iter_pokemon_with_offset(api):
+    """Test that iteration can start part way through the list"""
+    names = [r.name for r in api.iter_pokemon(page_size=3, offset=6)]
+    assert names == ALL_POKEMON[6:]
+
+def test_iter_generations(api):
+    """Test that iter_generations yields every generation"""
+    names = [r.name for r in api.iter_generations(page_size=1, prefetch=2)]
+    assert names == ["generation-i", "generation-ii", "generation-iii"]
+
+def test_iter_invalid_arguments(api):
+    """Test that invalid page sizes and prefetch depths are rejected"""
+    with pytest.raises(PokeAPIError) as exc:
+        next(api.iter_pokemon(page_size=0))
+    assert "Page size must be a positive number" in str(exc.value)
+    with pytest.raises(PokeAPIError) as exc:
+        next(api.iter_pokemon(prefetch=-1))
+    assert "Prefetch must not be negative" in str(exc.value)
+
+def test_async_iter_pokemon(stub_server):
+    """Test that the async iterator yields every Pokemon across pages"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return [r.name async for r in api.iter_pokemon(page_size=4, prefetch=2)]
+
+    assert asyncio.run(scenario()) == ALL_POKEMON
+
+def growing_list(list_page, stub_server, added=5):
+    """Wrap list_page so the list gains `added` Pokemon after the first page"""
+    calls = []
+
+    def grow():
+        calls.append(None)
+        if len(calls) == 2:
+            for i in range(added):
+                stub_server.update("pokemon", {"id": 10001 + i, "name": f"new-{i}"})
+
+    if asyncio.iscoroutinefunction(list_page):
+        async def grown(limit, offset):
+            grow()
+            return await list_page(limit, offset)
+        return grown
+
+    def grown(limit, offset):
+        grow()
+        return list_page(limit, offset)
+    return grown
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_pages_follows_list_that_grows(api, stub_server, prefetch):
+    """Test that pages past the first page's count are still followed"""
+    list_page = growing_list(api.list_pokemon, stub_server)
+    names = [r.name for page in iter_pages(list_page, 4, prefetch=prefetch)
+             for r in page.results]
+    assert names == ALL_POKEMON + [f"new-{i}" for i in range(5)]
+
+def test_async_iter_pages_follows_list_that_grows(stub_server):
+    """Test that the async iterator follows a growing list and cleans up early stops"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            list_page = growing_list(api.list_pokemon, stub_server)
+            names = [r.name async for page in aiter_pages(list_page, 4, prefetch=1)
+                     for r in page.results]
+            pages = aiter_pages(api.list_pokemon, 2, prefetch=3)
+            await pages.__anext__()
+            await pages.__anext__()
+            await pages.aclose()
+            others = asyncio.all_tasks() - {asyncio.current_task()}
+            return names, all(task.done() for task in others)
+
+    names, cleaned_up = asyncio.run(scenario())
+    assert names == ALL_POKEMON + [f"new-{i}" for i in range(5)]
+    assert cleaned_up
@@ -0,0 +1,146 @@
+# tests/integration/test_metrics.py
+
+import asyncio
+import json
+import logging
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.connection.hooks import Hook, LoggingHook
+from src.pokeapi.connection.metrics import Histogram, MetricsCollector
+from src.pokeapi.connection.resilience import RetryPolicy
+from src.pokeapi.exceptions import PokeAPIError
+
+
+class Recorder(Hook):
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, event):
+        self.events.append(event)
+
+    def on_cache(self, event):
+        self.events.append(event)
+
+    def on_parse(self, event):
+        self.events.append(event)
+
+    def on_retry(self, event):
+        self.events.append(event)
+
+def test_events_follow_the_request_lifecycle(stub_server):
+    """Test the cache, request and parse events of a miss, then of a hit"""
+    recorder = Recorder()
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache(),
+                 hooks=[recorder]) as api:
+        api.get_pokemon(25)
+        api.get_pokemon(25)
+    kinds = [event.kind for event in recorder.events]
+    assert kinds == ["cache", "request", "parse", "cache"]
+    miss, request, parse, hit = recorder.events
+    assert (miss.hit, hit.hit) == (False, True)
+    assert request.endpoint == "/pokemon"
+    assert request.status == 200
+    assert request.size > 1000
+    assert 0 <= request.time_to_headers <= request.elapsed
+    assert (parse.model, parse.mode) == ("Pokemon", "validated")
+    assert parse.elapsed > 0
+
+def test_errors_and_retries_are_reported(stub_server):
+    """Test request events for failed requests and retry events for failed attempts"""
+    stub_server.fail("/api/v2/pokemon/1", 503)
+    recorder = Recorder()
+    with PokeAPI(base_url=stub_server.base_url, hooks=[recorder],
+                 retry_policy=RetryPolicy(backoff=0.01)) as api:
+        api.get_pokemon(1)
+        with pytest.raises(PokeAPIError):
+            api.get_pokemon(name="missingno")
+    retry = next(e for e in recorder.events if e.kind == "retry")
+    assert (retry.attempt, retry.reason) == (1, "503")
+    requests = [e for e in recorder.events if e.kind == "request"]
+    assert [e.status for e in requests] == [200, 404]
+    assert requests[1].error == "The requested resource was not found"
+
+def test_failing_hook_does_not_break_requests(stub_server, caplog):
+    """Test that an exception in a hook is logged and the request succeeds"""
+    class Broken(Hook):
+        def on_request(self, event):
+            raise RuntimeError("boom")
+
+    with PokeAPI(base_url=stub_server.base_url, hooks=[Broken()]) as api:
+        with caplog.at_level(logging.ERROR, logger="pokeapi"):
+            assert api.get_pokemon(1).name == "bulbasaur"
+    assert "failed handling" in caplog.text
+
+def test_histogram_quantiles():
+    """Test bucket counting and interpolated quantiles"""
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1, 1.5, 3, 10):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(1, 2), (2, 3), (4, 4), (float("inf"), 5)]
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(1.0) == 4
+    assert Histogram((1,)).quantile(0.5) is None
+
+def test_metrics_collector_aggregates_per_endpoint(stub_server):
+    """Test latency, size, cache ratio and parse metrics per endpoint"""
+    metrics = MetricsCollector()
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache(),
+                 hooks=[metrics]) as api:
+        for _ in range(3):
+            api.get_pokemon(25)
+        api.list_generations()
+    assert metrics.latency("/pokemon").count == 1
+    assert metrics.latency("/generation").count == 1
+    assert metrics.response_sizes("/pokemon").sum > 1000
+    assert metrics.cache_hit_ratio("/pokemon") == pytest.approx(2 / 3)
+    assert metrics.cache_hit_ratio() == pytest.approx(2 / 4)
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"]["/pokemon"]["statuses"] == {"200": 1}
+    assert snapshot["parse"]["/pokemon Pokemon validated"]["count"] == 1
+    json.dumps(snapshot)
+
+def test_prometheus_export(stub_server):
+    """Test the Prometheus text exposition of the collected metrics"""
+    metrics = MetricsCollector()
+    stub_server.fail("/api/v2/pokemon/1", 500)
+    with PokeAPI(base_url=stub_server.base_url, hooks=[metrics],
+                 retry_policy=RetryPolicy(backoff=0.01)) as api:
+        api.get_pokemon(1)
+    text = metrics.render_prometheus()
+    assert "# TYPE pokeapi_request_duration_seconds histogram" in text
+    assert 'pokeapi_requests_total{endpoint="/pokemon",status="200"} 1' in text
+    assert 'pokeapi_request_duration_seconds_bucket{endpoint="/pokemon",le="+Inf"} 1' in text
+    assert 'pokeapi_request_duration_seconds_count{endpoint="/pokemon"} 1' in text
+    assert 'pokeapi_retries_total{reason="500"} 1' in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.rsplit(" ", 1)) == 2
+
+def test_structured_logs(stub_server, caplog):
+    """Test that events and metric summaries are logged as JSON lines"""
+    metrics = MetricsCollector()
+    with PokeAPI(base_url=stub_server.base_url,
+                 hooks=[LoggingHook(), metrics]) as api:
+        with caplog.at_level(logging.DEBUG, logger="pokeapi"):
+            api.get_pokemon(1)
+            metrics.log()
+    records = [json.loads(r.getMessage()) for r in caplog.records]
+    assert [r["event"] for r in records] == ["request", "parse", "metrics"]
+    assert records[0]["status"] == 200
+    assert records[2]["requests"]["/pokemon"]["latency"]["count"] == 1
+    assert caplog.records[0].pokeapi_event["url"].endswith("/pokemon/1")
+
+def test_async_hooks(stub_server):
+    """Test that the async client emits the same events"""
+    pytest.importorskip("httpx")
+    metrics = MetricsCollector()
+
+    async def run():
+        async with AsyncPokeAPI(base_url=stub_server.base_url,
+                                cache=ResponseCache(), hooks=[metrics]) as api:
+            await api.get_pokemon(4)
+            await api.get_pokemon(4)
+
+    asyncio.run(run())
+    assert metrics.latency("/pokemon").count == 1
+    assert metrics.cache_hit_ratio("/pokemon") == 0.5
@@ -6,6 +6,7 @@ from src.pokeapi.api_clients.pokemon_client import PokemonClient
 from src.pokeapi.api_clients.generation_client import GenerationClient
 from src.pokeapi.models.pokemon import Pokemon
 from src.pokeapi.models.generation import Generation
+from src.pokeapi.connection.transport import HttpTransport
 
 @pytest.fixture
 def api():
@@ -19,6 +20,28 @@ def test_generation_client_initialization(api):
     """Test that generation client is properly initialized"""
     assert isinstance(api.generation, GenerationClient)
 
+def test_clients_share_transport(api):
+    """Test that both clients send requests through the same pooled transport"""
+    assert isinstance(api.transport, HttpTransport)
+    assert api.pokemon.transport is api.transport
+    assert api.generation.transport is api.transport
+
+def test_pool_settings_applied():
+    """Test that pool settings are passed to the session adapters"""
+    with PokeAPI(pool_connections=2, pool_maxsize=5) as api:
+        adapter = api.transport.session.get_adapter("https://pokeapi.co")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+
+def test_close_keeps_external_transport_open():
+    """Test that a caller-provided transport is not closed by the SDK"""
+    transport = HttpTransport()
+    closed = []
+    transport.close = lambda: closed.append(True)
+    with PokeAPI(transport=transport):
+        pass
+    assert closed == []
+
 def test_get_pokemon_by_id(api):
     """Test getting pokemon through main API"""
     pokemon = api.pokemon.get_pokemon(pokemon_id=1)
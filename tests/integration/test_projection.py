@@ -0,0 +1,138 @@
+# tests/integration/test_projection.py
+
+import asyncio
+import json
+import os
+import tracemalloc
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.projection import project
+from src.pokeapi.models.trusted import TrustedModel, parse_model
+from tests.stub_server import FIXTURES_DIR
+
+
+@pytest.fixture
+def api(stub_server):
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache()) as api:
+        yield api
+
+def test_projection_keeps_only_requested_fields(api):
+    """Test that a projection holds the requested fields plus id and name"""
+    pikachu = api.get_pokemon(name="pikachu", fields=["types", "stats"])
+    assert set(type(pikachu).model_fields) == {"id", "name", "types", "stats"}
+    assert pikachu.id == 25
+    assert pikachu.types[0].type.name == "electric"
+    assert len(pikachu.stats) == 6
+    with pytest.raises(AttributeError):
+        pikachu.moves
+
+def test_projection_matches_full_model(api):
+    """Test that projected fields equal the same fields of the full model"""
+    full = api.get_pokemon(pokemon_id=6)
+    light = api.get_pokemon(pokemon_id=6, fields=("stats", "types", "height"))
+    for name in type(light).model_fields:
+        assert getattr(light, name) == getattr(full, name)
+
+def test_projection_shares_cached_response(api, stub_server):
+    """Test that projections are parsed from the cached response and reused"""
+    api.get_pokemon(pokemon_id=7)
+    first = api.get_pokemon(pokemon_id=7, fields=["types"])
+    again = api.get_pokemon(name="squirtle", fields=("types",))
+    assert again is first
+    assert stub_server.hits("/api/v2/pokemon/7") == 1
+
+def test_projection_unknown_field(api, stub_server):
+    """Test that an unknown field is rejected before any request is sent"""
+    with pytest.raises(PokeAPIError) as exc:
+        api.get_pokemon(pokemon_id=1, fields=["types", "movez"])
+    assert exc.value.message == "Unknown Pokemon fields: movez"
+    with pytest.raises(PokeAPIError):
+        api.get_many_pokemon([1, 2], fields="movez")
+    assert stub_server.requests == []
+
+def test_projection_bulk_and_trusted(stub_server):
+    """Test projections in bulk fetches and trusted mode"""
+    with PokeAPI(base_url=stub_server.base_url, model_mode="trusted") as api:
+        results = api.get_many_pokemon([1, 4], fields=["types"])
+        generation = api.get_generation(generation_id=1, fields="main_region")
+    assert all(isinstance(r.value, TrustedModel) for r in results)
+    assert [r.value.types[0].type.name for r in results] == ["grass", "fire"]
+    assert not hasattr(results[0].value, "moves")
+    assert generation.main_region.name == "kanto"
+
+def test_async_projection(stub_server):
+    """Test that the async client accepts projections"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            return await api.get_pokemon(pokemon_id=25, fields=["weight"])
+
+    pikachu = asyncio.run(scenario())
+    assert set(type(pikachu).model_fields) == {"id", "name", "weight"}
+
+def many_moves_pokemon():
+    """Return pikachu's document with a hundred moves of eight details each"""
+    with open(os.path.join(FIXTURES_DIR, "pokemon", "25.json")) as f:
+        document = json.load(f)
+    detail = document["moves"][0]["version_group_details"][0]
+    document["moves"] = [
+        {
+            "move": {"name": f"move-{i}", "url": f"https://pokeapi.co/api/v2/move/{i}/"},
+            "version_group_details": [
+                dict(detail, level_learned_at=level) for level in range(8)
+            ],
+        }
+        for i in range(100)
+    ]
+    return document
+
+@pytest.mark.parametrize("mode", ["validated", "trusted"])
+def test_projection_memory(mode):
+    """Test that a projected Pokemon with many moves retains 10x less memory"""
+    content = json.dumps(many_moves_pokemon()).encode()
+    narrowed = project(Pokemon, ["types", "stats"])
+
+    def retained(model):
+        parse_model(model, content, mode)  # build decoders before measuring
+        tracemalloc.start()
+        value = parse_model(model, content, mode)  # noqa: F841 (kept alive)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+    assert retained(Pokemon) > 10 * retained(narrowed)
+
+def test_cached_projection_memory_per_entry(stub_server):
+    """Test that a projected lookup caches 10x less than a full one, body included"""
+    stub_server.update("pokemon", many_moves_pokemon())
+    fields = ["types", "stats"]
+
+    def retained(fields):
+        cache = ResponseCache()
+        with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+            api.get_pokemon(pokemon_id=1, fields=fields)  # warm up decoders
+            tracemalloc.start()
+            api.get_pokemon(pokemon_id=25, fields=fields)
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size
+
+    assert retained(None) > 10 * retained(fields)
+
+def test_projected_entry_drops_body_but_still_serves(api, stub_server):
+    """Test that an entry read through one projection keeps only that model"""
+    url = stub_server.base_url + "/pokemon/25"
+    first = api.get_pokemon(pokemon_id=25, fields=["types"])
+    entry = api.cache.get_stale(url)
+    assert not entry.has_body and entry.response.content == b""
+    assert entry.response.headers.get("ETag")
+    assert api.get_pokemon(name="pikachu", fields=["types"]) is first
+    assert stub_server.hits("/api/v2/pokemon/25") == 1
+
+    # Other models need the body again, which is then kept
+    assert api.get_pokemon(pokemon_id=25).moves
+    assert api.pokemon.get("/pokemon", "25").json()["id"] == 25
+    assert api.cache.get_stale(url).has_body
+    assert stub_server.hits("/api/v2/pokemon/25") == 2
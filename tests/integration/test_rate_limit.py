@@ -0,0 +1,137 @@
+# tests/integration/test_rate_limit.py
+
+import asyncio
+import time
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.ratelimit import (
+    TokenBucket, FileTokenBucket, AdaptiveConcurrency,
+    AsyncAdaptiveConcurrency, parse_retry_after,
+)
+from src.pokeapi.exceptions import PokeAPIError, RateLimitError
+
+
+def test_token_bucket_spaces_requests():
+    """Test that reservations beyond the burst wait 1/rate each"""
+    bucket = TokenBucket(rate=10, burst=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.02)
+    assert delays[3] == pytest.approx(0.2, abs=0.02)
+    with pytest.raises(PokeAPIError):
+        TokenBucket(rate=0)
+
+def test_pause_delays_every_caller():
+    """Test that a pause holds back reservations and drops the burst"""
+    bucket = TokenBucket(rate=100, burst=10)
+    bucket.pause(0.5)
+    assert bucket.reserve() == pytest.approx(0.51, abs=0.02)
+
+def test_file_token_bucket_is_shared(tmp_path):
+    """Test that buckets on the same file share one budget"""
+    path = str(tmp_path / "bucket")
+    first = FileTokenBucket(path, rate=1, burst=1)
+    second = FileTokenBucket(path, rate=1, burst=1)
+    assert first.reserve() == 0.0
+    assert second.reserve() == pytest.approx(1.0, abs=0.05)
+    second.pause(5)
+    assert first.reserve() > 5
+    first.close()
+    second.close()
+
+def test_retry_after_parsing():
+    """Test Retry-After as seconds, as an HTTP date and when invalid"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+def test_aimd_adjusts_limit():
+    """Test additive increase on fast responses and multiplicative decrease on overload"""
+    concurrency = AdaptiveConcurrency(initial=4, maximum=8, latency_target=1.0)
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(0.01)
+    assert concurrency.limit == 5
+    concurrency.acquire()
+    concurrency.release(0.01, congested=True)
+    assert concurrency.limit == 2
+    concurrency.acquire()
+    concurrency.release(5.0)  # same round trip as the last decrease
+    assert concurrency.limit == 2
+
+    slow = AdaptiveConcurrency(initial=3, latency_target=1.0)
+    slow.acquire()
+    slow.release(5.0)
+    assert slow.limit == 1
+    with pytest.raises(PokeAPIError):
+        AdaptiveConcurrency(initial=0)
+
+def test_rate_limit_applies_to_every_client(stub_server):
+    """Test that clients of one PokeAPI share the token bucket"""
+    with PokeAPI(base_url=stub_server.base_url,
+                 rate_limiter=TokenBucket(rate=20, burst=1)) as api:
+        start = time.perf_counter()
+        api.get_many_pokemon([1, 2, 3], max_workers=3)
+        api.get_many_generations([1, 2, 3], max_workers=3)
+        elapsed = time.perf_counter() - start
+    assert elapsed >= 5 / 20
+
+def test_concurrency_limit_caps_in_flight_requests(stub_server):
+    """Test that no more requests than the limit are in flight"""
+    stub_server.delay = 0.1
+    concurrency = AdaptiveConcurrency(initial=2, maximum=2)
+    with PokeAPI(base_url=stub_server.base_url, concurrency=concurrency) as api:
+        start = time.perf_counter()
+        results = api.get_many_pokemon([1, 2, 3, 4, 5, 6], max_workers=6)
+        elapsed = time.perf_counter() - start
+    assert all(result.ok for result in results)
+    assert elapsed >= 0.3
+    assert concurrency.in_flight == 0
+
+def test_429_raises_rate_limit_error_and_pauses(stub_server):
+    """Test that a 429 raises RateLimitError and pauses the shared limiter"""
+    stub_server.fail("/api/v2/pokemon/25", 429, {"Retry-After": "0.3"})
+    bucket = TokenBucket(rate=100, burst=5)
+    concurrency = AdaptiveConcurrency(initial=4)
+    with PokeAPI(base_url=stub_server.base_url, rate_limiter=bucket,
+                 concurrency=concurrency) as api:
+        with pytest.raises(RateLimitError) as exc:
+            api.get_pokemon(pokemon_id=25)
+        assert exc.value.retry_after == 0.3
+        assert concurrency.limit == 2
+        start = time.perf_counter()
+        assert api.get_pokemon(pokemon_id=25).name == "pikachu"
+        assert time.perf_counter() - start >= 0.25
+
+def test_429_without_limiter(stub_server):
+    """Test that a 429 is reported as RateLimitError even without a limiter"""
+    stub_server.fail("/api/v2/generation/1", 429)
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        with pytest.raises(RateLimitError) as exc:
+            api.get_generation(generation_id=1)
+    assert exc.value.retry_after is None
+    assert isinstance(exc.value, PokeAPIError)
+
+def test_async_limits(stub_server):
+    """Test the async concurrency limit and 429 handling"""
+    stub_server.delay = 0.1
+    stub_server.fail("/api/v2/pokemon/7", 429, {"Retry-After": "0"})
+
+    async def scenario():
+        concurrency = AsyncAdaptiveConcurrency(initial=2, maximum=2)
+        async with AsyncPokeAPI(base_url=stub_server.base_url,
+                                rate_limiter=TokenBucket(rate=100),
+                                concurrency=concurrency) as api:
+            start = time.perf_counter()
+            found = await api.get_many_pokemon([1, 2, 3, 4])
+            elapsed = time.perf_counter() - start
+            with pytest.raises(RateLimitError):
+                await api.get_pokemon(pokemon_id=7)
+            return found, elapsed, concurrency
+
+    found, elapsed, concurrency = asyncio.run(scenario())
+    assert all(result.ok for result in found)
+    assert elapsed >= 0.2
+    assert concurrency.in_flight == 0
+    assert concurrency.limit == 1
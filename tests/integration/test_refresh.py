@@ -0,0 +1,182 @@
+# tests/integration/test_refresh.py
+
+import glob
+import json
+import os
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.cli import main
+from src.pokeapi.dataset import (
+    Change, DatasetUpdater, LocalDataset, crawl, refresh, snapshot,
+)
+from src.pokeapi.exceptions import PokeAPIError
+from tests.stub_server import FIXTURES_DIR
+
+
+def fixture(endpoint, resource_id, **changes):
+    with open(os.path.join(FIXTURES_DIR, endpoint, f"{resource_id}.json")) as f:
+        return dict(json.load(f), **changes)
+
+def stored(path, endpoint, key):
+    dataset = LocalDataset(path)
+    try:
+        body = dataset.get(endpoint, key)
+        return None if body is None else json.loads(bytes(body))
+    finally:
+        dataset.close()
+
+def listed(path, endpoint):
+    dataset = LocalDataset(path)
+    try:
+        return [name for _, name in dataset._endpoints[endpoint].order]
+    finally:
+        dataset.close()
+
+def api_listing(stub_server):
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        return [r.name for r in api.list_pokemon(limit=100).results]
+
+@pytest.fixture
+def dataset(stub_server, tmp_path):
+    path = str(tmp_path / "dataset")
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        snapshot(path, api, page_size=4)
+    stub_server.requests.clear()
+    return path
+
+def test_unchanged_dataset_costs_only_conditional_requests(stub_server, dataset):
+    """Test that an unchanged dataset is revalidated with 304s and left as is"""
+    data_file = os.path.join(dataset, "pokemon.bin")
+    size = os.path.getsize(data_file)
+    result = refresh(dataset)
+    assert result.changes == [] and result.relisted == []
+    assert result.checked == result.not_modified == 12
+    assert result.fetched == 0
+    assert stub_server.not_modified == 12
+    # One count probe per endpoint, then one conditional request per resource
+    assert len(stub_server.requests) == 2 + 12
+    assert os.path.getsize(data_file) == size
+
+def test_crawled_datasets_record_validators(stub_server, tmp_path):
+    """Test that crawl stores the validators refresh revalidates with"""
+    path = str(tmp_path / "dataset")
+    crawl(path, stub_server.base_url, processes=False)
+    assert refresh(path).not_modified == 12
+
+def test_only_changed_resources_are_rewritten(stub_server, dataset):
+    """Test that a changed resource is appended and reported, others untouched"""
+    data_file = os.path.join(dataset, "pokemon.bin")
+    size = os.path.getsize(data_file)
+    stub_server.update("pokemon", fixture("pokemon", 25, base_experience=999))
+    stub_server.update("generation", fixture("generation", 2, names=[]))
+    result = refresh(dataset)
+
+    assert [c.to_dict() for c in result.changes] == [
+        {"endpoint": "pokemon", "resource_id": 25, "name": "pikachu", "kind": "updated"},
+        {"endpoint": "generation", "resource_id": 2, "name": "generation-ii", "kind": "updated"},
+    ]
+    assert result.ids("pokemon") == [25] and result.ids("generation") == [2]
+    assert result.not_modified == 10 and result.fetched == 2
+    assert stored(dataset, "pokemon", "pikachu")["base_experience"] == 999
+    assert stored(dataset, "pokemon", "1") == fixture("pokemon", 1)
+    added = len(json.dumps(stored(dataset, "pokemon", "25"),
+                           ensure_ascii=False, separators=(",", ":")).encode())
+    assert os.path.getsize(data_file) == size + added
+
+    assert refresh(dataset).changes == []
+
+def test_added_and_removed_resources(stub_server, dataset):
+    """Test that count changes and vanished resources are detected by relisting"""
+    stub_server.update("pokemon", fixture("pokemon", 25, id=26, name="raichu"))
+    result = refresh(dataset)
+    assert result.relisted == ["pokemon"]
+    assert [(c.kind, c.resource_id) for c in result.changes] == [("added", 26)]
+    assert listed(dataset, "pokemon") == api_listing(stub_server)
+
+    # Same count: the vanished resource triggers a relist that finds its replacement
+    del stub_server.resources["pokemon"][94]
+    stub_server.update("pokemon", fixture("pokemon", 25, id=10000, name="pikachu-rock-star"))
+    result = refresh(dataset)
+    assert result.relisted == ["pokemon"]
+    assert [(c.kind, c.resource_id) for c in result.changes] == [
+        ("removed", 94), ("added", 10000),
+    ]
+    assert stored(dataset, "pokemon", "94") is None
+    assert stored(dataset, "pokemon", "pikachu-rock-star")["id"] == 10000
+    assert listed(dataset, "pokemon") == api_listing(stub_server)
+
+    # Several removals are reported in list order
+    del stub_server.resources["pokemon"][1]
+    del stub_server.resources["pokemon"][4]
+    result = refresh(dataset)
+    assert [(c.kind, c.resource_id) for c in result.changes] == [
+        ("removed", 1), ("removed", 4),
+    ]
+
+def test_datasets_without_revisions_compare_digests(stub_server, dataset):
+    """Test that datasets written before revisions were recorded still refresh"""
+    for revisions in glob.glob(os.path.join(dataset, "*.revisions.json")):
+        os.remove(revisions)
+    stub_server.update("pokemon", fixture("pokemon", 4, weight=1))
+    result = refresh(dataset)
+    assert [c.resource_id for c in result.changes] == [4]
+    assert result.fetched == 12 and result.not_modified == 0
+    # Validators of unchanged bodies were recorded for the next refresh
+    assert refresh(dataset).not_modified == 12
+
+def test_failed_refresh_leaves_dataset_unchanged(stub_server, dataset):
+    """Test that a failed refresh writes nothing"""
+    data_file = os.path.join(dataset, "pokemon.bin")
+    size = os.path.getsize(data_file)
+    stub_server.update("pokemon", fixture("pokemon", 1, base_experience=1))
+    stub_server.fail("/api/v2/pokemon/94", 500)
+    with pytest.raises(PokeAPIError, match="Refresh failed fetching pokemon 94"):
+        refresh(dataset)
+    assert os.path.getsize(data_file) == size
+    assert stored(dataset, "pokemon", "1") == fixture("pokemon", 1)
+
+    stub_server.update("pokemon", {"id": 1, "name": "bulbasaur", "moves": [{}]})
+    with pytest.raises(PokeAPIError, match="pokemon 1: Invalid JSON response"):
+        refresh(dataset)
+    assert stored(dataset, "pokemon", "1") == fixture("pokemon", 1)
+
+def test_commit_switches_indexes_with_the_manifest(stub_server, dataset, monkeypatch):
+    """Test that a crash before the manifest is replaced leaves the old version"""
+    write_json = DatasetUpdater._write_json
+
+    def crash_on_manifest(updater, name, value, indent=None):
+        if name == "manifest.json":
+            raise OSError("crashed")
+        write_json(updater, name, value, indent)
+
+    stub_server.update("pokemon", fixture("pokemon", 1, base_experience=1))
+    stub_server.update("generation", fixture("generation", 1, names=[]))
+    with monkeypatch.context() as patch:
+        patch.setattr(DatasetUpdater, "_write_json", crash_on_manifest)
+        with pytest.raises(OSError):
+            refresh(dataset)
+    assert stored(dataset, "pokemon", "1") == fixture("pokemon", 1)
+    assert stored(dataset, "generation", "1") == fixture("generation", 1)
+
+    assert len(refresh(dataset).changes) == 2
+    for experience in (2, 3):
+        stub_server.update("pokemon", fixture("pokemon", 1, base_experience=experience))
+        assert len(refresh(dataset).changes) == 1
+    assert stored(dataset, "pokemon", "1")["base_experience"] == 3
+    assert stored(dataset, "generation", "1")["names"] == []
+    # Only the indexes of the last two commits are kept
+    assert sorted(glob.glob(os.path.join(dataset, "pokemon.index*"))) == [
+        os.path.join(dataset, "pokemon.index.2.json"),
+        os.path.join(dataset, "pokemon.index.3.json"),
+    ]
+
+def test_cli_refresh_prints_change_feed(stub_server, dataset, capsys):
+    """Test `pokeapi refresh` and its JSON lines change feed"""
+    stub_server.update("pokemon", fixture("pokemon", 7, height=1))
+    assert main(["refresh", dataset, "--quiet"]) == 0
+    output = capsys.readouterr()
+    assert [json.loads(line) for line in output.out.splitlines()] == [
+        {"endpoint": "pokemon", "resource_id": 7, "name": "squirtle", "kind": Change.UPDATED},
+    ]
+    assert "1 changed, 12 checked, 11 not modified" in output.err
+    assert main(["refresh", str(os.path.dirname(dataset))]) == 1
@@ -0,0 +1,136 @@
+# tests/integration/test_replay.py
+
+import asyncio
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.replay import (
+    ArchiveWriter, ResponseArchive, RecordingTransport, ReplayTransport,
+    AsyncRecordingTransport, AsyncReplayTransport,
+)
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.connection.resilience import RetryPolicy
+from src.pokeapi.connection.transport import HttpTransport
+from src.pokeapi.connection.async_transport import AsyncHttpTransport
+from src.pokeapi.constants import ErrorMessages
+from src.pokeapi.exceptions import PokeAPIError
+
+OFFLINE_BASE_URL = "http://replay.invalid/api/v2"
+
+
+def record(stub_server, path, **kwargs):
+    with RecordingTransport(HttpTransport(), path) as recorder:
+        api = PokeAPI(base_url=stub_server.base_url, transport=recorder, **kwargs)
+        api.get_pokemon(25)
+        api.get_pokemon(name="charmander")
+        api.list_pokemon(limit=3)
+
+def test_record_then_replay_without_network(stub_server, tmp_path):
+    """Test that recorded responses replay under any base URL without requests"""
+    path = tmp_path / "traffic.pkar"
+    record(stub_server, str(path))
+    sent = len(stub_server.requests)
+
+    with PokeAPI(base_url=OFFLINE_BASE_URL, transport=ReplayTransport(str(path))) as api:
+        assert api.get_pokemon(25).name == "pikachu"
+        assert api.get_pokemon(name="charmander").id == 4
+        assert [r.name for r in api.list_pokemon(limit=3).results] == [
+            "bulbasaur", "ivysaur", "venusaur",
+        ]
+    assert len(stub_server.requests) == sent
+
+def test_archive_index_and_headers(stub_server, tmp_path):
+    """Test archive lookups, recording order and stored headers"""
+    path = str(tmp_path / "traffic.pkar")
+    record(stub_server, path)
+    archive = ResponseArchive(path)
+    assert len(archive) == 3
+    assert list(archive.keys())[0] == "/api/v2/pokemon/25"
+    assert f"{OFFLINE_BASE_URL}/pokemon/25/" in archive
+    status, headers, body = archive.get(f"{OFFLINE_BASE_URL}/pokemon/25")
+    assert status == 200
+    assert headers["Content-Type"].startswith("application/json")
+    assert "Content-Length" not in headers
+    assert b'"pikachu"' in body
+    assert archive.get(f"{OFFLINE_BASE_URL}/pokemon/26") is None
+    archive.close()
+
+def test_replays_recorded_sequences(stub_server, tmp_path):
+    """Test that a URL recorded failing then succeeding replays in order"""
+    path = str(tmp_path / "traffic.pkar")
+    stub_server.fail("/api/v2/pokemon/1", 503)
+    with RecordingTransport(HttpTransport(), path) as recorder:
+        api = PokeAPI(base_url=stub_server.base_url, transport=recorder,
+                      retry_policy=RetryPolicy(backoff=0.01))
+        api.get_pokemon(1)
+
+    replay = ReplayTransport(path)
+    assert replay.archive.count(f"{OFFLINE_BASE_URL}/pokemon/1") == 2
+    with PokeAPI(base_url=OFFLINE_BASE_URL, transport=replay,
+                 retry_policy=RetryPolicy(backoff=0.01)) as api:
+        assert api.get_pokemon(1).name == "bulbasaur"
+        assert api.transport.retries == 1
+        # The last recorded response is repeated once the sequence is used up
+        assert api.get_pokemon(1).name == "bulbasaur"
+    replay.rewind()
+    assert replay.send(f"{OFFLINE_BASE_URL}/pokemon/1").status_code == 503
+
+def test_not_modified_answers_are_not_recorded(stub_server, tmp_path):
+    """Test that a caching client's 304s do not break replay without a cache"""
+    path = str(tmp_path / "traffic.pkar")
+    with RecordingTransport(HttpTransport(), path) as recorder:
+        cache = ResponseCache(ttl=0)
+        api = PokeAPI(base_url=stub_server.base_url, transport=recorder, cache=cache)
+        api.get_pokemon(1)
+        api.get_pokemon(1)
+    assert stub_server.not_modified == 1
+    archive = ResponseArchive(path)
+    assert archive.count(f"{OFFLINE_BASE_URL}/pokemon/1") == 1
+    archive.close()
+
+    with PokeAPI(base_url=OFFLINE_BASE_URL, transport=ReplayTransport(path)) as api:
+        assert api.get_pokemon(1).name == "bulbasaur"
+        assert api.get_pokemon(1).name == "bulbasaur"
+
+def test_unrecorded_requests(stub_server, tmp_path):
+    """Test strict replay errors and non-strict 404 responses"""
+    path = str(tmp_path / "traffic.pkar")
+    record(stub_server, path)
+    with PokeAPI(base_url=OFFLINE_BASE_URL, transport=ReplayTransport(path)) as api:
+        with pytest.raises(PokeAPIError, match="No recorded response"):
+            api.get_pokemon(7)
+    lenient = ReplayTransport(path, strict=False)
+    with PokeAPI(base_url=OFFLINE_BASE_URL, transport=lenient) as api:
+        with pytest.raises(PokeAPIError, match=ErrorMessages.RESOURCE_NOT_FOUND):
+            api.get_pokemon(7)
+
+def test_invalid_or_unfinished_archives(tmp_path):
+    """Test that unreadable archives are rejected and aborted ones not written"""
+    path = tmp_path / "broken.pkar"
+    path.write_bytes(b"not an archive at all")
+    with pytest.raises(PokeAPIError, match="Cannot open response archive"):
+        ResponseArchive(str(path))
+    with pytest.raises(PokeAPIError):
+        ReplayTransport(str(tmp_path / "missing.pkar"))
+
+    with ArchiveWriter(str(tmp_path / "aborted.pkar")) as writer:
+        writer.add("http://x/api/v2/pokemon/1", 200, {}, b"{}")
+    assert list(tmp_path.iterdir()) == [path]
+
+def test_async_record_and_replay(stub_server, tmp_path):
+    """Test recording and replaying through the async client"""
+    pytest.importorskip("httpx")
+    path = str(tmp_path / "traffic.pkar")
+
+    async def run():
+        recorder = AsyncRecordingTransport(AsyncHttpTransport(), path)
+        async with AsyncPokeAPI(base_url=stub_server.base_url,
+                                transport=recorder) as api:
+            await api.get_many_pokemon([1, 4, 7])
+        await recorder.aclose()
+
+        async with AsyncPokeAPI(base_url=OFFLINE_BASE_URL,
+                                transport=AsyncReplayTransport(path)) as api:
+            return await api.get_many_pokemon([7, 4, 1])
+
+    names = [result.unwrap().name for result in asyncio.run(run())]
+    assert names == ["squirtle", "charmander", "bulbasaur"]
@@ -0,0 +1,174 @@
+# tests/integration/test_resilience.py
+
+import asyncio
+import socket
+import time
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.resilience import (
+    RetryPolicy, HedgePolicy, CircuitBreaker,
+)
+from src.pokeapi.connection.transport import HttpTransport
+from src.pokeapi.constants import ErrorMessages
+from src.pokeapi.exceptions import PokeAPIError, CircuitOpenError
+
+
+def unused_base_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/api/v2"
+
+def test_backoff_grows_exponentially_within_bounds():
+    """Test backoff ceilings, jitter bounds and when retries stop"""
+    policy = RetryPolicy(max_attempts=5, backoff=0.1, max_backoff=0.3, jitter=False)
+    assert [policy.next_delay(n) for n in range(1, 6)] == [0.1, 0.2, 0.3, 0.3, None]
+    jittered = RetryPolicy(max_attempts=5, backoff=0.1)
+    assert all(0 <= jittered.next_delay(3) <= 0.4 for _ in range(100))
+    assert jittered.next_delay(1, retry_after=2.0) == 2.0
+    assert jittered.next_delay(1, retry_after=60.0) is None
+    with pytest.raises(PokeAPIError):
+        RetryPolicy(max_attempts=0)
+
+def test_retries_transient_errors_until_success(stub_server):
+    """Test that 5xx and 429 responses are retried until one succeeds"""
+    stub_server.fail("/api/v2/pokemon/1", 503)
+    stub_server.fail("/api/v2/pokemon/1", 429, {"Retry-After": "0"})
+    policy = RetryPolicy(backoff=0.01)
+    with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+        assert api.get_pokemon(1).name == "bulbasaur"
+        assert api.transport.retries == 2
+    assert stub_server.hits("/api/v2/pokemon/1") == 3
+
+def test_gives_up_after_max_attempts(stub_server):
+    """Test that the last error is raised once attempts run out and 404 is not retried"""
+    stub_server.fail("/api/v2/pokemon/1", 500, times=5)
+    policy = RetryPolicy(max_attempts=3, backoff=0.01)
+    with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(1)
+        assert exc.value.message == ErrorMessages.SERVER_ERROR
+        with pytest.raises(PokeAPIError):
+            api.get_pokemon(name="missingno")
+    assert stub_server.hits("/api/v2/pokemon/1") == 3
+    assert stub_server.hits("/api/v2/pokemon/missingno") == 1
+
+def test_circuit_opens_after_connection_failures():
+    """Test that a host refusing connections is failed fast once the circuit opens"""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    policy = RetryPolicy(max_attempts=5, backoff=0.01)
+    api = PokeAPI(base_url=unused_base_url(), retry_policy=policy,
+                  circuit_breaker=breaker)
+    with api:
+        with pytest.raises(CircuitOpenError) as exc:
+            api.get_pokemon(1)
+        assert api.transport.retries == 2
+        host = exc.value.host
+        assert breaker.state(host) == CircuitBreaker.OPEN
+        assert exc.value.retry_after > 50
+        with pytest.raises(CircuitOpenError):
+            api.get_pokemon(2)
+        assert api.transport.retries == 2
+
+def test_half_open_probe_closes_circuit(stub_server):
+    """Test that a successful probe after the recovery time closes the circuit"""
+    stub_server.fail("/api/v2/pokemon/1", 500, times=3)
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=0.1)
+    with PokeAPI(base_url=stub_server.base_url, circuit_breaker=breaker) as api:
+        for _ in range(2):
+            with pytest.raises(PokeAPIError):
+                api.get_pokemon(1)
+        with pytest.raises(CircuitOpenError):
+            api.get_pokemon(4)
+        assert stub_server.hits("/api/v2/pokemon/4") == 0
+
+        time.sleep(0.15)
+        with pytest.raises(PokeAPIError):
+            api.get_pokemon(1)  # failed probe reopens the circuit
+        with pytest.raises(CircuitOpenError):
+            api.get_pokemon(4)
+        time.sleep(0.15)
+        assert api.get_pokemon(4).name == "charmander"
+        host = stub_server.base_url.split("/")[2]
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+
+def test_adaptive_hedge_delay_tracks_percentile():
+    """Test that the adaptive delay waits for samples, then follows the percentile"""
+    policy = HedgePolicy(percentile=95, min_samples=10, window=100)
+    for latency in range(1, 10):
+        policy.record(latency / 100)
+    assert policy.hedge_delay() is None
+    for latency in range(10, 101):
+        policy.record(latency / 100)
+    assert policy.hedge_delay() == 0.95
+    assert HedgePolicy(delay=0.2).hedge_delay() == 0.2
+
+def test_hedged_request_cuts_stalled_latency(stub_server):
+    """Test that a stalled request is answered by its hedge"""
+    stub_server.stall("/api/v2/pokemon/25", 2.0)
+    policy = HedgePolicy(delay=0.05)
+    with PokeAPI(base_url=stub_server.base_url, hedge_policy=policy) as api:
+        start = time.perf_counter()
+        assert api.get_pokemon(25).name == "pikachu"
+        assert time.perf_counter() - start < 1.0
+        assert api.get_pokemon(1).name == "bulbasaur"
+    assert stub_server.hits("/api/v2/pokemon/25") == 2
+    assert stub_server.hits("/api/v2/pokemon/1") == 1
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+
+def test_close_releases_wrappers_around_caller_transport(stub_server):
+    """Test that close() stops the hedge threads but leaves the caller's transport open"""
+    transport = HttpTransport()
+    with PokeAPI(base_url=stub_server.base_url, transport=transport,
+                 hedge_policy=HedgePolicy(delay=0.05)) as api:
+        assert api.get_pokemon(1).name == "bulbasaur"
+        hedged = api.transport
+    with pytest.raises(RuntimeError):
+        hedged._executor.submit(time.sleep, 0)
+    assert transport.send(stub_server.base_url + "/pokemon/4").status_code == 200
+    transport.close()
+
+def test_retry_count_is_exact_across_threads(stub_server):
+    """Test that retries from concurrent requests are all counted"""
+    ids = [1, 2, 4, 5, 6, 7, 25, 94]
+    for pokemon_id in ids:
+        stub_server.fail(f"/api/v2/pokemon/{pokemon_id}", 503, times=3)
+    policy = RetryPolicy(max_attempts=4, backoff=0.001, jitter=False)
+    with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+        results = api.get_many_pokemon(ids, max_workers=len(ids))
+        assert all(result.ok for result in results)
+        assert api.transport.retries == 3 * len(ids)
+
+def test_read_timeout(stub_server):
+    """Test that a response slower than the read timeout raises a timeout error"""
+    stub_server.delay = 0.5
+    with PokeAPI(base_url=stub_server.base_url, read_timeout=0.1) as api:
+        assert api.pokemon.timeout == (5, 0.1)
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(1)
+    assert exc.value.message == ErrorMessages.TIMEOUT_ERROR
+
+def test_async_retry_and_hedge(stub_server):
+    """Test retries and hedging through the async client"""
+    pytest.importorskip("httpx")
+    stub_server.fail("/api/v2/pokemon/1", 502)
+    stub_server.stall("/api/v2/pokemon/4", 2.0)
+
+    async def run():
+        async with AsyncPokeAPI(
+            base_url=stub_server.base_url,
+            retry_policy=RetryPolicy(backoff=0.01),
+            hedge_policy=HedgePolicy(delay=0.05),
+            read_timeout=5,
+        ) as api:
+            start = time.perf_counter()
+            names = await asyncio.gather(
+                api.get_pokemon(1), api.get_pokemon(4)
+            )
+            return [p.name for p in names], time.perf_counter() - start
+
+    names, elapsed = asyncio.run(run())
+    assert names == ["bulbasaur", "charmander"]
+    assert elapsed < 1.0
+    assert stub_server.hits("/api/v2/pokemon/1") == 2
+    assert stub_server.hits("/api/v2/pokemon/4") == 2
@@ -0,0 +1,86 @@
+# tests/integration/test_resolve.py
+
+import asyncio
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.api_resource import NamedAPIResource
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.generation import Generation
+
+
+@pytest.fixture
+def api(stub_server):
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache()) as api:
+        yield api
+
+def test_fetch_known_endpoint_returns_model(api, stub_server):
+    """Test that a link to a Pokemon is fetched as a Pokemon model"""
+    link = api.list_pokemon(limit=1).results[0]
+    pokemon = link.fetch(api)
+    assert isinstance(pokemon, Pokemon)
+    assert pokemon.name == "bulbasaur"
+
+def test_fetch_rebases_links_onto_base_url(api, stub_server):
+    """Test that absolute pokeapi.co links are requested from the configured API"""
+    generation = api.get_generation(generation_id=1)
+    region = generation.main_region.fetch(api)
+    assert region["name"] == "kanto"
+    assert stub_server.hits("/api/v2/region/1") == 1
+
+def test_resolve_shares_cache_with_getters(api, stub_server):
+    """Test that resolving a link reuses the entry cached by get_pokemon"""
+    pikachu = api.get_pokemon(pokemon_id=25)
+    link = NamedAPIResource(
+        name="pikachu", url="https://pokeapi.co/api/v2/pokemon/25/"
+    )
+    assert api.resolve(link) is pikachu
+    assert stub_server.hits("/api/v2/pokemon/25") == 1
+
+def test_resolve_raises_on_missing_or_malformed_link(api):
+    """Test that resolving a single bad link raises PokeAPIError"""
+    missing = NamedAPIResource(name="missing", url="https://pokeapi.co/api/v2/region/99/")
+    with pytest.raises(PokeAPIError) as exc:
+        api.resolve(missing)
+    assert exc.value.message == "The requested resource was not found"
+    with pytest.raises(PokeAPIError, match="Not a PokeAPI resource URL"):
+        NamedAPIResource(name="bad", url="https://pokeapi.co/").fetch(api)
+
+def test_resolve_all_deduplicates_urls(api, stub_server):
+    """Test that each distinct URL is requested once and results keep input order"""
+    links = api.list_pokemon(limit=3).results
+    results = api.resolve_all(links + links[::-1], max_workers=4)
+    assert [r.value.name for r in results] == [
+        "bulbasaur", "ivysaur", "venusaur", "venusaur", "ivysaur", "bulbasaur",
+    ]
+    assert results[0] is results[5]
+    for i in (1, 2, 3):
+        assert stub_server.hits(f"/api/v2/pokemon/{i}") == 1
+
+def test_resolve_all_reports_errors_per_item(api):
+    """Test that a missing or malformed link does not abort the batch"""
+    links = [
+        NamedAPIResource(name="kanto", url="https://pokeapi.co/api/v2/region/1/"),
+        NamedAPIResource(name="missing", url="https://pokeapi.co/api/v2/region/99/"),
+        NamedAPIResource(name="bad", url="https://pokeapi.co/"),
+        NamedAPIResource(name="generation-i", url="https://pokeapi.co/api/v2/generation/1/"),
+    ]
+    results = api.resolve_all(links)
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[1].error.message == "The requested resource was not found"
+    assert "Not a PokeAPI resource URL" in results[2].error.message
+    assert isinstance(results[3].value, Generation)
+
+def test_async_resolve_all(stub_server):
+    """Test that the async client resolves links concurrently and deduplicates them"""
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            links = (await api.list_pokemon(limit=2)).results
+            single = await links[0].fetch(api)
+            return single, await api.resolve_all(links * 3)
+
+    single, results = asyncio.run(scenario())
+    assert single.name == "bulbasaur"
+    assert [r.value.id for r in results] == [1, 2, 1, 2, 1, 2]
+    assert stub_server.hits("/api/v2/pokemon/2") == 1
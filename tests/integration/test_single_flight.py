@@ -0,0 +1,120 @@
+# tests/integration/test_single_flight.py
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.pokeapi.sdk import PokeAPI, AsyncPokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.connection.singleflight import SingleFlight, AsyncSingleFlight
+from src.pokeapi.exceptions import PokeAPIError
+
+
+def run_concurrently(fn, count=8):
+    """Call fn from `count` threads at once and return results or errors."""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        barrier.wait()
+        try:
+            return fn()
+        except PokeAPIError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+@pytest.mark.parametrize("cache", [None, ResponseCache()])
+def test_threads_share_one_request_and_model(stub_server, cache):
+    """Test that concurrent identical lookups send one request and share the model"""
+    stub_server.delay = 0.2
+    with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+        results = run_concurrently(lambda: api.get_pokemon(pokemon_id=25))
+        assert api.single_flight.coalesced == 7
+        assert len(api.single_flight) == 0
+    assert stub_server.hits("/api/v2/pokemon/25") == 1
+    assert all(result is results[0] for result in results)
+    assert results[0].name == "pikachu"
+
+def test_threads_share_errors(stub_server):
+    """Test that a failed request is reported to every waiter"""
+    stub_server.delay = 0.2
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        results = run_concurrently(lambda: api.get_pokemon(pokemon_id=9999))
+        assert len(api.single_flight) == 0
+    assert stub_server.hits("/api/v2/pokemon/9999") == 1
+    assert all(isinstance(result, PokeAPIError) for result in results)
+    assert results[0].message == "The requested resource was not found"
+
+def test_coalescing_across_clients(stub_server):
+    """Test that a link resolution joins an identical in-flight get_pokemon"""
+    stub_server.delay = 0.2
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache()) as api:
+        link = api.list_pokemon(limit=1).results[0]
+        barrier = threading.Barrier(2)
+
+        def by_link():
+            barrier.wait()
+            return link.fetch(api)
+
+        def by_id():
+            barrier.wait()
+            return api.get_pokemon(pokemon_id=1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first, second = executor.submit(by_link), executor.submit(by_id)
+            assert first.result().name == second.result().name == "bulbasaur"
+    assert stub_server.hits("/api/v2/pokemon/1") == 1
+
+def test_single_flight_releases_keys():
+    """Test that a finished call is not reused by later callers"""
+    flight = SingleFlight()
+    calls = []
+    assert flight.do("key", lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do("key", lambda: calls.append(1) or len(calls)) == 2
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: int("x"))
+    assert len(flight) == 0
+
+def test_async_tasks_share_one_request(stub_server):
+    """Test that concurrent tasks share one request, its model and its errors"""
+    stub_server.delay = 0.2
+
+    async def scenario():
+        async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+            found = await asyncio.gather(
+                *(api.get_pokemon(name="pikachu") for _ in range(8))
+            )
+            missing = await asyncio.gather(
+                *(api.get_pokemon(pokemon_id=9999) for _ in range(4)),
+                return_exceptions=True,
+            )
+            return found, missing, api.single_flight
+
+    found, missing, flight = asyncio.run(scenario())
+    assert stub_server.hits("/api/v2/pokemon/pikachu") == 1
+    assert stub_server.hits("/api/v2/pokemon/9999") == 1
+    assert all(pokemon is found[0] for pokemon in found)
+    assert all(isinstance(error, PokeAPIError) for error in missing)
+    assert flight.coalesced == 10
+    assert len(flight) == 0
+
+def test_async_waiter_cancellation_keeps_call_running():
+    """Test that cancelling the task that started a call does not cancel it for others"""
+    async def scenario():
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await started.wait()
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
@@ -0,0 +1,126 @@
+# tests/integration/test_streaming.py
+
+import json
+import os
+import tracemalloc
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.connection.streaming import JsonStream, stream_model
+from src.pokeapi.dataset import snapshot
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.trusted import parse_model
+from tests.stub_server import FIXTURES_DIR, load_fixtures
+
+
+def chunked(content, size):
+    return (content[i:i + size] for i in range(0, len(content), size))
+
+def read_document(stream):
+    """Rebuild a document from a JsonStream, reading arrays element by element"""
+    document = {}
+    for key in stream.members():
+        document[key] = list(stream.elements()) if stream.is_array() else stream.value()
+    stream.end()
+    return document
+
+def large_pokemon(moves):
+    """Return bulbasaur's fixture with `moves` distinct moves"""
+    with open(os.path.join(FIXTURES_DIR, "pokemon", "1.json")) as f:
+        document = json.load(f)
+    move = document["moves"][0]
+    document["moves"] = [
+        dict(move, move={"name": f"move-{i}", "url": f"https://pokeapi.co/api/v2/move/{i}/"})
+        for i in range(moves)
+    ]
+    return document
+
+def test_json_stream_is_independent_of_chunk_size():
+    """Test that documents decode the same whatever the chunk boundaries"""
+    content = ' {"id": 12345, "name": "flabébé", "list": [1, {"a": [true]}, null] ,'
+    content += '"empty": [], "nested": {"x": -1.5e3}} '
+    expected = json.loads(content)
+    for size in (1, 2, 3, 7, 1024):
+        stream = JsonStream(chunked(content.encode(), size))
+        assert read_document(stream) == expected
+
+@pytest.mark.parametrize("content", [
+    b'{"id": 1', b'{"id": 1} []', b'[1, 2]', b'{"id" 1}', b'{"id": [1 2]}', b'',
+])
+def test_json_stream_rejects_invalid_documents(content):
+    """Test that truncated and malformed documents raise ValueError"""
+    with pytest.raises(ValueError):
+        read_document(JsonStream(chunked(content, 2)))
+
+@pytest.mark.parametrize("mode", ["validated", "trusted", "compact"])
+def test_stream_model_matches_parse_model(mode):
+    """Test that streamed models equal models parsed from the whole body"""
+    for content in load_fixtures("pokemon"):
+        streamed = stream_model(Pokemon, chunked(content, 500), mode)
+        assert type(streamed) is type(parse_model(Pokemon, content, mode))
+        assert streamed.model_dump() == parse_model(Pokemon, content, mode).model_dump()
+
+def test_streamed_pokemon_api(stub_server):
+    """Test streamed gets and move iteration through the client"""
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        pikachu = api.get_pokemon(name="pikachu", stream=True)
+        assert pikachu == api.get_pokemon(name="pikachu")
+        light = api.get_pokemon(name="pikachu", fields=["types"], stream=True)
+        assert light.types == pikachu.types and not hasattr(light, "moves")
+        assert list(api.iter_pokemon_moves(name="pikachu")) == pikachu.moves
+
+def test_streamed_requests_use_but_do_not_fill_the_cache(stub_server):
+    """Test that streams are served from the cache but their responses are not stored"""
+    with PokeAPI(base_url=stub_server.base_url, cache=ResponseCache()) as api:
+        api.get_pokemon(pokemon_id=4, stream=True)
+        list(api.iter_pokemon_moves(pokemon_id=4))
+        assert stub_server.hits("/api/v2/pokemon/4") == 2
+        moves = api.get_pokemon(pokemon_id=4).moves
+        assert list(api.iter_pokemon_moves(pokemon_id=4)) == moves
+        api.get_pokemon(pokemon_id=4, stream=True)
+        assert stub_server.hits("/api/v2/pokemon/4") == 3
+
+def test_iterating_moves_keeps_memory_bounded(stub_server):
+    """Test that iterating moves holds far less than the response body"""
+    document = large_pokemon(5000)
+    stub_server.update("pokemon", document)
+    size = len(json.dumps(document))
+    with PokeAPI(base_url=stub_server.base_url, model_mode="trusted") as api:
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in api.iter_pokemon_moves(pokemon_id=1))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    assert count == 5000
+    assert peak < size / 4
+
+def test_streaming_errors(stub_server):
+    """Test that failed and invalid streamed responses raise PokeAPIError"""
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        with pytest.raises(PokeAPIError, match="not found"):
+            api.get_pokemon(pokemon_id=9999, stream=True)
+        moves = api.iter_pokemon_moves(pokemon_id=9999)
+        with pytest.raises(PokeAPIError, match="not found"):
+            next(moves)
+        with pytest.raises(PokeAPIError, match="no list field name"):
+            api.pokemon.iter_items("/pokemon", "1", Pokemon, "name")
+
+        stub_server.update("pokemon", {"id": 1, "name": "bulbasaur", "moves": [{}]})
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(pokemon_id=1, stream=True)
+        assert exc.value.message == "Invalid JSON response from server"
+        with pytest.raises(PokeAPIError) as exc:
+            list(api.iter_pokemon_moves(pokemon_id=1))
+        assert exc.value.message == "Invalid JSON response from server"
+
+def test_streaming_from_local_dataset(stub_server, tmp_path):
+    """Test that transports without streaming fall back to complete responses"""
+    path = str(tmp_path / "dataset")
+    with PokeAPI(base_url=stub_server.base_url) as api:
+        snapshot(path, api, page_size=4)
+        expected = api.get_pokemon(name="pikachu")
+    with PokeAPI(source=f"local:{path}") as local:
+        assert local.get_pokemon(name="pikachu", stream=True) == expected
+        assert list(local.iter_pokemon_moves(name="pikachu")) == expected.moves
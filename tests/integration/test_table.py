@@ -0,0 +1,103 @@
+# tests/integration/test_table.py
+
+import json
+import os
+import tracemalloc
+import pytest
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from tests.stub_server import FIXTURES_DIR
+
+np = pytest.importorskip("numpy")
+from src.pokeapi.analytics import PokemonTable  # noqa: E402
+
+
+def load_fixtures():
+    directory = os.path.join(FIXTURES_DIR, "pokemon")
+    pokemon = []
+    for filename in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, filename), "rb") as f:
+            pokemon.append(Pokemon.model_validate_json(f.read()))
+    return pokemon
+
+def base_stat(pokemon, name):
+    return next(s.base_stat for s in pokemon.stats if s.stat.name == name)
+
+def type_names(pokemon):
+    return {t.type.name for t in pokemon.types}
+
+def test_columns_match_models():
+    """Test that every column holds the values of the source models"""
+    pokemon = load_fixtures()
+    table = PokemonTable.from_pokemon(pokemon)
+    assert len(table) == len(pokemon)
+    assert table.ids.tolist() == [p.id for p in pokemon]
+    assert table.names.tolist() == [p.name for p in pokemon]
+    assert table.weight.tolist() == [p.weight for p in pokemon]
+    assert table.stat("speed").tolist() == [base_stat(p, "speed") for p in pokemon]
+    for p, row in zip(pokemon, table.types):
+        assert {table.type_names[code] for code in row if code >= 0} == type_names(p)
+
+def test_vectorized_filter_matches_python():
+    """Test that combined masks select the same Pokemon as a Python filter"""
+    pokemon = load_fixtures()
+    table = PokemonTable.from_pokemon(pokemon)
+    mask = table.has_type("fire") & (table.stat("speed") >= 80)
+    expected = [
+        p.name for p in pokemon
+        if "fire" in type_names(p) and base_stat(p, "speed") >= 80
+    ]
+    assert table[mask].names.tolist() == expected == ["charmeleon", "charizard"]
+    assert len(table[table.has_type("dragon")]) == 0
+
+def test_aggregates_match_python():
+    """Test type counts and per-type means against plain Python"""
+    pokemon = load_fixtures()
+    table = PokemonTable.from_pokemon(pokemon)
+    counts = table.type_counts()
+    means = table.mean_by_type("attack")
+    for name in {n for p in pokemon for n in type_names(p)}:
+        members = [p for p in pokemon if name in type_names(p)]
+        assert counts[name] == len(members)
+        expected = sum(base_stat(p, "attack") for p in members) / len(members)
+        assert means[name] == pytest.approx(expected)
+
+def test_built_from_projected_trusted_models(stub_server):
+    """Test building a table from bulk results fetched with fields= in trusted mode"""
+    with PokeAPI(base_url=stub_server.base_url, model_mode="trusted") as api:
+        results = api.get_many_pokemon([1, 4, 25], fields=PokemonTable.FIELDS)
+    table = PokemonTable.from_pokemon(r.value for r in results)
+    assert table.names.tolist() == ["bulbasaur", "charmander", "pikachu"]
+    assert table.has_type("poison").tolist() == [True, False, False]
+
+def test_unknown_stat():
+    """Test that asking for a stat no row has is rejected"""
+    table = PokemonTable.from_pokemon(load_fixtures())
+    with pytest.raises(PokeAPIError) as exc:
+        table.stat("sped")
+    assert exc.value.message.startswith("Unknown stat: sped")
+
+def test_table_is_far_smaller_than_models():
+    """Test that a table retains a small fraction of the memory of the models"""
+    directory = os.path.join(FIXTURES_DIR, "pokemon")
+    with open(os.path.join(directory, "6.json")) as f:
+        document = json.load(f)
+    bodies = [
+        json.dumps(dict(document, id=i, name=f"charizard-{i}")).encode()
+        for i in range(200)
+    ]
+
+    tracemalloc.start()
+    models = [Pokemon.model_validate_json(body) for body in bodies]
+    models_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    table = PokemonTable.from_pokemon(  # noqa: F841 (kept alive)
+        Pokemon.model_validate_json(body) for body in bodies
+    )
+    table_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(models) == 200
+    assert models_size > 100 * table_size
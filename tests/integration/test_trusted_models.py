@@ -0,0 +1,84 @@
+# tests/integration/test_trusted_models.py
+
+import pytest
+from pydantic import BaseModel
+from src.pokeapi.sdk import PokeAPI
+from src.pokeapi.connection.cache import ResponseCache
+from src.pokeapi.exceptions import PokeAPIError
+from src.pokeapi.models.pokemon import Pokemon
+from src.pokeapi.models.generation import Generation
+from src.pokeapi.models.pagination import NamedAPIResourceList
+from src.pokeapi.models.trusted import TrustedModel, parse_model, trusted_model
+from tests.stub_server import load_fixtures
+
+
+def assert_same_fields(trusted, validated):
+    """Compare a trusted model with a validated one, field by field."""
+    if isinstance(validated, BaseModel):
+        assert isinstance(trusted, trusted_model(type(validated)))
+        for name in type(validated).model_fields:
+            assert_same_fields(getattr(trusted, name), getattr(validated, name))
+    elif isinstance(validated, list):
+        assert isinstance(trusted, list)
+        assert len(trusted) == len(validated)
+        for t, v in zip(trusted, validated):
+            assert_same_fields(t, v)
+    else:
+        assert type(trusted) is type(validated)
+        assert trusted == validated
+
+@pytest.mark.parametrize("endpoint,model", [
+    ("pokemon", Pokemon), ("generation", Generation),
+])
+def test_trusted_models_match_validated_fixtures(endpoint, model):
+    """Test that trusted decoding matches validation for every recorded fixture"""
+    for content in load_fixtures(endpoint):
+        trusted = parse_model(model, content, "trusted")
+        validated = parse_model(model, content, "validated")
+        assert_same_fields(trusted, validated)
+        assert trusted.model_dump() == validated.model_dump()
+
+def test_trusted_model_fills_defaults():
+    """Test that optional fields missing from the response get their defaults"""
+    page = parse_model(
+        NamedAPIResourceList, b'{"count": 0, "results": []}', "trusted"
+    )
+    assert page.next is None and page.previous is None
+
+def test_trusted_model_api(stub_server):
+    """Test that a trusted client returns slotted models with the same attributes"""
+    with PokeAPI(base_url=stub_server.base_url, model_mode="trusted") as api:
+        pikachu = api.get_pokemon(name="pikachu")
+        assert isinstance(pikachu, TrustedModel)
+        assert not hasattr(pikachu, "__dict__")
+        assert type(pikachu).__name__ == "Pokemon"
+        assert pikachu.types[0].type.name == "electric"
+        assert pikachu.moves[0].version_group_details[0].level_learned_at >= 0
+
+        first = api.list_pokemon(limit=1).results[0]
+        assert first.fetch(api).name == "bulbasaur"
+
+def test_cache_keeps_models_per_mode(stub_server):
+    """Test that validated and trusted clients share a cached response"""
+    cache = ResponseCache()
+    validated = PokeAPI(base_url=stub_server.base_url, cache=cache)
+    trusted = PokeAPI(
+        base_url=stub_server.base_url, cache=cache, model_mode="trusted"
+    )
+    assert isinstance(validated.get_pokemon(pokemon_id=4), Pokemon)
+    assert isinstance(trusted.get_pokemon(pokemon_id=4), TrustedModel)
+    assert stub_server.hits("/api/v2/pokemon/4") == 1
+
+def test_trusted_model_rejects_incomplete_response(stub_server):
+    """Test that a response missing required fields is reported, not returned"""
+    stub_server.update("pokemon", {"id": 1, "name": "bulbasaur"})
+    with PokeAPI(base_url=stub_server.base_url, model_mode="trusted") as api:
+        with pytest.raises(PokeAPIError) as exc:
+            api.get_pokemon(pokemon_id=1)
+    assert exc.value.message == "Invalid JSON response from server"
+
+def test_invalid_model_mode():
+    """Test that an unknown model mode is rejected"""
+    with pytest.raises(PokeAPIError) as exc:
+        PokeAPI(model_mode="fast")
+    assert "Model mode must be one of: validated, trusted, compact" in str(exc.value)
@@ -0,0 +1,219 @@
+"""
+Local stub of the PokeAPI used by tests that must not depend on the network.
+Serves the recorded JSON fixtures under tests/fixtures over plain HTTP.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+API_PREFIX = "/api/v2"
+
+
+def load_fixtures(endpoint: str) -> list:
+    """Return the raw bodies of an endpoint's fixtures, ordered by file name."""
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, endpoint, "*.json"))):
+        with open(path, "rb") as f:
+            bodies.append(f.read())
+    return bodies
+
+
+class StubPokeAPIServer:
+    """
+    Threaded HTTP server answering `/pokemon` and `/generation` requests.
+
+    Every request path is recorded in `requests` so tests can assert how
+    many calls reached the network. Resources are served with an ETag and
+    conditional requests for unchanged resources get 304 Not Modified.
+    `fail()` queues error responses to exercise throttling and retries,
+    and `stall()` slow responses to exercise hedging.
+
+    Usage:
+        with StubPokeAPIServer() as server:
+            api = PokeAPI(base_url=server.base_url)
+    """
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR):
+        self.resources = {}
+        self.names = {}
+        for endpoint in sorted(os.listdir(fixtures_dir)):
+            endpoint_dir = os.path.join(fixtures_dir, endpoint)
+            if not os.path.isdir(endpoint_dir):
+                continue
+            self.resources[endpoint] = {}
+            self.names[endpoint] = {}
+            for filename in os.listdir(endpoint_dir):
+                with open(os.path.join(endpoint_dir, filename), "rb") as f:
+                    body = f.read()
+                document = json.loads(body)
+                self.resources[endpoint][document["id"]] = body
+                self.names[endpoint][document["name"]] = document["id"]
+
+        self.requests = []
+        self.failures = {}
+        self.stalls = {}
+        self.not_modified = 0
+        self.delay = 0.0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def hits(self, path: str) -> int:
+        """Return how many requests were made for a path (without query string)."""
+        with self._lock:
+            return sum(1 for p in self.requests if urlsplit(p).path == path)
+
+    def start(self) -> "StubPokeAPIServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def update(self, endpoint: str, document: dict) -> None:
+        """Replace (or add) the fixture for a resource, changing its ETag."""
+        body = json.dumps(document).encode()
+        with self._lock:
+            self.resources[endpoint][document["id"]] = body
+            self.names[endpoint][document["name"]] = document["id"]
+
+    def fail(self, path: str, status: int, headers: dict = None,
+             times: int = 1) -> None:
+        """Answer the next `times` requests for a path with an error status."""
+        with self._lock:
+            self.failures.setdefault(path, []).extend(
+                [(status, headers or {})] * times
+            )
+
+    def stall(self, path: str, seconds: float, times: int = 1) -> None:
+        """Answer the next `times` requests for a path after `seconds`."""
+        with self._lock:
+            self.stalls.setdefault(path, []).extend([seconds] * times)
+
+    def _next_stall(self, path: str) -> float:
+        with self._lock:
+            queued = self.stalls.get(path)
+            return queued.pop(0) if queued else 0.0
+
+    def _next_failure(self, path: str):
+        with self._lock:
+            queued = self.failures.get(path)
+            return queued.pop(0) if queued else None
+
+    def lookup(self, endpoint: str, key: str):
+        """Return the fixture body for an ID or name, or None."""
+        documents = self.resources.get(endpoint)
+        if documents is None:
+            return None
+        if key.isdigit():
+            return documents.get(int(key))
+        resource_id = self.names[endpoint].get(key)
+        return documents.get(resource_id) if resource_id is not None else None
+
+    def page(self, endpoint: str, query: dict):
+        """Build a paginated NamedAPIResourceList body for an endpoint."""
+        documents = self.resources.get(endpoint)
+        if documents is None:
+            return None
+        limit = int(query.get("limit", ["20"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        ids = sorted(documents)
+        names = {v: k for k, v in self.names[endpoint].items()}
+        url = f"{self.base_url}/{endpoint}"
+
+        def link(new_offset):
+            return f"{url}?offset={new_offset}&limit={limit}"
+
+        page = {
+            "count": len(ids),
+            "next": link(offset + limit) if offset + limit < len(ids) else None,
+            "previous": link(max(offset - limit, 0)) if offset > 0 else None,
+            "results": [
+                {"name": names[i], "url": f"{url}/{i}/"}
+                for i in ids[offset:offset + limit]
+            ],
+        }
+        return json.dumps(page).encode()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append(self.path)
+                if server.delay:
+                    threading.Event().wait(server.delay)
+
+                parts = urlsplit(self.path)
+                path = parts.path
+                stall = server._next_stall(path)
+                if stall:
+                    threading.Event().wait(stall)
+                failure = server._next_failure(path)
+                if failure is not None:
+                    status, headers = failure
+                    self._send(status, b"", None, extra_headers=headers)
+                    return
+
+                body = None
+                if path.startswith(API_PREFIX):
+                    segments = path[len(API_PREFIX):].strip("/").split("/")
+                    if len(segments) == 1:
+                        body = server.page(segments[0], parse_qs(parts.query))
+                    elif len(segments) == 2:
+                        body = server.lookup(segments[0], segments[1])
+
+                if body is None:
+                    self._send(404, b"Not Found", "text/plain")
+                    return
+
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self._send(304, b"", None, etag)
+                else:
+                    self._send(200, body, "application/json", etag)
+
+            def _send(self, status, body, content_type, etag=None,
+                      extra_headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                if etag:
+                    self.send_header("ETag", etag)
+                for name, value in (extra_headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler